@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Replay a trace through bounded per-worker KV block caches.
+
+Every request is routed to one worker by a routing policy. Its cache hits are
+the longest prefix of its hash ids already cached on that worker, as with
+prefix caching in the engines. All of its blocks are then inserted into that
+worker's cache, evicting blocks once the cache is over capacity.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+
+class BlockCache(ABC):
+    """A cache of hash ids holding at most `capacity` blocks (unbounded if None)."""
+
+    def __init__(self, capacity: Optional[int] = None):
+        if capacity is not None and capacity < 0:
+            raise ValueError("capacity must be non-negative")
+        self.capacity = capacity
+        self.evictions = 0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of cached blocks"""
+        pass
+
+    @abstractmethod
+    def __contains__(self, hash_id: int) -> bool:
+        """Whether the block is cached"""
+        pass
+
+    def match_prefix(self, hash_ids: Sequence[int]) -> int:
+        """Number of leading hash ids that are cached."""
+        for i, hash_id in enumerate(hash_ids):
+            if hash_id not in self:
+                return i
+        return len(hash_ids)
+
+    def insert(self, hash_ids: Sequence[int]) -> None:
+        """
+        Cache the blocks of a request, evicting blocks if over capacity.
+
+        Blocks are touched from the last to the first, so the tail of a prompt
+        is evicted before its shared prefix, as in the engines' free block queues.
+        """
+        for hash_id in reversed(hash_ids):
+            self._touch(hash_id)
+        if self.capacity is not None:
+            while len(self) > self.capacity:
+                self._evict()
+                self.evictions += 1
+
+    @abstractmethod
+    def _touch(self, hash_id: int) -> None:
+        """Insert a block or mark it as used"""
+        pass
+
+    @abstractmethod
+    def _evict(self) -> None:
+        """Remove one block according to the eviction policy"""
+        pass
+
+
+class LRUBlockCache(BlockCache):
+    """Evicts the least recently used block."""
+
+    def __init__(self, capacity: Optional[int] = None):
+        super().__init__(capacity)
+        self._blocks: OrderedDict[int, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __contains__(self, hash_id: int) -> bool:
+        return hash_id in self._blocks
+
+    def _touch(self, hash_id: int) -> None:
+        self._blocks[hash_id] = None
+        self._blocks.move_to_end(hash_id)
+
+    def _evict(self) -> None:
+        self._blocks.popitem(last=False)
+
+
+class LFUBlockCache(BlockCache):
+    """Evicts the least frequently used block, least recently used among ties."""
+
+    def __init__(self, capacity: Optional[int] = None):
+        super().__init__(capacity)
+        self._freqs: dict[int, int] = {}
+        # blocks with the same frequency, in LRU order
+        self._buckets: defaultdict[int, OrderedDict[int, None]] = defaultdict(
+            OrderedDict
+        )
+        self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._freqs)
+
+    def __contains__(self, hash_id: int) -> bool:
+        return hash_id in self._freqs
+
+    def _touch(self, hash_id: int) -> None:
+        freq = self._freqs.get(hash_id, 0)
+        if freq:
+            bucket = self._buckets[freq]
+            del bucket[hash_id]
+            if not bucket:
+                del self._buckets[freq]
+                if self._min_freq == freq:
+                    self._min_freq = freq + 1
+        else:
+            self._min_freq = 1
+        self._freqs[hash_id] = freq + 1
+        self._buckets[freq + 1][hash_id] = None
+
+    def _evict(self) -> None:
+        bucket = self._buckets[self._min_freq]
+        hash_id, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_freq]
+            self._min_freq = min(self._buckets, default=0)
+        del self._freqs[hash_id]
+
+
+EVICTION_POLICIES: dict[str, type[BlockCache]] = {
+    "lru": LRUBlockCache,
+    "lfu": LFUBlockCache,
+}
+
+
+class RoutingPolicy(ABC):
+    """Picks the worker serving a request, given the caches of all workers."""
+
+    def __init__(self, num_workers: int, seed: Optional[int] = None):
+        self.num_workers = num_workers
+        self.rng = random.Random(seed)
+
+    @abstractmethod
+    def select(self, hash_ids: Sequence[int], caches: Sequence[BlockCache]) -> int:
+        """Index of the worker serving the request"""
+        pass
+
+
+class RandomRouting(RoutingPolicy):
+    def select(self, hash_ids: Sequence[int], caches: Sequence[BlockCache]) -> int:
+        return self.rng.randrange(self.num_workers)
+
+
+class RoundRobinRouting(RoutingPolicy):
+    def __init__(self, num_workers: int, seed: Optional[int] = None):
+        super().__init__(num_workers, seed)
+        self._next = 0
+
+    def select(self, hash_ids: Sequence[int], caches: Sequence[BlockCache]) -> int:
+        worker_id = self._next
+        self._next = (self._next + 1) % self.num_workers
+        return worker_id
+
+
+class MaxOverlapRouting(RoutingPolicy):
+    """
+    Mirrors `KvRouter.get_best_worker` of the standalone router: the logit of a
+    worker is `2 * overlap - usage - waiting`, with ties broken at random.
+
+    The overlap is the cached prefix as a fraction of the request, the usage is
+    the cache fill ratio, and as there is no engine feedback offline, the
+    waiting term is the number of requests routed to the worker, normalized by
+    the maximum over all workers.
+    """
+
+    def __init__(self, num_workers: int, seed: Optional[int] = None):
+        super().__init__(num_workers, seed)
+        self.routed = [0] * num_workers
+
+    def select(self, hash_ids: Sequence[int], caches: Sequence[BlockCache]) -> int:
+        num_blocks = max(len(hash_ids), 1)
+        max_routed = max(self.routed)
+        logits = []
+        for cache, routed in zip(caches, self.routed):
+            overlap = cache.match_prefix(hash_ids) / num_blocks
+            usage = len(cache) / cache.capacity if cache.capacity else 0.0
+            waiting = routed / max_routed if max_routed else 0.0
+            logits.append(2 * overlap - usage - waiting)
+
+        best = max(logits)
+        worker_id = self.rng.choice(
+            [i for i, logit in enumerate(logits) if logit == best]
+        )
+        self.routed[worker_id] += 1
+        return worker_id
+
+
+ROUTING_POLICIES: dict[str, type[RoutingPolicy]] = {
+    "random": RandomRouting,
+    "round_robin": RoundRobinRouting,
+    "max_overlap": MaxOverlapRouting,
+}
+
+
+@dataclass
+class CacheSimulationResult:
+    """Hit and eviction counts of one cache configuration, per worker."""
+
+    capacity: Optional[int]
+    num_workers: int
+    eviction: str
+    routing: str
+    requests: np.ndarray = field(init=False)
+    blocks: np.ndarray = field(init=False)
+    hit_blocks: np.ndarray = field(init=False)
+    evictions: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.requests = np.zeros(self.num_workers, dtype=np.int64)
+        self.blocks = np.zeros(self.num_workers, dtype=np.int64)
+        self.hit_blocks = np.zeros(self.num_workers, dtype=np.int64)
+        self.evictions = np.zeros(self.num_workers, dtype=np.int64)
+
+    @property
+    def worker_hit_rates(self) -> np.ndarray:
+        """Fraction of looked up blocks that were cached, per worker."""
+        return self.hit_blocks / np.maximum(self.blocks, 1)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked up blocks that were cached, over all workers."""
+        return float(self.hit_blocks.sum() / max(self.blocks.sum(), 1))
+
+
+class CacheSimulator:
+    """
+    Simulates one cache configuration: `num_workers` caches of `capacity` blocks
+    each, with the given eviction and routing policies.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int],
+        num_workers: int = 1,
+        eviction: str = "lru",
+        routing: str = "max_overlap",
+        seed: Optional[int] = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be positive")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy {eviction}, expected one of {list(EVICTION_POLICIES)}"
+            )
+        if routing not in ROUTING_POLICIES:
+            raise ValueError(
+                f"Unknown routing policy {routing}, expected one of {list(ROUTING_POLICIES)}"
+            )
+
+        self.caches = [
+            EVICTION_POLICIES[eviction](capacity) for _ in range(num_workers)
+        ]
+        self.router = ROUTING_POLICIES[routing](num_workers, seed)
+        self.result = CacheSimulationResult(capacity, num_workers, eviction, routing)
+
+    def process(self, hash_ids: Sequence[int]) -> int:
+        """Route and serve one request; returns the chosen worker."""
+        worker_id = self.router.select(hash_ids, self.caches)
+
+        cache = self.caches[worker_id]
+        hits = cache.match_prefix(hash_ids)
+        evictions_before = cache.evictions
+        cache.insert(hash_ids)
+
+        result = self.result
+        result.requests[worker_id] += 1
+        result.blocks[worker_id] += len(hash_ids)
+        result.hit_blocks[worker_id] += hits
+        result.evictions[worker_id] += cache.evictions - evictions_before
+        return worker_id
+
+
+def simulate_cache_hit_rates(
+    requests: Iterable[Sequence[int]],
+    capacities: Sequence[Optional[int]],
+    num_workers: int = 1,
+    eviction: str = "lru",
+    routing: str = "max_overlap",
+    seed: Optional[int] = None,
+) -> list[CacheSimulationResult]:
+    """
+    Replay the hash ids of every request through one simulator per capacity.
+
+    All capacities are simulated side by side in a single pass over `requests`,
+    so the requests can be streamed. The results, ordered like `capacities`,
+    form the hit-rate-vs-capacity curve.
+
+    Args:
+        requests: Hash ids of every request, in arrival order.
+        capacities: Cache capacities in blocks per worker; None is unbounded.
+        num_workers: Number of workers, each with its own cache.
+        eviction: One of EVICTION_POLICIES.
+        routing: One of ROUTING_POLICIES.
+        seed: Seed of the random tie breaking / random routing.
+    """
+    simulators = [
+        CacheSimulator(capacity, num_workers, eviction, routing, seed)
+        for capacity in capacities
+    ]
+    for hash_ids in requests:
+        for simulator in simulators:
+            simulator.process(hash_ids)
+    return [simulator.result for simulator in simulators]
@@ -13,39 +13,179 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import networkx as nx
+from dataclasses import dataclass, replace
+from typing import Optional
+
 import numpy as np
 from data_generator.protocols import CACHE_END, END_NODE, SUPER_ROOT
-from data_generator.sampler import get_cdf
+from data_generator.trace_loader import TraceColumns
+
+
+@dataclass
+class PrefixTree:
+    """
+    Array-backed prefix tree over hash ids.
+
+    Every node has a dense index; index 0 is the SUPER_ROOT. Nodes are kept
+    sorted by hash id, so `index` is a binary search. Per-node attributes are
+    numpy columns indexed by the dense index:
+
+        node_ids: the hash id of the node (of the last block for contracted chains)
+        parents: dense index of the parent; the root is its own parent
+        visited: number of requests passing through the node
+        end: number of requests ending at the node
+        to_leaf: number of requests branching off into a unique (visited once) child
+        length: number of blocks contracted into the node
+
+    The transition table filled by `_precompute_transition_cdfs` is stored
+    CSR-style: the possible next nodes of node i are
+    `out_nodes[out_offsets[i]:out_offsets[i + 1]]` with CDF `out_cdf[...]`,
+    where next nodes are dense indices or CACHE_END / END_NODE.
+    """
+
+    node_ids: np.ndarray
+    parents: np.ndarray
+    visited: np.ndarray
+    end: np.ndarray
+    to_leaf: np.ndarray
+    length: np.ndarray
+    out_offsets: Optional[np.ndarray] = None
+    out_nodes: Optional[np.ndarray] = None
+    out_cdf: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def index(self, node_id: int) -> int:
+        """Dense index of the node with hash id `node_id`."""
+        i = int(np.searchsorted(self.node_ids, node_id))
+        if i == len(self) or self.node_ids[i] != node_id:
+            raise KeyError(node_id)
+        return i
+
+    def __contains__(self, node_id: int) -> bool:
+        try:
+            self.index(node_id)
+        except KeyError:
+            return False
+        return True
+
+    def children(self, i: int) -> np.ndarray:
+        """Dense indices of the children of node i, in hash id order."""
+        children = np.flatnonzero(self.parents == i)
+        return children[children != 0]
+
+    def successors(self, node_id: int) -> list[int]:
+        """Hash ids of the children of the node with hash id `node_id`."""
+        return self.node_ids[self.children(self.index(node_id))].tolist()
+
+    def depths(self) -> np.ndarray:
+        """Number of edges between every node and the root."""
+        steps, _ = _pointer_jump(self.parents, self.parents != np.arange(len(self)))
+        return steps
+
+    def _filter(self, keep: np.ndarray, parents: np.ndarray) -> "PrefixTree":
+        # `parents` must point at kept nodes for every kept node
+        new_index = np.cumsum(keep) - 1
+        return PrefixTree(
+            node_ids=self.node_ids[keep],
+            parents=new_index[parents[keep]],
+            visited=self.visited[keep],
+            end=self.end[keep],
+            to_leaf=self.to_leaf[keep],
+            length=self.length[keep],
+        )
 
 
-def _verify_tree(G: nx.DiGraph) -> None:
-    invalid_nodes = [(node, d) for node, d in G.in_degree() if d > 1]
-    if invalid_nodes:
+def _pointer_jump(
+    parents: np.ndarray, follow: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    For every node, walk up `parents` while `follow` holds for the current node.
+    Returns the number of steps taken and the node the walk stops at, using
+    pointer jumping, i.e. O(log depth) vectorized passes.
+    """
+    nodes = np.arange(len(parents))
+    top = np.where(follow, parents, nodes)
+    steps = follow.astype(np.int64)
+    while True:
+        next_top = top[top]
+        if np.array_equal(next_top, top):
+            return steps, top
+        steps = steps + steps[top]
+        top = next_top
+
+
+def _build_tree(trace: TraceColumns) -> PrefixTree:
+    """Build the prefix tree of all hash id paths in the trace."""
+    num_hash_ids = trace.num_hash_ids
+    non_empty = num_hash_ids > 0
+    row_starts = trace.hash_offsets[:-1][non_empty]
+    row_ends = trace.hash_offsets[1:][non_empty]
+
+    unique_ids, inverse, counts = np.unique(
+        trace.hash_values, return_inverse=True, return_counts=True
+    )
+    node_ids = np.concatenate(([SUPER_ROOT], unique_ids)).astype(np.int64)
+    num_nodes = len(node_ids)
+
+    # dense node and parent of every hash id occurrence
+    occurrence_nodes = inverse.astype(np.int64) + 1
+    occurrence_parents = np.empty_like(occurrence_nodes)
+    occurrence_parents[1:] = occurrence_nodes[:-1]
+    occurrence_parents[row_starts] = 0
+
+    parents = np.zeros(num_nodes, dtype=np.int64)
+    parents[occurrence_nodes] = occurrence_parents
+    _verify_tree(node_ids, parents, occurrence_nodes, occurrence_parents)
+
+    visited = np.concatenate(([len(trace)], counts)).astype(np.int64)
+    end = np.bincount(occurrence_nodes[row_ends - 1], minlength=num_nodes)
+    # requests without any hash ids end at the root
+    end[0] += np.count_nonzero(~non_empty)
+
+    return PrefixTree(
+        node_ids=node_ids,
+        parents=parents,
+        visited=visited,
+        end=end.astype(np.int64),
+        to_leaf=np.zeros(num_nodes, dtype=np.int64),
+        length=np.ones(num_nodes, dtype=np.int64),
+    )
+
+
+def _verify_tree(
+    node_ids: np.ndarray,
+    parents: np.ndarray,
+    occurrence_nodes: np.ndarray,
+    occurrence_parents: np.ndarray,
+) -> None:
+    conflicts = parents[occurrence_nodes] != occurrence_parents
+    if np.any(conflicts):
         print("ERROR: The following nodes have multiple parents (in-degree > 1):")
-        for node, in_degree in invalid_nodes:
-            parents = list(G.predecessors(node))
-            print(f"  Node {node}: in-degree={in_degree}, parents={parents}")
+        invalid_nodes = np.unique(occurrence_nodes[conflicts])
+        for node in invalid_nodes:
+            node_parents = np.unique(occurrence_parents[occurrence_nodes == node])
+            print(
+                f"  Node {node_ids[node]}: in-degree={len(node_parents)}, "
+                f"parents={node_ids[node_parents].tolist()}"
+            )
         raise ValueError(
             "Graph is not a valid tree: nodes with multiple parents detected"
         )
 
 
-def _mark_visited(G: nx.DiGraph) -> None:
+def _mark_visited(tree: PrefixTree) -> None:
     # visits to leaf nodes (non-core branches) are considered as ended
-    for node in G.nodes():
-        if "to_leaf" not in G.nodes[node]:
-            G.nodes[node]["to_leaf"] = 0
-        if G.nodes[node]["visited"] <= 1:
-            continue
-        for child in G.successors(node):
-            if G.nodes[child]["visited"] == 1:
-                G.nodes[node]["to_leaf"] += 1
+    leaf_children = np.flatnonzero(tree.visited[1:] == 1) + 1
+    to_leaf = np.bincount(tree.parents[leaf_children], minlength=len(tree))
+    to_leaf[tree.visited <= 1] = 0
+    tree.to_leaf = to_leaf.astype(np.int64)
 
 
-def _merge_chains(G: nx.DiGraph) -> nx.DiGraph:
+def _merge_chains(tree: PrefixTree) -> PrefixTree:
     """
-    Make the graph radix-like (meaning all unary paths are contracted).
+    Make the tree radix-like (meaning all unary paths are contracted).
 
     This function transforms a prefix tree into a radix tree structure by contracting
     unary paths (chains of nodes with exactly one predecessor and one successor).
@@ -53,65 +193,30 @@ def _merge_chains(G: nx.DiGraph) -> nx.DiGraph:
     as it eliminates redundant intermediate nodes while preserving the structural
     information needed for path sampling.
 
-    This compression is particularly beneficial for efficient path sampling during data
-    synthesis. In addition, keep track of the contracted lengths in the 'length' attribute
-    of each node to preserve the original path information.
+    A node is absorbed into its child when the child carries all of its visits.
+    Each remaining node keeps the hash id of the last block of its chain and
+    records the number of contracted blocks in `length`.
 
     Args:
-        G (networkx.DiGraph): A directed graph representing a prefix tree structure.
+        tree (PrefixTree): A prefix tree.
 
     Returns:
-        networkx.DiGraph: The resulting radix tree with unary paths contracted.
+        PrefixTree: The resulting radix tree with unary paths contracted.
     """
-    for visited in sorted(np.unique([G.nodes[node]["visited"] for node in G.nodes()])):
-        sub_nodes = [node for node in G.nodes() if G.nodes[node]["visited"] == visited]
-        subgraph = G.subgraph(sub_nodes)
-        if len(subgraph) == 1:
-            continue
-
-        chain_nodes = [
-            node
-            for node in subgraph.nodes()
-            if G.in_degree(node) == 1 and G.out_degree(node) == 1
-        ]
-        if not chain_nodes:
-            continue
-        chain_nodes = sorted(chain_nodes)
-
-        nodes_rm = []
-        for node in chain_nodes:
-            node_pred = list(G.predecessors(node))[0]
-            # find the parent node source
-            if G.nodes[node_pred]["visited"] == visited and node_pred != SUPER_ROOT:
-                continue
-            weight = G[node_pred][node]["weight"]
-
-            end_node = node
-            chain_len = 1
-            succ = list(G.successors(end_node))
-
-            # find the end of the chain
-            while succ and G.nodes[succ[0]]["visited"] == visited:
-                nodes_rm.append(end_node)
-                end_node = succ[0]
-                chain_len += 1
-                succ = list(G.successors(end_node))
-
-            G.add_edge(
-                node_pred, end_node, weight=weight
-            )  # may overwrite the edge (should be harmless)
-            G.nodes[end_node]["length"] = chain_len
-
-        G.remove_nodes_from(nodes_rm)
-
-    for node in G.nodes():
-        if "length" not in G.nodes[node]:
-            G.nodes[node]["length"] = 1
-
-    return G
-
-
-def _remove_leaves(G: nx.DiGraph) -> tuple[nx.DiGraph, list[int]]:
+    children = np.arange(1, len(tree))
+    child_parents = tree.parents[children]
+    carries_all = tree.visited[children] == tree.visited[child_parents]
+    absorbed = np.zeros(len(tree), dtype=bool)
+    absorbed[child_parents[carries_all]] = True
+    absorbed[0] = False
+
+    # walk up through absorbed ancestors to find the chain lengths and new parents
+    steps, top = _pointer_jump(tree.parents, absorbed[tree.parents])
+    merged = replace(tree, length=tree.length + steps)
+    return merged._filter(~absorbed, tree.parents[top])
+
+
+def _remove_leaves(tree: PrefixTree) -> tuple[PrefixTree, list[int]]:
     """
     Remove all nodes that are only visited once from the tree.
 
@@ -121,59 +226,74 @@ def _remove_leaves(G: nx.DiGraph) -> tuple[nx.DiGraph, list[int]]:
     were accessed only once and don't contribute to the core structural patterns.
 
     Args:
-        G (networkx.DiGraph): A directed graph representing a radix tree structure.
+        tree (PrefixTree): A radix tree.
 
     Returns:
-        tuple[networkx.DiGraph, list[int]]: A tuple containing:
-            - The modified graph with unique nodes removed
+        tuple[PrefixTree, list[int]]: A tuple containing:
+            - The tree with unique nodes removed
             - A list of lengths of the removed leaf nodes
     """
-    leaves = {
-        node: G.nodes[node]["length"]
-        for node in G.nodes()
-        if G.nodes[node]["visited"] == 1
-    }
-    leaves_id = list(leaves.keys())
-    leaves_len = list(leaves.values())
-    G.remove_nodes_from(leaves_id)
-    return G, leaves_len
-
-
-def _precompute_transition_cdfs(G: nx.DiGraph) -> nx.DiGraph:
-    for node in G.nodes():
-        out_edges = list(G.out_edges(node))
-        weights = [G[edge[0]][edge[1]]["weight"] for edge in out_edges] + [
-            G.nodes[node]["to_leaf"],
-            G.nodes[node]["end"],
-        ]
-        G.nodes[node]["out_cdf"] = get_cdf(weights)
-        G.nodes[node]["out_nodes"] = [edge[1] for edge in out_edges] + [
-            CACHE_END,
-            END_NODE,
-        ]
-
-    return G
-
-
-def _validate_graph(G: nx.DiGraph) -> bool:
-    for node in G.nodes():
-        # Skip nodes without parents or children
-        if G.in_degree(node) == 0 or G.out_degree(node) == 0:
-            continue
-
-        # Get incoming edge weight (should only be one parent)
-        parent = list(G.predecessors(node))[0]
-        in_weight = G[parent][node]["weight"]
-
-        # Sum outgoing edge weights
-        out_weights = [G[node][child]["weight"] for child in G.successors(node)]
-        out_weights += [G.nodes[node]["to_leaf"], G.nodes[node]["end"]]
-
-        # Compare weights (using np.isclose for float comparison)
-        if not in_weight == sum(out_weights):
-            raise ValueError(
-                f"Weight mismatch at node {node}: "
-                f"incoming weight {in_weight} != sum of outgoing weights {sum(out_weights)}"
-            )
+    leaves = tree.visited == 1
+    leaves[0] = False
+    leaves_len = tree.length[leaves].tolist()
+    return tree._filter(~leaves, tree.parents), leaves_len
+
+
+def _precompute_transition_cdfs(tree: PrefixTree) -> PrefixTree:
+    children = np.flatnonzero(tree.parents != np.arange(len(tree)))
+    child_parents = tree.parents[children]
+    order = np.argsort(child_parents, kind="stable")
+    children, child_parents = children[order], child_parents[order]
+    num_children = np.bincount(child_parents, minlength=len(tree))
+
+    # per node: its children, then the CACHE_END and END_NODE transitions
+    out_offsets = np.zeros(len(tree) + 1, dtype=np.int64)
+    np.cumsum(num_children + 2, out=out_offsets[1:])
+    out_nodes = np.empty(out_offsets[-1], dtype=np.int64)
+    weights = np.empty(out_offsets[-1], dtype=np.int64)
+
+    child_offsets = np.concatenate(([0], np.cumsum(num_children)[:-1]))
+    rank = np.arange(len(children)) - child_offsets[child_parents]
+    positions = out_offsets[child_parents] + rank
+    out_nodes[positions] = children
+    weights[positions] = tree.visited[children]
+    out_nodes[out_offsets[1:] - 2] = CACHE_END
+    weights[out_offsets[1:] - 2] = tree.to_leaf
+    out_nodes[out_offsets[1:] - 1] = END_NODE
+    weights[out_offsets[1:] - 1] = tree.end
+
+    # segmented cumulative sums, normalized per node
+    cumsum = np.cumsum(weights)
+    segment_start = np.repeat(
+        cumsum[out_offsets[:-1]] - weights[out_offsets[:-1]], num_children + 2
+    )
+    segment_cumsum = cumsum - segment_start
+    segment_total = np.repeat(segment_cumsum[out_offsets[1:] - 1], num_children + 2)
+
+    tree.out_offsets = out_offsets
+    tree.out_nodes = out_nodes
+    tree.out_cdf = segment_cumsum / segment_total
+    return tree
+
+
+def _validate_graph(tree: PrefixTree) -> bool:
+    # incoming weight of a node is its visit count; compare against its outgoing weights
+    children = np.arange(1, len(tree))
+    child_parents = tree.parents[children]
+    child_visits = np.bincount(
+        child_parents, weights=tree.visited[children], minlength=len(tree)
+    ).astype(np.int64)
+    has_children = np.bincount(child_parents, minlength=len(tree)) > 0
+    out_weights = child_visits + tree.to_leaf + tree.end
+
+    # Skip nodes without parents or children
+    mismatch = has_children & (tree.visited != out_weights)
+    mismatch[0] = False
+    if np.any(mismatch):
+        node = int(np.flatnonzero(mismatch)[0])
+        raise ValueError(
+            f"Weight mismatch at node {tree.node_ids[node]}: "
+            f"incoming weight {tree.visited[node]} != sum of outgoing weights {out_weights[node]}"
+        )
 
     return True
@@ -14,9 +14,18 @@
 # limitations under the License.
 
 import json
-from collections import Counter
-
+from typing import Optional, Sequence
+
+import numpy as np
+from data_generator.cache_simulator import (
+    EVICTION_POLICIES,
+    ROUTING_POLICIES,
+    CacheSimulationResult,
+    simulate_cache_hit_rates,
+)
 from data_generator.logging_utils import calculate_and_print_statistics
+from data_generator.trace_loader import TraceColumns, load_trace
+from tabulate import tabulate
 
 
 class PrefixAnalyzer:
@@ -24,38 +33,36 @@ class PrefixAnalyzer:
     A class for analyzing dataset characteristics related to prefixes, hash IDs, and cache hit rates.
     """
 
-    def __init__(self, dataset_path, block_size=1):
+    def __init__(self, dataset_path, block_size=1, use_trace_cache=False):
         """
         Initialize the analyzer with dataset path and block size.
 
         Args:
             dataset_path: Path to the JSONL dataset file
             block_size: Size of each block for prefix calculation
+            use_trace_cache: Cache the parsed trace in a `.npz` sidecar next to the dataset
         """
         self.dataset_path = dataset_path
         self.block_size = block_size
-        self.dataset = self._load_dataset()
-        self.hash_counter = self._build_hash_counter()
-        self.repeated_hash_ids = {
-            hash_id for hash_id, count in self.hash_counter.items() if count > 1
-        }
+        self.trace = self._load_dataset(use_trace_cache)
+        self.unique_hash_ids, self.hash_counts = self._count_hash_ids()
+        # sorted, so membership can be tested with np.isin
+        self.repeated_hash_ids = self.unique_hash_ids[self.hash_counts > 1]
 
-    def _load_dataset(self) -> list:
+    def _load_dataset(self, use_trace_cache: bool) -> TraceColumns:
         print(f"Loading dataset from {self.dataset_path}...")
-        dataset = []
-        with open(self.dataset_path, "r") as f:
-            for line in f:
-                dataset.append(json.loads(line))
-        print(f"Dataset loaded: {len(dataset)} examples")
-        return dataset
-
-    def _build_hash_counter(self) -> Counter:
-        all_hash_ids = []
-        for item in self.dataset:
-            all_hash_ids.extend(item["hash_ids"])
-        counter = Counter(all_hash_ids)
-        print(f"Hash counter built: {len(counter)} unique hash IDs")
-        return counter
+        trace = load_trace(self.dataset_path, use_cache=use_trace_cache)
+        print(f"Dataset loaded: {len(trace)} examples")
+        return trace
+
+    def _count_hash_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        unique_hash_ids, counts = np.unique(self.trace.hash_values, return_counts=True)
+        print(f"Hash counter built: {len(unique_hash_ids)} unique hash IDs")
+        return unique_hash_ids, counts
+
+    def _row_index(self) -> np.ndarray:
+        """Index of the request every entry of `trace.hash_values` belongs to."""
+        return np.repeat(np.arange(len(self.trace)), self.trace.num_hash_ids)
 
     def analyze(self) -> dict[str, list]:
         """
@@ -65,45 +72,37 @@ class PrefixAnalyzer:
             Tuple of lists: (input_lengths, prefix_lengths, user_prompt_lengths, output_lengths)
         """
         # Extract input and output lengths directly from fields
-        input_lengths = [item["input_length"] for item in self.dataset]
-        output_lengths = [item["output_length"] for item in self.dataset]
-
-        # Calculate prefix length and user prompt length for each row
-        prefix_lengths = []
-        user_prompt_lengths = []
-
-        for i, item in enumerate(self.dataset):
-            input_len = item["input_length"]
-            hash_ids = item["hash_ids"]
-            assert len(hash_ids) * self.block_size >= input_len
-
-            # Special case: if all hash IDs in the row are repeated elsewhere
-            if all(hash_id in self.repeated_hash_ids for hash_id in hash_ids):
-                prefix_len = input_len  # Set prefix length to input length
-                user_prompt_len = 0  # Set user prompt length to 0
-            else:
-                # Count how many hash IDs in this row are repeated elsewhere in the dataset
-                repeated_count = sum(
-                    1 for hash_id in hash_ids if hash_id in self.repeated_hash_ids
-                )
-                prefix_len = repeated_count * self.block_size
-                user_prompt_len = input_len - prefix_len
-
-            prefix_lengths.append(prefix_len)
-            user_prompt_lengths.append(user_prompt_len)
-
-            # Check if prefix length is greater than input length
-            if prefix_len > input_len:
-                print(f"WARNING: Line {i}: {json.dumps(item)}")
+        input_lengths = self.trace.input_lengths
+        output_lengths = self.trace.output_lengths
+        num_hash_ids = self.trace.num_hash_ids
+        assert np.all(num_hash_ids * self.block_size >= input_lengths)
+
+        # Count how many hash IDs in each row are repeated elsewhere in the dataset
+        is_repeated = np.isin(self.trace.hash_values, self.repeated_hash_ids)
+        repeated_count = np.bincount(
+            self._row_index(), weights=is_repeated, minlength=len(self.trace)
+        ).astype(np.int64)
+
+        # Special case: if all hash IDs in the row are repeated elsewhere,
+        # the prefix length is the input length and there is no user prompt
+        all_repeated = repeated_count == num_hash_ids
+        prefix_lengths = np.where(
+            all_repeated, input_lengths, repeated_count * self.block_size
+        )
+        user_prompt_lengths = input_lengths - prefix_lengths
+
+        # Check if prefix length is greater than input length
+        for i in np.flatnonzero(prefix_lengths > input_lengths):
+            print(f"WARNING: Line {i}: {json.dumps(self.trace.record(i))}")
 
         cache_hit_rates = self._analyze_cache_hit_rates()
 
         # Print statistics table
         metrics = {
-            "Input Length": input_lengths,
-            "Context Length": prefix_lengths,
-            "Unique Prompt Length": user_prompt_lengths,
-            "Output Length": output_lengths,
+            "Input Length": input_lengths.tolist(),
+            "Context Length": prefix_lengths.tolist(),
+            "Unique Prompt Length": user_prompt_lengths.tolist(),
+            "Output Length": output_lengths.tolist(),
             "Theoretical Hit Rates": cache_hit_rates,
         }
 
@@ -123,34 +122,92 @@ class PrefixAnalyzer:
         Returns:
             List of cache hit rates for each row in the dataset
         """
-        # Set to track all hash IDs we've seen
-        seen_hash_ids = set()
-
-        # Store cache hit rates for each row
-        cache_hit_rates = []
-
-        for item in self.dataset:
-            hash_ids = item["hash_ids"]
-
-            # Skip if there are no hash IDs
-            if len(hash_ids) == 0:
-                continue
-
-            # Find the first index where the hash ID hasn't been seen before
-            first_unseen_idx = len(hash_ids)  # Default if all are seen
-            for idx, hash_id in enumerate(hash_ids):
-                if hash_id not in seen_hash_ids:
-                    first_unseen_idx = idx
-                    break
+        offsets = self.trace.hash_offsets
+        num_hash_ids = self.trace.num_hash_ids
+        values = self.trace.hash_values
+        if len(values) == 0:
+            return []
+
+        # A hash ID is cached for a row if it first appeared in an earlier row
+        _, inverse = np.unique(values, return_inverse=True)
+        first_position = np.full(inverse.max() + 1, len(values), dtype=np.int64)
+        np.minimum.at(first_position, inverse, np.arange(len(values)))
+        row_index = self._row_index()
+        seen = first_position[inverse] < offsets[row_index]
+
+        # Find the first index in each row where the hash ID hasn't been seen before
+        position_in_row = np.arange(len(values)) - offsets[row_index]
+        first_unseen = np.where(seen, num_hash_ids[row_index], position_in_row)
+
+        # Skip rows without hash IDs; the remaining rows tile `values` contiguously
+        non_empty = num_hash_ids > 0
+        first_unseen_idx = np.minimum.reduceat(first_unseen, offsets[:-1][non_empty])
+        cache_hit_rates = first_unseen_idx / num_hash_ids[non_empty]
+        return cache_hit_rates.tolist()
+
+    def simulate_cache_hit_rates(
+        self,
+        capacities: Sequence[Optional[int]],
+        num_workers: int = 1,
+        eviction: str = "lru",
+        routing: str = "max_overlap",
+        seed: Optional[int] = None,
+    ) -> list[CacheSimulationResult]:
+        """
+        Replay the dataset through bounded per-worker caches and print the results.
 
-            # Calculate cache hit rate
-            cache_hit_rate = first_unseen_idx / len(hash_ids)
-            cache_hit_rates.append(cache_hit_rate)
+        Unlike `_analyze_cache_hit_rates`, blocks are evicted once a worker holds
+        `capacity` blocks, and every request only hits the cache of the worker it
+        is routed to.
 
-            # Add all hash IDs from this row to the seen set
-            seen_hash_ids.update(hash_ids)
+        Args:
+            capacities: Cache capacities in blocks per worker; None is unbounded
+            num_workers: Number of workers, each with its own cache
+            eviction: Eviction policy, "lru" or "lfu"
+            routing: Routing policy, "random", "round_robin" or "max_overlap"
+            seed: Seed for random routing and tie breaking
 
-        return cache_hit_rates
+        Returns:
+            One result per capacity, in the order of `capacities`
+        """
+        results = simulate_cache_hit_rates(
+            (hash_ids.tolist() for hash_ids in self.trace.iter_hash_ids()),
+            capacities,
+            num_workers=num_workers,
+            eviction=eviction,
+            routing=routing,
+            seed=seed,
+        )
+
+        print(
+            f"Simulated cache hit rates: {num_workers} workers, "
+            f"{eviction} eviction, {routing} routing"
+        )
+        rows = [
+            [
+                "inf" if result.capacity is None else result.capacity,
+                f"{result.hit_rate:.4f}",
+                int(result.evictions.sum()),
+                " ".join(f"{rate:.3f}" for rate in result.worker_hit_rates),
+                " ".join(str(count) for count in result.requests),
+            ]
+            for result in results
+        ]
+        print(
+            tabulate(
+                rows,
+                headers=[
+                    "Capacity (blocks/worker)",
+                    "Hit Rate",
+                    "Evictions",
+                    "Worker Hit Rates",
+                    "Worker Requests",
+                ],
+                tablefmt="pretty",
+            ),
+            "\n",
+        )
+        return results
 
 
 def main():
@@ -169,6 +226,42 @@ def main():
         default=512,
         help="Block size for prefix calculation (default: 512)",
     )
+    parser.add_argument(
+        "--trace-cache",
+        action="store_true",
+        help="Cache the parsed input trace in a .npz sidecar file to skip parsing on repeated runs",
+    )
+    parser.add_argument(
+        "--cache-capacities",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Also simulate bounded caches with these capacities in blocks per worker",
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Number of workers for the cache simulation (default: 1)",
+    )
+    parser.add_argument(
+        "--eviction",
+        choices=list(EVICTION_POLICIES),
+        default="lru",
+        help="Eviction policy for the cache simulation (default: lru)",
+    )
+    parser.add_argument(
+        "--routing",
+        choices=list(ROUTING_POLICIES),
+        default="max_overlap",
+        help="Routing policy for the cache simulation (default: max_overlap)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for the cache simulation",
+    )
     args = parser.parse_args()
 
     block_size = args.block_size
@@ -179,9 +272,20 @@ def main():
     print()
 
     # Create analyzer instance
-    analyzer = PrefixAnalyzer(dataset_path, block_size=block_size)
+    analyzer = PrefixAnalyzer(
+        dataset_path, block_size=block_size, use_trace_cache=args.trace_cache
+    )
     analyzer.analyze()
 
+    if args.cache_capacities:
+        analyzer.simulate_cache_hit_rates(
+            args.cache_capacities,
+            num_workers=args.num_workers,
+            eviction=args.eviction,
+            routing=args.routing,
+            seed=args.seed,
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -62,8 +62,16 @@ class EmpiricalSampler:
             logger.warning("Empty data provided to EmpiricalSampler")
         else:
             self.data, self.cdf = data_to_cdf(np.array(data))
+            self.data_array = np.array(self.data)
 
-    def sample(self) -> Any:
+    def sample(self, rng: Optional[Generator] = None) -> Any:
+        """Draw one sample, using the given generator or else the sampler's own."""
         if self.empty_data:
             return 0
-        return sample_from_cdf(self.data, self.cdf, self.rng)
+        return sample_from_cdf(self.data, self.cdf, self.rng if rng is None else rng)
+
+    def sample_batch(self, size: int, rng: Generator) -> np.ndarray:
+        """Draw `size` samples at once using the given generator."""
+        if self.empty_data:
+            return np.zeros(size, dtype=np.int64)
+        return self.data_array[np.searchsorted(self.cdf, rng.random(size))]
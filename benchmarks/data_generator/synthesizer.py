@@ -14,21 +14,83 @@
 # limitations under the License.
 
 import json
-from collections import Counter
-from typing import Any, Optional
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
 
-import networkx as nx
 import numpy as np
 import pandas as pd
 from data_generator.graph_utils import (
+    _build_tree,
     _mark_visited,
     _merge_chains,
     _precompute_transition_cdfs,
     _remove_leaves,
-    _verify_tree,
 )
-from data_generator.protocols import CACHE_END, END_NODE, SUPER_ROOT
-from data_generator.sampler import EmpiricalSampler, sample_from_cdf
+from data_generator.protocols import CACHE_END, END_NODE
+from data_generator.sampler import EmpiricalSampler
+from data_generator.trace_loader import load_trace
+from numpy.random import Generator
+
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_dumps = _stdlib_json_dumps
+
+
+# number of requests synthesized from one random stream; part of what makes
+# the output for a given seed independent of the number of workers
+REQUESTS_PER_BLOCK = 16384
+
+
+@dataclass
+class SynthesizedBlock:
+    """Columns of a block of synthesized requests, see `Synthesizer._synthesize_block`."""
+
+    timestamps: np.ndarray
+    end_timestamp: int
+    input_lengths: np.ndarray
+    output_lengths: np.ndarray
+    context_lengths: np.ndarray
+    leaf_lengths: np.ndarray
+    core_offsets: np.ndarray
+    core_ids: np.ndarray
+
+
+def _ranges_index(lengths: np.ndarray) -> np.ndarray:
+    """[0] * lengths[0] + [1] * lengths[1] + ..."""
+    return np.repeat(np.arange(len(lengths)), lengths)
+
+
+def _ranges_offset(lengths: np.ndarray) -> np.ndarray:
+    """[0, ..., lengths[0] - 1, 0, ..., lengths[1] - 1, ...]"""
+    starts = np.cumsum(lengths) - lengths
+    return np.arange(int(lengths.sum())) - np.repeat(starts, lengths)
+
+
+_worker_synthesizer: Optional["Synthesizer"] = None
+
+
+def _init_worker(synthesizer: "Synthesizer") -> None:
+    global _worker_synthesizer
+    _worker_synthesizer = synthesizer
+
+
+def _synthesize_block_in_worker(task) -> SynthesizedBlock:
+    num_requests, input_len_filter, block_seed = task
+    assert _worker_synthesizer is not None
+    return _worker_synthesizer._synthesize_block(
+        num_requests, input_len_filter, np.random.default_rng(block_seed)
+    )
 
 
 class Synthesizer:
@@ -40,6 +102,7 @@ class Synthesizer:
         prefix_root_multiplier: int = 1,
         prefix_len_multiplier: float = 1.0,
         prompt_len_multiplier: float = 1.0,
+        use_trace_cache: bool = False,
     ):
         """Load the mooncake dataset and extract core statistics like
         radix-tree structure, ISL, OSL, and request timings.
@@ -65,6 +128,8 @@ class Synthesizer:
             prompt_len_multiplier (float, optional): Multiplies the leaf path lengths by this factor
                 (rounded to integers). Use values < 1 to generate shorter prompts. Defaults to 1.
                 Note this does not affect the lengths of the core context prompts.
+            use_trace_cache (bool, optional): Cache the parsed trace columns in a `.npz` sidecar
+                next to the trace file so repeated runs skip parsing. Defaults to False.
 
         NOTE: currently may only work for the mooncake trace file,
             as it assumes consecutive integers
@@ -78,6 +143,8 @@ class Synthesizer:
         self.speedup_ratio = float(speedup_ratio)
         self.prefix_len_multiplier = float(prefix_len_multiplier)
         self.prompt_len_multiplier = float(prompt_len_multiplier)
+        # default generator of synthesize_path, seeded like EmpiricalSampler
+        self.rng = np.random.default_rng(0)
 
         # assert correct arg bounds
         assert (
@@ -96,50 +163,15 @@ class Synthesizer:
         ), "prompt_len_multiplier must be a positive float"
 
         # extract data from json file
-        with open(dataset_file, "r") as f:
-            hash_ids_list = []
-            timestamps = []
-            input_lens = []
-            output_lens = []
-            for line in f:
-                data = json.loads(line)
-                hash_ids_list.append(np.array(data["hash_ids"]))
-                timestamps.append(int(data["timestamp"]))
-                input_lens.append(np.array(data["input_length"]))
-                output_lens.append(int(data["output_length"]))
-
-        # represent prefix-tree as directed graph
-        self.G = nx.DiGraph()
-        max_hash_id = SUPER_ROOT
-        num_paths = 0
-
-        self.G.add_node(-1, end=0)
-        for hash_ids in hash_ids_list:
-            num_paths += 1
-            for i in range(len(hash_ids)):
-                u = hash_ids[i - 1] if i > 0 else SUPER_ROOT
-                v = hash_ids[i]
-                max_hash_id = max(v, max_hash_id)
-
-                if v in self.G:
-                    self.G.nodes[v]["visited"] += 1
-                else:
-                    self.G.add_node(v, visited=1, end=0)
-
-                if self.G.has_edge(u, v):
-                    self.G[u][v]["weight"] += 1
-                else:
-                    self.G.add_edge(u, v, weight=1)
-
-            self.G.nodes[v]["end"] += 1
-
-        self.G.nodes[SUPER_ROOT]["visited"] = num_paths
-        self.max_hash_id = max_hash_id
-
-        _verify_tree(self.G)
-        _mark_visited(self.G)
-        self.G = _merge_chains(self.G)  # make graph radix-like
-        self.G, leaves_lens = _remove_leaves(self.G)
+        trace = load_trace(dataset_file, use_cache=use_trace_cache)
+
+        # represent prefix-tree as an array-backed tree
+        self.tree = _build_tree(trace)
+        self.max_hash_id = int(self.tree.node_ids[-1])
+
+        _mark_visited(self.tree)
+        self.tree = _merge_chains(self.tree)  # make tree radix-like
+        self.tree, leaves_lens = _remove_leaves(self.tree)
 
         # Apply prompt_len_multiplier to leaves_lens
         if self.prompt_len_multiplier != 1:
@@ -150,48 +182,49 @@ class Synthesizer:
 
         self.leaves_lens_sampler = EmpiricalSampler(leaves_lens)
         self._relabel_nodes()
-        self.G = _precompute_transition_cdfs(self.G)
+        # copies of the core tree are shifted by multiples of this range
+        self.core_max_hash_id = self.max_hash_id
+        self.tree = _precompute_transition_cdfs(self.tree)
+        # plain lists make the per-hop lookups in synthesize_path cheap
+        self._out_offsets = self.tree.out_offsets.tolist()
+        self._out_nodes = self.tree.out_nodes.tolist()
+        self._out_cdf = self.tree.out_cdf.tolist()
+        self._node_ids = self.tree.node_ids.tolist()
+        self._lengths = self.tree.length.tolist()
 
         # get statistics of timing, request counts, ISL, and OSL
-        request_counts = list(Counter(timestamps).values())
+        _, request_counts = np.unique(trace.timestamps, return_counts=True)
         self.request_counts_sampler = EmpiricalSampler(request_counts)
-        timedeltas = np.diff(timestamps)
+        timedeltas = np.diff(trace.timestamps)
         timedeltas = timedeltas[timedeltas > 0]
         self.timedeltas_sampler = EmpiricalSampler(timedeltas)
-        input_lens_mod = np.array(
-            [
-                input_len - (len(hash_ids) - 1) * block_size
-                for input_len, hash_ids in zip(input_lens, hash_ids_list)
-            ]
-        )
+        input_lens_mod = trace.input_lengths - (trace.num_hash_ids - 1) * block_size
         assert np.all(0 < input_lens_mod) and np.all(input_lens_mod <= self.block_size)
         self.input_lens_mod_sampler = EmpiricalSampler(input_lens_mod)
-        self.output_lens_sampler = EmpiricalSampler(output_lens)
+        self.output_lens_sampler = EmpiricalSampler(trace.output_lengths)
 
     def _relabel_nodes(self) -> None:
         # Scale node labels by length multiplier if needed
         if self.prefix_len_multiplier > 1:
             multiplier = int(np.ceil(self.prefix_len_multiplier))
 
-            # Create mapping for relabeling, preserving -1 and -2
-            mapping = {
-                node: (node if node < 0 else node * multiplier + multiplier)
-                for node in self.G.nodes()
-            }
-            self.G = nx.relabel_nodes(self.G, mapping)
+            # Relabel, preserving the root; this keeps the node ids sorted
+            node_ids = self.tree.node_ids
+            self.tree.node_ids = np.where(
+                node_ids < 0, node_ids, node_ids * multiplier + multiplier
+            )
             # Update max_hash_id
             self.max_hash_id = multiplier * self.max_hash_id + multiplier
 
         # Shrink the lengths, but no need to relabel nodes
         elif self.prefix_len_multiplier < 1:
-            for node in self.G.nodes():
-                self.G.nodes[node]["length"] = max(
-                    round(self.G.nodes[node]["length"] * self.prefix_len_multiplier), 1
-                )
+            self.tree.length = np.maximum(
+                np.round(self.tree.length * self.prefix_len_multiplier), 1
+            ).astype(np.int64)
 
-    def _synthesize_leaf_path(self) -> list[int]:
+    def _synthesize_leaf_path(self, rng: Generator) -> list[int]:
         # Sample the leaf path length
-        leaf_length = self.leaves_lens_sampler.sample()
+        leaf_length = self.leaves_lens_sampler.sample(rng)
 
         # Generate new nodes starting from max_hash_id + 1
         path = [int(self.max_hash_id + 1 + i) for i in range(leaf_length)]
@@ -201,10 +234,16 @@ class Synthesizer:
 
         return path
 
-    def synthesize_path(self) -> tuple[list[int], bool, int]:
+    def synthesize_path(
+        self, rng: Optional[Generator] = None
+    ) -> tuple[list[int], bool, int]:
         """
         Synthesizes a path through the core radix tree, optionally appending a unique user prompt (leaf path).
 
+        Args:
+            rng (Generator, optional): Generator to draw the path from, e.g. the one of a seeded
+                block in `iter_requests`. Defaults to the synthesizer's own generator, seeded with 0.
+
         Returns:
             tuple:
                 - list[int]: The full path as a list of hash_ids. This consists of the cached (core) hash_ids,
@@ -212,18 +251,28 @@ class Synthesizer:
                 - bool: Whether the path contains a leaf path (i.e., new unique hash_ids were appended).
                 - int: The context length, defined as the number of cached hash_ids multiplied by block_size.
         """
-        # Start from root node (-1)
-        current_node = SUPER_ROOT
+        out_offsets = self._out_offsets
+        out_nodes = self._out_nodes
+        out_cdf = self._out_cdf
+        if rng is None:
+            rng = self.rng
+
+        # Start from root node (-1), which has dense index 0
+        current_node = 0
         path: list[int] = []
         context_len = 0
 
         # Continue until we reach a node with no outgoing edges
         while True:
             # Use precomputed CDFs for efficient sampling
-            next_node = sample_from_cdf(
-                self.G.nodes[current_node]["out_nodes"],
-                self.G.nodes[current_node]["out_cdf"],
-            )
+            next_node = out_nodes[
+                bisect_left(
+                    out_cdf,
+                    rng.random(),
+                    out_offsets[current_node],
+                    out_offsets[current_node + 1],
+                )
+            ]
 
             # end early
             # break and start sampling unique user prompt
@@ -236,85 +285,291 @@ class Synthesizer:
             # otherwise continue down prefix tree
 
             # Get the length of the contracted path
-            length = self.G.nodes[next_node]["length"]
+            length = self._lengths[next_node]
             context_len += length * self.block_size
 
             # Add all intermediate nodes
-            for i in range(length):
-                path.append(int(next_node - (length - 1) + i))
+            last_id = self._node_ids[next_node]
+            path.extend(range(last_id - (length - 1), last_id + 1))
 
             current_node = next_node
 
-        unique_user_prompt = self._synthesize_leaf_path()
+        unique_user_prompt = self._synthesize_leaf_path(rng)
         # Append a leaf path at the end
         return path + unique_user_prompt, True, context_len
 
-    def synthesize_requests(
-        self, num_requests: int, input_len_filter: Optional[int] = None
-    ) -> list[dict[str, Any]]:
-        timestamp = 0
-
-        requests: list[dict[str, Any]] = []
-        request_id = 0
-
-        while request_id < num_requests:
-            requests_per_interval = self.request_counts_sampler.sample()
-
-            for _ in range(requests_per_interval):
-                path, leaf_flag, context_len = self.synthesize_path()
-                if leaf_flag:
-                    input_len = (
-                        len(path) - 1
-                    ) * self.block_size + self.input_lens_mod_sampler.sample()
-                else:
-                    input_len = len(path) * self.block_size
-                output_len = self.output_lens_sampler.sample()
-
-                if input_len_filter is not None and input_len > input_len_filter:
-                    continue
-                requests.append(
-                    {
-                        "timestamp": int(timestamp),
-                        "input_length": int(input_len),
-                        "output_length": int(output_len),
-                        "hash_ids": path,
-                        "context_len": int(context_len),
-                        "unique_user_prompt_len": int(input_len - context_len),
-                    }
-                )
-                request_id += 1
-                if request_id >= num_requests:
-                    break
+    def _sample_core_paths(
+        self, size: int, rng: Generator
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Walk `size` paths through the core radix tree at once, one hop per pass.
+
+        Returns the CSR offsets and dense node indices of the visited nodes of
+        every path, and whether each path continues into a unique user prompt.
+        """
+        tree = self.tree
+        out_offsets, out_nodes, out_cdf = tree.out_offsets, tree.out_nodes, tree.out_cdf
+        search_steps = int(np.diff(out_offsets).max()).bit_length()
+
+        current = np.zeros(size, dtype=np.int64)
+        active = np.arange(size)
+        leaf_flags = np.zeros(size, dtype=bool)
+        hop_walkers = []
+        hop_nodes = []
+        while active.size:
+            # vectorized bisect_left of a uniform draw within each node's CDF segment
+            r = rng.random(active.size)
+            lo = out_offsets[current[active]]
+            hi = out_offsets[current[active] + 1]
+            for _ in range(search_steps):
+                mid = (lo + hi) // 2
+                go_right = (lo < hi) & (out_cdf[np.minimum(mid, len(out_cdf) - 1)] < r)
+                lo = np.where(go_right, mid + 1, lo)
+                hi = np.where(go_right, hi, mid)
+            next_nodes = out_nodes[lo]
+
+            leaf_flags[active[next_nodes == CACHE_END]] = True
+            descend = next_nodes >= 0
+            active = active[descend]
+            current[active] = next_nodes[descend]
+            hop_walkers.append(active)
+            hop_nodes.append(next_nodes[descend])
+
+        walkers = np.concatenate(hop_walkers)
+        order = np.argsort(walkers, kind="stable")
+        path_offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(walkers, minlength=size), out=path_offsets[1:])
+        return path_offsets, np.concatenate(hop_nodes)[order], leaf_flags
+
+    def _synthesize_block(
+        self, num_requests: int, input_len_filter: Optional[int], rng: Generator
+    ) -> "SynthesizedBlock":
+        """
+        Synthesize `num_requests` requests from a single random stream. Timestamps
+        start at 0 and unique user prompts are described by their lengths only,
+        see `iter_requests` for how blocks are stitched together.
+        """
+        # draw candidates until enough of them pass the input length filter
+        rounds: list[dict[str, np.ndarray]] = []
+        num_accepted = 0
+        while num_accepted < num_requests:
+            size = num_requests - num_accepted
+            path_offsets, nodes, leaf_flags = self._sample_core_paths(size, rng)
+
+            # expand the contracted nodes into the hash ids of their blocks
+            node_lengths = self.tree.length[nodes]
+            first_ids = self.tree.node_ids[nodes] - node_lengths + 1
+            core_ids = first_ids[_ranges_index(node_lengths)] + _ranges_offset(
+                node_lengths
+            )
+            node_ends = np.concatenate(([0], np.cumsum(node_lengths)))
+            core_offsets = node_ends[path_offsets]
+            core_len = np.diff(core_offsets)
 
-            timestamp += round(self.timedeltas_sampler.sample() / self.speedup_ratio)
+            leaf_len = np.where(
+                leaf_flags, self.leaves_lens_sampler.sample_batch(size, rng), 0
+            )
+            input_len = np.where(
+                leaf_flags,
+                (core_len + leaf_len - 1) * self.block_size
+                + self.input_lens_mod_sampler.sample_batch(size, rng),
+                core_len * self.block_size,
+            )
+            output_len = self.output_lens_sampler.sample_batch(size, rng)
+            copies = (
+                rng.integers(0, self.num_copies, size)
+                if self.num_copies > 1
+                else np.zeros(size, dtype=np.int64)
+            )
+            accepted = (
+                input_len <= input_len_filter
+                if input_len_filter is not None
+                else np.ones(size, dtype=bool)
+            )
+            rounds.append(
+                {
+                    "core_len": core_len,
+                    "core_ids": core_ids,
+                    "leaf_len": leaf_len,
+                    "input_len": input_len,
+                    "output_len": output_len,
+                    "copies": copies,
+                    "accepted": accepted,
+                }
+            )
+            num_accepted += int(accepted.sum())
+
+        columns = {key: np.concatenate([r[key] for r in rounds]) for key in rounds[0]}
+
+        # filtered candidates still take up their slot in the arrival process,
+        # candidates after the last needed request are dropped entirely
+        accepted = columns["accepted"]
+        num_candidates = int(np.flatnonzero(accepted)[num_requests - 1]) + 1
+        request_counts = np.maximum(
+            self.request_counts_sampler.sample_batch(num_candidates, rng), 1
+        )
+        interval = np.searchsorted(
+            np.cumsum(request_counts), np.arange(num_candidates), side="right"
+        )
+        timedeltas = np.round(
+            self.timedeltas_sampler.sample_batch(interval[-1] + 1, rng)
+            / self.speedup_ratio
+        ).astype(np.int64)
+        interval_starts = np.concatenate(([0], np.cumsum(timedeltas)))
+        keep = np.flatnonzero(accepted[:num_candidates])
+
+        # select the core hash ids of the kept requests and shift them to their copy
+        core_len = columns["core_len"]
+        core_starts = np.concatenate(([0], np.cumsum(core_len)[:-1]))
+        kept_len = core_len[keep]
+        core_ids = columns["core_ids"][
+            np.repeat(core_starts[keep], kept_len) + _ranges_offset(kept_len)
+        ]
+        core_ids += np.repeat(
+            columns["copies"][keep] * (self.core_max_hash_id + 1), kept_len
+        )
 
-        # Adjust hash_ids if num_copies > 1
-        if self.num_copies > 1:
-            for request in requests:
-                offset = (np.random.randint(0, self.num_copies)) * (
-                    self.max_hash_id + 1
+        return SynthesizedBlock(
+            timestamps=interval_starts[interval[keep]],
+            end_timestamp=int(interval_starts[interval[-1] + 1]),
+            input_lengths=columns["input_len"][keep],
+            output_lengths=columns["output_len"][keep],
+            context_lengths=kept_len * self.block_size,
+            leaf_lengths=columns["leaf_len"][keep],
+            core_offsets=np.concatenate(([0], np.cumsum(kept_len))),
+            core_ids=core_ids,
+        )
+
+    def iter_requests(
+        self,
+        num_requests: int,
+        input_len_filter: Optional[int] = None,
+        seed: Optional[int] = None,
+        num_workers: int = 1,
+        requests_per_block: int = REQUESTS_PER_BLOCK,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily synthesize requests in blocks of `requests_per_block`.
+
+        Every block draws from its own `np.random.Generator`, spawned from `seed`,
+        so the output for a given seed and block size does not depend on
+        `num_workers`. With more than one worker, blocks are synthesized in a
+        process pool and yielded in order as they complete.
+        """
+        num_blocks = -(-num_requests // requests_per_block)
+        block_sizes = [
+            min(requests_per_block, num_requests - i * requests_per_block)
+            for i in range(num_blocks)
+        ]
+        block_seeds = np.random.SeedSequence(seed).spawn(num_blocks)
+        tasks = [
+            (size, input_len_filter, block_seed)
+            for size, block_seed in zip(block_sizes, block_seeds)
+        ]
+
+        # unique user prompts get fresh hash ids above every copy of the core tree
+        next_leaf_id = max(
+            self.num_copies * (self.core_max_hash_id + 1), self.max_hash_id + 1
+        )
+        timestamp_offset = 0
+        for block in self._map_blocks(tasks, num_workers):
+            leaf_offsets = np.zeros(len(block.leaf_lengths) + 1, dtype=np.int64)
+            np.cumsum(block.leaf_lengths, out=leaf_offsets[1:])
+            leaf_offsets += next_leaf_id
+
+            # plain Python lists make building the per-request dicts cheap
+            core_ids = block.core_ids.tolist()
+            core_offsets = block.core_offsets.tolist()
+            leaf_bounds = leaf_offsets.tolist()
+            rows = zip(
+                (block.timestamps + timestamp_offset).tolist(),
+                block.input_lengths.tolist(),
+                block.output_lengths.tolist(),
+                block.context_lengths.tolist(),
+            )
+            for i, (timestamp, input_len, output_len, context_len) in enumerate(rows):
+                hash_ids = core_ids[core_offsets[i] : core_offsets[i + 1]]
+                hash_ids.extend(range(leaf_bounds[i], leaf_bounds[i + 1]))
+                yield {
+                    "timestamp": timestamp,
+                    "input_length": input_len,
+                    "output_length": output_len,
+                    "hash_ids": hash_ids,
+                    "context_len": context_len,
+                    "unique_user_prompt_len": input_len - context_len,
+                }
+            next_leaf_id = leaf_bounds[-1]
+            self.max_hash_id = max(self.max_hash_id, next_leaf_id - 1)
+            timestamp_offset += block.end_timestamp
+
+    def _map_blocks(
+        self, tasks: list, num_workers: int
+    ) -> Iterator["SynthesizedBlock"]:
+        if num_workers <= 1:
+            for num_requests, input_len_filter, block_seed in tasks:
+                yield self._synthesize_block(
+                    num_requests, input_len_filter, np.random.default_rng(block_seed)
                 )
-                request["hash_ids"] = [
-                    int(hash_id + offset) for hash_id in request["hash_ids"]
-                ]
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            # bound the number of blocks in flight so results are streamed
+            pending: deque = deque()
+            for task in tasks:
+                pending.append(executor.submit(_synthesize_block_in_worker, task))
+                if len(pending) >= 2 * num_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def synthesize_requests(
+        self,
+        num_requests: int,
+        input_len_filter: Optional[int] = None,
+        seed: Optional[int] = None,
+        num_workers: int = 1,
+    ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_requests(num_requests, input_len_filter, seed, num_workers)
+        )
 
-        return requests
+    def write_requests(
+        self,
+        output_file: str,
+        num_requests: int,
+        input_len_filter: Optional[int] = None,
+        seed: Optional[int] = None,
+        num_workers: int = 1,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream synthesized requests to `output_file` in jsonl format as they are
+        produced, yielding every written request (without materializing them all).
+        """
+        with open(output_file, "wb") as f:
+            for request in self.iter_requests(
+                num_requests, input_len_filter, seed, num_workers
+            ):
+                f.write(_json_dumps(request) + b"\n")
+                yield request
 
     def __repr__(self) -> str:
-        path_lengths = nx.single_source_shortest_path_length(self.G, -1)
-        core_radix_tree_size = len(self.G) - 1
-        core_radix_tree_depth = max(path_lengths.values()) if path_lengths else 0
+        core_radix_tree_size = len(self.tree) - 1
+        core_radix_tree_depth = int(self.tree.depths().max())
 
         rep = "MooncakeSynth("
         rep += f"core_radix_tree_size={core_radix_tree_size}, "
         rep += f"core_radix_tree_depth={core_radix_tree_depth}, "
         rep += f"block_size={self.block_size})"
 
-        children = list(self.G.successors(-1))
+        children = self.tree.children(0)
         data = {
-            "Child Node": children,
-            "Visited Count": [self.G.nodes[child]["visited"] for child in children],
-            "Length": [self.G.nodes[child].get("length", "N/A") for child in children],
+            "Child Node": self.tree.node_ids[children],
+            "Visited Count": self.tree.visited[children],
+            "Length": self.tree.length[children],
         }
         df = pd.DataFrame(data)
         df = df[df["Visited Count"] >= 5]
@@ -385,6 +640,23 @@ def main():
         default=512,
         help="Block size for prefilling and decoding (default: 512)",
     )
+    parser.add_argument(
+        "--trace-cache",
+        action="store_true",
+        help="Cache the parsed input trace in a .npz sidecar file to skip parsing on repeated runs",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed; the output for a given seed does not depend on --num-workers (default: None, random)",
+    )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used for synthesis (default: 1)",
+    )
     parser.add_argument(
         "--output-file",
         type=str,
@@ -412,29 +684,36 @@ def main():
         prefix_len_multiplier=args.prefix_len_multiplier,
         prefix_root_multiplier=args.prefix_root_multiplier,
         prompt_len_multiplier=args.prompt_len_multiplier,
+        use_trace_cache=args.trace_cache,
     )
 
     print("synthesizing requests...", flush=True)
-    requests = synthesizer.synthesize_requests(args.num_requests, args.max_isl)
-    print(f"synthesized {len(requests)} requests")
+    # requests are written as they are produced; only keep what the statistics need
+    metrics: dict[str, list] = {
+        "Input Length": [],
+        "Context Length": [],
+        "Unique Prompt Length": [],
+        "Output Length": [],
+    }
+    for request in synthesizer.write_requests(
+        str(output_file),
+        args.num_requests,
+        args.max_isl,
+        seed=args.seed,
+        num_workers=args.num_workers,
+    ):
+        metrics["Input Length"].append(request["input_length"])
+        metrics["Context Length"].append(request["context_len"])
+        metrics["Unique Prompt Length"].append(request["unique_user_prompt_len"])
+        metrics["Output Length"].append(request["output_length"])
+    print(f"synthesized {len(metrics['Input Length'])} requests")
 
     # Print statistics in a single table with metrics as rows and statistics as columns
     print("\n###### Synthesized Statistics ######")
 
-    # Extract all values first
-    metrics = {
-        "Input Length": [req["input_length"] for req in requests],
-        "Context Length": [req["context_len"] for req in requests],
-        "Unique Prompt Length": [req["unique_user_prompt_len"] for req in requests],
-        "Output Length": [req["output_length"] for req in requests],
-    }
-
     # Calculate statistics for each metric
     calculate_and_print_statistics(metrics)
 
-    with open(output_file, "w") as f:
-        for request in requests:
-            f.write(json.dumps(request) + "\n")
     print(f"synthetic dataset saved at {Path(output_file).resolve()}")
 
 
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import random
+import tempfile
+
+import numpy as np
+import pytest
+from data_generator.cache_simulator import (
+    BlockCache,
+    CacheSimulator,
+    LFUBlockCache,
+    LRUBlockCache,
+    simulate_cache_hit_rates,
+)
+from data_generator.prefix_analyzer import PrefixAnalyzer
+
+
+def test_block_cache_requires_eviction_policy():
+    class NoEvictionCache(BlockCache):
+        def __len__(self):
+            return 0
+
+        def __contains__(self, hash_id):
+            return False
+
+        def _touch(self, hash_id):
+            pass
+
+    with pytest.raises(TypeError):
+        NoEvictionCache(capacity=1)
+
+
+def test_lru_evicts_tail_before_prefix():
+    cache = LRUBlockCache(capacity=3)
+    cache.insert([0, 1, 2])
+    cache.insert([0, 1, 3])
+    # the tail of the first request is the least recently used block
+    assert 2 not in cache
+    assert cache.match_prefix([0, 1, 3]) == 3
+    assert cache.evictions == 1
+
+    cache.insert([4, 5])
+    assert len(cache) == 3
+    assert cache.evictions == 3
+    assert cache.match_prefix([0, 1]) == 1
+
+
+def test_lfu_keeps_frequent_blocks():
+    cache = LFUBlockCache(capacity=3)
+    for _ in range(3):
+        cache.insert([0, 1])
+    cache.insert([2])
+    cache.insert([3])
+    assert cache.match_prefix([0, 1]) == 2
+    assert 2 not in cache and 3 in cache
+    assert cache.evictions == 1
+
+
+def test_max_overlap_routes_to_cached_prefix():
+    simulator = CacheSimulator(
+        capacity=None, num_workers=4, routing="max_overlap", seed=0
+    )
+    worker_id = simulator.process([0, 1, 2])
+    for _ in range(10):
+        assert simulator.process([0, 1, 2, 3]) == worker_id
+    assert simulator.result.hit_blocks[worker_id] == 3 + 9 * 4
+    assert simulator.result.requests.sum() == 11
+
+
+def test_round_robin_spreads_requests():
+    simulator = CacheSimulator(capacity=8, num_workers=3, routing="round_robin")
+    for _ in range(9):
+        simulator.process([0, 1])
+    assert simulator.result.requests.tolist() == [3, 3, 3]
+    assert simulator.result.hit_blocks.tolist() == [4, 4, 4]
+
+
+def test_hit_rate_grows_with_capacity():
+    rng = random.Random(0)
+    requests = [
+        [rng.randrange(20)] + [1000 + rng.randrange(50) for _ in range(3)]
+        for _ in range(500)
+    ]
+    results = simulate_cache_hit_rates(
+        requests, [4, 16, 64, None], num_workers=2, routing="random", seed=0
+    )
+    hit_rates = [result.hit_rate for result in results]
+    assert hit_rates == sorted(hit_rates)
+    assert results[-1].evictions.sum() == 0
+    assert results[0].evictions.sum() > 0
+
+
+def test_unbounded_single_worker_matches_theoretical_hit_rates():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
+        rng = random.Random(0)
+        for i in range(200):
+            hash_ids = [0, 1, 2][: rng.randrange(4)] + [
+                100 + rng.randrange(30) for _ in range(rng.randrange(1, 4))
+            ]
+            record = {
+                "timestamp": i,
+                "input_length": len(hash_ids),
+                "output_length": 1,
+                "hash_ids": hash_ids,
+            }
+            tmp.write(json.dumps(record) + "\n")
+
+    analyzer = PrefixAnalyzer(tmp.name, block_size=1)
+    (result,) = analyzer.simulate_cache_hit_rates([None], num_workers=1)
+    theoretical = np.array(analyzer._analyze_cache_hit_rates())
+    num_hash_ids = analyzer.trace.num_hash_ids
+    assert result.hit_blocks.sum() == round(
+        (theoretical * num_hash_ids[num_hash_ids > 0]).sum()
+    )
+
+    os.unlink(tmp.name)
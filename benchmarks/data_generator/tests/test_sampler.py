@@ -44,3 +44,16 @@ def test_empirical_sampler_distribution():
         2,
         3,
     }, f"Unexpected values in samples: {set(counts.keys()) - {1, 2, 3}}"
+
+
+def test_empirical_sampler_batch_is_seeded():
+    sampler = EmpiricalSampler(np.array([1, 2, 3, 1, 2, 3, 1, 2, 3]))
+
+    samples = sampler.sample_batch(3000, np.random.default_rng(0))
+    counts = Counter(samples.tolist())
+    assert set(counts.keys()) == {1, 2, 3}
+    for value in [1, 2, 3]:
+        assert 900 <= counts[value] <= 1100
+
+    repeated = sampler.sample_batch(3000, np.random.default_rng(0))
+    assert np.array_equal(samples, repeated)
@@ -19,6 +19,7 @@ import random
 import tempfile
 import unittest
 
+import numpy as np
 from data_generator.synthesizer import Synthesizer
 
 
@@ -38,15 +39,17 @@ def dump_record(handle, hash_ids, block_size=512):
 
 
 def check_attributes(
-    graph,
+    tree,
     node,
     expected_children,
     expected_visited=None,
     expected_length=None,
     expected_to_leaf=None,
 ):
+    i = tree.index(node)
+
     # Check children
-    actual_children = list(graph.successors(node))
+    actual_children = tree.successors(node)
     assert sorted(actual_children) == sorted(
         expected_children
     ), f"Node {node} has children {actual_children}, expected {expected_children}"
@@ -54,20 +57,20 @@ def check_attributes(
     # Check 'visited' attribute if expected
     if expected_visited is not None:
         assert (
-            graph.nodes[node].get("visited") == expected_visited
-        ), f"Node {node} has 'visited' value {graph.nodes[node].get('visited')}, expected {expected_visited}"
+            tree.visited[i] == expected_visited
+        ), f"Node {node} has 'visited' value {tree.visited[i]}, expected {expected_visited}"
 
     # Check 'length' attribute if expected
     if expected_length is not None:
         assert (
-            graph.nodes[node].get("length") == expected_length
-        ), f"Node {node} has 'length' value {graph.nodes[node].get('length')}, expected {expected_length}"
+            tree.length[i] == expected_length
+        ), f"Node {node} has 'length' value {tree.length[i]}, expected {expected_length}"
 
     # Check 'to_leaf' attribute if expected
     if expected_to_leaf is not None:
         assert (
-            graph.nodes[node].get("to_leaf") == expected_to_leaf
-        ), f"Node {node} has 'to_leaf' value {graph.nodes[node].get('to_leaf')}, expected {expected_to_leaf}"
+            tree.to_leaf[i] == expected_to_leaf
+        ), f"Node {node} has 'to_leaf' value {tree.to_leaf[i]}, expected {expected_to_leaf}"
 
     return True
 
@@ -84,7 +87,7 @@ def test_graph_structure():
 
     # Create the Synthesizer with the temporary file
     synthesizer = Synthesizer(tmp.name, block_size=512)
-    G = synthesizer.G
+    G = synthesizer.tree
 
     # Verify the graph structure
     check_attributes(G, -1, [1, 8], 6, None, 1)
@@ -96,5 +99,106 @@ def test_graph_structure():
     os.unlink(tmp.name)
 
 
+def test_synthesized_paths_follow_tree():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
+        dump_record(tmp, [0, 1])
+        dump_record(tmp, [0, 1, 2, 3, 4])
+        dump_record(tmp, [0, 1, 2, 3, 4, 5, 6])
+        dump_record(tmp, [7, 8])
+        dump_record(tmp, [7, 8, 9, 10])
+        dump_record(tmp, [11, 12])
+
+    synthesizer = Synthesizer(tmp.name, block_size=512)
+    max_hash_id = synthesizer.max_hash_id
+    core_prefixes: tuple[list[int], ...] = ([], [0, 1], [0, 1, 2, 3, 4], [7, 8])
+    for _ in range(200):
+        path, leaf_flag, context_len = synthesizer.synthesize_path()
+        core = path[: context_len // 512]
+        assert core in core_prefixes
+        # anything after the core prefix is a fresh unique user prompt
+        unique = path[len(core) :]
+        assert leaf_flag == bool(unique)
+        assert all(hash_id > max_hash_id for hash_id in unique)
+
+    os.unlink(tmp.name)
+
+
+def test_synthesize_path_uses_given_generator():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
+        dump_record(tmp, [0, 1])
+        dump_record(tmp, [0, 1, 2, 3, 4])
+        dump_record(tmp, [7, 8])
+        dump_record(tmp, [7, 8, 9, 10])
+        dump_record(tmp, [11, 12])
+
+    def paths(seed):
+        synthesizer = Synthesizer(tmp.name, block_size=512)
+        rng = np.random.default_rng(seed)
+        return [synthesizer.synthesize_path(rng) for _ in range(50)]
+
+    # the global random state plays no part in the paths
+    np.random.seed(1)
+    first = paths(42)
+    np.random.seed(2)
+    assert paths(42) == first
+    assert paths(43) != first
+
+    os.unlink(tmp.name)
+
+
+def test_seeded_synthesis_is_independent_of_workers():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
+        for i in range(50):
+            dump_record(tmp, [0, 1, 2 + i % 5])
+            dump_record(tmp, [100, 101, 102][: 1 + i % 3])
+
+    synthesizer = Synthesizer(tmp.name, block_size=512)
+    kwargs = dict(num_requests=500, seed=7, requests_per_block=64)
+    sequential = list(synthesizer.iter_requests(num_workers=1, **kwargs))
+    parallel = list(synthesizer.iter_requests(num_workers=2, **kwargs))
+    assert sequential == parallel
+    assert len(sequential) == 500
+
+    timestamps = [request["timestamp"] for request in sequential]
+    assert timestamps == sorted(timestamps)
+
+    # unique user prompts never collide with each other or with the core tree
+    unique_ids = [
+        hash_id
+        for request in sequential
+        for hash_id in request["hash_ids"][request["context_len"] // 512 :]
+    ]
+    assert len(unique_ids) == len(set(unique_ids))
+    assert min(unique_ids, default=synthesizer.core_max_hash_id + 1) > (
+        synthesizer.core_max_hash_id
+    )
+
+    os.unlink(tmp.name)
+
+
+def test_write_requests_respects_input_len_filter():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
+        for i in range(50):
+            dump_record(tmp, [0, 1, 2, 3][: 1 + i % 4])
+
+    synthesizer = Synthesizer(tmp.name, block_size=512)
+    with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as out:
+        pass
+    written = list(
+        synthesizer.write_requests(
+            out.name, num_requests=200, input_len_filter=1024, seed=3
+        )
+    )
+
+    with open(out.name) as f:
+        loaded = [json.loads(line) for line in f]
+    assert loaded == written
+    assert len(loaded) == 200
+    assert all(request["input_length"] <= 1024 for request in loaded)
+
+    os.unlink(tmp.name)
+    os.unlink(out.name)
+
+
 if __name__ == "__main__":
     unittest.main()
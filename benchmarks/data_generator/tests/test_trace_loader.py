@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import numpy as np
+from data_generator import trace_loader
+from data_generator.prefix_analyzer import PrefixAnalyzer
+from data_generator.trace_loader import load_trace, trace_cache_path
+
+RECORDS = [
+    {"timestamp": 0, "input_length": 20, "output_length": 5, "hash_ids": [0, 1, 2]},
+    {"timestamp": 0, "input_length": 20, "output_length": 7, "hash_ids": [0, 1, 3]},
+    {"timestamp": 10, "input_length": 3, "output_length": 2, "hash_ids": [4]},
+    {"timestamp": 25, "input_length": 0, "output_length": 1, "hash_ids": []},
+    {"timestamp": 30, "input_length": 12, "output_length": 9, "hash_ids": [0, 4]},
+]
+
+
+def write_trace(path):
+    with open(path, "w") as f:
+        for record in RECORDS:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+def test_columns_match_records(tmp_path):
+    trace = load_trace(write_trace(tmp_path / "trace.jsonl"), chunk_size=2)
+
+    assert len(trace) == len(RECORDS)
+    assert trace.hash_offsets.tolist() == [0, 3, 6, 7, 7, 9]
+    assert trace.num_hash_ids.tolist() == [3, 3, 1, 0, 2]
+    for i, record in enumerate(RECORDS):
+        assert trace.record(i) == record
+
+
+def test_sidecar_cache(tmp_path):
+    trace_file = write_trace(tmp_path / "trace.jsonl")
+    parsed = load_trace(trace_file, use_cache=True)
+    assert trace_cache_path(trace_file).exists()
+
+    cached = load_trace(trace_file, use_cache=True)
+    np.testing.assert_array_equal(cached.hash_values, parsed.hash_values)
+    np.testing.assert_array_equal(cached.timestamps, parsed.timestamps)
+
+    # a modified trace invalidates the sidecar
+    with open(trace_file, "a") as f:
+        f.write(json.dumps(RECORDS[0]) + "\n")
+    assert len(load_trace(trace_file, use_cache=True)) == len(RECORDS) + 1
+
+
+def test_failed_cache_write_leaves_no_file(tmp_path, monkeypatch):
+    trace_file = write_trace(tmp_path / "trace.jsonl")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(trace_loader.os, "replace", fail_replace)
+    trace = load_trace(trace_file, use_cache=True)
+
+    assert len(trace) == len(RECORDS)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["trace.jsonl"]
+
+
+def test_prefix_analyzer_hit_rates(tmp_path):
+    analyzer = PrefixAnalyzer(str(write_trace(tmp_path / "trace.jsonl")), block_size=8)
+
+    assert analyzer.repeated_hash_ids.tolist() == [0, 1, 4]
+    # empty rows are skipped; [0, 4] is fully cached by the time it arrives
+    assert analyzer._analyze_cache_hit_rates() == [0.0, 2 / 3, 0.0, 1.0]
+
+    metrics = analyzer.analyze()
+    assert metrics["Context Length"] == [16, 16, 3, 0, 12]
+    assert metrics["Unique Prompt Length"] == [4, 4, 0, 0, 0]
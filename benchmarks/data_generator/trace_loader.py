@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming, columnar loader for mooncake-style jsonl traces.
+
+The trace is parsed in chunks of lines straight into typed columns, so memory
+stays proportional to the columns rather than to one Python dict per request.
+The variable-length hash_ids are stored CSR-style: the hash ids of request i are
+`hash_values[hash_offsets[i]:hash_offsets[i + 1]]`.
+
+Parsed columns can be cached in a `.npz` sidecar next to the trace, which is
+reused as long as the trace size and modification time are unchanged.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+import numpy as np
+
+_json_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# bump when the sidecar layout changes so stale caches are ignored
+TRACE_CACHE_VERSION = 1
+TRACE_CACHE_SUFFIX = ".columns.npz"
+DEFAULT_CHUNK_SIZE = 65536
+
+
+@dataclass
+class TraceColumns:
+    """Columnar view of a trace, one entry per request."""
+
+    timestamps: np.ndarray
+    input_lengths: np.ndarray
+    output_lengths: np.ndarray
+    hash_offsets: np.ndarray
+    hash_values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def num_hash_ids(self) -> np.ndarray:
+        """Number of hash ids of every request."""
+        return np.diff(self.hash_offsets)
+
+    def hash_ids(self, i: int) -> np.ndarray:
+        """Hash ids of request i, as a view into `hash_values`."""
+        return self.hash_values[self.hash_offsets[i] : self.hash_offsets[i + 1]]
+
+    def iter_hash_ids(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self.hash_ids(i)
+
+    def record(self, i: int) -> dict[str, Any]:
+        """Request i in the original jsonl format."""
+        return {
+            "timestamp": int(self.timestamps[i]),
+            "input_length": int(self.input_lengths[i]),
+            "output_length": int(self.output_lengths[i]),
+            "hash_ids": self.hash_ids(i).tolist(),
+        }
+
+
+def trace_cache_path(trace_file: Union[str, Path]) -> Path:
+    trace_file = Path(trace_file)
+    return trace_file.with_name(trace_file.name + TRACE_CACHE_SUFFIX)
+
+
+def _trace_signature(trace_file: Path) -> np.ndarray:
+    stat = trace_file.stat()
+    return np.array([TRACE_CACHE_VERSION, stat.st_size, stat.st_mtime_ns])
+
+
+def _load_cache(cache_file: Path, signature: np.ndarray) -> Optional[TraceColumns]:
+    try:
+        with np.load(cache_file) as data:
+            if not np.array_equal(data["signature"], signature):
+                return None
+            return TraceColumns(
+                timestamps=data["timestamps"],
+                input_lengths=data["input_lengths"],
+                output_lengths=data["output_lengths"],
+                hash_offsets=data["hash_offsets"],
+                hash_values=data["hash_values"],
+            )
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable trace cache {cache_file}: {e}")
+        return None
+
+
+def _save_cache(cache_file: Path, signature: np.ndarray, columns: TraceColumns):
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".npz")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                signature=signature,
+                timestamps=columns.timestamps,
+                input_lengths=columns.input_lengths,
+                output_lengths=columns.output_lengths,
+                hash_offsets=columns.hash_offsets,
+                hash_values=columns.hash_values,
+            )
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+    except OSError as e:
+        logger.warning(f"Failed to write trace cache {cache_file}: {e}")
+    finally:
+        # do not leave a partial cache behind when writing or renaming it failed
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def parse_trace(
+    trace_file: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> TraceColumns:
+    """Parse a jsonl trace into columns, `chunk_size` lines at a time."""
+    timestamps = array("q")
+    input_lengths = array("q")
+    output_lengths = array("q")
+    hash_offsets = array("q", [0])
+    hash_values = array("q")
+
+    with open(trace_file, "rb") as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            for line in lines:
+                if not line.strip():
+                    continue
+                data = _json_loads(line)
+                timestamps.append(int(data["timestamp"]))
+                input_lengths.append(int(data["input_length"]))
+                output_lengths.append(int(data["output_length"]))
+                hash_values.extend(data["hash_ids"])
+                hash_offsets.append(len(hash_values))
+
+    return TraceColumns(
+        timestamps=np.frombuffer(timestamps, dtype=np.int64),
+        input_lengths=np.frombuffer(input_lengths, dtype=np.int64),
+        output_lengths=np.frombuffer(output_lengths, dtype=np.int64),
+        hash_offsets=np.frombuffer(hash_offsets, dtype=np.int64),
+        hash_values=np.frombuffer(hash_values, dtype=np.int64),
+    )
+
+
+def load_trace(
+    trace_file: Union[str, Path],
+    use_cache: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TraceColumns:
+    """
+    Load a jsonl trace as columns.
+
+    Args:
+        trace_file: Path to the trace in mooncake jsonl format.
+        use_cache: Read from / write to a `.npz` sidecar next to the trace so
+            repeated runs skip parsing.
+        chunk_size: Number of lines parsed per chunk.
+    """
+    trace_file = Path(trace_file)
+    if not use_cache:
+        return parse_trace(trace_file, chunk_size)
+
+    cache_file = trace_cache_path(trace_file)
+    signature = _trace_signature(trace_file)
+    columns = _load_cache(cache_file, signature)
+    if columns is not None:
+        logger.info(f"Loaded trace columns from {cache_file}")
+        return columns
+
+    columns = parse_trace(trace_file, chunk_size)
+    _save_cache(cache_file, signature, columns)
+    return columns
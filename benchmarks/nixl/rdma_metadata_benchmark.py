@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Size and serialization time of the `dynamo.nixl_connect.RdmaMetadata` encodings.
+
+For each descriptor count, a metadata object carrying --nixl-metadata-bytes of
+NIXL agent metadata (compressed like a worker does) is encoded and decoded
+--iterations times with each encoding:
+
+    json     model_dump_json / model_validate_json, hex NIXL metadata
+    base64   to_base64 / from_base64, for embedding in JSON request bodies
+    binary   to_bytes / from_bytes
+
+The JSON decoder runs the Pydantic field validators, which dominate decoding
+as the number of descriptors grows. The compact decoders check the values
+while unpacking them, and construct the models without validating them again.
+
+Usage:
+    python rdma_metadata_benchmark.py --descriptors 1 8 64 --nixl-metadata-bytes 4096
+"""
+
+import argparse
+import random
+import time
+import uuid
+import zlib
+
+from dynamo.nixl_connect import OperationKind, RdmaMetadata, SerializedDescriptor
+
+
+def make_metadata(num_descriptors: int, nixl_metadata_bytes: int) -> RdmaMetadata:
+    rng = random.Random(0)
+    # agent metadata is mostly small integers and names, about half of it compresses away
+    nixl_metadata = bytes(rng.randrange(16) for _ in range(nixl_metadata_bytes))
+    return RdmaMetadata(
+        agent_name=uuid.uuid4().hex,
+        descriptors=[
+            SerializedDescriptor(
+                device="cuda:0", ptr=0x7F0000000000 + i * (1 << 22), size=1 << 22
+            )
+            for i in range(num_descriptors)
+        ],
+        nixl_metadata=zlib.compress(nixl_metadata, level=6),
+        notification_key=str(uuid.uuid4()),
+        operation_kind=int(OperationKind.READ),
+    )
+
+
+def measure(encode, decode, iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encoded = encode()
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decoded = decode(encoded)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+    return len(encoded), encode_us, decode_us, decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--descriptors", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--nixl-metadata-bytes", type=int, default=4096)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'descriptors':>11} {'encoding':>8} {'bytes':>8} {'size':>6} "
+        f"{'encode us':>10} {'decode us':>10}"
+    )
+    for num_descriptors in args.descriptors:
+        metadata = make_metadata(num_descriptors, args.nixl_metadata_bytes)
+        encodings = {
+            "json": (metadata.model_dump_json, RdmaMetadata.model_validate_json),
+            "base64": (metadata.to_base64, RdmaMetadata.from_base64),
+            "binary": (metadata.to_bytes, RdmaMetadata.from_bytes),
+        }
+        json_size = None
+        for name, (encode, decode) in encodings.items():
+            size, encode_us, decode_us, decoded = measure(
+                encode, decode, args.iterations
+            )
+            assert decoded == metadata, f"{name} did not round trip"
+            json_size = json_size or size
+            print(
+                f"{num_descriptors:>11} {name:>8} {size:>8} {size / json_size:>6.2f} "
+                f"{encode_us:>10.2f} {decode_us:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
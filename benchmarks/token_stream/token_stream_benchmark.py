@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-token CPU overhead of the backend token streaming path.
+
+A fake engine advances many concurrent requests by one token per step and
+reports cumulative token lists, as vLLM (by default), SGLang and TRT-LLM do.
+Each request is streamed through one of the handler variants below, and every
+chunk is serialized to JSON, plus --chunk-cost-us of busy CPU, as a stand-in
+for the conversion to Rust and the network send that each chunk costs in a
+worker:
+
+    legacy     slicing the cumulative list with per chunk length bookkeeping
+    deltas     dynamo.llm.token_stream.TokenDeltas
+    coalesced  TokenDeltas + coalesce_token_chunks with --latency-budget-ms
+
+Usage:
+    python token_stream_benchmark.py --num-requests 256 --num-tokens 512
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from dynamo.llm.token_stream import TokenDeltas, coalesce_token_chunks
+
+
+class FakeEngine:
+    """Appends one token per step to every request, `step_interval` seconds apart."""
+
+    def __init__(self, num_tokens: int, step_interval: float):
+        self.num_tokens = num_tokens
+        self.step_interval = step_interval
+
+    async def generate(self):
+        token_ids = []
+        for i in range(self.num_tokens):
+            await asyncio.sleep(self.step_interval)
+            # engines extend the same list in place
+            token_ids.append(i)
+            yield token_ids
+
+
+async def legacy_chunks(engine: FakeEngine):
+    num_output_tokens_so_far = 0
+    async for token_ids in engine.generate():
+        next_total_toks = len(token_ids)
+        yield {"token_ids": token_ids[num_output_tokens_so_far:]}
+        num_output_tokens_so_far = next_total_toks
+    yield {"finish_reason": "stop", "token_ids": []}
+
+
+async def delta_chunks(engine: FakeEngine):
+    deltas = TokenDeltas()
+    async for token_ids in engine.generate():
+        yield {"token_ids": deltas.delta(token_ids)}
+    yield {"finish_reason": "stop", "token_ids": []}
+
+
+def busy_wait(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def consume(chunks, chunk_cost: float) -> tuple[int, int]:
+    num_chunks = num_tokens = 0
+    async for chunk in chunks:
+        json.dumps(chunk)
+        busy_wait(chunk_cost)
+        num_chunks += 1
+        num_tokens += len(chunk["token_ids"])
+    return num_chunks, num_tokens
+
+
+async def run(variant: str, args) -> None:
+    engine = FakeEngine(args.num_tokens, args.step_interval_ms / 1000)
+
+    def stream():
+        if variant == "legacy":
+            return legacy_chunks(engine)
+        if variant == "deltas":
+            return delta_chunks(engine)
+        return coalesce_token_chunks(
+            delta_chunks(engine), latency_budget=args.latency_budget_ms / 1000
+        )
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    results = await asyncio.gather(
+        *(consume(stream(), args.chunk_cost_us / 1e6) for _ in range(args.num_requests))
+    )
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    num_chunks = sum(chunks for chunks, _ in results)
+    num_tokens = sum(tokens for _, tokens in results)
+    assert num_tokens == args.num_requests * args.num_tokens
+    print(
+        f"{variant:>10}: {cpu / num_tokens * 1e6:7.2f} us CPU/token, "
+        f"{num_chunks / args.num_requests:7.1f} chunks/request, "
+        f"{num_tokens / wall:10.0f} tokens/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Token streaming micro-benchmark")
+    parser.add_argument("--num-requests", type=int, default=256)
+    parser.add_argument("--num-tokens", type=int, default=512)
+    parser.add_argument(
+        "--step-interval-ms",
+        type=float,
+        default=0.0,
+        help="Time between engine steps; 0 measures the streaming overhead alone",
+    )
+    parser.add_argument("--latency-budget-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--chunk-cost-us",
+        type=float,
+        default=20.0,
+        help="Simulated CPU cost of handing one chunk to the runtime",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.num_requests} requests x {args.num_tokens} tokens, "
+        f"step interval {args.step_interval_ms} ms, chunk cost {args.chunk_cost_us} us"
+    )
+    for variant in ("legacy", "deltas", "coalesced"):
+        asyncio.run(run(variant, args))
+
+
+if __name__ == "__main__":
+    main()
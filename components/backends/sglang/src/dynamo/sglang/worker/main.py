@@ -8,7 +8,7 @@ import random
 import signal
 import socket
 import sys
-from typing import Any, Dict, Optional, Union
+from typing import Any, Optional
 
 import sglang as sgl
 import uvloop
@@ -18,16 +18,14 @@ from sglang.srt.utils import get_ip, get_zmq_socket
 
 from dynamo._core import Endpoint
 from dynamo.llm import (
-    ForwardPassMetrics,
-    KvStats,
     ModelRuntimeConfig,
     ModelType,
-    WorkerMetricsPublisher,
-    WorkerStats,
     ZmqKvEventPublisher,
     ZmqKvEventPublisherConfig,
     register_llm,
 )
+from dynamo.llm.load_publisher import CoalescingMetricsPublisher, WorkerLoad
+from dynamo.llm.token_stream import TokenDeltas, coalesce_token_chunks
 from dynamo.runtime import DistributedRuntime, dynamo_worker
 from dynamo.runtime.logging import configure_dynamo_logging
 from dynamo.sglang.common import (
@@ -50,7 +48,7 @@ class RequestHandler(BaseWorkerHandler):
         decode_client: Optional[Any] = None,
     ):
         super().__init__(engine, server_args, component, decode_client)
-        self.metrics_publisher = WorkerMetricsPublisher()
+        self.metrics_publisher = CoalescingMetricsPublisher()
 
         self.zmq_context = zmq.asyncio.Context()  # type: ignore
         self.receive_metrics_from_scheduler = None
@@ -84,28 +82,20 @@ class RequestHandler(BaseWorkerHandler):
 
     def init_publish(self):
         """Publish initial set of warmup metrics"""
-        worker_stats = WorkerStats(
-            request_active_slots=0,
-            request_total_slots=1024,
-            num_requests_waiting=0,
-            data_parallel_rank=0,
+        self.metrics_publisher.update(
+            WorkerLoad(
+                request_active_slots=0,
+                request_total_slots=1024,
+                num_requests_waiting=0,
+                kv_active_blocks=0,
+                kv_total_blocks=1024,
+                gpu_cache_usage_perc=0,
+                gpu_prefix_cache_hit_rate=0,
+                data_parallel_rank=0,
+            ),
+            force=True,
         )
 
-        kv_stats = KvStats(
-            kv_active_blocks=0,
-            kv_total_blocks=1024,
-            gpu_cache_usage_perc=0,
-            gpu_prefix_cache_hit_rate=0,
-        )
-
-        metrics = ForwardPassMetrics(
-            worker_stats=worker_stats,
-            kv_stats=kv_stats,
-            spec_decode_stats=None,
-        )
-
-        self.metrics_publisher.publish(metrics)
-
     async def create_metrics_publisher_endpoint(self):
         logging.debug("Creating metrics publisher endpoint")
         await self.metrics_publisher.create_endpoint(self.component)
@@ -115,26 +105,26 @@ class RequestHandler(BaseWorkerHandler):
         while True:
             try:
                 kv_metrics = await self.receive_metrics_from_scheduler.recv_pyobj()  # type: ignore
-                worker_stats = WorkerStats(
-                    request_active_slots=kv_metrics.request_active_slots,
-                    request_total_slots=kv_metrics.request_total_slots,
-                    num_requests_waiting=kv_metrics.num_requests_waiting,
-                    data_parallel_rank=kv_metrics.data_parallel_rank,  # Note: 0 means it's either 0 or None from sglang
-                )
-                kv_stats = KvStats(
-                    kv_active_blocks=kv_metrics.kv_active_blocks,
-                    kv_total_blocks=kv_metrics.kv_total_blocks,
-                    gpu_cache_usage_perc=kv_metrics.gpu_cache_usage_perc,
-                    gpu_prefix_cache_hit_rate=kv_metrics.gpu_prefix_cache_hit_rate,
+                # only the latest of the reports queued up meanwhile matters
+                while True:
+                    try:
+                        kv_metrics = await self.receive_metrics_from_scheduler.recv_pyobj(zmq.NOBLOCK)  # type: ignore
+                    except zmq.Again:
+                        break
+                # SGLang reports a hit rate but no lookup counts, so there is no
+                # cumulative prefix cache counter to publish
+                self.metrics_publisher.update(
+                    WorkerLoad(
+                        request_active_slots=kv_metrics.request_active_slots,
+                        request_total_slots=kv_metrics.request_total_slots,
+                        num_requests_waiting=kv_metrics.num_requests_waiting,
+                        kv_active_blocks=kv_metrics.kv_active_blocks,
+                        kv_total_blocks=kv_metrics.kv_total_blocks,
+                        gpu_cache_usage_perc=kv_metrics.gpu_cache_usage_perc,
+                        gpu_prefix_cache_hit_rate=kv_metrics.gpu_prefix_cache_hit_rate,
+                        data_parallel_rank=kv_metrics.data_parallel_rank,  # Note: 0 means it's either 0 or None from sglang
+                    )
                 )
-                spec_dec_stats = None
-                metrics = ForwardPassMetrics(
-                    worker_stats=worker_stats,
-                    kv_stats=kv_stats,
-                    spec_decode_stats=spec_dec_stats,
-                )
-
-                self.metrics_publisher.publish(metrics)
             except Exception:
                 logging.exception("Failed to recieve or publish metrics")
 
@@ -239,48 +229,31 @@ class RequestHandler(BaseWorkerHandler):
             async for out in self._process_stream(g, unpack=False, is_batch=is_batch):
                 yield out
 
-    async def _process_stream(self, stream_source, unpack: bool, is_batch: bool):
-        # Initialize based on batch mode
-        num_output_tokens_so_far: Union[Dict[int, int], int]
-        if is_batch:
-            num_output_tokens_so_far = {}
-        else:
-            num_output_tokens_so_far = 0
+    def _process_stream(self, stream_source, unpack: bool, is_batch: bool):
+        """Token chunks of the stream, coalesced as set by DYN_TOKEN_STREAM_COALESCE_MS."""
+        return coalesce_token_chunks(
+            self._token_chunks(stream_source, unpack, is_batch)
+        )
+
+    async def _token_chunks(self, stream_source, unpack: bool, is_batch: bool):
+        # output_ids are cumulative unless the server streams them incrementally
+        deltas = TokenDeltas(
+            cumulative=not getattr(
+                self.server_args, "incremental_streaming_output", False
+            )
+        )
 
         async for res in stream_source:
             data = res.data() if unpack else res
             finish_reason = data["meta_info"]["finish_reason"]
+            index = data.get("index", 0) if is_batch else 0
 
-            if is_batch:
-                # Handle batch response
-                assert isinstance(num_output_tokens_so_far, dict)
-                index = data.get("index", 0)
-                if index not in num_output_tokens_so_far:
-                    num_output_tokens_so_far[index] = 0
-
-                if finish_reason:
-                    out = {
-                        "token_ids": [],
-                        "finish_reason": finish_reason["type"],
-                        "index": index,
-                    }
-                else:
-                    next_total_toks = len(data["output_ids"])
-                    new_tokens = data["output_ids"][num_output_tokens_so_far[index] :]
-                    out = {
-                        "token_ids": new_tokens,
-                        "index": index,
-                    }
-                    num_output_tokens_so_far[index] = next_total_toks
+            if finish_reason:
+                out = {"token_ids": [], "finish_reason": finish_reason["type"]}
             else:
-                # Handle single response
-                assert isinstance(num_output_tokens_so_far, int)
-                if finish_reason:
-                    out = {"token_ids": [], "finish_reason": finish_reason["type"]}
-                else:
-                    next_total_toks = len(data["output_ids"])
-                    out = {"token_ids": data["output_ids"][num_output_tokens_so_far:]}
-                    num_output_tokens_so_far = next_total_toks
+                out = {"token_ids": deltas.delta(data["output_ids"], index)}
+            if is_batch:
+                out["index"] = index
 
             yield out
 
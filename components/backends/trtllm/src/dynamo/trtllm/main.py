@@ -21,9 +21,11 @@ from torch.cuda import device_count
 from transformers import AutoConfig
 
 from dynamo.llm import ModelRuntimeConfig, ModelType, register_llm
+from dynamo.llm.worker_metrics import register_collector
 from dynamo.runtime import DistributedRuntime, dynamo_worker
 from dynamo.runtime.logging import configure_dynamo_logging
 from dynamo.trtllm.engine import TensorRTLLMEngine, get_llm_engine
+from dynamo.trtllm.metrics import KvEventMetricsCollector
 from dynamo.trtllm.multimodal_processor import MultimodalRequestProcessor
 from dynamo.trtllm.publisher import get_publisher
 from dynamo.trtllm.request_handlers.handlers import (
@@ -263,6 +265,7 @@ async def init(runtime: DistributedRuntime, config: Config):
                 int(endpoint.lease_id()),
                 config.kv_block_size,
             ) as publisher:
+                register_collector(KvEventMetricsCollector(publisher))
                 handler_config.publisher = publisher
                 handler = RequestHandlerFactory().get_request_handler(handler_config)
                 await endpoint.serve_endpoint(handler.generate)
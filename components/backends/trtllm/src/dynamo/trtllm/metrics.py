@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Prometheus export of the KV event publishing statistics."""
+
+from typing import Iterator
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from dynamo.trtllm.publisher import Publisher
+
+PREFIX = "dynamo_trtllm_"
+
+
+class KvEventMetricsCollector:
+    """Reads the KV event counters of a publisher on every scrape."""
+
+    def __init__(self, publisher: Publisher):
+        self.publisher = publisher
+
+    def collect(self) -> Iterator:
+        stats = self.publisher.kv_event_stats
+        yield CounterMetricFamily(
+            PREFIX + "kv_events_received",
+            "KV cache events received from the engine",
+            value=stats.received,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "kv_events_published",
+            "KV cache events published to the router",
+            value=stats.published,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "kv_events_dropped",
+            "KV cache events of attention windows other than the global one",
+            value=stats.dropped,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "kv_event_batches",
+            "Publisher calls, each with a run of stored or removed events",
+            value=stats.batches,
+        )
+        blocks = CounterMetricFamily(
+            PREFIX + "kv_event_blocks",
+            "Blocks in the published KV cache events, by event type",
+            labels=["type"],
+        )
+        blocks.add_metric(["stored"], stats.stored_blocks)
+        blocks.add_metric(["removed"], stats.removed_blocks)
+        yield blocks
+        yield CounterMetricFamily(
+            PREFIX + "kv_event_processing_seconds",
+            "Time spent translating and publishing KV cache events",
+            value=stats.processing_seconds,
+        )
+        yield GaugeMetricFamily(
+            PREFIX + "kv_event_backlog",
+            "KV cache events translated and waiting for the next publish",
+            value=stats.backlog,
+        )
+        yield GaugeMetricFamily(
+            PREFIX + "kv_event_max_backlog",
+            "Largest number of KV cache events published at once",
+            value=stats.max_backlog,
+        )
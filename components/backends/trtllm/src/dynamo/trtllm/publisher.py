@@ -4,29 +4,39 @@
 import asyncio
 import concurrent.futures
 import logging
+import os
 import threading
+import time
 import traceback
 import weakref
+from array import array
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from operator import itemgetter
 from queue import Queue
-from typing import Awaitable, Callable, Optional, Union
-
-from dynamo.llm import (
-    ForwardPassMetrics,
-    KvEventPublisher,
-    KvStats,
-    WorkerMetricsPublisher,
-    WorkerStats,
+from typing import Awaitable, Callable, List, Optional, Union
+
+from dynamo.llm import KvEventPublisher
+from dynamo.llm.load_publisher import (
+    CoalescingMetricsPublisher,
+    PrefixCacheCounter,
+    WorkerLoad,
 )
 
 logging.basicConfig(level=logging.DEBUG)
 
+# KV events translated and not yet published are flushed at the latest after
+# this many milliseconds; with 0 they are flushed as soon as the engine has no
+# more events ready
+KV_EVENT_BATCH_MS_ENV = "DYN_KV_EVENT_BATCH_MS"
+MAX_KV_EVENT_BATCH = 256
+KV_EVENT_STATS_LOG_INTERVAL = 30.0
 
-def _to_signed_i64(value: int | None) -> int | None:
-    """Convert a Python int to signed 64-bit range by two's complement."""
-    if value is None:
-        return None
+_token_id = itemgetter("token_id")
 
+
+def _to_signed_i64(value: int) -> int:
+    """Convert a Python int to signed 64-bit range by two's complement."""
     if value >= 2**63:
         return value - 2**64
     if value < -(2**63):
@@ -106,6 +116,51 @@ class ManagedThread(threading.Thread):
             self._current_future.cancel()
 
 
+@dataclass
+class KvEventStats:
+    """Counters of the KV event translation, see `metrics.KvEventMetricsCollector`."""
+
+    received: int = 0
+    # events of other attention windows than the global one
+    dropped: int = 0
+    stored_blocks: int = 0
+    removed_blocks: int = 0
+    tokens: int = 0
+    batches: int = 0
+    published: int = 0
+    # events translated and waiting for the next batch flush
+    backlog: int = 0
+    max_backlog: int = 0
+    # time spent translating and publishing events, holding the GIL
+    processing_seconds: float = 0.0
+
+
+class KvEventBatch:
+    """
+    A run of translated stored or removed events, in the layout of
+    `KvEventPublisher.publish_stored_batch` and `publish_removed_batch`.
+
+    A batch only holds one kind of event, so that publishing it keeps the
+    order of the engine's events.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.kind: Optional[str] = None
+        self.event_ids: List[int] = []
+        self.num_blocks: List[int] = []
+        self.block_hashes: List[int] = []
+        self.token_ids = array("I")
+        self.num_block_tokens: List[int] = []
+        self.lora_ids: List[int] = []
+        self.parent_hashes: List[Optional[int]] = []
+
+    def __len__(self):
+        return len(self.event_ids)
+
+
 class Publisher:
     """
     A class to retrieve stats and kv cache events from TRTLLM engine and publish them to the metrics and events publishers.
@@ -132,6 +187,11 @@ class Publisher:
         # A set to store the block hash of partial block (i.e. block containing less than kv_block_size tokens) hashes.
         # It is used to prevent sending remove event to kv router since partial blocks are not stored.
         self.partial_block_hashes = set()
+        self.kv_event_batch = KvEventBatch()
+        self.kv_event_stats = KvEventStats()
+        self._kv_event_flush_handle: Optional[asyncio.Handle] = None
+        self._kv_event_batch_window = _kv_event_batch_window()
+        self._last_kv_event_stats_log = time.monotonic()
         self.error_queue: Queue = Queue()
         self._stop_event = threading.Event()
 
@@ -144,7 +204,7 @@ class Publisher:
 
     def initialize(self):
         # Setup the metrics publisher
-        self.metrics_publisher = WorkerMetricsPublisher()
+        self.metrics_publisher = CoalescingMetricsPublisher()
         self._init_publish_metrics_thread()
         task = asyncio.create_task(self._create_metrics_publisher_endpoint())
         task.add_done_callback(
@@ -176,26 +236,18 @@ class Publisher:
             logging.error("KV metrics publisher not initialized!")
             return
 
-        worker_stats = WorkerStats(
-            request_active_slots=request_active_slots,
-            request_total_slots=request_total_slots,
-            num_requests_waiting=num_requests_waiting,
-            data_parallel_rank=None,
-        )
-
-        kv_stats = KvStats(
-            kv_active_blocks=kv_active_block,
-            kv_total_blocks=kv_total_blocks,
-            gpu_cache_usage_perc=gpu_cache_usage_perc,
-            gpu_prefix_cache_hit_rate=gpu_prefix_cache_hit_rate,
-        )
-
-        metrics = ForwardPassMetrics(
-            worker_stats=worker_stats,
-            kv_stats=kv_stats,
-            spec_decode_stats=None,
+        self.metrics_publisher.update(
+            WorkerLoad(
+                request_active_slots=request_active_slots,
+                request_total_slots=request_total_slots,
+                num_requests_waiting=num_requests_waiting,
+                kv_active_blocks=kv_active_block,
+                kv_total_blocks=kv_total_blocks,
+                gpu_cache_usage_perc=gpu_cache_usage_perc,
+                gpu_prefix_cache_hit_rate=gpu_prefix_cache_hit_rate,
+            ),
+            force=True,
         )
-        self.metrics_publisher.publish(metrics)
 
         # Prepare threads for publishing stats but don't start them yet.
         # TRTLLM needs to start generating tokens first before stats
@@ -248,35 +300,36 @@ class Publisher:
                 + stat["inflightBatchingStats"]["numPausedRequests"]
             )
             gpu_cache_usage_perc = allocTotalBlocks / kv_total_blocks
-            gpu_prefix_cache_hit_rate = stat["kvCacheStats"]["cacheHitRate"]
+            # TRTLLM counts reused and missed blocks since the engine started
+            missed_blocks = stat["kvCacheStats"].get("missedBlocks")
+            if missed_blocks is not None:
+                prefix_cache = PrefixCacheCounter(
+                    queries=reused_blocks + missed_blocks, hits=reused_blocks
+                )
+                gpu_prefix_cache_hit_rate = None
+            else:
+                prefix_cache = None
+                gpu_prefix_cache_hit_rate = stat["kvCacheStats"]["cacheHitRate"]
 
             logging.debug(
-                f"Publishing stats: request_active_slots: {request_active_slots}, request_total_slots: {request_total_slots}, kv_active_block: {kv_active_block}, kv_total_blocks: {kv_total_blocks}, num_requests_waiting: {num_requests_waiting}, reused_blocks: {reused_blocks}, freeNumBlocks: {freeNumBlocks}, allocTotalBlocks: {allocTotalBlocks}, allocNewBlocks: {allocNewBlocks}, gpu_cache_usage_perc: {gpu_cache_usage_perc}, gpu_prefix_cache_hit_rate: {gpu_prefix_cache_hit_rate}"
-            )
-
-            worker_stats = WorkerStats(
-                request_active_slots=request_active_slots,
-                request_total_slots=request_total_slots,
-                num_requests_waiting=num_requests_waiting,
-                data_parallel_rank=None,
-            )
-
-            kv_stats = KvStats(
-                kv_active_blocks=kv_active_block,
-                kv_total_blocks=kv_total_blocks,
-                gpu_cache_usage_perc=gpu_cache_usage_perc,
-                gpu_prefix_cache_hit_rate=gpu_prefix_cache_hit_rate,
+                f"Publishing stats: request_active_slots: {request_active_slots}, request_total_slots: {request_total_slots}, kv_active_block: {kv_active_block}, kv_total_blocks: {kv_total_blocks}, num_requests_waiting: {num_requests_waiting}, reused_blocks: {reused_blocks}, missed_blocks: {missed_blocks}, freeNumBlocks: {freeNumBlocks}, allocTotalBlocks: {allocTotalBlocks}, allocNewBlocks: {allocNewBlocks}, gpu_cache_usage_perc: {gpu_cache_usage_perc}"
             )
 
             # TODO: get spec_decode_stats from engine
-            spec_decode_stats = None
-
-            metrics = ForwardPassMetrics(
-                worker_stats=worker_stats,
-                kv_stats=kv_stats,
-                spec_decode_stats=spec_decode_stats,
+            # stats of every iteration since the last call arrive at once, the
+            # publisher coalesces them into the latest
+            self.metrics_publisher.update(
+                WorkerLoad(
+                    request_active_slots=request_active_slots,
+                    request_total_slots=request_total_slots,
+                    num_requests_waiting=num_requests_waiting,
+                    kv_active_blocks=kv_active_block,
+                    kv_total_blocks=kv_total_blocks,
+                    gpu_cache_usage_perc=gpu_cache_usage_perc,
+                    prefix_cache=prefix_cache,
+                    gpu_prefix_cache_hit_rate=gpu_prefix_cache_hit_rate,
+                )
             )
-            self.metrics_publisher.publish(metrics)
 
         return True
 
@@ -293,76 +346,184 @@ class Publisher:
             return
 
         events = self.engine.llm.get_kv_cache_events_async(timeout=5)
-        async for event in events:
-            logging.debug(f"KV cache event received: {event}")
-            # drop the events that is not emitted from the global attention layer.
-            if self.should_drop_event(event):
-                continue
+        try:
+            async for event in events:
+                self._add_kv_cache_event(event)
+        finally:
+            self._flush_kv_cache_events()
 
-            event_id = event["event_id"]
-            data = event["data"]
-            if data["type"] == "stored":
-                self.processing_initial_created_events = False
-                parent_hash = _to_signed_i64(data["parent_hash"])
-                token_ids = []
-                num_block_tokens = []
-                block_hashes = []
-                for block in data["blocks"]:
-                    token_num_in_block = len(block["tokens"])
-                    block_hash = _to_signed_i64(block["block_hash"])
-                    if token_num_in_block > self.kv_block_size:
-                        logging.error(
-                            f"Block {block_hash} contains {token_num_in_block} tokens, which is greater than kv_block_size {self.kv_block_size}"
-                        )
-                        return
-                    if token_num_in_block < self.kv_block_size:
-                        logging.debug(
-                            f"Early stop when block {block_hash} containing {token_num_in_block} tokens not equal to kv_block_size {self.kv_block_size}"
-                        )
-                        self.partial_block_hashes.add(block_hash)
-                        break
-                    num_block_tokens.append(token_num_in_block)
-                    block_hashes.append(block_hash)
-                    for token in block["tokens"]:
-                        token_ids.append(int(token["token_id"]))
-
-                # Note: Currently data does not have lora_id.
-                # Using 0 as default value. If later data has
-                # lora_id, we need to verify if this is correct.
-                lora_id = data.get("lora_id", 0)
+        return True
 
-                logging.debug(
-                    f"publish stored event: event_id: {event_id}, token_ids: {token_ids}, num_block_tokens: {num_block_tokens}, block_hashes: {block_hashes}, lora_id: {lora_id}, parent_hash: {parent_hash}"
+    def _add_kv_cache_event(self, event):
+        """Translate an engine event into the pending batch, publishing it when due."""
+        start = time.perf_counter()
+        stats = self.kv_event_stats
+        stats.received += 1
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("KV cache event received: %s", event)
+        # drop the events that is not emitted from the global attention layer.
+        if self.should_drop_event(event):
+            stats.dropped += 1
+            return
+
+        data = event["data"]
+        kind = data["type"]
+        if kind == "created":
+            if self.processing_initial_created_events:
+                self.update_max_window_size(event)
+            return
+        if kind not in ("stored", "removed"):
+            return
+        self.processing_initial_created_events = False
+
+        batch = self.kv_event_batch
+        if batch.kind != kind or len(batch) >= MAX_KV_EVENT_BATCH:
+            self._flush_kv_cache_events()
+            batch.kind = kind
+        if kind == "stored":
+            self._add_stored_event(event["event_id"], data)
+        else:
+            self._add_removed_event(event["event_id"], data)
+
+        stats.backlog = len(batch)
+        stats.max_backlog = max(stats.max_backlog, stats.backlog)
+        if self._kv_event_flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self._kv_event_batch_window > 0:
+                self._kv_event_flush_handle = loop.call_later(
+                    self._kv_event_batch_window, self._flush_kv_cache_events
                 )
-                self.kv_event_publisher.publish_stored(
-                    event_id,
-                    token_ids,
-                    num_block_tokens,
-                    block_hashes,
-                    lora_id,
-                    parent_hash,
+            else:
+                # runs once the event iterator has to wait for the engine
+                self._kv_event_flush_handle = loop.call_soon(
+                    self._flush_kv_cache_events
                 )
-            elif data["type"] == "removed":
-                self.processing_initial_created_events = False
-                block_hashes = []
-                for block_hash in data["block_hashes"]:
-                    block_hash = _to_signed_i64(block_hash)
-                    if block_hash in self.partial_block_hashes:
-                        logging.debug(
-                            f"Skipping removing block hash {block_hash} since it is a partial block"
-                        )
-                        self.partial_block_hashes.remove(block_hash)
-                        continue
-                    block_hashes.append(block_hash)
-
+        stats.processing_seconds += time.perf_counter() - start
+
+    def _add_stored_event(self, event_id, data):
+        batch = self.kv_event_batch
+        blocks = data["blocks"]
+        num_blocks = 0
+        for block in blocks:
+            tokens = block["tokens"]
+            token_num_in_block = len(tokens)
+            if token_num_in_block != self.kv_block_size:
+                block_hash = _to_signed_i64(block["block_hash"])
+                if token_num_in_block > self.kv_block_size:
+                    logging.error(
+                        f"Block {block_hash} contains {token_num_in_block} tokens, which is greater than kv_block_size {self.kv_block_size}"
+                    )
+                    # drop the blocks of this event translated so far;
+                    # num_block_tokens is only extended once the event is done
+                    del batch.block_hashes[len(batch.block_hashes) - num_blocks :]
+                    del batch.token_ids[
+                        len(batch.token_ids) - num_blocks * self.kv_block_size :
+                    ]
+                    return
                 logging.debug(
-                    f"publish removed event: event_id: {event_id}, block_hashes: {block_hashes}"
+                    f"Early stop when block {block_hash} containing {token_num_in_block} tokens not equal to kv_block_size {self.kv_block_size}"
                 )
-                self.kv_event_publisher.publish_removed(event_id, block_hashes)
-            elif data["type"] == "created" and self.processing_initial_created_events:
-                self.update_max_window_size(event)
+                self.partial_block_hashes.add(block_hash)
+                break
+            batch.block_hashes.append(_to_signed_i64(block["block_hash"]))
+            batch.token_ids.extend(map(_token_id, tokens))
+            num_blocks += 1
+
+        batch.num_block_tokens.extend([self.kv_block_size] * num_blocks)
+        batch.event_ids.append(event_id)
+        batch.num_blocks.append(num_blocks)
+        # Note: Currently data does not have lora_id.
+        # Using 0 as default value. If later data has
+        # lora_id, we need to verify if this is correct.
+        batch.lora_ids.append(data.get("lora_id", 0))
+        parent_hash = data["parent_hash"]
+        batch.parent_hashes.append(
+            None if parent_hash is None else _to_signed_i64(parent_hash)
+        )
 
-        return True
+        self.kv_event_stats.stored_blocks += num_blocks
+        self.kv_event_stats.tokens += num_blocks * self.kv_block_size
+
+    def _add_removed_event(self, event_id, data):
+        batch = self.kv_event_batch
+        num_blocks = 0
+        for block_hash in data["block_hashes"]:
+            block_hash = _to_signed_i64(block_hash)
+            if block_hash in self.partial_block_hashes:
+                logging.debug(
+                    f"Skipping removing block hash {block_hash} since it is a partial block"
+                )
+                self.partial_block_hashes.remove(block_hash)
+                continue
+            batch.block_hashes.append(block_hash)
+            num_blocks += 1
+
+        batch.event_ids.append(event_id)
+        batch.num_blocks.append(num_blocks)
+        self.kv_event_stats.removed_blocks += num_blocks
+
+    def _flush_kv_cache_events(self):
+        """Publish the pending batch in one call."""
+        if self._kv_event_flush_handle is not None:
+            self._kv_event_flush_handle.cancel()
+            self._kv_event_flush_handle = None
+        batch = self.kv_event_batch
+        if not batch:
+            return
+        publisher = self.kv_event_publisher
+        if publisher is None:
+            logging.error("KV event publisher not initialized!")
+            batch.clear()
+            return
+        start = time.perf_counter()
+        try:
+            if batch.kind == "stored":
+                logging.debug(
+                    "publish %d stored events: event_ids: %s",
+                    len(batch),
+                    batch.event_ids,
+                )
+                publisher.publish_stored_batch(
+                    batch.event_ids,
+                    batch.token_ids.tobytes(),
+                    batch.num_block_tokens,
+                    batch.block_hashes,
+                    batch.num_blocks,
+                    batch.lora_ids,
+                    batch.parent_hashes,
+                )
+            else:
+                logging.debug(
+                    "publish %d removed events: event_ids: %s",
+                    len(batch),
+                    batch.event_ids,
+                )
+                publisher.publish_removed_batch(
+                    batch.event_ids, batch.block_hashes, batch.num_blocks
+                )
+        finally:
+            stats = self.kv_event_stats
+            stats.batches += 1
+            stats.published += len(batch)
+            stats.backlog = 0
+            batch.clear()
+            stats.processing_seconds += time.perf_counter() - start
+            self._maybe_log_kv_event_stats()
+
+    def _maybe_log_kv_event_stats(self):
+        now = time.monotonic()
+        elapsed = now - self._last_kv_event_stats_log
+        if elapsed < KV_EVENT_STATS_LOG_INTERVAL:
+            return
+        self._last_kv_event_stats_log = now
+        stats = self.kv_event_stats
+        logging.info(
+            f"KV events: received={stats.received} published={stats.published} "
+            f"dropped={stats.dropped} batches={stats.batches} "
+            f"stored_blocks={stats.stored_blocks} removed_blocks={stats.removed_blocks} "
+            f"max_backlog={stats.max_backlog} "
+            f"processing={stats.processing_seconds:.3f}s"
+        )
 
     def start(self):
         if (
@@ -446,6 +607,13 @@ class Publisher:
         return False
 
 
+def _kv_event_batch_window() -> float:
+    try:
+        return max(float(os.environ.get(KV_EVENT_BATCH_MS_ENV, "0")), 0.0) / 1000
+    except ValueError:
+        return 0.0
+
+
 @asynccontextmanager
 async def get_publisher(component, engine, kv_listener, worker_id, kv_block_size):
     publisher = Publisher(component, engine, kv_listener, worker_id, kv_block_size)
@@ -21,6 +21,7 @@ from typing import Optional
 from tensorrt_llm import SamplingParams
 from tensorrt_llm.llmapi import DisaggregatedParams as LlmDisaggregatedParams
 
+from dynamo.llm.token_stream import TokenDeltas, coalesce_token_chunks
 from dynamo.runtime.logging import configure_dynamo_logging
 from dynamo.trtllm.engine import TensorRTLLMEngine
 from dynamo.trtllm.multimodal_processor import MultimodalRequestProcessor
@@ -89,10 +90,14 @@ class HandlerBase:
                 result["finish_reason"] == "stop" or result["finish_reason"] == "error"
             )
 
-    async def generate_locally(self, request: dict):
+    def generate_locally(self, request: dict):
         """
         Generate responses based on the disaggregation mode in the request.
+        Token chunks are coalesced as set by DYN_TOKEN_STREAM_COALESCE_MS.
         """
+        return coalesce_token_chunks(self._generate_locally(request))
+
+    async def _generate_locally(self, request: dict):
         logging.debug(f"Request: {request}")
 
         # Default to text-based input. This will be overwritten if multimodal
@@ -137,7 +142,7 @@ class HandlerBase:
         ):
             raise ValueError("Disaggregated params are required for decode mode")
 
-        num_output_tokens_so_far = 0
+        deltas = TokenDeltas()
 
         sampling_params = self.default_sampling_params
 
@@ -200,13 +205,13 @@ class HandlerBase:
             output = res.outputs[0]
             # The engine returns all tokens generated so far. We must calculate the new
             # tokens generated in this iteration to create the "delta".
-            next_total_toks = len(output.token_ids)
             if self.multimodal_processor:
                 out = self.multimodal_processor.create_response_chunk(
-                    output, num_output_tokens_so_far, request_id, model_name
+                    output, deltas.num_seen(), request_id, model_name
                 )
+                deltas.mark_seen(output.token_ids)
             else:
-                out = {"token_ids": output.token_ids[num_output_tokens_so_far:]}
+                out = {"token_ids": deltas.delta(output.token_ids)}
             if output.finish_reason:
                 out["finish_reason"] = output.finish_reason
             if output.stop_reason:
@@ -216,6 +221,4 @@ class HandlerBase:
                 out["disaggregated_params"] = asdict(
                     DisaggregatedParamsCodec.encode(output.disaggregated_params)
                 )
-            # Yield the chunk to the client and update the token count for the next iteration.
             yield out
-            num_output_tokens_so_far = next_total_toks
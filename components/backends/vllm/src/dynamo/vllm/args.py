@@ -43,6 +43,13 @@ class Config:
     endpoint: str
     is_prefill_worker: bool
     migration_limit: int = 0
+    max_inflight_prefills_per_worker: int = 4
+    prefill_batch_window_ms: float = 0.0
+    disagg_policy: str = "cost"
+    max_local_prefill_length: int = 128
+    local_prefill_tokens_per_s: float = 20000.0
+    kv_transfer_gbps: float = 12.5
+    remote_prefill_overhead_ms: float = 2.0
     kv_port: Optional[int] = None
     side_channel_port: Optional[int] = None
     port_range: DynamoPortRange
@@ -79,6 +86,49 @@ def parse_args() -> Config:
         default=0,
         help="Maximum number of times a request may be migrated to a different engine worker. The number may be overridden by the engine.",
     )
+    parser.add_argument(
+        "--max-inflight-prefills-per-worker",
+        type=int,
+        default=4,
+        help="Maximum number of remote prefills a decode worker keeps in flight on each prefill worker; further prefills wait in the decode worker's prefill queue. 0 means unlimited.",
+    )
+    parser.add_argument(
+        "--prefill-batch-window-ms",
+        type=float,
+        default=0.0,
+        help="How long the prefill dispatcher waits for more prefills to dispatch together. 0 only batches prefills that are already queued.",
+    )
+    parser.add_argument(
+        "--disagg-policy",
+        type=str,
+        choices=["always", "threshold", "cost"],
+        default="cost",
+        help="How a decode worker chooses between local and remote prefill. 'always': remote whenever a prefill worker is up. 'threshold': remote when the uncached prompt is longer than --max-local-prefill-length. 'cost': as 'threshold', and only if the remote round trip, KV transfer and prefill queue wait cost less than prefilling locally.",
+    )
+    parser.add_argument(
+        "--max-local-prefill-length",
+        type=int,
+        default=128,
+        help="Uncached prompt tokens up to which requests are prefilled locally. Can be updated at runtime through etcd, see DisaggregatedRouter.",
+    )
+    parser.add_argument(
+        "--local-prefill-tokens-per-s",
+        type=float,
+        default=20000.0,
+        help="Prefill throughput of the decode worker, used by the 'cost' disaggregation policy.",
+    )
+    parser.add_argument(
+        "--kv-transfer-gbps",
+        type=float,
+        default=12.5,
+        help="KV cache transfer bandwidth from prefill to decode workers in GB/s, used by the 'cost' disaggregation policy.",
+    )
+    parser.add_argument(
+        "--remote-prefill-overhead-ms",
+        type=float,
+        default=2.0,
+        help="Fixed cost of a remote prefill round trip in milliseconds, used by the 'cost' disaggregation policy.",
+    )
     parser.add_argument(
         "--dynamo-port-min",
         type=int,
@@ -137,6 +187,13 @@ def parse_args() -> Config:
     config.engine_args = engine_args
     config.is_prefill_worker = args.is_prefill_worker
     config.migration_limit = args.migration_limit
+    config.max_inflight_prefills_per_worker = args.max_inflight_prefills_per_worker
+    config.prefill_batch_window_ms = args.prefill_batch_window_ms
+    config.disagg_policy = args.disagg_policy
+    config.max_local_prefill_length = args.max_local_prefill_length
+    config.local_prefill_tokens_per_s = args.local_prefill_tokens_per_s
+    config.kv_transfer_gbps = args.kv_transfer_gbps
+    config.remote_prefill_overhead_ms = args.remote_prefill_overhead_ms
     config.port_range = DynamoPortRange(
         min=args.dynamo_port_min, max=args.dynamo_port_max
     )
@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-request choice between local and remote prefill on a decode worker.
+
+Remote prefill keeps long prefills from stalling the decode batch, but each one
+pays a round trip to the prefill worker, the wait in the prefill queue and the
+KV cache transfer back. For short prompts, or prompts mostly cached on the
+decode worker already, that costs more than the local prefill it replaces.
+
+Policies estimate both sides for each request:
+
+    local  = new tokens / local prefill throughput
+    remote = round trip + new tokens * KV bytes per token / transfer bandwidth
+             + expected prefill queue wait
+
+where the new tokens are the prompt minus the estimated local prefix hit, and
+differ in how they decide, see DISAGG_POLICIES.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+ROOT = 0
+
+
+class PrefillRemoteRule(Protocol):
+    """Length rule of `dynamo.llm.DisaggregatedRouter`."""
+
+    def prefill_remote(self, prefill_length: int, prefix_hit_length: int) -> bool:
+        ...
+
+
+class StaticPrefillRemoteRule:
+    """Fallback `PrefillRemoteRule` with a fixed threshold, when etcd is not available."""
+
+    def __init__(self, max_local_prefill_length: int):
+        self.max_local_prefill_length = max_local_prefill_length
+
+    def prefill_remote(self, prefill_length: int, prefix_hit_length: int) -> bool:
+        return prefill_length - prefix_hit_length > self.max_local_prefill_length
+
+
+class LocalPrefixEstimator:
+    """
+    Approximates the prefix cache of this decode worker with an LRU of the blocks
+    of recent prompts, bounded to `capacity` blocks (the KV cache size).
+
+    Blocks are identified by chaining the hash of their tokens with the id of
+    the previous block, so only whole leading blocks of a prompt can match, as
+    in the engine.
+    """
+
+    def __init__(self, block_size: int, capacity: int):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.capacity = capacity
+        self.blocks: OrderedDict[int, None] = OrderedDict()
+
+    def observe(self, token_ids) -> int:
+        """Return the number of cached prompt tokens, then cache the prompt's blocks."""
+        block_bytes = 4 * self.block_size
+        num_blocks = len(token_ids) // self.block_size
+        # slices of a read-only memoryview hash like bytes, without copying
+        data = memoryview(
+            array("I", token_ids[: num_blocks * self.block_size]).tobytes()
+        )
+
+        keys = []
+        parent = ROOT
+        for i in range(num_blocks):
+            parent = hash((parent, data[i * block_bytes : (i + 1) * block_bytes]))
+            keys.append(parent)
+
+        num_hits = 0
+        while num_hits < num_blocks and keys[num_hits] in self.blocks:
+            num_hits += 1
+
+        # deepest blocks first, so that shared prefixes are evicted last
+        for key in reversed(keys):
+            self.blocks[key] = None
+            self.blocks.move_to_end(key)
+        while len(self.blocks) > self.capacity:
+            self.blocks.popitem(last=False)
+
+        return num_hits * self.block_size
+
+
+@dataclass
+class DisaggDecision:
+    remote: bool
+    reason: str
+    prefix_hit_length: int
+    # estimated time the choice saves over the alternative, can be negative
+    # when a rule overrides the estimate
+    saved_seconds: float
+
+
+@dataclass
+class DisaggPolicyStats:
+    """Decision counts by (remote, reason) and the cumulative estimated saving."""
+
+    decisions: Dict[tuple, int] = field(default_factory=dict)
+    saved_seconds: float = 0.0
+    prompt_tokens: int = 0
+    prefix_hit_tokens: int = 0
+
+    def record(self, decision: DisaggDecision, prompt_length: int):
+        key = ("remote" if decision.remote else "local", decision.reason)
+        self.decisions[key] = self.decisions.get(key, 0) + 1
+        self.saved_seconds += decision.saved_seconds
+        self.prompt_tokens += prompt_length
+        self.prefix_hit_tokens += decision.prefix_hit_length
+
+
+@dataclass
+class DisaggCostModel:
+    # prefill throughput of this worker, tokens per second
+    local_prefill_tokens_per_s: float = 20000.0
+    # KV cache bytes per token moved by one rank of the transfer
+    kv_bytes_per_token: int = 0
+    kv_transfer_bytes_per_s: float = 12.5e9
+    # fixed cost of a remote prefill: request, response and transfer setup
+    remote_overhead_s: float = 0.002
+
+    def local_seconds(self, new_tokens: int) -> float:
+        return new_tokens / self.local_prefill_tokens_per_s
+
+    def remote_seconds(self, new_tokens: int, queue_wait: float) -> float:
+        transfer = new_tokens * self.kv_bytes_per_token / self.kv_transfer_bytes_per_s
+        return self.remote_overhead_s + transfer + queue_wait
+
+
+class DisaggregationPolicy(ABC):
+    """
+    Decides whether a request is prefilled locally or remotely.
+
+    Subclasses implement `_choose`; the prefix hit estimate, the cost estimates
+    and the statistics are common to all policies. Without a length rule, every
+    uncached token counts as long enough for a remote prefill.
+    """
+
+    def __init__(
+        self,
+        estimator: LocalPrefixEstimator,
+        cost_model: DisaggCostModel,
+        rule: Optional[PrefillRemoteRule] = None,
+    ):
+        self.estimator = estimator
+        self.cost_model = cost_model
+        self.rule: PrefillRemoteRule = rule or StaticPrefillRemoteRule(0)
+        self.stats = DisaggPolicyStats()
+
+    def decide(
+        self, token_ids, num_prefill_workers: int, queue_wait: float = 0.0
+    ) -> DisaggDecision:
+        """
+        Args:
+            token_ids: Prompt of the request.
+            num_prefill_workers: Prefill workers currently available.
+            queue_wait: Expected wait in the prefill queue, in seconds.
+        """
+        prompt_length = len(token_ids)
+        prefix_hit_length = self.estimator.observe(token_ids)
+        new_tokens = prompt_length - prefix_hit_length
+        local = self.cost_model.local_seconds(new_tokens)
+        remote = self.cost_model.remote_seconds(new_tokens, queue_wait)
+
+        if num_prefill_workers == 0:
+            decision = DisaggDecision(
+                False, "no_prefill_workers", prefix_hit_length, 0.0
+            )
+        else:
+            is_remote, reason = self._choose(
+                prompt_length, prefix_hit_length, local, remote, queue_wait
+            )
+            saved = local - remote if is_remote else remote - local
+            decision = DisaggDecision(is_remote, reason, prefix_hit_length, saved)
+
+        self.stats.record(decision, prompt_length)
+        return decision
+
+    @abstractmethod
+    def _choose(
+        self,
+        prompt_length: int,
+        prefix_hit_length: int,
+        local_seconds: float,
+        remote_seconds: float,
+        queue_wait: float,
+    ) -> tuple[bool, str]:
+        """Whether to prefill remotely, and the reason of the decision."""
+        pass
+
+
+class AlwaysRemotePolicy(DisaggregationPolicy):
+    """Prefill remotely whenever a prefill worker is available."""
+
+    def _choose(
+        self,
+        prompt_length: int,
+        prefix_hit_length: int,
+        local_seconds: float,
+        remote_seconds: float,
+        queue_wait: float,
+    ) -> tuple[bool, str]:
+        return True, "always"
+
+
+class ThresholdPolicy(DisaggregationPolicy):
+    """Prefill remotely when the uncached part of the prompt exceeds the length rule."""
+
+    def _choose(
+        self,
+        prompt_length: int,
+        prefix_hit_length: int,
+        local_seconds: float,
+        remote_seconds: float,
+        queue_wait: float,
+    ) -> tuple[bool, str]:
+        if self.rule.prefill_remote(prompt_length, prefix_hit_length):
+            return True, "length"
+        return False, "length"
+
+
+class CostPolicy(ThresholdPolicy):
+    """
+    Applies the length rule, then prefills remotely only if the estimated remote
+    cost is below the local one.
+    """
+
+    def _choose(
+        self,
+        prompt_length: int,
+        prefix_hit_length: int,
+        local_seconds: float,
+        remote_seconds: float,
+        queue_wait: float,
+    ) -> tuple[bool, str]:
+        if not self.rule.prefill_remote(prompt_length, prefix_hit_length):
+            return False, "length"
+        if remote_seconds < local_seconds:
+            return True, "cost"
+        # tell apart requests the prefill queue alone pushed back to local
+        if remote_seconds - queue_wait < local_seconds:
+            return False, "queue"
+        return False, "cost"
+
+
+DISAGG_POLICIES: Dict[str, type[DisaggregationPolicy]] = {
+    "always": AlwaysRemotePolicy,
+    "threshold": ThresholdPolicy,
+    "cost": CostPolicy,
+}
@@ -5,15 +5,18 @@ import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Callable, Optional
 
 import msgspec
 from vllm.inputs import TokensPrompt
-from vllm.sampling_params import SamplingParams
+from vllm.sampling_params import RequestOutputKind, SamplingParams
 
+from dynamo.llm.token_stream import coalesce_token_chunks
 from dynamo.runtime.logging import configure_dynamo_logging
+from dynamo.runtime.membership import InstanceWatcher, release, watch_instances
 
+from .disagg_policy import DisaggregationPolicy
+from .prefill_dispatch import PrefillDispatchConfig, PrefillDispatcher
 from .protocol import MyRequestOutput
 
 configure_dynamo_logging()
@@ -46,10 +49,19 @@ class BaseWorkerHandler(ABC):
         """Override in subclasses if cleanup is needed."""
         pass
 
-    async def generate_tokens(self, prompt, sampling_params, request_id):
+    def generate_tokens(
+        self, prompt, sampling_params, request_id
+    ) -> AsyncIterator[dict]:
+        """Token chunks of the request, coalesced as set by DYN_TOKEN_STREAM_COALESCE_MS."""
+        # the engine then reports only the new tokens of each step, nothing to slice
+        sampling_params.output_kind = RequestOutputKind.DELTA
+        return coalesce_token_chunks(
+            self._token_chunks(prompt, sampling_params, request_id)
+        )
+
+    async def _token_chunks(self, prompt, sampling_params, request_id):
         gen = self.engine_client.generate(prompt, sampling_params, request_id)
 
-        num_output_tokens_so_far = 0
         try:
             async for res in gen:
                 # res is vllm's RequestOutput
@@ -65,14 +77,12 @@ class BaseWorkerHandler(ABC):
                     break
 
                 output = res.outputs[0]
-                next_total_toks = len(output.token_ids)
-                out = {"token_ids": output.token_ids[num_output_tokens_so_far:]}
+                out = {"token_ids": output.token_ids}
                 if output.finish_reason:
                     out["finish_reason"] = output.finish_reason
                 if output.stop_reason:
                     out["stop_reason"] = output.stop_reason
                 yield out
-                num_output_tokens_so_far = next_total_toks
         except asyncio.CancelledError:
             # raise EngineShGeneratorExit when engine exits so that frontend can migrate the request
             raise GeneratorExit(
@@ -82,34 +92,89 @@ class BaseWorkerHandler(ABC):
 
 class DecodeWorkerHandler(BaseWorkerHandler):
     def __init__(
-        self, component, engine, default_sampling_params, prefill_worker_client=None
+        self,
+        component,
+        engine,
+        default_sampling_params,
+        prefill_worker_client=None,
+        block_size: int = 16,
+        prefill_dispatch_config: Optional[PrefillDispatchConfig] = None,
+        disagg_policy: Optional[DisaggregationPolicy] = None,
     ):
         super().__init__(component, engine, default_sampling_params)
         self.prefill_worker_client = prefill_worker_client
+        self.disagg_policy = disagg_policy
         self.can_prefill = 0
-        self._prefill_check_task = None
+        self.prefill_dispatcher: Optional[PrefillDispatcher] = None
+        self._prefill_watcher: Optional[InstanceWatcher] = None
+        self._remove_prefill_listener: Optional[Callable[[], None]] = None
 
         if self.prefill_worker_client is not None:
-            self._prefill_check_task = asyncio.create_task(self._prefill_check_loop())
-
-    async def _prefill_check_loop(self):
-        """Background task that checks prefill worker availability every 5 seconds."""
-        while True:
-            try:
-                if self.prefill_worker_client is not None:
-                    self.can_prefill = len(self.prefill_worker_client.instance_ids())
-                    logger.debug(f"Current Prefill Workers: {self.can_prefill}")
-                await asyncio.sleep(5)
-            except Exception as e:
-                logger.error(f"Error in prefill check loop: {e}")
-                await asyncio.sleep(5)  # Still sleep on error to avoid tight loop
+            # pushed by the etcd watch instead of polling instance_ids
+            watcher = watch_instances(self.prefill_worker_client)
+            self._prefill_watcher = watcher
+            self.can_prefill = len(watcher)
+            self._remove_prefill_listener = watcher.add_listener(
+                self._on_prefill_workers_changed
+            )
+            self.prefill_dispatcher = PrefillDispatcher(
+                self.prefill_worker_client,
+                watcher,
+                block_size,
+                prefill_dispatch_config,
+            )
+
+    def _on_prefill_workers_changed(self, added, removed):
+        if self._prefill_watcher is None:
+            return
+        self.can_prefill = len(self._prefill_watcher)
+        logger.debug(
+            f"Prefill workers added: {sorted(added)}, removed: {sorted(removed)}, current: {self.can_prefill}"
+        )
 
     def cleanup(self):
-        """Cancel background tasks."""
-        if self._prefill_check_task is not None:
-            self._prefill_check_task.cancel()
+        """Stop dispatching prefills and watching prefill workers."""
+        if self.prefill_dispatcher is not None:
+            self.prefill_dispatcher.close()
+            self.prefill_dispatcher = None
+        if self._remove_prefill_listener is not None:
+            self._remove_prefill_listener()
+            self._remove_prefill_listener = None
+        if self._prefill_watcher is not None:
+            release(self._prefill_watcher)
+            self._prefill_watcher = None
         super().cleanup()
 
+    def _prefill_remote(self, dispatcher: PrefillDispatcher, token_ids) -> bool:
+        """Whether to prefill `token_ids` on a prefill worker, without a policy whenever one is up."""
+        if self.disagg_policy is None:
+            return bool(self.can_prefill)
+        decision = self.disagg_policy.decide(
+            token_ids, self.can_prefill, dispatcher.expected_queue_wait()
+        )
+        logger.debug(
+            f"Prefill {'remote' if decision.remote else 'local'} ({decision.reason}), "
+            f"estimated prefix hit {decision.prefix_hit_length}/{len(token_ids)} tokens, "
+            f"saves {decision.saved_seconds * 1e3:.2f}ms"
+        )
+        return decision.remote
+
+    @staticmethod
+    def _prefill_sampling_params(sampling_params: SamplingParams) -> dict:
+        """
+        Wire format of the prefill copy of `sampling_params`. The overrides are
+        applied to the builtins, which are fresh containers, so the decode
+        parameters need not be deep copied.
+        """
+        params = msgspec.to_builtins(sampling_params)
+        params["extra_args"] = {
+            **(params.get("extra_args") or {}),
+            "kv_transfer_params": {"do_remote_decode": True},
+        }
+        params["max_tokens"] = 1
+        params["min_tokens"] = 1
+        return params
+
     async def generate(self, request):
         request_id = str(uuid.uuid4().hex)
         logger.debug(f"New Request ID: {request_id}")
@@ -127,29 +192,20 @@ class DecodeWorkerHandler(BaseWorkerHandler):
             if value is not None and hasattr(sampling_params, key):
                 setattr(sampling_params, key, value)
 
-        if self.can_prefill:
-            # Create a copy for prefill with specific modifications
-            prefill_sampling_params = deepcopy(sampling_params)
-
-            if prefill_sampling_params.extra_args is None:
-                prefill_sampling_params.extra_args = {}
-            prefill_sampling_params.extra_args["kv_transfer_params"] = {
-                "do_remote_decode": True,
-            }
-            prefill_sampling_params.max_tokens = 1
-            prefill_sampling_params.min_tokens = 1
-
-            prefill_request = {
-                "token_ids": request["token_ids"],
-                "sampling_params": msgspec.to_builtins(prefill_sampling_params),
-                "request_id": request_id,
-            }
-
-            # TODO Change to prefill queue
-            if self.prefill_worker_client is not None:
-                prefill_response = await anext(
-                    await self.prefill_worker_client.round_robin(prefill_request)
-                )
+        dispatcher = self.prefill_dispatcher
+        if dispatcher is not None and self._prefill_remote(
+            dispatcher, request["token_ids"]
+        ):
+            prefill_response = await dispatcher.prefill(
+                request["token_ids"],
+                {
+                    "token_ids": request["token_ids"],
+                    "sampling_params": self._prefill_sampling_params(sampling_params),
+                    "request_id": request_id,
+                },
+            )
+            # None if the last prefill worker left while queued: prefill locally
+            if prefill_response is not None:
                 prefill_response = MyRequestOutput.model_validate_json(
                     prefill_response.data()
                 )
@@ -12,12 +12,14 @@ from vllm.usage.usage_lib import UsageContext
 from vllm.v1.engine.async_llm import AsyncLLM
 
 from dynamo.llm import (
+    DisaggregatedRouter,
     ModelRuntimeConfig,
     ModelType,
     ZmqKvEventPublisher,
     ZmqKvEventPublisherConfig,
     register_llm,
 )
+from dynamo.llm.worker_metrics import register_collector
 from dynamo.runtime import DistributedRuntime, dynamo_worker
 from dynamo.runtime.logging import configure_dynamo_logging
 
@@ -28,7 +30,16 @@ from .args import (
     overwrite_args,
     parse_args,
 )
+from .disagg_policy import (
+    DISAGG_POLICIES,
+    DisaggCostModel,
+    LocalPrefixEstimator,
+    PrefillRemoteRule,
+    StaticPrefillRemoteRule,
+)
 from .handlers import DecodeWorkerHandler, PrefillWorkerHandler
+from .metrics import PrefillMetricsCollector
+from .prefill_dispatch import PrefillDispatchConfig
 from .publisher import StatLoggerFactory
 
 configure_dynamo_logging()
@@ -191,7 +202,24 @@ async def init(runtime: DistributedRuntime, config: Config):
     logger.info(f"VllmWorker for {config.model} has been initialized")
 
     handler = DecodeWorkerHandler(
-        component, engine_client, default_sampling_params, prefill_worker_client
+        component,
+        engine_client,
+        default_sampling_params,
+        prefill_worker_client,
+        block_size=vllm_config.cache_config.block_size,
+        prefill_dispatch_config=PrefillDispatchConfig(
+            max_inflight_per_worker=config.max_inflight_prefills_per_worker,
+            batch_window=config.prefill_batch_window_ms / 1000,
+        ),
+        disagg_policy=setup_disagg_policy(
+            config,
+            vllm_config,
+            await make_prefill_remote_rule(runtime, config),
+        ),
+    )
+
+    register_collector(
+        PrefillMetricsCollector(handler.prefill_dispatcher, handler.disagg_policy)
     )
 
     if config.engine_args.enable_prefix_caching:
@@ -250,6 +278,60 @@ async def init(runtime: DistributedRuntime, config: Config):
         handler.cleanup()
 
 
+async def make_prefill_remote_rule(
+    runtime: DistributedRuntime, config: Config
+) -> PrefillRemoteRule:
+    """
+    Length rule of the disaggregation policy. The DisaggregatedRouter watches
+    its threshold in etcd, so that it can be tuned without restarting workers.
+    """
+    model_name = config.served_model_name or config.model
+    try:
+        # the constructor waits for etcd, keep it off the event loop
+        return await asyncio.to_thread(
+            DisaggregatedRouter, runtime, model_name, config.max_local_prefill_length
+        )
+    except Exception as e:
+        logger.warning(
+            f"DisaggregatedRouter unavailable, using a fixed max local prefill length: {e}"
+        )
+        return StaticPrefillRemoteRule(config.max_local_prefill_length)
+
+
+def setup_disagg_policy(config: Config, vllm_config, rule: PrefillRemoteRule):
+    """Build the local vs remote prefill policy of a decode worker."""
+    cache_config = vllm_config.cache_config
+    model_config = vllm_config.model_config
+    parallel_config = vllm_config.parallel_config
+    if cache_config.cache_dtype.startswith("fp8"):
+        kv_dtype_bytes = 1
+    else:
+        kv_dtype_bytes = model_config.dtype.itemsize
+    # K and V of every layer, for the KV heads of one tensor parallel rank
+    kv_bytes_per_token = (
+        2
+        * model_config.get_num_layers(parallel_config)
+        * model_config.get_num_kv_heads(parallel_config)
+        * model_config.get_head_size()
+        * kv_dtype_bytes
+    )
+
+    cost_model = DisaggCostModel(
+        local_prefill_tokens_per_s=config.local_prefill_tokens_per_s,
+        kv_bytes_per_token=kv_bytes_per_token,
+        kv_transfer_bytes_per_s=config.kv_transfer_gbps * 1e9,
+        remote_overhead_s=config.remote_prefill_overhead_ms / 1000,
+    )
+    estimator = LocalPrefixEstimator(
+        cache_config.block_size, cache_config.num_gpu_blocks or 0
+    )
+    logger.info(
+        f"Disaggregation policy '{config.disagg_policy}': {cost_model}, "
+        f"max local prefill length {config.max_local_prefill_length}"
+    )
+    return DISAGG_POLICIES[config.disagg_policy](estimator, cost_model, rule)
+
+
 def get_engine_cache_info(engine: AsyncLLM):
     """Retrieve cache configuration information from [`AsyncLLM`] engine."""
 
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Prometheus export of the prefill dispatch and disaggregation policy statistics."""
+
+from typing import Iterator, Optional
+
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    SummaryMetricFamily,
+)
+
+from .disagg_policy import DisaggregationPolicy
+from .prefill_dispatch import PrefillDispatcher
+
+PREFIX = "dynamo_vllm_"
+
+
+class PrefillMetricsCollector:
+    """Reads the counters of a decode worker's dispatcher and policy on every scrape."""
+
+    def __init__(
+        self,
+        dispatcher: Optional[PrefillDispatcher] = None,
+        policy: Optional[DisaggregationPolicy] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.policy = policy
+
+    def collect(self) -> Iterator:
+        if self.dispatcher is not None:
+            yield from self._collect_dispatcher(self.dispatcher)
+        if self.policy is not None:
+            yield from self._collect_policy(self.policy)
+
+    def _collect_dispatcher(self, dispatcher: PrefillDispatcher) -> Iterator:
+        stats = dispatcher.stats
+        yield SummaryMetricFamily(
+            PREFIX + "prefill_queue_wait_seconds",
+            "Time remote prefills waited in the decode worker's prefill queue",
+            count_value=stats.dispatched,
+            sum_value=stats.queue_wait_sum,
+        )
+        recent = GaugeMetricFamily(
+            PREFIX + "prefill_queue_wait_recent_seconds",
+            "Quantiles of the most recent prefill queue waits",
+            labels=["quantile"],
+        )
+        for q in (50, 90, 99):
+            recent.add_metric([str(q / 100)], stats.queue_wait_percentile(q))
+        yield recent
+        yield GaugeMetricFamily(
+            PREFIX + "prefill_queue_depth",
+            "Remote prefills waiting for a prefill worker",
+            value=dispatcher.queue_depth,
+        )
+        inflight = GaugeMetricFamily(
+            PREFIX + "prefill_inflight",
+            "Remote prefills in flight, per prefill worker",
+            labels=["worker_id"],
+        )
+        for worker_id, load in dispatcher.inflight.items():
+            inflight.add_metric([str(worker_id)], load)
+        yield inflight
+        yield CounterMetricFamily(
+            PREFIX + "prefill_affinity_hits",
+            "Remote prefills sent to the worker that last prefilled their prefix",
+            value=stats.affinity_hits,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "prefill_local_fallbacks",
+            "Queued remote prefills run locally because no prefill worker was left",
+            value=stats.local_fallbacks,
+        )
+
+    def _collect_policy(self, policy: DisaggregationPolicy) -> Iterator:
+        stats = policy.stats
+        decisions = CounterMetricFamily(
+            PREFIX + "disagg_decisions",
+            "Local vs remote prefill decisions, by reason",
+            labels=["prefill", "reason"],
+        )
+        for (prefill, reason), count in stats.decisions.items():
+            decisions.add_metric([prefill, reason], count)
+        yield decisions
+        yield GaugeMetricFamily(
+            PREFIX + "disagg_estimated_saved_seconds",
+            "Cumulative estimated time saved by the decisions over the alternative",
+            value=stats.saved_seconds,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "disagg_prompt_tokens",
+            "Prompt tokens seen by the disaggregation policy",
+            value=stats.prompt_tokens,
+        )
+        yield CounterMetricFamily(
+            PREFIX + "disagg_estimated_prefix_hit_tokens",
+            "Prompt tokens estimated to be cached on this decode worker",
+            value=stats.prefix_hit_tokens,
+        )
@@ -0,0 +1,329 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Queue-based dispatch of remote prefills from a decode worker.
+
+Prefill requests wait in a local FIFO queue. A dispatch loop drains the queue in
+micro-batches and grants each request a prefill worker:
+
+- admission control: a worker never has more than `max_inflight_per_worker`
+  prefills in flight from this decode worker; when all workers are full,
+  requests stay queued until a slot frees up instead of piling onto a worker.
+- prefix affinity: requests whose leading blocks were recently prefilled by a
+  worker go back to that worker, where they are likely prefix cache hits,
+  as long as it is not much busier than the least loaded worker.
+- load awareness: otherwise the worker with the fewest prefills in flight wins.
+
+Requests of one micro-batch sharing a prefix are granted back to back, so they
+land on the same worker together.
+"""
+
+import asyncio
+import logging
+import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefillDispatchConfig:
+    # 0 disables admission control
+    max_inflight_per_worker: int = 4
+    # how long the dispatch loop waits for more requests to join a micro-batch;
+    # 0 only batches requests that are already queued
+    batch_window: float = 0.0
+    max_batch_size: int = 32
+    # number of leading blocks identifying a prefix for worker affinity
+    affinity_blocks: int = 4
+    affinity_capacity: int = 8192
+    # an affinity worker is preferred while it has at most this many more
+    # prefills in flight than the least loaded worker
+    affinity_slack: int = 1
+    stats_log_interval: float = 30.0
+
+
+@dataclass
+class PrefillDispatchStats:
+    """Counters of a `PrefillDispatcher`, queue wait times are in seconds."""
+
+    dispatched: int = 0
+    affinity_hits: int = 0
+    local_fallbacks: int = 0
+    batches: int = 0
+    queue_wait_sum: float = 0.0
+    queue_wait_max: float = 0.0
+    # moving average of the round trip of a granted prefill, in seconds
+    prefill_seconds: float = 0.0
+    recent_queue_waits: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def record_wait(self, wait: float):
+        self.queue_wait_sum += wait
+        self.queue_wait_max = max(self.queue_wait_max, wait)
+        self.recent_queue_waits.append(wait)
+
+    def record_prefill(self, seconds: float, weight: float = 0.1):
+        if self.prefill_seconds == 0.0:
+            self.prefill_seconds = seconds
+        else:
+            self.prefill_seconds += weight * (seconds - self.prefill_seconds)
+
+    def queue_wait_percentile(self, q: float) -> float:
+        """Percentile `q` in [0, 100] of the most recent queue waits."""
+        if not self.recent_queue_waits:
+            return 0.0
+        waits = sorted(self.recent_queue_waits)
+        return waits[min(int(len(waits) * q / 100), len(waits) - 1)]
+
+
+@dataclass
+class _PendingPrefill:
+    prefix_key: Optional[int]
+    enqueued_at: float
+    grant: asyncio.Future
+
+
+class PrefillDispatcher:
+    """
+    Grants prefill workers to queued prefill requests, see the module docstring.
+
+    `watcher` is the `InstanceWatcher` of the prefill workers' client.
+    """
+
+    def __init__(
+        self,
+        client,
+        watcher,
+        block_size: int,
+        config: Optional[PrefillDispatchConfig] = None,
+    ):
+        self.client = client
+        self.watcher = watcher
+        self.block_size = block_size
+        self.config = config or PrefillDispatchConfig()
+        self.stats = PrefillDispatchStats()
+
+        self.inflight: Dict[int, int] = {
+            worker_id: 0 for worker_id in watcher.instance_ids
+        }
+        # prefix key -> worker that last prefilled it, in LRU order
+        self.affinity: OrderedDict[int, int] = OrderedDict()
+        self.queue: asyncio.Queue[_PendingPrefill] = asyncio.Queue()
+        # set whenever a slot frees up or the prefill workers change
+        self._capacity_changed = asyncio.Event()
+        self._last_stats_log = time.monotonic()
+
+        self._remove_listener = watcher.add_listener(self._on_workers_changed)
+        self._task: Optional[asyncio.Task] = asyncio.create_task(self._dispatch())
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.qsize()
+
+    @property
+    def num_workers(self) -> int:
+        return len(self.inflight)
+
+    def expected_queue_wait(self) -> float:
+        """
+        Rough wait in seconds of a prefill queued now: zero while a worker has a
+        free slot, otherwise the queue ahead of it drained at the rate at which
+        slots free up.
+        """
+        limit = self.config.max_inflight_per_worker
+        if limit <= 0 or not self.inflight:
+            return 0.0
+        if any(load < limit for load in self.inflight.values()):
+            return 0.0
+        slots = limit * len(self.inflight)
+        return (self.queue_depth + 1) / slots * self.stats.prefill_seconds
+
+    async def prefill(self, token_ids, prefill_request: dict):
+        """
+        Send `prefill_request` to a prefill worker once one is granted and return
+        its first response, or None if no prefill worker is left, in which case
+        the caller should prefill locally.
+        """
+        worker_id = await self.acquire(token_ids)
+        if worker_id is None:
+            return None
+        start = time.monotonic()
+        try:
+            stream = await self.client.direct(prefill_request, worker_id)
+            response = await anext(stream)
+        finally:
+            self.release(worker_id)
+        self.stats.record_prefill(time.monotonic() - start)
+        return response
+
+    async def acquire(self, token_ids) -> Optional[int]:
+        """
+        Queue a prefill of `token_ids` and wait for a worker to be granted.
+        Every granted worker must be handed back with `release`.
+        """
+        pending = _PendingPrefill(
+            prefix_key=self._prefix_key(token_ids),
+            enqueued_at=time.monotonic(),
+            grant=asyncio.get_running_loop().create_future(),
+        )
+        self.queue.put_nowait(pending)
+        try:
+            return await pending.grant
+        except asyncio.CancelledError:
+            # granted in the meantime, the slot would leak otherwise
+            if pending.grant.done() and not pending.grant.cancelled():
+                worker_id = pending.grant.result()
+                if worker_id is not None:
+                    self.release(worker_id)
+            raise
+
+    def release(self, worker_id: int):
+        if self.inflight.get(worker_id, 0) > 0:
+            self.inflight[worker_id] -= 1
+        self._capacity_changed.set()
+
+    def close(self):
+        self._remove_listener()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        while not self.queue.empty():
+            pending = self.queue.get_nowait()
+            if not pending.grant.done():
+                pending.grant.set_result(None)
+
+    def _prefix_key(self, token_ids) -> Optional[int]:
+        num_tokens = (
+            min(len(token_ids) // self.block_size, self.config.affinity_blocks)
+            * self.block_size
+        )
+        if num_tokens == 0:
+            return None
+        return hash(array("I", token_ids[:num_tokens]).tobytes())
+
+    def _on_workers_changed(self, added, removed):
+        for worker_id in added:
+            self.inflight.setdefault(worker_id, 0)
+        for worker_id in removed:
+            self.inflight.pop(worker_id, None)
+        if removed:
+            self.affinity = OrderedDict(
+                (key, worker_id)
+                for key, worker_id in self.affinity.items()
+                if worker_id not in removed
+            )
+        self._capacity_changed.set()
+
+    async def _dispatch(self):
+        while True:
+            batch = [await self.queue.get()]
+            await self._fill_batch(batch)
+
+            # group requests sharing a prefix, keeping the FIFO order of first arrival
+            groups: Dict[Optional[int], list] = {}
+            for pending in batch:
+                key = (
+                    pending.prefix_key
+                    if pending.prefix_key is not None
+                    else id(pending)
+                )
+                groups.setdefault(key, []).append(pending)
+            self.stats.batches += 1
+
+            for group in groups.values():
+                for pending in group:
+                    if pending.grant.done():
+                        # the request was cancelled while queued
+                        continue
+                    worker_id, affinity = await self._select_worker(pending.prefix_key)
+                    if not pending.grant.done():
+                        self._grant(pending, worker_id, affinity)
+
+            self._maybe_log_stats()
+
+    async def _fill_batch(self, batch: list):
+        deadline = time.monotonic() + self.config.batch_window
+        while len(batch) < self.config.max_batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                return
+
+    async def _select_worker(
+        self, prefix_key: Optional[int]
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Wait until a worker has a free slot and pick one, None if there are no
+        workers. Also returns whether the worker was picked for prefix affinity.
+        """
+        limit = self.config.max_inflight_per_worker
+        while True:
+            self._capacity_changed.clear()
+            if not self.inflight:
+                return None, False
+
+            candidates = {
+                worker_id: load
+                for worker_id, load in self.inflight.items()
+                if limit <= 0 or load < limit
+            }
+            if candidates:
+                min_load = min(candidates.values())
+                worker_id = (
+                    self.affinity.get(prefix_key) if prefix_key is not None else None
+                )
+                if (
+                    worker_id in candidates
+                    and candidates[worker_id] <= min_load + self.config.affinity_slack
+                ):
+                    return worker_id, True
+                return min(candidates, key=candidates.__getitem__), False
+
+            await self._capacity_changed.wait()
+
+    def _grant(
+        self, pending: _PendingPrefill, worker_id: Optional[int], affinity: bool
+    ):
+        if worker_id is None:
+            self.stats.local_fallbacks += 1
+            pending.grant.set_result(None)
+            return
+
+        self.inflight[worker_id] += 1
+        if pending.prefix_key is not None:
+            self.affinity[pending.prefix_key] = worker_id
+            self.affinity.move_to_end(pending.prefix_key)
+            if len(self.affinity) > self.config.affinity_capacity:
+                self.affinity.popitem(last=False)
+
+        self.stats.dispatched += 1
+        if affinity:
+            self.stats.affinity_hits += 1
+        self.stats.record_wait(time.monotonic() - pending.enqueued_at)
+        pending.grant.set_result(worker_id)
+
+    def _maybe_log_stats(self):
+        now = time.monotonic()
+        if now - self._last_stats_log < self.config.stats_log_interval:
+            return
+        self._last_stats_log = now
+        stats = self.stats
+        logger.info(
+            f"Prefill dispatch: dispatched={stats.dispatched} batches={stats.batches} "
+            f"affinity_hits={stats.affinity_hits} local_fallbacks={stats.local_fallbacks} "
+            f"queue_depth={self.queue_depth} "
+            f"queue_wait_p50={stats.queue_wait_percentile(50) * 1e3:.2f}ms "
+            f"queue_wait_p99={stats.queue_wait_percentile(99) * 1e3:.2f}ms "
+            f"queue_wait_max={stats.queue_wait_max * 1e3:.2f}ms "
+            f"inflight={self.inflight}"
+        )
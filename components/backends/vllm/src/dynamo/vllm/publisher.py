@@ -7,12 +7,11 @@ from vllm.config import VllmConfig
 from vllm.v1.metrics.loggers import StatLoggerBase
 from vllm.v1.metrics.stats import IterationStats, SchedulerStats
 
-from dynamo.llm import (
-    ForwardPassMetrics,
-    KvStats,
-    SpecDecodeStats,
-    WorkerMetricsPublisher,
-    WorkerStats,
+from dynamo.llm import SpecDecodeStats, WorkerMetricsPublisher
+from dynamo.llm.load_publisher import (
+    CoalescingMetricsPublisher,
+    PrefixCacheCounter,
+    WorkerLoad,
 )
 from dynamo.runtime import Component
 
@@ -34,14 +33,23 @@ class NullStatLogger(StatLoggerBase):
 
 
 class DynamoStatLoggerPublisher(StatLoggerBase):
-    """Stat logger publisher. Wrapper for the WorkerMetricsPublisher to match the StatLoggerBase interface."""
+    """
+    Stat logger publisher. Wrapper for the WorkerMetricsPublisher to match the StatLoggerBase interface.
+
+    vLLM records stats on every scheduler iteration; the coalescing publisher
+    rate limits and deduplicates them before they reach the router.
+    """
 
     def __init__(self, component: Component, dp_rank: int) -> None:
         self.inner = WorkerMetricsPublisher()
         self.inner.create_endpoint(component)
+        self.publisher = CoalescingMetricsPublisher(self.inner)
         self.dp_rank = dp_rank
         self.num_gpu_block = 1
         self.request_total_slots = 1
+        # vLLM reports the prefix cache lookups of each iteration, the router
+        # gets the totals
+        self.prefix_cache = PrefixCacheCounter()
 
     # TODO: Remove this and pass as metadata through etcd
     def set_num_gpu_block(self, num_blocks):
@@ -60,25 +68,9 @@ class DynamoStatLoggerPublisher(StatLoggerBase):
         # request_total_slots and kv_total_blocks are properties of model + gpu
         # we should only publish them once, not every metric update
         # they should be part of some runtime metadata tied to MDC or put in etcd ?
-        hit_rate = 0
-        if scheduler_stats.prefix_cache_stats.queries > 0:
-            hit_rate = (
-                scheduler_stats.prefix_cache_stats.hits
-                / scheduler_stats.prefix_cache_stats.queries
-            )
-
-        worker_stats = WorkerStats(
-            request_active_slots=scheduler_stats.num_running_reqs,
-            request_total_slots=self.request_total_slots,
-            num_requests_waiting=scheduler_stats.num_waiting_reqs,
-            data_parallel_rank=self.dp_rank,
-        )
-
-        kv_stats = KvStats(
-            kv_active_blocks=int(self.num_gpu_block * scheduler_stats.kv_cache_usage),
-            kv_total_blocks=self.num_gpu_block,
-            gpu_cache_usage_perc=scheduler_stats.kv_cache_usage,
-            gpu_prefix_cache_hit_rate=hit_rate,  # TODO: This is a point in time update, not cumulative. Will be problematic on router side if we try to use it.
+        self.prefix_cache.add(
+            scheduler_stats.prefix_cache_stats.queries,
+            scheduler_stats.prefix_cache_stats.hits,
         )
 
         spec_dec_stats = scheduler_stats.spec_decoding_stats
@@ -91,37 +83,37 @@ class DynamoStatLoggerPublisher(StatLoggerBase):
                 num_accepted_tokens_per_pos=spec_dec_stats.num_accepted_tokens_per_pos,
             )
 
-        metrics = ForwardPassMetrics(
-            worker_stats=worker_stats,
-            kv_stats=kv_stats,
-            spec_decode_stats=spec_dec_stats,
+        self.publisher.update(
+            WorkerLoad(
+                request_active_slots=scheduler_stats.num_running_reqs,
+                request_total_slots=self.request_total_slots,
+                num_requests_waiting=scheduler_stats.num_waiting_reqs,
+                kv_active_blocks=int(
+                    self.num_gpu_block * scheduler_stats.kv_cache_usage
+                ),
+                kv_total_blocks=self.num_gpu_block,
+                gpu_cache_usage_perc=scheduler_stats.kv_cache_usage,
+                prefix_cache=self.prefix_cache,
+                data_parallel_rank=self.dp_rank,
+                spec_decode_stats=spec_dec_stats,
+            )
         )
 
-        self.inner.publish(metrics)
-
     def init_publish(self):
-        worker_stats = WorkerStats(
-            request_active_slots=0,
-            request_total_slots=self.request_total_slots,
-            num_requests_waiting=0,
-            data_parallel_rank=self.dp_rank,
-        )
-
-        kv_stats = KvStats(
-            kv_active_blocks=0,
-            kv_total_blocks=self.num_gpu_block,
-            gpu_cache_usage_perc=0,
-            gpu_prefix_cache_hit_rate=0,
+        self.publisher.update(
+            WorkerLoad(
+                request_active_slots=0,
+                request_total_slots=self.request_total_slots,
+                num_requests_waiting=0,
+                kv_active_blocks=0,
+                kv_total_blocks=self.num_gpu_block,
+                gpu_cache_usage_perc=0,
+                prefix_cache=self.prefix_cache,
+                data_parallel_rank=self.dp_rank,
+            ),
+            force=True,
         )
 
-        metrics = ForwardPassMetrics(
-            worker_stats=worker_stats,
-            kv_stats=kv_stats,
-            spec_decode_stats=None,
-        )
-
-        self.inner.publish(metrics)
-
     def log_engine_initialized(self) -> None:
         pass
 
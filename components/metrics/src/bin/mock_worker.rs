@@ -129,6 +129,8 @@ fn mock_stats_handler(_stats: EndpointStats) -> serde_json::Value {
         kv_total_blocks,
         gpu_cache_usage_perc,
         gpu_prefix_cache_hit_rate,
+        gpu_prefix_cache_queries: 0,
+        gpu_prefix_cache_hits: 0,
     };
 
     let spec_decode_stats = None;
@@ -78,7 +78,7 @@ class SLAPlannerDefaults(BasePlannerDefaults):
     osl = 150  # in number of tokens
     ttft = 0.5  # in seconds
     itl = 0.05  # in seconds
-    load_predictor = "arima"  # ["constant", "arima", "prophet"]
+    load_predictor = "arima"  # ["constant", "arima", "prophet", "arima_incremental", "holt_winters", "kalman"]
     load_prediction_window_size = 50  # predict load using how many recent load samples
 
 
@@ -15,10 +15,14 @@
 
 import logging
 import math
+import time
 import warnings
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timedelta
+from typing import Any, MutableSequence
 
+import numpy as np
 import pandas as pd
 import pmdarima
 from prophet import Prophet
@@ -38,7 +42,13 @@ class BasePredictor(ABC):
 
     def __init__(self, minimum_data_points=5):
         self.minimum_data_points = minimum_data_points
-        self.data_buffer = []
+        # a list, or a deque bounded to the window of the incremental predictors
+        self.data_buffer: MutableSequence[Any] = []
+
+        # latency of predict_next calls, in seconds
+        self.last_prediction_latency = 0.0
+        self.total_prediction_latency = 0.0
+        self.num_predictions = 0
 
     def add_data_point(self, value):
         """Add new data point to the buffer"""
@@ -53,8 +63,24 @@ class BasePredictor(ABC):
             return 0
         return self.data_buffer[-1]
 
-    @abstractmethod
+    @property
+    def avg_prediction_latency(self):
+        """Average latency of predict_next calls, in seconds"""
+        if self.num_predictions == 0:
+            return 0.0
+        return self.total_prediction_latency / self.num_predictions
+
     def predict_next(self):
+        """Predict the next value and record how long the prediction took"""
+        start = time.perf_counter()
+        prediction = self._predict_next()
+        self.last_prediction_latency = time.perf_counter() - start
+        self.total_prediction_latency += self.last_prediction_latency
+        self.num_predictions += 1
+        return prediction
+
+    @abstractmethod
+    def _predict_next(self):
         """Predict the next value"""
         pass
 
@@ -67,7 +93,7 @@ class ConstantPredictor(BasePredictor):
     def __init__(self, **kwargs):
         super().__init__(minimum_data_points=1)
 
-    def predict_next(self):
+    def _predict_next(self):
         return self.get_last_value()
 
 
@@ -84,7 +110,7 @@ class ARIMAPredictor(BasePredictor):
         if len(self.data_buffer) > self.window_size:
             self.data_buffer = self.data_buffer[-self.window_size :]
 
-    def predict_next(self):
+    def _predict_next(self):
         """Predict the next value(s)"""
         if len(self.data_buffer) < self.minimum_data_points:
             return self.get_last_value()
@@ -129,7 +155,7 @@ class ProphetPredictor(BasePredictor):
             return 0
         return self.data_buffer[-1]["y"]
 
-    def predict_next(self):
+    def _predict_next(self):
         """Predict the next value"""
         if len(self.data_buffer) < self.minimum_data_points:
             return self.get_last_value()
@@ -152,8 +178,181 @@ class ProphetPredictor(BasePredictor):
         return forecast["yhat"].iloc[0]
 
 
+# Auto ARIMA order search once, then O(1) state updates with fixed parameters and a
+# warm-started parameter refit over the window every refit_interval points
+class IncrementalARIMAPredictor(BasePredictor):
+    def __init__(
+        self,
+        window_size=100,
+        minimum_data_points=5,
+        refit_interval=10,
+        refit_maxiter=10,
+    ):
+        super().__init__(minimum_data_points=minimum_data_points)
+        self.window_size = window_size
+        self.refit_interval = refit_interval
+        self.refit_maxiter = refit_maxiter
+        self.data_buffer = deque(maxlen=window_size)
+        self.model = None
+        self.results = None  # statsmodels results carrying the filtered state
+        self.pending = []  # points observed since the state was last updated
+        self.points_since_refit = 0
+
+    def add_data_point(self, value):
+        super().add_data_point(value)
+        if self.model is not None:
+            self.pending.append(self.data_buffer[-1])
+            self.points_since_refit += 1
+
+    def _fit(self):
+        y = np.asarray(self.data_buffer, dtype=float)
+        if self.model is None:
+            self.model = pmdarima.auto_arima(
+                y, suppress_warnings=True, error_action="ignore"
+            )
+        else:
+            # warm start from the previous parameters, far fewer iterations than a
+            # cold fit and no order search
+            self.model = pmdarima.ARIMA(
+                order=self.model.order,
+                seasonal_order=self.model.seasonal_order,
+                with_intercept=self.model.with_intercept,
+                start_params=self.model.params(),
+                maxiter=self.refit_maxiter,
+                suppress_warnings=True,
+            ).fit(y)
+        self.results = self.model.arima_res_
+        self.pending = []
+        self.points_since_refit = 0
+
+    def _predict_next(self):
+        if len(self.data_buffer) < self.minimum_data_points:
+            return self.get_last_value()
+
+        if self.model is None or self.points_since_refit >= self.refit_interval:
+            self._fit()
+        assert self.results is not None  # set by _fit
+        if self.pending:
+            # run the Kalman filter forward over the new points only
+            self.results = self.results.extend(np.asarray(self.pending, dtype=float))
+            self.pending = []
+
+        return float(self.results.forecast(1)[0])
+
+
+# Additive Holt-Winters (triple exponential smoothing), updated in O(1) per point.
+# season_length=0 disables the seasonal component (Holt's linear trend method).
+class HoltWintersPredictor(BasePredictor):
+    def __init__(
+        self,
+        window_size=100,
+        minimum_data_points=2,
+        alpha=0.5,
+        beta=0.1,
+        gamma=0.1,
+        season_length=0,
+    ):
+        super().__init__(minimum_data_points=minimum_data_points)
+        self.alpha = alpha  # level smoothing
+        self.beta = beta  # trend smoothing
+        self.gamma = gamma  # seasonal smoothing
+        self.season_length = season_length
+        self.data_buffer = deque(maxlen=window_size)
+        self.level = None
+        self.trend = 0.0
+        self.seasonal = [0.0] * season_length
+        self.step = 0
+
+    def _season(self, step):
+        if not self.season_length:
+            return 0.0
+        return self.seasonal[step % self.season_length]
+
+    def add_data_point(self, value):
+        super().add_data_point(value)
+        value = self.data_buffer[-1]
+
+        if self.level is None:
+            self.level = value
+        else:
+            prev_level = self.level
+            self.level = self.alpha * (value - self._season(self.step)) + (
+                1 - self.alpha
+            ) * (prev_level + self.trend)
+            self.trend = (
+                self.beta * (self.level - prev_level) + (1 - self.beta) * self.trend
+            )
+        if self.season_length:
+            idx = self.step % self.season_length
+            self.seasonal[idx] = (
+                self.gamma * (value - self.level)
+                + (1 - self.gamma) * self.seasonal[idx]
+            )
+        self.step += 1
+
+    def _predict_next(self):
+        if len(self.data_buffer) < self.minimum_data_points or self.level is None:
+            return self.get_last_value()
+        return max(0.0, self.level + self.trend + self._season(self.step))
+
+
+# Kalman filter over a local linear trend model (state = [level, trend]), updated in
+# O(1) per point. Noise is expressed relative to the measurement noise, which makes
+# the filter independent of the scale of the load being predicted.
+class KalmanPredictor(BasePredictor):
+    def __init__(
+        self,
+        window_size=100,
+        minimum_data_points=2,
+        level_noise=0.1,
+        trend_noise=0.01,
+    ):
+        super().__init__(minimum_data_points=minimum_data_points)
+        self.level_noise = level_noise
+        self.trend_noise = trend_noise
+        self.data_buffer = deque(maxlen=window_size)
+        self.level = None
+        self.trend = 0.0
+        # state covariance [[p00, p01], [p01, p11]]
+        self.p00, self.p01, self.p11 = 0.0, 0.0, 0.0
+
+    def add_data_point(self, value):
+        super().add_data_point(value)
+        value = self.data_buffer[-1]
+
+        if self.level is None:
+            # diffuse prior on the trend, the level is known from the first point
+            self.level, self.trend = value, 0.0
+            self.p00, self.p01, self.p11 = 1.0, 0.0, 1e6
+            return
+
+        # predict: x = F x, P = F P F^T + Q with F = [[1, 1], [0, 1]]
+        level = self.level + self.trend
+        p00 = self.p00 + 2 * self.p01 + self.p11 + self.level_noise
+        p01 = self.p01 + self.p11
+        p11 = self.p11 + self.trend_noise
+
+        # update with the observation of the level (unit measurement noise)
+        innovation = value - level
+        s = p00 + 1.0
+        k0, k1 = p00 / s, p01 / s
+        self.level = level + k0 * innovation
+        self.trend += k1 * innovation
+        self.p00 = (1 - k0) * p00
+        self.p01 = (1 - k0) * p01
+        self.p11 = p11 - k1 * p01
+
+    def _predict_next(self):
+        if len(self.data_buffer) < self.minimum_data_points or self.level is None:
+            return self.get_last_value()
+        return max(0.0, self.level + self.trend)
+
+
 LOAD_PREDICTORS = {
     "constant": ConstantPredictor,
     "arima": ARIMAPredictor,
     "prophet": ProphetPredictor,
+    "arima_incremental": IncrementalARIMAPredictor,
+    "holt_winters": HoltWintersPredictor,
+    "kalman": KalmanPredictor,
 }
@@ -14,9 +14,110 @@
 # limitations under the License.
 
 
+import bisect
+import glob
+import hashlib
+import logging
+import math
+import os
+import tempfile
+from typing import Optional, Union
+
 import numpy as np
 import scipy
 
+logger = logging.getLogger(__name__)
+
+# Every interpolator method accepts either python/numpy scalars or array-likes.
+# Scalars return python floats/ints, arrays return numpy arrays of the broadcast shape.
+ArrayLike = Union[float, np.ndarray]
+
+
+_SCALAR_TYPES = (int, float, np.generic)
+
+
+def _is_scalar(*values) -> bool:
+    return all(isinstance(v, _SCALAR_TYPES) or np.ndim(v) == 0 for v in values)
+
+
+# Bump whenever the way decode grids are computed changes, so stale caches are ignored.
+GRID_CACHE_VERSION = 1
+GRID_CACHE_PREFIX = "interpolation_grid"
+
+
+def _grid_cache_key(raw_data: dict[str, np.ndarray], resolution: int) -> str:
+    """Digest of the profiled raw data and grid resolution that produced a grid."""
+    digest = hashlib.sha256(f"v{GRID_CACHE_VERSION}:r{resolution}".encode())
+    for name in sorted(raw_data):
+        arr = np.ascontiguousarray(raw_data[name])
+        digest.update(f"{name}:{arr.dtype.str}:{arr.shape}".encode())
+        digest.update(arr.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _grid_cache_path(cache_dir: str, raw_data: dict[str, np.ndarray], resolution: int):
+    key = _grid_cache_key(raw_data, resolution)
+    return os.path.join(
+        cache_dir, f"{GRID_CACHE_PREFIX}.v{GRID_CACHE_VERSION}.r{resolution}.{key}.npy"
+    )
+
+
+def _load_grid_cache(path: str, resolution: int) -> Optional[np.ndarray]:
+    """Memory-map a cached (itl, thpt) grid stack, or return None if unusable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        grids = np.load(path, mmap_mode="r")
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable interpolation grid cache {path}: {e}")
+        return None
+    if grids.shape != (2, resolution, resolution):
+        logger.warning(f"Ignoring interpolation grid cache {path} with bad shape")
+        return None
+    return grids
+
+
+def _save_grid_cache(path: str, grids: np.ndarray, resolution: int):
+    """Atomically write the grid stack and drop caches built from older inputs."""
+    cache_dir = os.path.dirname(path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, grids)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to write interpolation grid cache {path}: {e}")
+        return
+
+    # drop grids built from older raw data at this resolution, or by an older version
+    current_version = f"{GRID_CACHE_PREFIX}.v{GRID_CACHE_VERSION}."
+    same_resolution = f"{current_version}r{resolution}."
+    for stale in glob.glob(os.path.join(cache_dir, f"{GRID_CACHE_PREFIX}.*.npy")):
+        name = os.path.basename(stale)
+        if stale == path or (
+            name.startswith(current_version) and not name.startswith(same_resolution)
+        ):
+            continue
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass
+
+
+def _grid_index(value: ArrayLike, start: float, step: float, size: int):
+    """Map value(s) to the nearest index of an evenly spaced grid, clipped to the grid."""
+    if isinstance(value, _SCALAR_TYPES) and math.isfinite(value):
+        # pure python path: round() uses round-half-to-even just like np.round
+        return min(max(round((value - start) / step), 0), size - 1)
+    idx = np.clip(np.round((np.asarray(value) - start) / step), 0, size - 1)
+    if np.ndim(idx) == 0:
+        return int(idx)
+    return idx.astype(np.intp)
+
 
 class PrefillInterpolator:
     """
@@ -34,24 +135,30 @@ class PrefillInterpolator:
             self.prefill_ttft = raw_data["prefill_ttft"] / 1000  # convert ms to s
             self.prefill_thpt_per_gpu = raw_data["prefill_thpt_per_gpu"]
 
-        self.min_isl = min(self.prefill_isl)
-        self.max_isl = max(self.prefill_isl)
+        self.min_isl = float(np.min(self.prefill_isl))
+        self.max_isl = float(np.max(self.prefill_isl))
 
-        # perform 1d interpolation
-        self.ttft_interpolator = scipy.interpolate.interp1d(
-            self.prefill_isl, self.prefill_ttft, kind="cubic"
+        # perform 1d cubic spline interpolation
+        # this is the same not-a-knot spline as interp1d(kind="cubic"), but calling the
+        # BSpline directly skips the interp1d bookkeeping on every (batched) call
+        order = np.argsort(self.prefill_isl)
+        self.ttft_interpolator = scipy.interpolate.make_interp_spline(
+            self.prefill_isl[order], self.prefill_ttft[order], k=3
         )
-        self.thpt_interpolator = scipy.interpolate.interp1d(
-            self.prefill_isl, self.prefill_thpt_per_gpu, kind="cubic"
+        self.thpt_interpolator = scipy.interpolate.make_interp_spline(
+            self.prefill_isl[order], self.prefill_thpt_per_gpu[order], k=3
         )
 
-    def interpolate_ttft(self, isl: float) -> float:
-        isl = max(self.min_isl, min(isl, self.max_isl))
-        return self.ttft_interpolator(isl)
+    def _interpolate(self, spline, isl: ArrayLike) -> ArrayLike:
+        if _is_scalar(isl):
+            return float(spline(max(self.min_isl, min(isl, self.max_isl))))
+        return spline(np.clip(isl, self.min_isl, self.max_isl))
+
+    def interpolate_ttft(self, isl: ArrayLike) -> ArrayLike:
+        return self._interpolate(self.ttft_interpolator, isl)
 
-    def interpolate_thpt_per_gpu(self, isl: float) -> float:
-        isl = max(self.min_isl, min(isl, self.max_isl))
-        return self.thpt_interpolator(isl)
+    def interpolate_thpt_per_gpu(self, isl: ArrayLike) -> ArrayLike:
+        return self._interpolate(self.thpt_interpolator, isl)
 
 
 class DecodeInterpolator:
@@ -60,10 +167,14 @@ class DecodeInterpolator:
     throughput/gpu and ITL for a given decode context length.
     """
 
-    def __init__(self, profile_results_dir: str, resolution: int = 100):
-        decode_npz_fn = (
-            f"{profile_results_dir}/selected_decode_interpolation/raw_data.npz"
-        )
+    def __init__(
+        self,
+        profile_results_dir: str,
+        resolution: int = 100,
+        use_grid_cache: bool = True,
+    ):
+        decode_dir = f"{profile_results_dir}/selected_decode_interpolation"
+        decode_npz_fn = f"{decode_dir}/raw_data.npz"
 
         with np.load(decode_npz_fn) as raw_data:
             self.x_kv_usage = raw_data["x_kv_usage"]
@@ -71,101 +182,135 @@ class DecodeInterpolator:
             self.z_itl = raw_data["z_itl"]
             self.z_thpt_per_gpu = raw_data["z_thpt_per_gpu"]
             self.max_kv_tokens = raw_data["max_kv_tokens"][0]
+            raw_arrays = {name: raw_data[name] for name in raw_data.files}
 
         # pre-compute the interpolation grid for fast lookup
         self.resolution = resolution
         self.xi = np.linspace(0, 1, resolution)
         self.yi = np.linspace(0, max(self.y_context_length), resolution)
-        self.X, self.Y = np.meshgrid(self.xi, self.yi)
+
+        # griddata is slow, so the finished grids are cached next to raw_data.npz and
+        # memory-mapped on later starts as long as the raw data and resolution match
+        grids = None
+        if use_grid_cache:
+            cache_path = _grid_cache_path(decode_dir, raw_arrays, resolution)
+            grids = _load_grid_cache(cache_path, resolution)
+        if grids is None:
+            grids = self._compute_grids()
+            if use_grid_cache:
+                _save_grid_cache(cache_path, grids, resolution)
+        else:
+            logger.info(f"Loaded decode interpolation grids from {cache_path}")
+        self.itl_interpolator, self.thpt_interpolator = grids[0], grids[1]
+
+        self._build_lookup_tables()
+
+    def _compute_grids(self) -> np.ndarray:
+        """Interpolate ITL and throughput onto the grid, stacked as (itl, thpt)."""
+        X, Y = np.meshgrid(self.xi, self.yi)
 
         # perform 2d interpolation with fallback for NaN values
-        self.itl_interpolator = scipy.interpolate.griddata(
+        itl_interpolator = scipy.interpolate.griddata(
             (self.x_kv_usage, self.y_context_length),
             self.z_itl,
-            (self.X, self.Y),
+            (X, Y),
             method="cubic",
         )
         # Fill NaN values using nearest neighbor interpolation
-        nan_mask = np.isnan(self.itl_interpolator)
+        nan_mask = np.isnan(itl_interpolator)
         if np.any(nan_mask):
             itl_nearest = scipy.interpolate.griddata(
                 (self.x_kv_usage, self.y_context_length),
                 self.z_itl,
-                (self.X, self.Y),
+                (X, Y),
                 method="nearest",
             )
-            self.itl_interpolator[nan_mask] = itl_nearest[nan_mask]
-        self.itl_interpolator /= 1000  # convert ms to s
+            itl_interpolator[nan_mask] = itl_nearest[nan_mask]
+        itl_interpolator /= 1000  # convert ms to s
 
-        self.thpt_interpolator = scipy.interpolate.griddata(
+        thpt_interpolator = scipy.interpolate.griddata(
             (self.x_kv_usage, self.y_context_length),
             self.z_thpt_per_gpu,
-            (self.X, self.Y),
+            (X, Y),
             method="cubic",
         )
         # Fill NaN values using nearest neighbor interpolation
-        nan_mask = np.isnan(self.thpt_interpolator)
+        nan_mask = np.isnan(thpt_interpolator)
         if np.any(nan_mask):
             thpt_nearest = scipy.interpolate.griddata(
                 (self.x_kv_usage, self.y_context_length),
                 self.z_thpt_per_gpu,
-                (self.X, self.Y),
+                (X, Y),
                 method="nearest",
             )
-            self.thpt_interpolator[nan_mask] = thpt_nearest[nan_mask]
+            thpt_interpolator[nan_mask] = thpt_nearest[nan_mask]
 
-    def compute_idx(self, concurrency: float, context_length: float) -> tuple[int, int]:
-        kv_usage = concurrency * context_length / self.max_kv_tokens
+        return np.stack([itl_interpolator, thpt_interpolator])
+
+    def _build_lookup_tables(self):
+        self.x_start, self.x_step = float(self.xi[0]), float(self.xi[1] - self.xi[0])
+        self.y_start, self.y_step = float(self.yi[0]), float(self.yi[1] - self.yi[0])
+        self._max_kv_tokens = float(self.max_kv_tokens)
+
+        # For every context length row, itl_suffix_min[iy, ix] is the smallest ITL over
+        # kv_usage >= xi[ix]. It is non-decreasing along ix, so the largest kv_usage whose
+        # ITL meets a target is the number of entries <= target minus one.
+        # NaNs can never satisfy an ITL target, so treat them as infinitely slow.
+        itl = np.where(np.isnan(self.itl_interpolator), np.inf, self.itl_interpolator)
+        self.itl_suffix_min = np.minimum.accumulate(itl[:, ::-1], axis=1)[:, ::-1]
+        self._itl_suffix_min_rows = [row.tolist() for row in self.itl_suffix_min]
+
+    def compute_idx(self, concurrency: ArrayLike, context_length: ArrayLike):
+        kv_usage = concurrency * context_length / self._max_kv_tokens
         # Calculate x index (kv_usage)
-        ix = int(
-            np.clip(
-                np.round((kv_usage - self.xi[0]) / (self.xi[1] - self.xi[0])),
-                0,
-                self.resolution - 1,
-            )
-        )
+        ix = _grid_index(kv_usage, self.x_start, self.x_step, self.resolution)
         # Calculate y index (context_length)
-        iy = int(
-            np.clip(
-                np.round((context_length - self.yi[0]) / (self.yi[1] - self.yi[0])),
-                0,
-                self.resolution - 1,
-            )
-        )
+        iy = _grid_index(context_length, self.y_start, self.y_step, self.resolution)
+        if not _is_scalar(ix, iy):
+            ix, iy = np.broadcast_arrays(ix, iy)
         return ix, iy
 
-    def interpolate_itl(self, concurrency: float, context_length: float) -> float:
+    def interpolate_itl(
+        self, concurrency: ArrayLike, context_length: ArrayLike
+    ) -> ArrayLike:
         ix, iy = self.compute_idx(concurrency, context_length)
+        if _is_scalar(ix, iy):
+            return float(self.itl_interpolator[iy, ix])
         return self.itl_interpolator[iy, ix]
 
     def interpolate_thpt_per_gpu(
-        self, concurrency: float, context_length: float
-    ) -> float:
+        self, concurrency: ArrayLike, context_length: ArrayLike
+    ) -> ArrayLike:
         ix, iy = self.compute_idx(concurrency, context_length)
+        if _is_scalar(ix, iy):
+            return float(self.thpt_interpolator[iy, ix])
         return self.thpt_interpolator[iy, ix]
 
     def find_best_throughput_per_gpu(
-        self, itl: float, context_length: float
-    ) -> tuple[float, float, float]:
+        self, itl: ArrayLike, context_length: ArrayLike
+    ) -> tuple[ArrayLike, ArrayLike, ArrayLike]:
         # find the max kv_load that has itl <= target itl
-        # here we cannot use binary search as interpolated itl might not be monotonic
-        iy = int(
-            np.clip(
-                np.round((context_length - self.yi[0]) / (self.yi[1] - self.yi[0])),
-                0,
-                self.resolution - 1,
+        # interpolated itl might not be monotonic, so search the per-row suffix minimum
+        # of itl instead, which is monotonic; if no kv_load meets the target, fall back to the
+        # lowest kv_load
+        iy = _grid_index(context_length, self.y_start, self.y_step, self.resolution)
+
+        if _is_scalar(itl, iy):
+            ix = max(bisect.bisect_right(self._itl_suffix_min_rows[iy], itl) - 1, 0)
+            return (
+                float(self.thpt_interpolator[iy, ix]),
+                float(self.itl_interpolator[iy, ix]),
+                float(self.xi[ix]),
             )
-        )
-        iy = max(0, min(iy, self.resolution - 1))
 
-        for ix in range(self.resolution - 1, -1, -1):
-            if self.itl_interpolator[iy, ix] <= itl:
-                return (
-                    self.thpt_interpolator[iy, ix],
-                    self.itl_interpolator[iy, ix],
-                    self.xi[ix],
-                )
-        return self.thpt_interpolator[iy, 0], self.itl_interpolator[iy, 0], self.xi[0]
+        itl, iy = np.broadcast_arrays(np.asarray(itl, dtype=float), iy)
+        ix = np.count_nonzero(self.itl_suffix_min[iy] <= itl[..., None], axis=-1) - 1
+        ix = np.maximum(ix, 0)
+        return (
+            self.thpt_interpolator[iy, ix],
+            self.itl_interpolator[iy, ix],
+            self.xi[ix],
+        )
 
 
 if __name__ == "__main__":
@@ -177,6 +322,11 @@ if __name__ == "__main__":
     parser.add_argument("--osl", type=int, default=150)
     parser.add_argument("--ttft", type=float, default=0.1, help="in s")
     parser.add_argument("--itl", type=float, default=0.01, help="in s")
+    parser.add_argument(
+        "--no-grid-cache",
+        action="store_true",
+        help="always recompute the decode interpolation grids instead of loading/writing the on-disk cache",
+    )
     args = parser.parse_args()
 
     print(f"ISL={args.isl}, OSL={args.osl}")
@@ -207,7 +357,9 @@ if __name__ == "__main__":
     print("")
 
     # then interpolate decode
-    decode_interpolator = DecodeInterpolator(args.profile_results_dir)
+    decode_interpolator = DecodeInterpolator(
+        args.profile_results_dir, use_grid_cache=not args.no_grid_cache
+    )
 
     print("Interpolating decode performance ...")
     context_length = args.isl + args.osl // 2
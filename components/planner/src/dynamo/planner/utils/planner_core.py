@@ -9,7 +9,7 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
-from prometheus_client import Gauge, start_http_server
+from prometheus_client import REGISTRY, Gauge, start_http_server
 
 from dynamo.planner import KubernetesConnector, __version__
 from dynamo.planner.defaults import WORKER_COMPONENT_NAMES, SLAPlannerDefaults
@@ -18,9 +18,10 @@ from dynamo.planner.utils.perf_interpolation import (
     DecodeInterpolator,
     PrefillInterpolator,
 )
-from dynamo.planner.utils.prometheus import PrometheusAPIClient
+from dynamo.planner.utils.prometheus import AsyncPrometheusAPIClient
 from dynamo.runtime import DistributedRuntime, dynamo_worker
 from dynamo.runtime.logging import configure_dynamo_logging
+from dynamo.runtime.membership import InstanceWatcher, watch_instances
 
 configure_dynamo_logging()
 logger = logging.getLogger(__name__)
@@ -52,20 +53,32 @@ class Metrics:
 
 
 class Planner:
-    def __init__(self, runtime: DistributedRuntime, args: argparse.Namespace):
+    def __init__(
+        self,
+        runtime: Optional[DistributedRuntime],
+        args: argparse.Namespace,
+        dryrun: bool = False,
+    ):
+        """
+        In dryrun mode the planner does not connect to the runtime, Kubernetes or
+        Prometheus. The caller provides worker info, metrics and a connector, see
+        dynamo.planner.utils.simulator.
+        """
         self.runtime = runtime
         self.args = args
         self.namespace = SLAPlannerDefaults.namespace
+        self.dryrun = dryrun
 
-        if not args.no_operation:
+        if not args.no_operation and not dryrun:
             if args.environment == "kubernetes":
                 self.connector = KubernetesConnector(self.namespace)
             else:
                 raise ValueError(f"Invalid environment: {args.environment}")
 
-        self.prometheus_api_client = PrometheusAPIClient(
-            SLAPlannerDefaults.prometheus_endpoint
-        )
+        if not dryrun:
+            self.prometheus_api_client = AsyncPrometheusAPIClient(
+                SLAPlannerDefaults.prometheus_endpoint
+            )
 
         self.num_req_predictor = LOAD_PREDICTORS[args.load_predictor](
             window_size=args.load_prediction_window_size,
@@ -80,8 +93,9 @@ class Planner:
         self.prefill_interpolator = PrefillInterpolator(args.profile_results_dir)
         self.decode_interpolator = DecodeInterpolator(args.profile_results_dir)
 
-        self.prefill_client = None
-        self.workers_client = None
+        # shared watch-based caches of the worker instances, see dynamo.runtime.membership
+        self.prefill_watcher: Optional[InstanceWatcher] = None
+        self.decode_watcher: Optional[InstanceWatcher] = None
         self.p_endpoints = []  # type: ignore
         self.d_endpoints = []  # type: ignore
 
@@ -94,12 +108,24 @@ class Planner:
         self.prometheus_port = args.prometheus_port
 
         # Initialize Prometheus metrics
+        # dryrun planners do not register them so that many can live in one process
+        registry = None if dryrun else REGISTRY
         # TODO: use proper naming
-        self.num_p_workers_gauge = Gauge("num_p_workers", "Number of prefill workers")
-        self.num_d_workers_gauge = Gauge("num_d_workers", "Number of decode workers")
+        self.num_p_workers_gauge = Gauge(
+            "num_p_workers", "Number of prefill workers", registry=registry
+        )
+        self.num_d_workers_gauge = Gauge(
+            "num_d_workers", "Number of decode workers", registry=registry
+        )
+        self.load_prediction_latency_gauge = Gauge(
+            "load_prediction_latency_seconds",
+            "Latency of the most recent load prediction",
+            ["metric"],
+            registry=registry,
+        )
 
         # Start Prometheus HTTP server if port is specified
-        if self.prometheus_port != 0:
+        if self.prometheus_port != 0 and not dryrun:
             try:
                 start_http_server(self.prometheus_port)
                 logger.info(
@@ -108,56 +134,67 @@ class Planner:
             except Exception as e:
                 logger.error(f"Failed to start Prometheus metrics server: {e}")
 
+    async def _watch_workers(self, component_name: str, endpoint_name: str):
+        client = (
+            await self.runtime.namespace(self.namespace)  # type: ignore
+            .component(component_name)
+            .endpoint(endpoint_name)
+            .client()
+        )
+        return watch_instances(client)
+
     async def get_workers_info(self):
+        names = WORKER_COMPONENT_NAMES[self.args.backend]
         try:
-            if self.prefill_client is None:
-                self.prefill_client = (
-                    await self.runtime.namespace(self.namespace)
-                    .component(
-                        WORKER_COMPONENT_NAMES[
-                            self.args.backend
-                        ].prefill_worker_component_name
-                    )
-                    .endpoint(
-                        WORKER_COMPONENT_NAMES[
-                            self.args.backend
-                        ].prefill_worker_endpoint
-                    )
-                    .client()
+            if self.prefill_watcher is None:
+                self.prefill_watcher = await self._watch_workers(
+                    names.prefill_worker_component_name,
+                    names.prefill_worker_endpoint,
                 )
-                # TODO: remove this sleep after rust client() is blocking until watching state
-                await asyncio.sleep(0.1)
-            # TODO: use etcd events instead of pulling instance_ids
-            p_endpoints = self.prefill_client.instance_ids()  # type: ignore
+                self.prefill_watcher.add_listener(self._on_prefill_workers_changed)
+            p_endpoints = self.prefill_watcher.instance_ids
         except Exception:
             p_endpoints = []
             logger.warning(
                 "No prefill workers found, aggregated mode is not supported yet"
             )
         try:
-            if self.workers_client is None:
-                self.workers_client = (
-                    await self.runtime.namespace(self.namespace)
-                    .component(
-                        WORKER_COMPONENT_NAMES[
-                            self.args.backend
-                        ].decode_worker_component_name
-                    )
-                    .endpoint(
-                        WORKER_COMPONENT_NAMES[self.args.backend].decode_worker_endpoint
-                    )
-                    .client()
+            if self.decode_watcher is None:
+                self.decode_watcher = await self._watch_workers(
+                    names.decode_worker_component_name,
+                    names.decode_worker_endpoint,
                 )
-                # TODO: remove this sleep after rust client() is blocking until watching state
-                await asyncio.sleep(0.1)
-            # TODO: use etcd events instead of pulling instance_ids
-            d_endpoints = self.workers_client.instance_ids()  # type: ignore
+                self.decode_watcher.add_listener(self._on_decode_workers_changed)
+            d_endpoints = self.decode_watcher.instance_ids
         except Exception as e:
             raise RuntimeError(f"Failed to get decode worker endpoints: {e}")
         return p_endpoints, d_endpoints
 
+    def _on_prefill_workers_changed(self, added, removed):
+        self.p_endpoints = self.prefill_watcher.instance_ids  # type: ignore
+        logger.info(
+            f"Prefill workers changed: added {sorted(added)}, removed {sorted(removed)}, now {len(self.p_endpoints)}"
+        )
+        if self.prometheus_port != 0:
+            self.num_p_workers_gauge.set(len(self.p_endpoints))
+
+    def _on_decode_workers_changed(self, added, removed):
+        self.d_endpoints = self.decode_watcher.instance_ids  # type: ignore
+        logger.info(
+            f"Decode workers changed: added {sorted(added)}, removed {sorted(removed)}, now {len(self.d_endpoints)}"
+        )
+        if self.prometheus_port != 0:
+            self.num_d_workers_gauge.set(len(self.d_endpoints))
+
     async def observe_metrics(self):
-        self.p_endpoints, self.d_endpoints = await self.get_workers_info()
+        # worker discovery and the prometheus queries do not depend on each other
+        workers_info, metrics = await asyncio.gather(
+            self.get_workers_info(),
+            self.prometheus_api_client.get_planner_metrics(
+                f"{self.args.adjustment_interval}s"
+            ),
+        )
+        self.p_endpoints, self.d_endpoints = workers_info
         logger.debug(
             f"Number of prefill workers: {len(self.p_endpoints)}, number of decode workers: {len(self.d_endpoints)}"
         )
@@ -167,30 +204,12 @@ class Planner:
             self.num_p_workers_gauge.set(len(self.p_endpoints))
             self.num_d_workers_gauge.set(len(self.d_endpoints))
 
-        self.last_metrics.ttft = self.prometheus_api_client.get_avg_time_to_first_token(
-            f"{self.args.adjustment_interval}s"
-        )
-        self.last_metrics.itl = self.prometheus_api_client.get_avg_inter_token_latency(
-            f"{self.args.adjustment_interval}s"
-        )
-        self.last_metrics.num_req = self.prometheus_api_client.get_avg_request_count(
-            f"{self.args.adjustment_interval}s"
-        )
-        self.last_metrics.request_duration = (
-            self.prometheus_api_client.get_avg_request_duration(
-                f"{self.args.adjustment_interval}s"
-            )
-        )
-        self.last_metrics.isl = (
-            self.prometheus_api_client.get_avg_input_sequence_tokens(
-                f"{self.args.adjustment_interval}s"
-            )
-        )
-        self.last_metrics.osl = (
-            self.prometheus_api_client.get_avg_output_sequence_tokens(
-                f"{self.args.adjustment_interval}s"
-            )
-        )
+        self.last_metrics.ttft = metrics["ttft"]
+        self.last_metrics.itl = metrics["itl"]
+        self.last_metrics.num_req = metrics["num_req"]
+        self.last_metrics.request_duration = metrics["request_duration"]
+        self.last_metrics.isl = metrics["isl"]
+        self.last_metrics.osl = metrics["osl"]
 
         logger.info(
             f"Observed num_req: {self.last_metrics.num_req:.2f} isl: {self.last_metrics.isl:.2f} osl: {self.last_metrics.osl:.2f}"
@@ -203,6 +222,26 @@ class Planner:
         self.isl_predictor.add_data_point(self.last_metrics.isl)
         self.osl_predictor.add_data_point(self.last_metrics.osl)
 
+    def report_prediction_latency(self):
+        predictors = {
+            "num_req": self.num_req_predictor,
+            "isl": self.isl_predictor,
+            "osl": self.osl_predictor,
+        }
+        logger.info(
+            "Load prediction latency: "
+            + ", ".join(
+                f"{name}={predictor.last_prediction_latency * 1000:.2f}ms "
+                f"(avg {predictor.avg_prediction_latency * 1000:.2f}ms)"
+                for name, predictor in predictors.items()
+            )
+        )
+        if self.prometheus_port != 0:
+            for name, predictor in predictors.items():
+                self.load_prediction_latency_gauge.labels(metric=name).set(
+                    predictor.last_prediction_latency
+                )
+
     async def make_adjustments(self):
         try:
             # Skip adjustment if no traffic
@@ -224,14 +263,17 @@ class Planner:
             )
             self.p_correction_factor = self.last_metrics.ttft / expect_ttft
             # for ITL, we expect the correction factor to be close to 1
-            expect_itl = self.decode_interpolator.interpolate_itl(
-                concurrency=self.last_metrics.num_req  # type: ignore
-                / len(self.d_endpoints)
-                * self.last_metrics.request_duration  # type: ignore
-                / self.args.adjustment_interval,
-                context_length=self.last_metrics.isl + self.last_metrics.osl / 2,  # type: ignore
-            )
-            self.d_correction_factor = self.last_metrics.itl / expect_itl
+            # without decode workers (min_endpoint 0) there is no ITL to compare to,
+            # keep the last factor so that the planner can still scale up
+            if self.d_endpoints:
+                expect_itl = self.decode_interpolator.interpolate_itl(
+                    concurrency=self.last_metrics.num_req  # type: ignore
+                    / len(self.d_endpoints)
+                    * self.last_metrics.request_duration  # type: ignore
+                    / self.args.adjustment_interval,
+                    context_length=self.last_metrics.isl + self.last_metrics.osl / 2,  # type: ignore
+                )
+                self.d_correction_factor = self.last_metrics.itl / expect_itl
             logger.info(
                 f"Correction factors: TTFT: {self.p_correction_factor:.3f}, ITL: {self.d_correction_factor:.3f}"
             )
@@ -247,6 +289,7 @@ class Planner:
             logger.info(
                 f"Predicted load: num_req={next_num_req:.2f}, isl={next_isl:.2f}, osl={next_osl:.2f}"
             )
+            self.report_prediction_latency()
         except Exception as e:
             logger.error(f"Failed to predict load: {e}")
             return
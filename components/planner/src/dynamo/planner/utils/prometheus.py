@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import time
+from typing import Optional
 
+import httpx
 from prometheus_api_client import PrometheusConnect
 
 from dynamo.runtime.logging import configure_dynamo_logging
@@ -23,6 +27,15 @@ configure_dynamo_logging()
 logger = logging.getLogger(__name__)
 
 
+def _average_metric_query(metric_name: str, interval: str) -> str:
+    full_metric_name = f"dynamo_frontend_{metric_name}"
+    return f"increase({full_metric_name}_sum[{interval}])/increase({full_metric_name}_count[{interval}])"
+
+
+def _request_count_query(interval: str) -> str:
+    return f"increase(dynamo_frontend_requests_total[{interval}])"
+
+
 class PrometheusAPIClient:
     def __init__(self, url: str):
         self.prom = PrometheusConnect(url=url, disable_ssl=True)
@@ -43,8 +56,7 @@ class PrometheusAPIClient:
             Average metric value or 0 if no data/error
         """
         try:
-            full_metric_name = f"dynamo_frontend_{metric_name}"
-            query = f"increase({full_metric_name}_sum[{interval}])/increase({full_metric_name}_count[{interval}])"
+            query = _average_metric_query(metric_name, interval)
             result = self.prom.custom_query(query=query)
             if not result:
                 # No data available yet (no requests made) - return 0 silently
@@ -78,9 +90,7 @@ class PrometheusAPIClient:
     def get_avg_request_count(self, interval: str):
         # This function follows a different query pattern than the other metrics
         try:
-            raw_res = self.prom.custom_query(
-                query=f"increase(dynamo_frontend_requests_total[{interval}])"
-            )
+            raw_res = self.prom.custom_query(query=_request_count_query(interval))
             total_count = 0.0
             for res in raw_res:
                 # count all success/failed and stream/non-stream requests
@@ -103,3 +113,125 @@ class PrometheusAPIClient:
             interval,
             "avg output sequence tokens",
         )
+
+
+# planner metric name -> (frontend metric name, human-readable name for error logging)
+# the request count ("num_req") follows a different query pattern, see _request_count_query
+PLANNER_AVERAGE_METRICS = {
+    "ttft": ("time_to_first_token_seconds", "avg time to first token"),
+    "itl": ("inter_token_latency_seconds", "avg inter token latency"),
+    "request_duration": ("request_duration_seconds", "avg request duration"),
+    "isl": ("input_sequence_tokens", "avg input sequence tokens"),
+    "osl": ("output_sequence_tokens", "avg output sequence tokens"),
+}
+
+
+class AsyncPrometheusAPIClient:
+    """
+    Non-blocking Prometheus client for the planner.
+
+    All planner metrics are fetched concurrently over one pooled HTTP connection pool,
+    so an observation takes as long as the slowest single query. Every query has its
+    own timeout and results are cached for cache_ttl seconds.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        query_timeout: float = 5.0,
+        cache_ttl: float = 1.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if "://" not in url:
+            url = f"http://{url}"
+        self.url = url.rstrip("/")
+        self.query_timeout = query_timeout
+        self.cache_ttl = cache_ttl
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: dict[str, tuple[float, list]] = {}  # query -> (expiry, result)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.url,
+                timeout=self.query_timeout,
+                limits=httpx.Limits(
+                    max_connections=len(PLANNER_AVERAGE_METRICS) + 1,
+                    max_keepalive_connections=len(PLANNER_AVERAGE_METRICS) + 1,
+                ),
+                verify=False,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def custom_query(self, query: str) -> list:
+        """Run an instant query and return its result vector, served from cache if fresh."""
+        now = time.monotonic()
+        cached = self._cache.get(query)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        response = await asyncio.wait_for(
+            self.client.get(
+                "/api/v1/query",
+                params={"query": query, "timeout": f"{self.query_timeout}s"},
+            ),
+            timeout=self.query_timeout,
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("status") != "success":
+            raise RuntimeError(f"query failed: {body.get('error', body)}")
+        result = body["data"]["result"]
+
+        self._cache[query] = (time.monotonic() + self.cache_ttl, result)
+        return result
+
+    async def _get_average_metric(
+        self, metric_name: str, interval: str, operation_name: str
+    ) -> float:
+        try:
+            result = await self.custom_query(
+                _average_metric_query(metric_name, interval)
+            )
+            if not result:
+                # No data available yet (no requests made) - return 0 silently
+                return 0
+            return float(result[0]["value"][1])
+        except Exception as e:
+            logger.error(f"Error getting {operation_name}: {e!r}")
+            return 0
+
+    async def get_avg_request_count(self, interval: str) -> float:
+        try:
+            raw_res = await self.custom_query(_request_count_query(interval))
+            # count all success/failed and stream/non-stream requests
+            return sum(float(res["value"][1]) for res in raw_res)
+        except Exception as e:
+            logger.error(f"Error getting avg request count: {e!r}")
+            return 0
+
+    async def get_planner_metrics(self, interval: str) -> dict[str, float]:
+        """Fetch every metric the planner observes, concurrently."""
+        start = time.perf_counter()
+        names = ["num_req", *PLANNER_AVERAGE_METRICS]
+        values = await asyncio.gather(
+            self.get_avg_request_count(interval),
+            *(
+                self._get_average_metric(metric_name, interval, operation_name)
+                for metric_name, operation_name in PLANNER_AVERAGE_METRICS.values()
+            ),
+        )
+        metrics = dict(zip(names, values))
+        logger.debug(
+            f"Collected {len(metrics)} planner metrics in "
+            f"{(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return metrics
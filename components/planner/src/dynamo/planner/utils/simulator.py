@@ -0,0 +1,455 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline replay of a mooncake-style trace through the SLA planner.
+
+The trace is replayed in simulated time, interval by interval. Worker latencies come
+from the pre-deployment profiling surfaces (raw_data.npz) and the replica decisions
+come from the real Planner: the same load predictors, interpolators and scaling math,
+running in dryrun mode against a simulated connector.
+
+Each interval is simulated as follows:
+  * prefill: every request is queued FCFS on the earliest free prefill engine and
+    occupies it for the profiled TTFT of its ISL, so TTFT includes queueing delay.
+    While there is no prefill engine, arrivals wait for the next scale-up.
+  * decode: the steady-state concurrency per decode engine is solved from Little's law,
+    c = request_rate / num_d * osl * itl(c, context_length), capped by the kv cache
+    capacity; the ITL of the interval is the profiled ITL at that concurrency. Without
+    decode engines, the interval is saturated.
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import logging
+import math
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from dynamo.planner.defaults import WORKER_COMPONENT_NAMES, SLAPlannerDefaults
+from dynamo.planner.utils.planner_core import Metrics, Planner
+
+logger = logging.getLogger(__name__)
+
+
+def load_trace(trace_file: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read a mooncake-style jsonl trace (timestamp in ms, input_length, output_length).
+
+    Returns arrival times in seconds relative to the first request, ISLs and OSLs,
+    sorted by arrival time.
+    """
+    timestamps, isl, osl = [], [], []
+    with open(trace_file, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            timestamps.append(data["timestamp"])
+            isl.append(data["input_length"])
+            osl.append(data["output_length"])
+    if not timestamps:
+        raise ValueError(f"No requests found in {trace_file}")
+
+    arrival = np.asarray(timestamps, dtype=np.float64) / 1000  # convert ms to s
+    order = np.argsort(arrival, kind="stable")
+    arrival = arrival[order] - arrival[order[0]]
+    return (
+        arrival,
+        np.asarray(isl, dtype=np.float64)[order],
+        np.asarray(osl, dtype=np.float64)[order],
+    )
+
+
+class SimulatedConnector:
+    """Records the replica targets requested by the planner instead of scaling."""
+
+    def __init__(self):
+        self.target_replicas: Optional[dict[str, int]] = None
+
+    async def set_component_replicas(
+        self, target_replicas: dict[str, int], blocking: bool = True
+    ):
+        self.target_replicas = dict(target_replicas)
+
+
+class SimulatedPlanner(Planner):
+    """Planner in dryrun mode whose workers are whatever the simulator says they are."""
+
+    def __init__(self, args: argparse.Namespace):
+        super().__init__(None, args, dryrun=True)
+        self.connector = SimulatedConnector()
+        self.num_p_workers = args.initial_prefill_replicas
+        self.num_d_workers = args.initial_decode_replicas
+
+    async def get_workers_info(self):
+        return list(range(self.num_p_workers)), list(range(self.num_d_workers))
+
+
+class PlannerSimulator:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.planner = SimulatedPlanner(args)
+        self.prefill_interpolator = self.planner.prefill_interpolator
+        self.decode_interpolator = self.planner.decode_interpolator
+
+        component_names = WORKER_COMPONENT_NAMES[args.backend]
+        self.prefill_k8s_name = component_names.prefill_worker_k8s_name
+        self.decode_k8s_name = component_names.decode_worker_k8s_name
+
+    def _estimate_decode(
+        self, num_d: int, request_rate: float, osl: float, context_length: float
+    ) -> tuple[float, float, bool]:
+        """Return (concurrency per engine, ITL, saturated) for one interval."""
+        max_concurrency = self.decode_interpolator.max_kv_tokens / max(
+            context_length, 1.0
+        )
+        if num_d == 0:
+            itl = self.decode_interpolator.interpolate_itl(
+                max_concurrency, context_length
+            )
+            return max_concurrency, itl, True
+
+        def excess(concurrency: float) -> float:
+            itl = self.decode_interpolator.interpolate_itl(concurrency, context_length)
+            return concurrency - request_rate / num_d * osl * itl
+
+        if excess(max_concurrency) < 0:
+            # the kv cache is full before the arrival rate is served
+            itl = self.decode_interpolator.interpolate_itl(
+                max_concurrency, context_length
+            )
+            return max_concurrency, itl, True
+
+        lo, hi = 0.0, max_concurrency
+        for _ in range(30):
+            mid = (lo + hi) / 2
+            if excess(mid) < 0:
+                lo = mid
+            else:
+                hi = mid
+        return hi, self.decode_interpolator.interpolate_itl(hi, context_length), False
+
+    @staticmethod
+    def _resize_prefill_pool(free_at: list[float], num_p: int, now: float):
+        """Add idle engines or drop the engines that free up last."""
+        if num_p > len(free_at):
+            for _ in range(num_p - len(free_at)):
+                heapq.heappush(free_at, now)
+        elif num_p < len(free_at):
+            free_at.sort()
+            del free_at[num_p:]  # a sorted list is a valid heap
+
+    async def run(self, arrival: np.ndarray, isl: np.ndarray, osl: np.ndarray):
+        args = self.args
+        interval = float(args.adjustment_interval)
+        num_intervals = max(1, math.ceil((arrival[-1] + 1e-9) / interval))
+        bounds = np.searchsorted(arrival, np.arange(num_intervals + 1) * interval)
+        base_ttft = self.prefill_interpolator.interpolate_ttft(isl)
+
+        planner = self.planner
+        num_p, num_d = planner.num_p_workers, planner.num_d_workers
+        prefill_free_at = [0.0] * num_p
+        # requests that arrived while there was no prefill engine
+        prefill_backlog: deque[int] = deque()
+        pending_scaling: list[tuple[float, int, int]] = []  # (effective time, p, d)
+
+        timeline = []
+        gpu_hours = 0.0
+        num_ttft_violations = 0
+        num_itl_violations = 0
+
+        for k in range(num_intervals):
+            start, end = k * interval, (k + 1) * interval
+
+            # apply scaling decisions whose delay has elapsed
+            while pending_scaling and pending_scaling[0][0] <= start + 1e-9:
+                _, num_p, num_d = pending_scaling.pop(0)
+                self._resize_prefill_pool(prefill_free_at, num_p, start)
+            planner.num_p_workers, planner.num_d_workers = num_p, num_d
+
+            lo, hi = bounds[k], bounds[k + 1]
+            num_req = int(hi - lo)
+
+            # prefill: FCFS on the earliest free engine, starting with the requests
+            # that arrived while there was none
+            prefill_backlog.extend(range(lo, hi))
+            if prefill_free_at:
+                ttft = np.empty(len(prefill_backlog))
+                for i, idx in enumerate(prefill_backlog):
+                    begin = max(arrival[idx], heapq.heappop(prefill_free_at))
+                    finish = begin + base_ttft[idx]
+                    heapq.heappush(prefill_free_at, finish)
+                    ttft[i] = finish - arrival[idx]
+                prefill_backlog.clear()
+            else:
+                ttft = np.empty(0)
+            interval_ttft_violations = int(np.count_nonzero(ttft > args.ttft))
+            num_ttft_violations += interval_ttft_violations
+
+            gpus = (
+                num_p * args.prefill_engine_num_gpu + num_d * args.decode_engine_num_gpu
+            )
+            gpu_hours += gpus * interval / 3600
+
+            row = {
+                "time": start,
+                "num_req": num_req,
+                "num_p": num_p,
+                "num_d": num_d,
+                "gpus": gpus,
+            }
+
+            if num_req > 0:
+                avg_isl = float(isl[lo:hi].mean())
+                avg_osl = float(osl[lo:hi].mean())
+                concurrency, itl, saturated = self._estimate_decode(
+                    num_d, num_req / interval, avg_osl, avg_isl + avg_osl / 2
+                )
+                itl_violated = saturated or itl > args.itl
+                num_itl_violations += num_req if itl_violated else 0
+                if len(ttft):
+                    mean_ttft = float(ttft.mean())
+                    p99_ttft = float(np.percentile(ttft, 99))
+                else:
+                    # no request got its first token, report how long the oldest waited
+                    mean_ttft = p99_ttft = float(end - arrival[prefill_backlog[0]])
+
+                metrics = Metrics(
+                    ttft=mean_ttft,
+                    itl=float(itl),
+                    num_req=float(num_req),
+                    isl=avg_isl,
+                    osl=avg_osl,
+                    request_duration=mean_ttft + avg_osl * float(itl),
+                )
+                row.update(
+                    {
+                        "isl": avg_isl,
+                        "osl": avg_osl,
+                        "ttft": metrics.ttft,
+                        "ttft_p99": p99_ttft,
+                        "itl": metrics.itl,
+                        "decode_concurrency": float(concurrency),
+                        "decode_saturated": saturated,
+                        # of the requests prefilled in the interval
+                        "ttft_violation_rate": interval_ttft_violations
+                        / max(len(ttft), 1),
+                        "prefill_backlog": len(prefill_backlog),
+                        "itl_violated": itl_violated,
+                    }
+                )
+            else:
+                # no traffic, same as what prometheus reports for an idle interval
+                metrics = Metrics(
+                    ttft=math.nan,
+                    itl=math.nan,
+                    num_req=0.0,
+                    isl=math.nan,
+                    osl=math.nan,
+                    request_duration=math.nan,
+                )
+
+            # observe and adjust exactly like Planner.run does
+            planner.last_metrics = metrics
+            planner.num_req_predictor.add_data_point(metrics.num_req)
+            planner.isl_predictor.add_data_point(metrics.isl)
+            planner.osl_predictor.add_data_point(metrics.osl)
+            planner.connector.target_replicas = None
+            await planner.make_adjustments()
+
+            targets = planner.connector.target_replicas
+            if targets is not None:
+                next_num_p = targets[self.prefill_k8s_name]
+                next_num_d = targets[self.decode_k8s_name]
+                row.update({"next_num_p": next_num_p, "next_num_d": next_num_d})
+                pending_scaling.append(
+                    (end + args.scaling_delay, next_num_p, next_num_d)
+                )
+            timeline.append(row)
+
+        # requests still waiting for a prefill engine at the end never met the SLA
+        num_ttft_violations += len(prefill_backlog)
+        total_req = len(arrival)
+        summary = {
+            "duration_hours": num_intervals * interval / 3600,
+            "num_requests": total_req,
+            "num_intervals": num_intervals,
+            "gpu_hours": gpu_hours,
+            "avg_num_p": float(np.mean([row["num_p"] for row in timeline])),
+            "avg_num_d": float(np.mean([row["num_d"] for row in timeline])),
+            "max_gpus": max(row["gpus"] for row in timeline),
+            "ttft_violation_rate": num_ttft_violations / total_req,
+            "itl_violation_rate": num_itl_violations / total_req,
+            "avg_prediction_latency_ms": 1000
+            * float(
+                np.mean(
+                    [
+                        predictor.avg_prediction_latency
+                        for predictor in (
+                            planner.num_req_predictor,
+                            planner.isl_predictor,
+                            planner.osl_predictor,
+                        )
+                    ]
+                )
+            ),
+        }
+        return summary, timeline
+
+
+def simulate(args: argparse.Namespace) -> tuple[dict, list[dict]]:
+    arrival, isl, osl = load_trace(args.trace)
+    simulator = PlannerSimulator(args)
+    return asyncio.run(simulator.run(arrival, isl, osl))
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Replay a mooncake-style trace through the SLA planner offline"
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        required=True,
+        help="Trace in jsonl format with timestamp (ms), input_length and output_length",
+    )
+    parser.add_argument(
+        "--backend",
+        default=SLAPlannerDefaults.backend,
+        choices=list(WORKER_COMPONENT_NAMES),
+        help="Backend type",
+    )
+    parser.add_argument(
+        "--profile-results-dir",
+        type=str,
+        default=SLAPlannerDefaults.profile_results_dir,
+        help="Directory to pre-deployment profiling results",
+    )
+    parser.add_argument(
+        "--adjustment-interval",
+        type=int,
+        default=SLAPlannerDefaults.adjustment_interval,
+        help="Interval in seconds between scaling adjustments",
+    )
+    parser.add_argument(
+        "--max-gpu-budget",
+        type=int,
+        default=SLAPlannerDefaults.max_gpu_budget,
+        help="Maximum number of GPUs to use",
+    )
+    parser.add_argument(
+        "--min-endpoint",
+        type=int,
+        default=SLAPlannerDefaults.min_endpoint,
+        help="Minimum number of endpoints to keep for prefill/decode workers",
+    )
+    parser.add_argument(
+        "--decode-engine-num-gpu",
+        type=int,
+        default=SLAPlannerDefaults.decode_engine_num_gpu,
+        help="Number of GPUs per decode engine",
+    )
+    parser.add_argument(
+        "--prefill-engine-num-gpu",
+        type=int,
+        default=SLAPlannerDefaults.prefill_engine_num_gpu,
+        help="Number of GPUs per prefill engine",
+    )
+    parser.add_argument(
+        "--ttft",
+        type=float,
+        default=SLAPlannerDefaults.ttft,
+        help="Time to first token (in seconds)",
+    )
+    parser.add_argument(
+        "--itl",
+        type=float,
+        default=SLAPlannerDefaults.itl,
+        help="Inter-token latency (in seconds)",
+    )
+    parser.add_argument(
+        "--load-predictor",
+        type=str,
+        default=SLAPlannerDefaults.load_predictor,
+        help="Load predictor to use",
+    )
+    parser.add_argument(
+        "--load-prediction-window-size",
+        type=int,
+        default=SLAPlannerDefaults.load_prediction_window_size,
+        help="Window size for load prediction",
+    )
+    parser.add_argument(
+        "--initial-prefill-replicas",
+        type=int,
+        default=SLAPlannerDefaults.min_endpoint,
+        help="Number of prefill engines at the start of the trace",
+    )
+    parser.add_argument(
+        "--initial-decode-replicas",
+        type=int,
+        default=SLAPlannerDefaults.min_endpoint,
+        help="Number of decode engines at the start of the trace",
+    )
+    parser.add_argument(
+        "--scaling-delay",
+        type=float,
+        default=0.0,
+        help="Seconds for a scaling decision to take effect, applied at the first adjustment interval boundary after the delay",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the summary and the per-interval replica timeline to this json file",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the planner logs of every interval"
+    )
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    args = make_parser().parse_args(argv)
+    # fixed planner settings for the replay
+    args.environment = SLAPlannerDefaults.environment
+    args.no_operation = False
+    args.prometheus_port = 0
+    args.isl = SLAPlannerDefaults.isl
+    args.osl = SLAPlannerDefaults.osl
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not args.verbose:
+        logging.getLogger("dynamo.planner.utils.planner_core").setLevel(logging.WARNING)
+
+    summary, timeline = simulate(args)
+
+    print(
+        f"Replayed {summary['num_requests']} requests over {summary['duration_hours']:.2f}h in {summary['num_intervals']} intervals"
+    )
+    print(f"\tGPU-hours: {summary['gpu_hours']:.2f} (max {summary['max_gpus']} GPUs)")
+    print(
+        f"\tAverage replicas: prefill={summary['avg_num_p']:.2f}, decode={summary['avg_num_d']:.2f}"
+    )
+    print(
+        f"\tTTFT SLA ({args.ttft}s) violation rate: {summary['ttft_violation_rate'] * 100:.2f}%"
+    )
+    print(
+        f"\tITL SLA ({args.itl}s) violation rate: {summary['itl_violation_rate'] * 100:.2f}%"
+    )
+    print(
+        f"\tAverage load prediction latency: {summary['avg_prediction_latency_ms']:.2f}ms"
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"summary": summary, "timeline": timeline}, f, indent=2)
+        print(f"Wrote replica timeline to {args.output}")
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from dynamo.planner.utils.load_predictor import (
+    LOAD_PREDICTORS,
+    HoltWintersPredictor,
+    KalmanPredictor,
+)
+
+
+@pytest.mark.parametrize("name", ["holt_winters", "kalman", "arima_incremental"])
+def test_incremental_predictors_registered(name):
+    predictor = LOAD_PREDICTORS[name](window_size=10)
+    assert predictor.predict_next() == 0
+    predictor.add_data_point(5.0)
+    assert predictor.predict_next() == 5.0
+
+
+@pytest.mark.parametrize("predictor_cls", [HoltWintersPredictor, KalmanPredictor])
+def test_incremental_predictors_track_linear_trend(predictor_cls):
+    predictor = predictor_cls(window_size=10)
+    for i in range(100):
+        predictor.add_data_point(100.0 + 2.0 * i)
+    assert predictor.predict_next() == pytest.approx(300.0, rel=0.01)
+    # only the window is kept around
+    assert len(predictor.data_buffer) == 10
+
+
+def test_holt_winters_learns_seasonality():
+    season = [10.0, 50.0, 30.0, 20.0]
+    predictor = HoltWintersPredictor(beta=0.0, gamma=0.5, season_length=len(season))
+    for i in range(200):
+        predictor.add_data_point(season[i % len(season)])
+    assert predictor.predict_next() == pytest.approx(season[200 % len(season)], abs=1)
+
+
+def test_kalman_predictor_is_scale_invariant():
+    rng = np.random.default_rng(0)
+    series = 10 + rng.normal(0, 1, 50)
+    small, large = KalmanPredictor(), KalmanPredictor()
+    for value in series:
+        small.add_data_point(value)
+        large.add_data_point(value * 1000)
+    assert large.predict_next() == pytest.approx(small.predict_next() * 1000)
+
+
+def test_nan_data_points_are_treated_as_zero():
+    predictor = KalmanPredictor()
+    predictor.add_data_point(float("nan"))
+    assert predictor.predict_next() == 0
+
+
+def test_prediction_latency_is_recorded():
+    predictor = LOAD_PREDICTORS["constant"]()
+    assert predictor.avg_prediction_latency == 0.0
+    predictor.add_data_point(1.0)
+    predictor.predict_next()
+    predictor.predict_next()
+    assert predictor.num_predictions == 2
+    assert predictor.last_prediction_latency >= 0.0
+    assert predictor.avg_prediction_latency == pytest.approx(
+        predictor.total_prediction_latency / 2
+    )
+
+
+def test_incremental_arima_refits_every_interval():
+    rng = np.random.default_rng(0)
+    predictor = LOAD_PREDICTORS["arima_incremental"](window_size=30, refit_interval=5)
+    for i in range(10):
+        predictor.add_data_point(100 + rng.normal(0, 1))
+    predictor.predict_next()
+    first_model = predictor.model
+
+    predictor.add_data_point(100.0)
+    predictor.predict_next()
+    assert predictor.model is first_model
+    assert predictor.points_since_refit == 1
+
+    for _ in range(4):
+        predictor.add_data_point(100 + rng.normal(0, 1))
+    prediction = predictor.predict_next()
+    assert predictor.model is not first_model
+    assert predictor.model.order == first_model.order
+    assert predictor.points_since_refit == 0
+    assert 90 < prediction < 110
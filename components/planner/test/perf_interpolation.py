@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dynamo.planner.utils.perf_interpolation import (
+    DecodeInterpolator,
+    PrefillInterpolator,
+)
+
+PROFILE_RESULTS_DIR = str(
+    Path(__file__).resolve().parents[3]
+    / "tests"
+    / "planner"
+    / "profiling_results"
+    / "H200_TP1P_TP1D"
+)
+
+
+@pytest.fixture(scope="module")
+def prefill_interpolator():
+    return PrefillInterpolator(PROFILE_RESULTS_DIR)
+
+
+@pytest.fixture(scope="module")
+def decode_interpolator():
+    return DecodeInterpolator(PROFILE_RESULTS_DIR, use_grid_cache=False)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def test_prefill_scalar_returns_float(prefill_interpolator):
+    ttft = prefill_interpolator.interpolate_ttft(3000)
+    assert isinstance(ttft, float)
+    assert 0 < ttft < 0.1
+
+
+def test_prefill_clips_to_profiled_range(prefill_interpolator):
+    assert prefill_interpolator.interpolate_ttft(
+        0
+    ) == prefill_interpolator.interpolate_ttft(prefill_interpolator.min_isl)
+    assert prefill_interpolator.interpolate_thpt_per_gpu(
+        1e9
+    ) == prefill_interpolator.interpolate_thpt_per_gpu(prefill_interpolator.max_isl)
+
+
+def test_prefill_array_matches_scalar(prefill_interpolator, rng):
+    isl = rng.uniform(0, 20000, 500)
+    ttft = prefill_interpolator.interpolate_ttft(isl)
+    thpt = prefill_interpolator.interpolate_thpt_per_gpu(isl)
+    assert ttft.shape == thpt.shape == isl.shape
+    np.testing.assert_allclose(
+        ttft, [prefill_interpolator.interpolate_ttft(x) for x in isl]
+    )
+    np.testing.assert_allclose(
+        thpt, [prefill_interpolator.interpolate_thpt_per_gpu(x) for x in isl]
+    )
+
+
+def test_decode_array_matches_scalar(decode_interpolator, rng):
+    concurrency = rng.uniform(0, 500, 500)
+    context_length = rng.uniform(0, 20000, 500)
+
+    ix, iy = decode_interpolator.compute_idx(concurrency, context_length)
+    expected = [
+        decode_interpolator.compute_idx(c, cl)
+        for c, cl in zip(concurrency, context_length)
+    ]
+    assert list(zip(ix.tolist(), iy.tolist())) == expected
+
+    np.testing.assert_array_equal(
+        decode_interpolator.interpolate_itl(concurrency, context_length),
+        [
+            decode_interpolator.interpolate_itl(c, cl)
+            for c, cl in zip(concurrency, context_length)
+        ],
+    )
+    np.testing.assert_array_equal(
+        decode_interpolator.interpolate_thpt_per_gpu(concurrency, context_length),
+        [
+            decode_interpolator.interpolate_thpt_per_gpu(c, cl)
+            for c, cl in zip(concurrency, context_length)
+        ],
+    )
+
+
+def test_decode_broadcasts_scalar_and_array(decode_interpolator):
+    context_length = np.array([1000, 3000, 8000])
+    itl = decode_interpolator.interpolate_itl(10, context_length)
+    assert itl.shape == (3,)
+    assert itl[1] == decode_interpolator.interpolate_itl(10, 3000)
+
+
+def _find_best_throughput_per_gpu_reference(interpolator, itl, context_length):
+    _, iy = interpolator.compute_idx(0, context_length)
+    for ix in range(interpolator.resolution - 1, -1, -1):
+        if interpolator.itl_interpolator[iy, ix] <= itl:
+            break
+    else:
+        ix = 0
+    return (
+        interpolator.thpt_interpolator[iy, ix],
+        interpolator.itl_interpolator[iy, ix],
+        interpolator.xi[ix],
+    )
+
+
+def test_find_best_throughput_per_gpu_matches_reverse_scan(decode_interpolator, rng):
+    itl = rng.uniform(0, 0.05, 500)
+    context_length = rng.uniform(0, 20000, 500)
+
+    expected = np.array(
+        [
+            _find_best_throughput_per_gpu_reference(decode_interpolator, t, cl)
+            for t, cl in zip(itl, context_length)
+        ]
+    )
+    scalar = np.array(
+        [
+            decode_interpolator.find_best_throughput_per_gpu(t, cl)
+            for t, cl in zip(itl, context_length)
+        ]
+    )
+    batched = np.stack(
+        decode_interpolator.find_best_throughput_per_gpu(itl, context_length), axis=1
+    )
+    np.testing.assert_array_equal(scalar, expected)
+    np.testing.assert_array_equal(batched, expected)
+
+
+def test_find_best_throughput_per_gpu_unreachable_itl(decode_interpolator):
+    thpt, itl, kv_usage = decode_interpolator.find_best_throughput_per_gpu(0.0, 3000)
+    assert kv_usage == 0.0
+    assert itl > 0.0
+    assert (
+        thpt
+        == decode_interpolator.thpt_interpolator[
+            decode_interpolator.compute_idx(0, 3000)[1], 0
+        ]
+    )
+
+
+@pytest.fixture
+def profile_dir(tmp_path):
+    profile_dir = tmp_path / "profile"
+    shutil.copytree(
+        PROFILE_RESULTS_DIR,
+        profile_dir,
+        ignore=shutil.ignore_patterns("interpolation_grid.*"),
+    )
+    return profile_dir
+
+
+def test_decode_grid_cache_roundtrip(profile_dir):
+    decode_dir = profile_dir / "selected_decode_interpolation"
+
+    built = DecodeInterpolator(str(profile_dir))
+    cache_files = list(decode_dir.glob("interpolation_grid.*.npy"))
+    assert len(cache_files) == 1
+
+    loaded = DecodeInterpolator(str(profile_dir))
+    assert isinstance(loaded.itl_interpolator, np.memmap)
+    np.testing.assert_array_equal(loaded.itl_interpolator, built.itl_interpolator)
+    np.testing.assert_array_equal(loaded.thpt_interpolator, built.thpt_interpolator)
+    assert loaded.find_best_throughput_per_gpu(
+        0.01, 3075
+    ) == built.find_best_throughput_per_gpu(0.01, 3075)
+
+    # a different resolution gets its own cache entry
+    DecodeInterpolator(str(profile_dir), resolution=50)
+    assert len(list(decode_dir.glob("interpolation_grid.*.npy"))) == 2
+
+
+def test_decode_grid_cache_invalidated_by_raw_data(profile_dir):
+    decode_dir = profile_dir / "selected_decode_interpolation"
+    DecodeInterpolator(str(profile_dir))
+    (old_cache,) = decode_dir.glob("interpolation_grid.*.npy")
+
+    with np.load(decode_dir / "raw_data.npz") as raw_data:
+        arrays = dict(raw_data)
+    arrays["z_itl"] = arrays["z_itl"] * 2
+    np.savez(decode_dir / "raw_data.npz", **arrays)
+
+    rebuilt = DecodeInterpolator(str(profile_dir))
+    assert not isinstance(rebuilt.itl_interpolator, np.memmap)
+    (new_cache,) = decode_dir.glob("interpolation_grid.*.npy")
+    assert new_cache != old_cache
+
+
+def test_decode_grid_cache_disabled(profile_dir):
+    DecodeInterpolator(str(profile_dir), use_grid_cache=False)
+    assert not list(
+        (profile_dir / "selected_decode_interpolation").glob("interpolation_grid.*")
+    )
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from dynamo.planner.utils.prometheus import AsyncPrometheusAPIClient
+
+QUERY_DELAY = 0.2
+
+
+def _vector(*values):
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "vector",
+            "result": [{"metric": {}, "value": [0, str(v)]} for v in values],
+        },
+    }
+
+
+def _make_transport(calls, delay=0.0, slow_metric=None, slow_delay=0.0):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        calls.append(query)
+        await asyncio.sleep(
+            slow_delay if slow_metric and slow_metric in query else delay
+        )
+        if "requests_total" in query:
+            return httpx.Response(200, json=_vector(3, 4))
+        if "time_to_first_token" in query:
+            return httpx.Response(200, json=_vector(0.25))
+        if "inter_token_latency" in query:
+            return httpx.Response(500, text="internal error")
+        if "request_duration" in query:
+            return httpx.Response(200, json=_vector(2.0))
+        if "input_sequence_tokens" in query:
+            return httpx.Response(200, json=_vector(3000))
+        return httpx.Response(200, json=_vector())
+
+    return httpx.MockTransport(handler)
+
+
+async def test_get_planner_metrics_runs_queries_concurrently():
+    calls: list = []
+    client = AsyncPrometheusAPIClient(
+        "http://prometheus:9090", transport=_make_transport(calls, delay=QUERY_DELAY)
+    )
+    start = time.perf_counter()
+    metrics = await client.get_planner_metrics("60s")
+    elapsed = time.perf_counter() - start
+    await client.close()
+
+    assert len(calls) == 6
+    # bounded by one round trip rather than the sum of all six
+    assert elapsed < 3 * QUERY_DELAY
+    assert metrics == {
+        "num_req": 7.0,
+        "ttft": 0.25,
+        "itl": 0,  # failed query
+        "request_duration": 2.0,
+        "isl": 3000.0,
+        "osl": 0,  # no data
+    }
+
+
+async def test_slow_query_times_out_without_blocking_others():
+    calls: list = []
+    client = AsyncPrometheusAPIClient(
+        "prometheus:9090",
+        query_timeout=0.1,
+        transport=_make_transport(
+            calls, slow_metric="time_to_first_token", slow_delay=5
+        ),
+    )
+    start = time.perf_counter()
+    metrics = await client.get_planner_metrics("60s")
+    await client.close()
+
+    assert time.perf_counter() - start < 1
+    assert metrics["ttft"] == 0
+    assert metrics["num_req"] == 7.0
+
+
+async def test_results_are_cached_for_ttl():
+    calls: list = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["query"])
+        return httpx.Response(200, json=_vector(1))
+
+    client = AsyncPrometheusAPIClient(
+        "http://prometheus:9090", cache_ttl=60, transport=httpx.MockTransport(handler)
+    )
+    await client.get_planner_metrics("60s")
+    await client.get_planner_metrics("60s")
+    assert len(calls) == 6
+
+    # a different interval is a different query
+    await client.get_planner_metrics("30s")
+    assert len(calls) == 12
+
+    # without a ttl every observation goes to prometheus
+    client.cache_ttl = 0
+    client._cache.clear()
+    await client.get_planner_metrics("30s")
+    await client.get_planner_metrics("30s")
+    assert len(calls) == 24
+    await client.close()
+
+
+async def test_failed_queries_are_not_cached():
+    calls: list = []
+    client = AsyncPrometheusAPIClient(
+        "http://prometheus:9090", cache_ttl=60, transport=_make_transport(calls)
+    )
+    await client.get_planner_metrics("60s")
+    await client.get_planner_metrics("60s")
+    # only the failing inter token latency query is retried
+    assert len(calls) == 7
+    await client.close()
+
+
+async def test_prometheus_error_status():
+    async def handler(request):
+        return httpx.Response(200, json={"status": "error", "error": "bad query"})
+
+    client = AsyncPrometheusAPIClient(
+        "http://prometheus:9090", transport=httpx.MockTransport(handler)
+    )
+    with pytest.raises(RuntimeError, match="bad query"):
+        await client.custom_query("up")
+    assert await client.get_avg_request_count("60s") == 0
+    await client.close()
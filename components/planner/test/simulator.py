@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dynamo.planner.utils.simulator import load_trace, parse_args, simulate
+
+PROFILE_RESULTS_DIR = str(
+    Path(__file__).resolve().parents[3]
+    / "tests"
+    / "planner"
+    / "profiling_results"
+    / "H200_TP1P_TP1D"
+)
+
+
+def _write_trace(path, rates, interval_s=60, seed=0):
+    """Poisson arrivals with the given request rate (req/s) per interval."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as f:
+        for k, rate in enumerate(rates):
+            num_req = rng.poisson(rate * interval_s)
+            arrivals = np.sort(
+                rng.uniform(k * interval_s, (k + 1) * interval_s, num_req)
+            )
+            for t in arrivals:
+                f.write(
+                    json.dumps(
+                        {
+                            "timestamp": int(t * 1000),
+                            "input_length": 3000,
+                            "output_length": 150,
+                            "hash_ids": [0],
+                        }
+                    )
+                    + "\n"
+                )
+
+
+@pytest.fixture
+def profile_dir(tmp_path):
+    profile_dir = tmp_path / "profile"
+    shutil.copytree(
+        PROFILE_RESULTS_DIR,
+        profile_dir,
+        ignore=shutil.ignore_patterns("interpolation_grid.*"),
+    )
+    return str(profile_dir)
+
+
+def _args(trace, profile_dir, *extra):
+    return parse_args(
+        [
+            "--trace",
+            str(trace),
+            "--profile-results-dir",
+            profile_dir,
+            "--adjustment-interval",
+            "60",
+            "--load-predictor",
+            "constant",
+            "--max-gpu-budget",
+            "16",
+            *extra,
+        ]
+    )
+
+
+def test_load_trace_sorts_and_rebases(tmp_path):
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        '{"timestamp": 5000, "input_length": 10, "output_length": 1}\n'
+        '{"timestamp": 2000, "input_length": 20, "output_length": 2}\n'
+    )
+    arrival, isl, osl = load_trace(str(trace))
+    np.testing.assert_array_equal(arrival, [0.0, 3.0])
+    np.testing.assert_array_equal(isl, [20, 10])
+    np.testing.assert_array_equal(osl, [2, 1])
+
+
+def test_simulator_scales_up_with_load(tmp_path, profile_dir):
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace, [5] * 3 + [60] * 8)
+
+    summary, timeline = simulate(_args(trace, profile_dir))
+
+    assert summary["num_intervals"] == len(timeline) == 11
+    assert timeline[0]["num_p"] == timeline[0]["num_d"] == 1
+    # scaling decided at the end of an interval applies to the next one
+    for prev, row in zip(timeline, timeline[1:]):
+        assert (row["num_p"], row["num_d"]) == (prev["next_num_p"], prev["next_num_d"])
+    assert timeline[-1]["num_p"] > timeline[0]["num_p"]
+    # the queue built up while under-provisioned drains after scaling up
+    assert timeline[3]["ttft_violation_rate"] > 0.5
+    assert timeline[-1]["ttft_violation_rate"] == 0
+
+    expected_gpu_hours = sum(row["gpus"] for row in timeline) * 60 / 3600
+    assert summary["gpu_hours"] == pytest.approx(expected_gpu_hours)
+
+
+def test_simulator_scaling_delay(tmp_path, profile_dir):
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace, [100] * 4)
+
+    _, timeline = simulate(_args(trace, profile_dir, "--scaling-delay", "90"))
+
+    # decided at t=60, takes effect at the first boundary after t=150
+    assert timeline[1]["num_p"] == timeline[2]["num_p"] == 1
+    assert timeline[3]["num_p"] == timeline[0]["next_num_p"]
+
+
+def test_simulator_respects_gpu_budget(tmp_path, profile_dir):
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace, [200] * 4)
+
+    summary, _ = simulate(_args(trace, profile_dir, "--max-gpu-budget", "3"))
+
+    assert summary["max_gpus"] <= 3
+    assert summary["ttft_violation_rate"] > 0
+
+
+def test_simulator_queues_prefill_without_replicas(tmp_path, profile_dir):
+    trace = tmp_path / "trace.jsonl"
+    _write_trace(trace, [5] * 4)
+
+    summary, timeline = simulate(
+        _args(
+            trace,
+            profile_dir,
+            "--min-endpoint",
+            "0",
+            "--initial-prefill-replicas",
+            "0",
+            "--initial-decode-replicas",
+            "0",
+        )
+    )
+
+    assert (timeline[0]["num_p"], timeline[0]["num_d"]) == (0, 0)
+    # nothing is prefilled until the planner scales up
+    assert timeline[0]["prefill_backlog"] == timeline[0]["num_req"]
+    assert timeline[0]["decode_saturated"]
+    assert timeline[1]["num_p"] > 0 and timeline[1]["num_d"] > 0
+    # the backlog is prefilled first, long after its arrival
+    assert timeline[1]["prefill_backlog"] == 0
+    assert timeline[1]["ttft_p99"] > 30
+    assert summary["ttft_violation_rate"] > 0
@@ -23,9 +23,12 @@ from typing import Optional
 
 import httpx
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.responses import StreamingResponse
+from prefix_hash_cache import PrefixHashCache, PrefixHashCacheCollector
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
 from router import RouterAPI, RouterRequest, RouterResponse  # Add this import
+from router_protocol import RouterZmqClient
 from transformers import PreTrainedTokenizerBase
 from vllm.config import ModelConfig
 from vllm.entrypoints.openai.protocol import (
@@ -52,6 +55,12 @@ class ServingParams:
     base_metrics_port: int
     router_port: int
     http_port: int
+    # "zmq" sends packed block hashes over a pipelined ZMQ connection,
+    # "http" posts JSON to the router's FastAPI endpoint
+    router_transport: str = "zmq"
+    router_zmq_port: int = 7001
+    # memory budget for memoized block hashes of repeated prompt prefixes, 0 disables it
+    prefix_hash_cache_bytes: int = 0
 
 
 class ServiceAPI:
@@ -65,6 +74,15 @@ class ServiceAPI:
         self.openai_serving_chat: Optional[OpenAIServingChat] = None
         self.model_config: Optional[ModelConfig] = None
         self.http_client: Optional[httpx.AsyncClient] = None
+        self.router_client: Optional[RouterZmqClient] = None
+
+        self.registry = CollectorRegistry()
+        self.prefix_hash_cache: Optional[PrefixHashCache] = None
+        if init_params.prefix_hash_cache_bytes > 0:
+            self.prefix_hash_cache = PrefixHashCache(
+                init_params.block_size, max_bytes=init_params.prefix_hash_cache_bytes
+            )
+            self.registry.register(PrefixHashCacheCollector(self.prefix_hash_cache))
 
         self.setup_routes()
 
@@ -139,26 +157,25 @@ class ServiceAPI:
                 # as block hashes can be orders of magnitude smaller.
                 # Note that the hashing function needs to be deterministic (across processes),
                 # and has to be consistent with the hashing function used to send KV Events to the Router.
-                local_hashes = compute_block_hash_for_seq_py(
-                    tokens, self.init_params.block_size
-                )
+                # With a prefix hash cache, repeated prefixes (system prompts, earlier chat turns)
+                # are only hashed once.
+                if self.prefix_hash_cache is not None:
+                    local_hashes = self.prefix_hash_cache.compute_block_hashes(tokens)
+                else:
+                    local_hashes = compute_block_hash_for_seq_py(
+                        tokens, self.init_params.block_size
+                    )
 
-                # Call router via HTTP
                 try:
-                    router_request = RouterRequest(
-                        local_hashes=local_hashes, num_tokens=num_tokens
+                    best_worker_id = await self.find_best_worker(
+                        local_hashes, num_tokens
                     )
-                    router_response = await self.http_client.post(
-                        f"http://localhost:{self.init_params.router_port}/find_best_worker",
-                        json=router_request.model_dump(),
-                        timeout=1,
-                    )
-
-                    router_response.raise_for_status()
-                    router_data = RouterResponse.model_validate(router_response.json())
-                    best_worker_id = router_data.worker_id
-
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                except (
+                    httpx.RequestError,
+                    httpx.HTTPStatusError,
+                    asyncio.TimeoutError,
+                    RuntimeError,
+                ) as e:
                     logger.error(f"Router request failed: {e}")
                     return ErrorResponse(
                         message="Router service unavailable",
@@ -197,6 +214,27 @@ class ServiceAPI:
                 logger.error(f"Error processing request: {e}")
                 return ErrorResponse(message=str(e), type="internal_error", code=500)
 
+        @self.app.get("/metrics")
+        async def metrics():
+            return Response(
+                generate_latest(self.registry), media_type=CONTENT_TYPE_LATEST
+            )
+
+    async def find_best_worker(self, local_hashes: list[int], num_tokens: int) -> int:
+        if self.router_client is not None:
+            return await self.router_client.find_best_worker(local_hashes, num_tokens)
+
+        # Call router via HTTP
+        assert self.http_client is not None
+        router_request = RouterRequest(local_hashes=local_hashes, num_tokens=num_tokens)
+        router_response = await self.http_client.post(
+            f"http://localhost:{self.init_params.router_port}/find_best_worker",
+            json=router_request.model_dump(),
+            timeout=1,
+        )
+        router_response.raise_for_status()
+        return RouterResponse.model_validate(router_response.json()).worker_id
+
     async def initialize_services(self):
         """Initialize workers, HTTP client, and OpenAI serving components"""
         logger.info("Initializing VllmWorkers...")
@@ -210,6 +248,10 @@ class ServiceAPI:
 
         # Initialize HTTP client for router communication
         self.http_client = httpx.AsyncClient()
+        if self.init_params.router_transport == "zmq":
+            self.router_client = RouterZmqClient(
+                f"tcp://localhost:{self.init_params.router_zmq_port}"
+            )
 
         logger.info("Initializing OpenAI serving components...")
         # Initialize tokenizer and model config
@@ -267,6 +309,8 @@ class ServiceAPI:
 
         if self.http_client:
             await self.http_client.aclose()
+        if self.router_client:
+            await self.router_client.close()
 
         logger.info("API shutdown completed")
 
@@ -304,6 +348,25 @@ def main():
     parser.add_argument(
         "--http-port", type=int, default=8000, help="Port to serve the API on"
     )
+    parser.add_argument(
+        "--router-transport",
+        choices=["zmq", "http"],
+        default="zmq",
+        help="Transport for routing queries: packed binary over ZMQ, or JSON over HTTP",
+    )
+    parser.add_argument(
+        "--prefix-hash-cache-mb",
+        type=float,
+        default=0,
+        help="Memory budget in MiB for memoized block hashes of repeated prompt prefixes "
+        "(0 disables, see prefix_hash_cache_benchmark.py before enabling)",
+    )
+    parser.add_argument(
+        "--router-zmq-port",
+        type=int,
+        default=7001,
+        help="Port for the router's ZMQ transport",
+    )
 
     args = parser.parse_args()
 
@@ -318,6 +381,9 @@ def main():
         base_metrics_port=args.base_metrics_port,
         router_port=args.router_port,
         http_port=args.http_port,
+        router_transport=args.router_transport,
+        router_zmq_port=args.router_zmq_port,
+        prefix_hash_cache_bytes=int(args.prefix_hash_cache_mb * 1024**2),
     )
 
     # Create both services
@@ -328,6 +394,7 @@ def main():
         base_kv_events_port=args.base_kv_events_port,
         base_metrics_port=args.base_metrics_port,
         port=args.router_port,
+        zmq_port=args.router_zmq_port if args.router_transport == "zmq" else None,
     )
 
     async def run_with_shutdown():
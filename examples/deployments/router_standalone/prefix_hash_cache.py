@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memoization of block hashes for prompts sharing a prefix.
+
+Multi-turn chats and shared system prompts resend the same leading blocks with
+every request. The cache is a prefix tree of blocks: an entry is keyed by its
+parent entry and the raw bytes of its tokens, so a lookup walks the leading
+blocks of a prompt until the first unseen one, and only the remaining tail is
+hashed (block hashes only depend on the tokens of their own block).
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Callable, Iterator
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from dynamo._core import compute_block_hash_for_seq_py
+
+# rough per-entry cost of the key tuple, the entry tuple and the dict slot
+ENTRY_OVERHEAD_BYTES = 200
+ROOT = 0
+
+
+class PrefixHashCache:
+    """
+    LRU cache of block hashes keyed by prompt prefix, bounded to `max_bytes`.
+
+    Least recently used entries are evicted first. A lookup refreshes the blocks
+    of a prompt from the last to the first, so the tail of a prompt is evicted
+    before the prefix it shares with other prompts.
+    """
+
+    def __init__(
+        self,
+        block_size: int,
+        max_bytes: int = 64 * 1024**2,
+        hash_fn: Callable[[list[int], int], list[int]] = compute_block_hash_for_seq_py,
+    ):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.hash_fn = hash_fn
+
+        # (parent entry id, block token bytes) -> (entry id, block hash)
+        self.entries: OrderedDict[tuple[int, bytes], tuple[int, int]] = OrderedDict()
+        self.next_entry_id = ROOT + 1
+        self.num_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def compute_block_hashes(self, tokens: list[int]) -> list[int]:
+        """Same as `compute_block_hash_for_seq_py(tokens, block_size)`, reusing cached blocks."""
+        block_bytes = 4 * self.block_size
+        num_blocks = len(tokens) // self.block_size
+        # bytes slices are cheaper to hash and compare than memoryview slices
+        data = array("I", tokens[: num_blocks * self.block_size]).tobytes()
+
+        hashes: list[int] = []
+        path: list[tuple[int, bytes]] = []
+        parent = ROOT
+        for i in range(num_blocks):
+            key = (parent, data[i * block_bytes : (i + 1) * block_bytes])
+            entry = self.entries.get(key)
+            if entry is None:
+                break
+            path.append(key)
+            parent, block_hash = entry
+            hashes.append(block_hash)
+
+        num_cached = len(hashes)
+        self.hits += num_cached
+        self.misses += num_blocks - num_cached
+
+        if num_cached < num_blocks:
+            tail_hashes = self.hash_fn(
+                tokens[num_cached * self.block_size : num_blocks * self.block_size],
+                self.block_size,
+            )
+            tail = []
+            for i, block_hash in enumerate(tail_hashes, start=num_cached):
+                key = (parent, data[i * block_bytes : (i + 1) * block_bytes])
+                parent = self.next_entry_id
+                self.next_entry_id += 1
+                tail.append((key, (parent, block_hash)))
+            for key, entry in reversed(tail):
+                self.entries[key] = entry
+            self.num_bytes += len(tail) * (block_bytes + ENTRY_OVERHEAD_BYTES)
+            hashes.extend(tail_hashes)
+
+        # deepest blocks first, so that the shared prefix ends up most recently used
+        for key in reversed(path):
+            self.entries.move_to_end(key)
+        self._evict()
+
+        return hashes
+
+    def _evict(self):
+        entry_bytes = 4 * self.block_size + ENTRY_OVERHEAD_BYTES
+        while self.num_bytes > self.max_bytes and self.entries:
+            # descendants of an evicted entry become unreachable and age out in turn
+            self.entries.popitem(last=False)
+            self.num_bytes -= entry_bytes
+            self.evictions += 1
+
+
+class PrefixHashCacheCollector:
+    """Exports the counters of a `PrefixHashCache` to a prometheus registry."""
+
+    def __init__(self, cache: PrefixHashCache):
+        self.cache = cache
+
+    def collect(self) -> Iterator:
+        cache = self.cache
+        yield CounterMetricFamily(
+            "router_prefix_hash_cache_hit_blocks",
+            "Blocks whose hash was reused from the prefix hash cache",
+            value=cache.hits,
+        )
+        yield CounterMetricFamily(
+            "router_prefix_hash_cache_miss_blocks",
+            "Blocks that had to be hashed",
+            value=cache.misses,
+        )
+        yield CounterMetricFamily(
+            "router_prefix_hash_cache_evictions",
+            "Blocks evicted from the prefix hash cache",
+            value=cache.evictions,
+        )
+        yield GaugeMetricFamily(
+            "router_prefix_hash_cache_bytes",
+            "Approximate memory held by the prefix hash cache",
+            value=cache.num_bytes,
+        )
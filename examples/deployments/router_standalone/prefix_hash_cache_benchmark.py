@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark of the prefix hash cache vs. hashing every block of a prompt.
+
+Times `compute_block_hash_for_seq_py` on whole prompts against
+`PrefixHashCache.compute_block_hashes` on prompts sharing a varying fraction of
+their leading blocks with a previous prompt, so the break-even hit ratio of the
+cache can be read off directly.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from prefix_hash_cache import PrefixHashCache
+
+from dynamo._core import compute_block_hash_for_seq_py
+
+
+def time_calls(fn, prompts: list[list[int]]) -> np.ndarray:
+    latencies = np.zeros(len(prompts))
+    for i, tokens in enumerate(prompts):
+        start = time.perf_counter()
+        fn(tokens)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def report(name: str, latencies: np.ndarray):
+    print(
+        f"{name:>12}: p50 {np.percentile(latencies, 50) * 1e6:9.1f} us, "
+        f"p99 {np.percentile(latencies, 99) * 1e6:9.1f} us"
+    )
+
+
+def benchmark(args):
+    rng = np.random.default_rng(0)
+    num_blocks = args.num_tokens // args.block_size
+
+    def random_tokens(num_tokens: int) -> list[int]:
+        return rng.integers(0, 2**31, size=num_tokens, dtype=np.uint32).tolist()
+
+    print(
+        f"{args.num_requests} prompts of {args.num_tokens} tokens, "
+        f"block size {args.block_size}"
+    )
+
+    prompts = [random_tokens(args.num_tokens) for _ in range(args.num_requests)]
+    report(
+        "uncached",
+        time_calls(
+            lambda tokens: compute_block_hash_for_seq_py(tokens, args.block_size),
+            prompts,
+        ),
+    )
+
+    for hit_ratio in args.hit_ratios:
+        num_shared = int(num_blocks * hit_ratio) * args.block_size
+        cache = PrefixHashCache(args.block_size)
+        prefix = random_tokens(num_shared)
+        cache.compute_block_hashes(prefix)
+        prompts = [
+            prefix + random_tokens(args.num_tokens - num_shared)
+            for _ in range(args.num_requests)
+        ]
+        latencies = time_calls(cache.compute_block_hashes, prompts)
+        report(f"{hit_ratio:.0%} cached", latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefix hash cache micro-benchmark")
+    parser.add_argument("--block-size", type=int, default=64)
+    parser.add_argument("--num-tokens", type=int, default=8192)
+    parser.add_argument("--num-requests", type=int, default=200)
+    parser.add_argument(
+        "--hit-ratios",
+        type=float,
+        nargs="+",
+        default=[0.0, 0.5, 0.9, 1.0],
+        help="Fractions of the leading blocks of each prompt found in the cache",
+    )
+    args = parser.parse_args()
+
+    benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
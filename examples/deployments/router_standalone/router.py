@@ -15,16 +15,25 @@
 
 import argparse
 import asyncio
-import json
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional
 
 import numpy as np
 import uvicorn
 import zmq
-from fastapi import FastAPI, HTTPException
+import zmq.asyncio
+from fastapi import FastAPI, HTTPException, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+)
 from pydantic import BaseModel
+from router_protocol import RouterZmqServer, decode_load_metrics
 
 from dynamo._core import RadixTree, ZmqKvEventListener
 
@@ -40,20 +49,56 @@ class RouterResponse(BaseModel):
     worker_id: int
 
 
-class LoadMetrics(BaseModel):
-    gpu_cache_usage: float
-    num_waiting_reqs: int
-
-
-def setup_zmq_subscriber(context: zmq.Context, endpoint: str) -> zmq.Socket[bytes]:
+def setup_zmq_subscriber(
+    context: zmq.asyncio.Context, endpoint: str
+) -> zmq.asyncio.Socket:
     socket = context.socket(zmq.SUB)
     socket.connect(endpoint)
     socket.setsockopt(zmq.SUBSCRIBE, b"")  # Subscribe to all messages
     socket.setsockopt(zmq.CONFLATE, 1)  # Only keep latest message
-    socket.setsockopt(zmq.RCVTIMEO, 1)  # 1ms timeout (very short)
     return socket
 
 
+# routing decisions are expected to take well under a millisecond
+ROUTING_LATENCY_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.1,
+)
+
+
+@dataclass
+class ScoringConfig:
+    """
+    Worker scoring: logit = overlap_weight * overlap - usage_weight * usage - waiting_weight * waiting
+
+    temperature: 0 picks the best logit (ties broken at random), otherwise workers
+        are sampled from softmax(logits / temperature)
+    power_of_k: if positive, only score k workers sampled uniformly per request
+    """
+
+    overlap_weight: float = 2.0
+    usage_weight: float = 1.0
+    waiting_weight: float = 1.0
+    temperature: float = 0.0
+    power_of_k: int = 0
+
+
+class WorkerStates:
+    """Per-worker load, one numpy column per field indexed by worker id."""
+
+    def __init__(self, num_workers: int):
+        self.kv_usage = np.zeros(num_workers)
+        self.waiting = np.zeros(num_workers)
+
+
 class KvRouter:
     def __init__(
         self,
@@ -61,16 +106,30 @@ class KvRouter:
         num_workers: int = 4,
         base_kv_events_port: int = 5557,
         base_metrics_port: int = 5657,
+        scoring: Optional[ScoringConfig] = None,
+        seed: Optional[int] = None,
     ):
         self.num_workers = num_workers
         self.block_size = block_size
+        self.scoring = scoring or ScoringConfig()
+        if self.scoring.temperature < 0:
+            raise ValueError("temperature must be non-negative")
+        self.rng = np.random.default_rng(seed)
 
         self.radix_tree = RadixTree()
 
-        self.kv_usages = [0.0] * num_workers
-        self.waitings = [0] * num_workers
+        self.workers = WorkerStates(num_workers)
+        self.all_workers = np.arange(num_workers)
+
+        self.registry = CollectorRegistry()
+        self.routing_latency = Histogram(
+            "router_routing_decision_seconds",
+            "Latency of selecting the best worker for a request",
+            buckets=ROUTING_LATENCY_BUCKETS,
+            registry=self.registry,
+        )
 
-        self.context = zmq.Context()
+        self.context = zmq.asyncio.Context()
         self.load_listeners = [
             setup_zmq_subscriber(
                 self.context, f"tcp://localhost:{base_metrics_port + worker_id}"
@@ -96,98 +155,123 @@ class KvRouter:
         )
 
     async def periodic_update_load(self):
-        async def update_load(worker_id: int):
-            while True:
+        """Apply load metrics of all workers as they arrive, multiplexed on one poller."""
+        poller = zmq.asyncio.Poller()
+        worker_ids = {}
+        for worker_id, listener in enumerate(self.load_listeners):
+            poller.register(listener, zmq.POLLIN)
+            worker_ids[listener] = worker_id
+
+        while True:
+            ready = await poller.poll()
+            for listener, _ in ready:
+                worker_id = worker_ids[listener]
                 try:
-                    metrics_dict = self.load_listeners[worker_id].recv_json(zmq.NOBLOCK)
-                    metrics = LoadMetrics.model_validate(metrics_dict)
-                    self.kv_usages[worker_id] = metrics.gpu_cache_usage
-                    self.waitings[worker_id] = metrics.num_waiting_reqs
+                    # CONFLATE keeps only the latest frame, so one read is up to date
+                    frame = await listener.recv(zmq.NOBLOCK, copy=False)
+                    num_waiting_reqs, gpu_cache_usage = decode_load_metrics(
+                        frame.buffer
+                    )
                 except zmq.Again:
-                    pass
+                    continue
                 except Exception as e:
                     logger.warning(
                         f"Error receiving metrics for worker {worker_id}: {e}"
                     )
-
-                await asyncio.sleep(0.1)
-
-        for worker_id in range(self.num_workers):
-            asyncio.create_task(update_load(worker_id))
+                    continue
+                self.workers.kv_usage[worker_id] = gpu_cache_usage
+                self.workers.waiting[worker_id] = num_waiting_reqs
 
     async def periodic_update_indexer(self):
         async def update_tree(worker_id: int):
+            # Event batches are forwarded to the radix tree as the raw frames produced by
+            # the listener, and each wait resolves as soon as the worker publishes events
+            listener = self.kv_listeners[worker_id]
             while True:
                 try:
-                    kv_events: list[str] = await self.kv_listeners[
-                        worker_id
-                    ].get_events()
-                    for event in kv_events:
-                        event = json.loads(event)
-                        self.radix_tree.apply_event(
-                            worker_id, json.dumps(event).encode("utf-8")
-                        )
-                except zmq.Again:
-                    pass
+                    kv_events = await listener.next_event_batch()
+                    if kv_events is None:
+                        logger.info(f"KV event listener for worker {worker_id} closed")
+                        return
+                    self.radix_tree.apply_events(worker_id, kv_events)
                 except Exception as e:
                     logger.warning(
                         f"Error receiving KV events for worker {worker_id}: {e}"
                     )
-
-                await asyncio.sleep(0.1)
+                    await asyncio.sleep(0.1)
 
         for worker_id in range(self.num_workers):
-            asyncio.create_task(update_tree(worker_id))
+            self.background_tasks.append(asyncio.create_task(update_tree(worker_id)))
 
     async def get_best_worker(self, local_hashes: list[int], num_tokens: int) -> int:
+        start = time.perf_counter()
         try:
             if num_tokens <= 0:
                 raise ValueError("num_tokens must be positive")
 
             # local_hashes can be empty
             raw_scores = self.radix_tree.find_matches(local_hashes).scores
-
-            overlap_scores = {
-                worker_id: raw_scores.get(worker_id, 0) * self.block_size / num_tokens
-                for worker_id in range(self.num_workers)
-            }
-
-            kv_usages = self.kv_usages[:]
-            waitings = self.waitings[:]
-
-            max_waiting = max(waitings) if waitings else 0
-            waitings_normalized = [
-                waiting / max_waiting if max_waiting else 0.0 for waiting in waitings
-            ]
-
-            logits = []
-            for worker_id in range(self.num_workers):
-                overlap = overlap_scores[worker_id]
-                usage = kv_usages[worker_id]
-                waiting = waitings_normalized[worker_id]
-                logit = 2 * overlap - usage - waiting
-                logits.append(logit)
-                logger.info(
-                    f"worker_id: {worker_id}, logit = 2 * {overlap:.3f} - {usage:.3f} - {waiting:.3f} = {logit:.3f}"
-                )
-
-            logits_array = np.array(logits)
-            best_worker_id = int(
-                np.random.choice(np.flatnonzero(logits_array == logits_array.max()))
-            )
+            best_worker_id = self.select_worker(raw_scores, num_tokens)
 
             # this is a predictive update which will be reset as new metrics are polled
             # but it is helpful for handling short bursts of highly concurrent requests
             # we omit updating the gpu_usage_perc as done in the rusty router for simplicity
             # as this requires obtaining num_gpu_blocks from the engines and can be intrusive
             # no need for async lock here, as the state is intended to be continuously overwritten
-            self.waitings[best_worker_id] += 1
+            self.workers.waiting[best_worker_id] += 1
 
             return best_worker_id
 
         except Exception as e:
             logger.error(f"Error in get_best_worker: {e}")
             raise
+        finally:
+            self.routing_latency.observe(time.perf_counter() - start)
+
+    def select_worker(self, raw_scores: dict[int, int], num_tokens: int) -> int:
+        """Score the candidate workers at once and pick one according to `self.scoring`."""
+        scoring = self.scoring
+        workers = self.workers
+
+        if 0 < scoring.power_of_k < self.num_workers:
+            candidates = self.rng.choice(
+                self.num_workers, scoring.power_of_k, replace=False
+            )
+        else:
+            candidates = self.all_workers
+
+        overlap_blocks = np.zeros(self.num_workers)
+        for worker_id, score in raw_scores.items():
+            if 0 <= worker_id < self.num_workers:
+                overlap_blocks[worker_id] = score
+        overlaps = overlap_blocks[candidates] * self.block_size / num_tokens
+
+        # normalized by the busiest of all workers, so sampling candidates does not
+        # change how a worker is scored
+        max_waiting = workers.waiting.max()
+        waitings_normalized = (
+            workers.waiting[candidates] / max_waiting
+            if max_waiting > 0
+            else np.zeros(len(candidates))
+        )
+
+        logits = (
+            scoring.overlap_weight * overlaps
+            - scoring.usage_weight * workers.kv_usage[candidates]
+            - scoring.waiting_weight * waitings_normalized
+        )
+
+        if scoring.temperature > 0:
+            weights = np.exp((logits - logits.max()) / scoring.temperature)
+            choice = self.rng.choice(len(candidates), p=weights / weights.sum())
+        else:
+            choice = self.rng.choice(np.flatnonzero(logits == logits.max()))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"candidates: {candidates.tolist()}, logits: {np.round(logits, 3).tolist()}"
+            )
+        return int(candidates[choice])
 
     async def shutdown(self):
         """Shutdown ZMQ listeners, context, and background tasks"""
@@ -225,13 +309,18 @@ class RouterAPI:
         base_kv_events_port: int = 5557,
         base_metrics_port: int = 5657,
         port: int = 7000,
+        scoring: Optional[ScoringConfig] = None,
+        zmq_port: Optional[int] = None,
     ):
         self.port = port
+        self.zmq_port = zmq_port
+        self.scoring = scoring
         self.block_size = block_size
         self.num_workers = num_workers
         self.base_kv_events_port = base_kv_events_port
         self.base_metrics_port = base_metrics_port
         self.router = None
+        self.server: Optional[uvicorn.Server] = None
         self.app = FastAPI(
             title="KV Router API", version="0.0.1", lifespan=self.lifespan
         )
@@ -245,13 +334,26 @@ class RouterAPI:
             num_workers=self.num_workers,
             base_kv_events_port=self.base_kv_events_port,
             base_metrics_port=self.base_metrics_port,
+            scoring=self.scoring,
         )
         await self.router.start_background_tasks()
+
+        # binary transport for RouterZmqClient, next to the HTTP endpoints
+        zmq_server = None
+        zmq_task = None
+        if self.zmq_port is not None:
+            zmq_server = RouterZmqServer(self.router, f"tcp://*:{self.zmq_port}")
+            zmq_task = asyncio.create_task(zmq_server.serve())
         logger.info("Router API started successfully")
 
         yield
 
         # Shutdown
+        if zmq_task is not None:
+            zmq_task.cancel()
+            await asyncio.gather(zmq_task, return_exceptions=True)
+        if zmq_server is not None:
+            zmq_server.close()
         if self.router:
             await self.router.shutdown()
 
@@ -272,14 +374,22 @@ class RouterAPI:
                 logger.error(f"Error finding best worker: {e}")
                 raise HTTPException(status_code=500, detail="Internal server error")
 
+        @self.app.get("/metrics")
+        async def metrics():
+            if self.router is None:
+                raise HTTPException(status_code=503, detail="Router not initialized")
+            return Response(
+                generate_latest(self.router.registry), media_type=CONTENT_TYPE_LATEST
+            )
+
     async def start(self):
         """Start the router API server"""
         logger.info(f"Starting Router API server on port {self.port}")
         config = uvicorn.Config(
             self.app, host="0.0.0.0", port=self.port, log_level="info"
         )
-        server = uvicorn.Server(config)
-        await server.serve()
+        self.server = uvicorn.Server(config)
+        await self.server.serve()
 
 
 def main():
@@ -301,6 +411,43 @@ def main():
         "--port", type=int, default=7000, help="Port to serve the Router API on"
     )
 
+    parser.add_argument(
+        "--zmq-port",
+        type=int,
+        default=None,
+        help="Port to serve binary routing queries over ZMQ on (default: HTTP only)",
+    )
+    parser.add_argument(
+        "--overlap-weight",
+        type=float,
+        default=2.0,
+        help="Weight of the KV cache overlap in the worker logits",
+    )
+    parser.add_argument(
+        "--usage-weight",
+        type=float,
+        default=1.0,
+        help="Weight of the KV cache usage in the worker logits",
+    )
+    parser.add_argument(
+        "--waiting-weight",
+        type=float,
+        default=1.0,
+        help="Weight of the normalized waiting requests in the worker logits",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=0.0,
+        help="Softmax temperature for sampling workers, 0 always picks the best worker",
+    )
+    parser.add_argument(
+        "--power-of-k",
+        type=int,
+        default=0,
+        help="Only score k randomly sampled workers per request, 0 scores all workers",
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -312,6 +459,14 @@ def main():
         base_kv_events_port=args.base_kv_events_port,
         base_metrics_port=args.base_metrics_port,
         port=args.port,
+        zmq_port=args.zmq_port,
+        scoring=ScoringConfig(
+            overlap_weight=args.overlap_weight,
+            usage_weight=args.usage_weight,
+            waiting_weight=args.waiting_weight,
+            temperature=args.temperature,
+            power_of_k=args.power_of_k,
+        ),
     )
 
     async def run_with_shutdown():
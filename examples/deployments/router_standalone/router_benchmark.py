@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of the routing round trip over HTTP/JSON vs. the binary ZMQ transport.
+
+Starts a RouterAPI in-process (no workers are needed, the router only waits for
+their events) and issues routing queries for random block hashes at a fixed
+concurrency through both transports.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+import numpy as np
+from router import RouterAPI, RouterRequest, RouterResponse
+from router_protocol import RouterZmqClient
+
+logger = logging.getLogger(__name__)
+
+
+async def run_queries(query_fn, queries: list[list[int]], concurrency: int):
+    latencies = np.zeros(len(queries))
+    next_query = 0
+
+    async def client():
+        nonlocal next_query
+        while next_query < len(queries):
+            i = next_query
+            next_query += 1
+            start = time.perf_counter()
+            await query_fn(queries[i])
+            latencies[i] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def report(name: str, latencies: np.ndarray, elapsed: float):
+    print(
+        f"{name:>5}: {len(latencies) / elapsed:10.0f} req/s, "
+        f"p50 {np.percentile(latencies, 50) * 1e3:7.3f} ms, "
+        f"p99 {np.percentile(latencies, 99) * 1e3:7.3f} ms"
+    )
+
+
+async def wait_for_http(http_client: httpx.AsyncClient, url: str):
+    for _ in range(100):
+        try:
+            response = await http_client.get(url)
+            if response.status_code == 200:
+                return
+        except httpx.RequestError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"Router API did not come up at {url}")
+
+
+async def benchmark(args):
+    router_api = RouterAPI(
+        block_size=args.block_size,
+        num_workers=args.num_workers,
+        port=args.http_port,
+        zmq_port=args.zmq_port,
+    )
+    server_task = asyncio.create_task(router_api.start())
+
+    rng = np.random.default_rng(0)
+    queries = [
+        rng.integers(0, 2**63, size=args.num_blocks, dtype=np.uint64).tolist()
+        for _ in range(args.num_requests)
+    ]
+    num_tokens = args.num_blocks * args.block_size
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=args.concurrency)
+    )
+    zmq_client = RouterZmqClient(
+        f"tcp://localhost:{args.zmq_port}", max_batch_size=args.max_batch_size
+    )
+    try:
+        await wait_for_http(http_client, f"http://localhost:{args.http_port}/metrics")
+        # per-request access logs would dominate the HTTP timings
+        logging.getLogger("uvicorn.access").disabled = True
+
+        async def query_http(local_hashes: list[int]) -> int:
+            response = await http_client.post(
+                f"http://localhost:{args.http_port}/find_best_worker",
+                json=RouterRequest(
+                    local_hashes=local_hashes, num_tokens=num_tokens
+                ).model_dump(),
+            )
+            response.raise_for_status()
+            return RouterResponse.model_validate(response.json()).worker_id
+
+        async def query_zmq(local_hashes: list[int]) -> int:
+            return await zmq_client.find_best_worker(local_hashes, num_tokens)
+
+        print(
+            f"{args.num_requests} queries of {args.num_blocks} block hashes, "
+            f"concurrency {args.concurrency}"
+        )
+        for name, query_fn in (("http", query_http), ("zmq", query_zmq)):
+            # warm up connections before timing
+            await run_queries(query_fn, queries[: args.concurrency], args.concurrency)
+            report(name, *await run_queries(query_fn, queries, args.concurrency))
+    finally:
+        await http_client.aclose()
+        await zmq_client.close()
+        if router_api.server is not None:
+            router_api.server.should_exit = True
+        await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Router transport micro-benchmark")
+    parser.add_argument("--num-workers", type=int, default=4)
+    parser.add_argument("--block-size", type=int, default=64)
+    parser.add_argument(
+        "--num-blocks", type=int, default=256, help="Block hashes per query"
+    )
+    parser.add_argument("--num-requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=64,
+        help="Maximum queries per ZMQ round trip",
+    )
+    parser.add_argument("--http-port", type=int, default=7100)
+    parser.add_argument("--zmq-port", type=int, default=7101)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary, batched transport for routing queries over ZMQ.
+
+A client (DEALER) sends batches of routing queries to the router (ROUTER) and
+can keep many batches in flight on one connection; replies are matched to
+their batch by id. All integers are little-endian.
+
+Query batch:
+    header: version (u8), pad (u8), number of queries (u16), batch id (u32)
+    per query: num_tokens (u32), number of hashes (u32), hashes (u64 each)
+
+Reply:
+    header: same layout as the query batch header
+    worker ids: one i32 per query, in query order, ERROR_WORKER_ID on failure
+
+Workers publish their load to the router in a fixed size frame:
+    version (u8), pad (3 bytes), num_waiting_reqs (u32), gpu_cache_usage (f32)
+"""
+
+import asyncio
+import logging
+import struct
+from typing import Optional, Protocol, Sequence
+
+import numpy as np
+import zmq
+import zmq.asyncio
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+BATCH_HEADER = struct.Struct("<BxHI")
+QUERY_HEADER = struct.Struct("<II")
+HASH_DTYPE = np.dtype("<u8")
+WORKER_ID_DTYPE = np.dtype("<i4")
+ERROR_WORKER_ID = -1
+MAX_BATCH_SIZE = 2**16 - 1
+LOAD_METRICS_FRAME = struct.Struct("<BxxxIf")
+
+
+class WorkerSelector(Protocol):
+    async def get_best_worker(self, local_hashes: list[int], num_tokens: int) -> int:
+        ...
+
+
+def encode_queries(
+    batch_id: int, queries: Sequence[tuple[Sequence[int], int]]
+) -> bytes:
+    """Pack (local_hashes, num_tokens) routing queries into one frame."""
+    if len(queries) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} queries fit in one batch")
+    parts = [BATCH_HEADER.pack(PROTOCOL_VERSION, len(queries), batch_id)]
+    for local_hashes, num_tokens in queries:
+        parts.append(QUERY_HEADER.pack(num_tokens, len(local_hashes)))
+        parts.append(np.asarray(local_hashes, dtype=HASH_DTYPE).tobytes())
+    return b"".join(parts)
+
+
+def decode_queries(frame) -> tuple[int, list[tuple[np.ndarray, int]]]:
+    """
+    Unpack a query frame into its batch id and (local_hashes, num_tokens) queries.
+    The hashes are views into `frame`, which can be any buffer.
+    """
+    batch_id, count = _unpack_header(frame)
+    offset = BATCH_HEADER.size
+    queries = []
+    for _ in range(count):
+        num_tokens, num_hashes = _unpack(QUERY_HEADER, frame, offset)
+        offset += QUERY_HEADER.size
+        if offset + num_hashes * HASH_DTYPE.itemsize > len(frame):
+            raise ValueError("Truncated query frame")
+        local_hashes = np.frombuffer(
+            frame, dtype=HASH_DTYPE, count=num_hashes, offset=offset
+        )
+        offset += num_hashes * HASH_DTYPE.itemsize
+        queries.append((local_hashes, num_tokens))
+    if offset != len(frame):
+        raise ValueError("Trailing bytes in query frame")
+    return batch_id, queries
+
+
+def encode_worker_ids(batch_id: int, worker_ids: Sequence[int]) -> bytes:
+    header = BATCH_HEADER.pack(PROTOCOL_VERSION, len(worker_ids), batch_id)
+    return header + np.asarray(worker_ids, dtype=WORKER_ID_DTYPE).tobytes()
+
+
+def decode_worker_ids(frame) -> tuple[int, np.ndarray]:
+    batch_id, count = _unpack_header(frame)
+    if len(frame) != BATCH_HEADER.size + count * WORKER_ID_DTYPE.itemsize:
+        raise ValueError("Malformed reply frame")
+    worker_ids = np.frombuffer(
+        frame, dtype=WORKER_ID_DTYPE, count=count, offset=BATCH_HEADER.size
+    )
+    return batch_id, worker_ids
+
+
+def encode_load_metrics(num_waiting_reqs: int, gpu_cache_usage: float) -> bytes:
+    return LOAD_METRICS_FRAME.pack(PROTOCOL_VERSION, num_waiting_reqs, gpu_cache_usage)
+
+
+def decode_load_metrics(frame) -> tuple[int, float]:
+    """Unpack a load metrics frame into (num_waiting_reqs, gpu_cache_usage)."""
+    if len(frame) != LOAD_METRICS_FRAME.size:
+        raise ValueError("Malformed load metrics frame")
+    version, num_waiting_reqs, gpu_cache_usage = LOAD_METRICS_FRAME.unpack(frame)
+    if version != PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported router protocol version {version}")
+    return num_waiting_reqs, gpu_cache_usage
+
+
+def _unpack(layout: struct.Struct, frame, offset: int = 0) -> tuple:
+    try:
+        return layout.unpack_from(frame, offset)
+    except struct.error as e:
+        raise ValueError(f"Truncated frame: {e}") from e
+
+
+def _unpack_header(frame) -> tuple[int, int]:
+    version, count, batch_id = _unpack(BATCH_HEADER, frame)
+    if version != PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported router protocol version {version}")
+    return batch_id, count
+
+
+class RouterZmqServer:
+    """Serves routing queries of `RouterZmqClient`s with a `KvRouter`."""
+
+    def __init__(self, router: WorkerSelector, endpoint: str):
+        self.router = router
+        self.endpoint = endpoint
+        self.context = zmq.asyncio.Context()
+        self.socket: Optional[zmq.asyncio.Socket] = None
+
+    async def serve(self):
+        self.socket = self.context.socket(zmq.ROUTER)
+        self.socket.bind(self.endpoint)
+        logger.info(f"Router ZMQ server listening on {self.endpoint}")
+
+        while True:
+            identity, frame = await self.socket.recv_multipart(copy=False)
+            try:
+                batch_id, queries = decode_queries(frame.buffer)
+            except ValueError as e:
+                logger.warning(f"Dropping malformed routing batch: {e}")
+                continue
+
+            worker_ids = []
+            for local_hashes, num_tokens in queries:
+                try:
+                    worker_id = await self.router.get_best_worker(
+                        local_hashes.tolist(), num_tokens
+                    )
+                except Exception:
+                    # already logged by the router
+                    worker_id = ERROR_WORKER_ID
+                worker_ids.append(worker_id)
+
+            await self.socket.send_multipart(
+                [identity, encode_worker_ids(batch_id, worker_ids)]
+            )
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close(linger=0)
+        self.context.term()
+
+
+class RouterZmqClient:
+    """
+    Sends routing queries to a `RouterZmqServer` over one pipelined connection.
+
+    Queries issued concurrently (in the same event loop iteration) are coalesced
+    into one batch of at most `max_batch_size` queries, and any number of
+    batches can be awaiting their reply at the same time.
+    """
+
+    def __init__(self, endpoint: str, max_batch_size: int = 64, timeout: float = 1.0):
+        if not 0 < max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"max_batch_size must be in [1, {MAX_BATCH_SIZE}]")
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+
+        self.context = zmq.asyncio.Context()
+        self.socket = self.context.socket(zmq.DEALER)
+        self.socket.connect(endpoint)
+
+        self.pending: list[tuple[Sequence[int], int, asyncio.Future]] = []
+        self.in_flight: dict[int, list[asyncio.Future]] = {}
+        self.next_batch_id = 0
+        self.flush_task: Optional[asyncio.Task] = None
+        self.receive_task: Optional[asyncio.Task] = None
+
+    async def find_best_worker(
+        self, local_hashes: Sequence[int], num_tokens: int
+    ) -> int:
+        """
+        Raises:
+            asyncio.TimeoutError: if the router does not reply within `timeout`
+            RuntimeError: if the router failed to select a worker
+        """
+        if self.receive_task is None:
+            self.receive_task = asyncio.create_task(self._receive())
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((local_hashes, num_tokens, future))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush())
+
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self._discard_finished_batches()
+            raise
+
+    async def find_best_workers(
+        self, queries: Sequence[tuple[Sequence[int], int]]
+    ) -> list[int]:
+        """Route several (local_hashes, num_tokens) queries in as few round trips as possible."""
+        return list(
+            await asyncio.gather(
+                *(self.find_best_worker(hashes, tokens) for hashes, tokens in queries)
+            )
+        )
+
+    async def _flush(self):
+        try:
+            while self.pending:
+                batch = self.pending[: self.max_batch_size]
+                del self.pending[: self.max_batch_size]
+
+                batch_id = self.next_batch_id
+                self.next_batch_id = (self.next_batch_id + 1) % 2**32
+                futures = [future for _, _, future in batch]
+                self.in_flight[batch_id] = futures
+                frame = encode_queries(
+                    batch_id, [(hashes, tokens) for hashes, tokens, _ in batch]
+                )
+                try:
+                    await self.socket.send(frame, copy=False)
+                except Exception as e:
+                    self.in_flight.pop(batch_id, None)
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+        finally:
+            self.flush_task = None
+
+    async def _receive(self):
+        while True:
+            frame = await self.socket.recv(copy=False)
+            try:
+                batch_id, worker_ids = decode_worker_ids(frame.buffer)
+            except ValueError as e:
+                logger.warning(f"Dropping malformed routing reply: {e}")
+                continue
+
+            futures = self.in_flight.pop(batch_id, None)
+            if futures is None:
+                continue
+            for future, worker_id in zip(futures, worker_ids.tolist()):
+                if future.done():
+                    # timed out or cancelled
+                    continue
+                if worker_id == ERROR_WORKER_ID:
+                    future.set_exception(
+                        RuntimeError("Router failed to select a worker")
+                    )
+                else:
+                    future.set_result(worker_id)
+
+    def _discard_finished_batches(self):
+        # batches whose replies never arrived would otherwise stay in flight forever
+        finished = [
+            batch_id
+            for batch_id, futures in self.in_flight.items()
+            if all(future.done() for future in futures)
+        ]
+        for batch_id in finished:
+            del self.in_flight[batch_id]
+
+    async def close(self):
+        for task in (self.flush_task, self.receive_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self.socket.close(linger=0)
+        self.context.term()
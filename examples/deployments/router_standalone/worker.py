@@ -14,12 +14,15 @@
 # limitations under the License.
 
 
+import asyncio
 import logging
 import os
+import time
 import uuid
 from typing import AsyncGenerator, Optional
 
 import zmq
+from router_protocol import encode_load_metrics
 from vllm.config import CacheConfig, ModelConfig, SchedulerConfig, VllmConfig
 from vllm.distributed.kv_events import KVEventsConfig
 from vllm.inputs.data import TokensPrompt
@@ -33,27 +36,68 @@ logger = logging.getLogger(__name__)
 
 
 class MetricsPublisher(StatLoggerBase):
-    """Stat logger publisher. Wrapper for the WorkerMetricsPublisher to match the StatLoggerBase interface."""
+    """
+    Stat logger publisher. Wrapper for the WorkerMetricsPublisher to match the StatLoggerBase interface.
 
-    def __init__(self, port: int) -> None:
+    vLLM records stats on every scheduler iteration. Unchanged load is not republished
+    (except every `heartbeat_interval`), and changes are coalesced to at most one frame
+    per `min_interval`; the latest load is always published at the end of an interval.
+    """
+
+    def __init__(
+        self, port: int, min_interval: float = 0.01, heartbeat_interval: float = 1.0
+    ) -> None:
         self.context = zmq.Context()
         self.socket = self.context.socket(zmq.PUB)
         self.socket.bind(f"tcp://*:{port}")
         logger.info(f"ZMQ publisher initialized on port {port}")
 
+        self.min_interval = min_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.latest: Optional[tuple[int, float]] = None
+        self.last_sent: Optional[tuple[int, float]] = None
+        self.last_sent_time = 0.0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
     def record(
         self,
         scheduler_stats: SchedulerStats,
         iteration_stats: Optional[IterationStats],
         engine_idx: int = 0,
     ):
+        self.latest = (
+            scheduler_stats.num_waiting_reqs,
+            scheduler_stats.gpu_cache_usage,
+        )
+        if self.flush_handle is not None:
+            # a trailing publish is already scheduled and will pick up the latest load
+            return
+
+        elapsed = time.monotonic() - self.last_sent_time
+        if self.latest == self.last_sent and elapsed < self.heartbeat_interval:
+            return
+        if elapsed >= self.min_interval:
+            self._publish()
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish()
+            return
+        self.flush_handle = loop.call_later(self.min_interval - elapsed, self._flush)
+
+    def _flush(self):
+        self.flush_handle = None
+        if self.latest != self.last_sent:
+            self._publish()
+
+    def _publish(self):
+        assert self.latest is not None
         # Send metrics over ZMQ
-        metrics_data = {
-            "num_waiting_reqs": scheduler_stats.num_waiting_reqs,
-            "gpu_cache_usage": scheduler_stats.gpu_cache_usage,
-        }
-
-        self.socket.send_json(metrics_data)
+        self.socket.send(encode_load_metrics(*self.latest), zmq.NOBLOCK)
+        self.last_sent = self.latest
+        self.last_sent_time = time.monotonic()
 
     def log_engine_initialized(self) -> None:
         pass
@@ -62,11 +106,12 @@ class MetricsPublisher(StatLoggerBase):
 class LoggerFactory:
     """Factory for creating stat logger publishers. Required by vLLM."""
 
-    def __init__(self, port: int) -> None:
+    def __init__(self, port: int, min_interval: float = 0.01) -> None:
         self.port = port
+        self.min_interval = min_interval
 
     def __call__(self, vllm_config: VllmConfig, dp_rank: int) -> StatLoggerBase:
-        return MetricsPublisher(port=self.port)
+        return MetricsPublisher(port=self.port, min_interval=self.min_interval)
 
 
 class VllmWorkers:
@@ -77,6 +122,7 @@ class VllmWorkers:
         base_kv_events_port: int = 5557,
         base_metrics_port: int = 5657,
         num_workers: int = 1,
+        metrics_min_interval: float = 0.01,
     ):
         os.environ["VLLM_NO_USAGE_STATS"] = "1"
 
@@ -118,7 +164,11 @@ class VllmWorkers:
             self.llms.append(
                 AsyncLLM.from_vllm_config(
                     vllm_config=vllm_config,
-                    stat_loggers=[LoggerFactory(port=metrics_port)],
+                    stat_loggers=[
+                        LoggerFactory(
+                            port=metrics_port, min_interval=metrics_min_interval
+                        )
+                    ],
                 )
             )
 
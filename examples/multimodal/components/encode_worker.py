@@ -93,7 +93,7 @@ class VllmEncodeWorker:
         # 2. Process the image using the image processor.
         # 3. Run the image through the vision model's vision tower.
         # 4. Run the results of the vision tower through the multi-modal projector.
-        # 5. Create a descriptor for the embeddings.
+        # 5. Copy the embeddings into a descriptor leased from the connector's pool.
         # 6. Create a write operation using the serialized request and the descriptor.
         # 7. Await for the write operation to complete.
         # 8. Yield the encode response.
@@ -146,9 +146,14 @@ class VllmEncodeWorker:
                 embeddings = vision_outputs.last_hidden_state
                 embeddings = self.vision_model.multi_modal_projector(embeddings)
 
-            descriptor = connect.Descriptor(embeddings)
+            # Copy the embeddings into memory leased from the connector's pool, which is registered
+            # with NIXL once instead of registering and deregistering the embeddings of every request.
+            lease = self._connector.lease_descriptor(
+                embeddings.shape, embeddings.dtype, embeddings.device
+            )
+            lease.tensor.copy_(embeddings)
 
-            with self._connector.create_readable(descriptor) as readable:
+            with lease, self._connector.create_readable(lease.descriptor) as readable:
                 request.serialized_request = readable.to_serialized()
                 # Clear the image URL as hint that the image is passed as embeddings.
                 request.image_url = None
@@ -160,6 +165,8 @@ class VllmEncodeWorker:
                     request.model_dump_json()
                 )
                 await readable.wait_for_completion()
+                # The PD worker has read the embeddings, return the memory for the next request.
+                lease.release()
 
                 async for response in response_generator:
                     output = MyRequestOutput.model_validate_json(response.data())
@@ -9,6 +9,7 @@ import socket
 import uuid
 import zlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import IntEnum
 from functools import cached_property
 from typing import Any, List, Optional
@@ -436,6 +437,7 @@ class Connector:
         self._nixl = nixl_api.nixl_agent(self._worker_id)
         self._hostname = socket.gethostname()
         self._agent_metadata: Optional[bytes] = None
+        self._descriptor_pool = DescriptorPool(self)
 
         logger.debug(f"Created {self.__repr__()}.")
 
@@ -470,6 +472,13 @@ class Connector:
         """
         return self._nixl.get_agent_metadata()
 
+    @property
+    def descriptor_pool(self) -> DescriptorPool:
+        """
+        Get the pool of pre-registered memory used to lease descriptors, see `lease_descriptor`.
+        """
+        return self._descriptor_pool
+
     @property
     def name(self) -> str | None:
         """
@@ -605,6 +614,23 @@ class Connector:
         op = WritableOperation(self, local_descriptors)
         return op
 
+    def lease_descriptor(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+    ) -> DescriptorLease:
+        """
+        Leases a descriptor of pre-registered memory from the connector's descriptor pool.
+
+        Returns
+        -------
+        DescriptorLease
+            Lease of the memory; write into `lease.tensor`, transfer `lease.descriptor`, and return the lease once the
+            operation has completed.
+        """
+        return self._descriptor_pool.lease(shape, dtype, device)
+
     async def initialize(self) -> None:
         # Only initialize the connector once.
         if self._is_initialized:
@@ -829,6 +855,270 @@ class Descriptor:
         return self._serialized
 
 
+class DescriptorLease:
+    """
+    Descriptor of pooled, pre-registered memory leased from a `DescriptorPool`.
+
+    Write the data to transfer into `tensor`, transfer it using `descriptor`, and return the lease once the operation
+    using it has completed; the memory may be handed to another lease as soon as it has been returned.
+    """
+
+    def __init__(
+        self,
+        pool: DescriptorPool,
+        buffer: _PoolBuffer,
+        tensor: torch.Tensor,
+    ) -> None:
+        self._pool = pool
+        self._buffer: Optional[_PoolBuffer] = buffer
+        self._tensor = tensor
+        self._descriptor = Descriptor(tensor)
+        # The memory is registered with NIXL by the pool for the lifetime of the buffer.
+        self._descriptor._connector = pool._connector
+
+    def __del__(self) -> None:
+        self.release()
+
+    def __enter__(self) -> DescriptorLease:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={tuple(self._tensor.shape)}, dtype={self._tensor.dtype}, descriptor={self._descriptor})"
+
+    @property
+    def descriptor(self) -> Descriptor:
+        """
+        Gets the descriptor of the leased memory, for use with readable, writable, read, and write operations.
+        """
+        return self._descriptor
+
+    @property
+    def tensor(self) -> torch.Tensor:
+        """
+        Gets the leased memory as a tensor of the requested shape and dtype.
+        """
+        return self._tensor
+
+    def release(self) -> None:
+        """
+        Returns the leased memory to the pool.
+        """
+        buffer = getattr(self, "_buffer", None)
+        if buffer is None:
+            return
+        self._buffer = None
+        self._pool._return(buffer)
+
+
+class DescriptorPool:
+    """
+    Connector-owned pool of host and CUDA memory buffers, registered with NIXL once and reused by leases.
+
+    Registering memory with NIXL, and deregistering it, is expensive and changes the metadata remote workers must load.
+    The pool rounds each lease up to a power of two size class of at least `min_buffer_size` bytes, hands out an idle
+    buffer of that class when there is one and otherwise allocates and registers a new one. Returned buffers stay
+    registered unless the idle buffers would exceed `max_idle_bytes`.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        min_buffer_size: int = 4096,
+        max_idle_bytes: int = 1 << 30,
+        cpu_only: bool = False,
+    ) -> None:
+        """
+        Creates a new descriptor pool.
+
+        Parameters
+        ----------
+        connector : Connector
+            Connector the pooled memory is registered with.
+        min_buffer_size : int, optional
+            Size, in bytes, of the smallest size class, by default 4KiB.
+        max_idle_bytes : int, optional
+            Maximum number of bytes kept registered by idle buffers, by default 1GiB.
+        cpu_only : bool, optional
+            When `True`, leases of CUDA memory are served from host memory, which allows code using the pool to be
+            tested without a GPU; by default `False`.
+        """
+        if not isinstance(connector, Connector):
+            raise TypeError("Argument `connector` must be `dynamo.connect.Connector`.")
+        if min_buffer_size <= 0:
+            raise ValueError("Argument `min_buffer_size` must be positive.")
+        if max_idle_bytes < 0:
+            raise ValueError("Argument `max_idle_bytes` must not be negative.")
+
+        self._connector = connector
+        self._min_buffer_size = min_buffer_size
+        self._max_idle_bytes = max_idle_bytes
+        self._cpu_only = cpu_only
+        # Idle buffers by device and size class.
+        self._idle: dict[tuple[str, int], list[_PoolBuffer]] = {}
+        self._idle_bytes = 0
+        self._stats = DescriptorPoolStats()
+
+    @property
+    def cpu_only(self) -> bool:
+        """
+        Gets `True` when leases of CUDA memory are served from host memory.
+        """
+        return self._cpu_only
+
+    @property
+    def stats(self) -> DescriptorPoolStats:
+        """
+        Gets the lease counters and memory high-watermarks of the pool.
+        """
+        return self._stats
+
+    def clear(self) -> None:
+        """
+        Frees, and deregisters, every idle buffer.
+        """
+        for buffers in self._idle.values():
+            for buffer in buffers:
+                self._free(buffer)
+        self._idle.clear()
+        self._idle_bytes = 0
+
+    def lease(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+    ) -> DescriptorLease:
+        """
+        Leases pre-registered memory for a tensor of `shape` and `dtype` on `device`.
+
+        Parameters
+        ----------
+        shape : int | tuple[int, ...] | torch.Size
+            Shape of the tensor.
+        dtype : torch.dtype
+            Data type of the tensor.
+        device : str | torch.device, optional
+            Device of the tensor, by default "cpu".
+
+        Returns
+        -------
+        DescriptorLease
+            Lease which must be returned, using `release()` or a `with` block, once the transfer has completed.
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+        if not isinstance(dtype, torch.dtype):
+            raise TypeError("Argument `dtype` must be `torch.dtype`.")
+
+        device = self._resolve_device(device)
+        element_size = torch.empty((), dtype=dtype).element_size()
+        nbytes = element_size
+        for dim in shape:
+            if dim < 0:
+                raise ValueError("Argument `shape` must not contain negative dimensions.")
+            nbytes *= dim
+        size_class = max(self._min_buffer_size, 1 << max(nbytes - 1, 0).bit_length())
+
+        idle = self._idle.get((str(device), size_class))
+        if idle:
+            buffer = idle.pop()
+            self._idle_bytes -= buffer.size
+            self._stats.hits += 1
+        else:
+            buffer = self._allocate(device, size_class)
+
+        self._stats.leases += 1
+        self._stats.leased += 1
+        self._stats.leased_bytes += buffer.size
+        self._stats.leased_high_watermark = max(self._stats.leased_high_watermark, self._stats.leased)
+        self._stats.leased_bytes_high_watermark = max(self._stats.leased_bytes_high_watermark, self._stats.leased_bytes)
+
+        # Only buffers freed by `_free()` drop their tensor, and those are never pooled.
+        assert buffer.tensor is not None
+        tensor = buffer.tensor[:nbytes].view(dtype).view(shape)
+        return DescriptorLease(self, buffer, tensor)
+
+    def reserve(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+        count: int = 1,
+    ) -> None:
+        """
+        Allocates and registers `count` idle buffers for leases of `shape` and `dtype` on `device` ahead of time, for
+        example during startup, so that the first requests do not pay for the registration.
+        """
+        if count < 0:
+            raise ValueError("Argument `count` must not be negative.")
+        leases = [self.lease(shape, dtype, device) for _ in range(count)]
+        for lease in leases:
+            lease.release()
+
+    def _allocate(self, device: torch.device, size: int) -> _PoolBuffer:
+        tensor = torch.empty(size, dtype=torch.uint8, device=device)
+        descriptor = Descriptor(tensor)
+        descriptor.register_memory(self._connector)
+
+        self._stats.allocations += 1
+        self._stats.registered_bytes += size
+        self._stats.registered_bytes_high_watermark = max(
+            self._stats.registered_bytes_high_watermark, self._stats.registered_bytes
+        )
+        logger.debug(
+            f"Registered {size} byte buffer on {device} {{ registered: {self._stats.registered_bytes} bytes }}."
+        )
+        return _PoolBuffer(tensor, descriptor, str(device), size)
+
+    def _free(self, buffer: _PoolBuffer) -> None:
+        self._stats.registered_bytes -= buffer.size
+        # Deleting the descriptor deregisters the memory from NIXL.
+        buffer.descriptor = None
+        buffer.tensor = None
+
+    def _resolve_device(self, device: str | torch.device) -> torch.device:
+        device = torch.device(device)
+        if device.type == "cuda":
+            if self._cpu_only:
+                return torch.device("cpu")
+            if device.index is None:
+                return torch.device("cuda", torch.cuda.current_device())
+        elif device.type != "cpu":
+            raise ValueError(f"Argument `device` must be a CPU or CUDA device; got {device}.")
+        return device
+
+    def _return(self, buffer: _PoolBuffer) -> None:
+        self._stats.leased -= 1
+        self._stats.leased_bytes -= buffer.size
+        if self._idle_bytes + buffer.size > self._max_idle_bytes:
+            self._free(buffer)
+            return
+        self._idle.setdefault((buffer.device, buffer.size), []).append(buffer)
+        self._idle_bytes += buffer.size
+
+
+@dataclass
+class DescriptorPoolStats:
+    """
+    Lease counters and memory high-watermarks of a `DescriptorPool`.
+    """
+
+    leases: int = 0
+    # Leases served by an idle buffer, without registering memory.
+    hits: int = 0
+    allocations: int = 0
+    # Leases not yet returned, and the size of their buffers.
+    leased: int = 0
+    leased_bytes: int = 0
+    leased_high_watermark: int = 0
+    leased_bytes_high_watermark: int = 0
+    registered_bytes: int = 0
+    registered_bytes_high_watermark: int = 0
+
+
 class Device:
     """
     Represents a device in the system.
@@ -1470,3 +1760,17 @@ class WriteOperation(ActiveOperation):
         Blocks the caller asynchronously until the operation has completed.
         """
         await super()._wait_for_completion_()
+
+
+class _PoolBuffer:
+    """
+    Private class holding a registered buffer of a `DescriptorPool`.
+    """
+
+    __slots__ = ("descriptor", "device", "size", "tensor")
+
+    def __init__(self, tensor: torch.Tensor, descriptor: Descriptor, device: str, size: int) -> None:
+        self.descriptor: Optional[Descriptor] = descriptor
+        self.device = device
+        self.size = size
+        self.tensor: Optional[torch.Tensor] = tensor
@@ -654,6 +654,12 @@ impl Client {
         self.router.client.instance_ids()
     }
 
+    /// Is the endpoint known at startup rather than discovered via etcd?
+    /// The instances of a static endpoint cannot be watched.
+    fn is_static(&self) -> bool {
+        self.router.client.is_static()
+    }
+
     /// Wait for an instance to be available for work.
     /// Replaces wait_for_endpoints.
     fn wait_for_instances<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
@@ -667,6 +673,22 @@ impl Client {
         })
     }
 
+    /// Wait for the set of instances to differ from `known_ids` and return the new set.
+    /// Driven by the etcd watch, so callers do not need to poll instance_ids.
+    fn wait_for_instance_change<'p>(
+        &self,
+        py: Python<'p>,
+        known_ids: Vec<i64>,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let inner = self.router.client.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            inner
+                .wait_for_instance_ids_change(&known_ids)
+                .await
+                .map_err(to_pyerr)
+        })
+    }
+
     /// Issue a request to the endpoint using the default routing strategy.
     #[pyo3(signature = (request, annotated=DEFAULT_ANNOTATED_SETTING))]
     fn generate<'p>(
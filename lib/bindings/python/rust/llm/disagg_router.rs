@@ -17,7 +17,6 @@ use super::*;
 
 use pyo3::exceptions::PyRuntimeError;
 use std::sync::Arc;
-use tokio::runtime::Runtime;
 
 #[pyclass]
 pub struct DisaggregatedRouter {
@@ -29,29 +28,31 @@ impl DisaggregatedRouter {
     #[new]
     #[pyo3(signature = (drt, model_name, default_max_local_prefill_length))]
     fn new(
+        py: Python<'_>,
         drt: PyObject,
         model_name: String,
         default_max_local_prefill_length: i32,
     ) -> PyResult<Self> {
-        let drt_arc = Python::with_gil(|py| {
-            let drt_ref = drt.extract::<DistributedRuntime>(py)?;
-            Ok::<_, PyErr>(Arc::new(drt_ref.inner))
-        })?;
-
-        // Create the runtime directly with the correct import
-        let runtime = Runtime::new().map_err(|e| {
-            PyRuntimeError::new_err(format!("Failed to create tokio runtime: {}", e))
-        })?;
+        let drt_arc = Arc::new(drt.extract::<DistributedRuntime>(py)?.inner);
 
-        let router = runtime.block_on(async {
-            dynamo_llm::disagg_router::DisaggregatedRouter::new_with_etcd_and_default(
-                drt_arc,
-                model_name,
-                default_max_local_prefill_length,
-            )
-            .await
-            .map_err(|e| {
-                PyRuntimeError::new_err(format!("Failed to create DisaggregatedRouter: {}", e))
+        // The runtime of the DistributedRuntime keeps the etcd config watcher spawned
+        // by the router alive after the constructor returns. The GIL is released
+        // while etcd is queried.
+        let runtime = pyo3_async_runtimes::tokio::get_runtime();
+        let router = py.allow_threads(|| {
+            runtime.block_on(async {
+                dynamo_llm::disagg_router::DisaggregatedRouter::new_with_etcd_and_default(
+                    drt_arc,
+                    model_name,
+                    default_max_local_prefill_length,
+                )
+                .await
+                .map_err(|e| {
+                    PyRuntimeError::new_err(format!(
+                        "Failed to create DisaggregatedRouter: {}",
+                        e
+                    ))
+                })
             })
         })?;
 
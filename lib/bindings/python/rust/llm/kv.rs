@@ -205,6 +205,38 @@ impl ZmqKvEventListener {
             }
         })
     }
+
+    /// Wait until at least one event is available, then drain all available events
+    /// into a single JSON array frame that can be passed to `RadixTree.apply_events`.
+    /// Resolves to None once the listener has shut down.
+    fn next_event_batch<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
+        let receiver = self.event_receiver.clone();
+        let shutdown_token = self.shutdown_token.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let mut rx = receiver.lock().await;
+
+            let first = tokio::select! {
+                _ = shutdown_token.cancelled() => None,
+                event = rx.recv() => event,
+            };
+            let Some(first) = first else {
+                return Ok(Python::with_gil(|py| py.None()));
+            };
+
+            let mut events = vec![first];
+            while let Ok(event) = rx.try_recv() {
+                events.push(event);
+            }
+
+            let frame = serde_json::to_vec(&events).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Failed to serialize events to JSON: {}",
+                    e
+                ))
+            })?;
+            Python::with_gil(|py| Ok(PyBytes::new(py, &frame).into_any().unbind()))
+        })
+    }
 }
 
 // manual shutdown needed as it's not tied to the dynamo DRT
@@ -286,6 +318,116 @@ impl KvEventPublisher {
 
         self.inner.publish(event).map_err(to_pyerr)
     }
+
+    /// Publish a run of stored events in one call. Event `i` has `num_blocks[i]` blocks,
+    /// the per block lists of all events are concatenated, and `token_ids` packs the
+    /// tokens of all blocks as native endian u32.
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (event_ids, token_ids, num_block_tokens, block_hashes, num_blocks, lora_ids, parent_hashes))]
+    fn publish_stored_batch(
+        &mut self,
+        _py: Python,
+        event_ids: Vec<u64>,
+        token_ids: &[u8],
+        num_block_tokens: Vec<u64>,
+        block_hashes: Vec<i64>,
+        num_blocks: Vec<usize>,
+        lora_ids: Vec<u64>,
+        parent_hashes: Vec<Option<i64>>,
+    ) -> PyResult<()> {
+        let num_events = event_ids.len();
+        if num_blocks.len() != num_events
+            || lora_ids.len() != num_events
+            || parent_hashes.len() != num_events
+        {
+            return Err(to_pyerr(anyhow::anyhow!(
+                "event_ids, num_blocks, lora_ids and parent_hashes must have the same length"
+            )));
+        }
+        if num_block_tokens.len() != block_hashes.len()
+            || num_blocks.iter().sum::<usize>() != block_hashes.len()
+        {
+            return Err(to_pyerr(anyhow::anyhow!(
+                "num_blocks must add up to the number of block hashes and block token counts"
+            )));
+        }
+        if token_ids.len() % 4 != 0 {
+            return Err(to_pyerr(anyhow::anyhow!(
+                "token_ids must be packed 32 bit integers"
+            )));
+        }
+        let token_ids: Vec<u32> = token_ids
+            .chunks_exact(4)
+            .map(|b| u32::from_ne_bytes([b[0], b[1], b[2], b[3]]))
+            .collect();
+
+        let mut block_start = 0;
+        let mut token_start = 0;
+        for i in 0..num_events {
+            let block_end = block_start + num_blocks[i];
+            let num_tokens = num_block_tokens[block_start..block_end]
+                .iter()
+                .sum::<u64>() as usize;
+            let token_end = token_start + num_tokens;
+            if token_end > token_ids.len() {
+                return Err(to_pyerr(anyhow::anyhow!(
+                    "token_ids has fewer tokens than num_block_tokens"
+                )));
+            }
+            let event = KvCacheEvent {
+                event_id: event_ids[i],
+                data: KvCacheEventData::Stored(KvCacheStoreData {
+                    parent_hash: parent_hashes[i].map(ExternalSequenceBlockHash::from),
+                    blocks: create_stored_blocks(
+                        self.kv_block_size as u32,
+                        &token_ids[token_start..token_end],
+                        &num_block_tokens[block_start..block_end],
+                        &block_hashes[block_start..block_end],
+                        lora_ids[i],
+                        &self.warning_count,
+                    ),
+                }),
+            };
+            self.inner.publish(event).map_err(to_pyerr)?;
+            block_start = block_end;
+            token_start = token_end;
+        }
+        Ok(())
+    }
+
+    /// Publish a run of removed events in one call. Event `i` removes the next
+    /// `num_blocks[i]` hashes of `block_hashes`.
+    fn publish_removed_batch(
+        &self,
+        _py: Python,
+        event_ids: Vec<u64>,
+        block_hashes: Vec<i64>,
+        num_blocks: Vec<usize>,
+    ) -> PyResult<()> {
+        if num_blocks.len() != event_ids.len()
+            || num_blocks.iter().sum::<usize>() != block_hashes.len()
+        {
+            return Err(to_pyerr(anyhow::anyhow!(
+                "num_blocks must have one entry per event and add up to the number of block hashes"
+            )));
+        }
+        let mut block_start = 0;
+        for (event_id, count) in event_ids.into_iter().zip(num_blocks) {
+            let block_end = block_start + count;
+            let event = KvCacheEvent {
+                event_id,
+                data: KvCacheEventData::Removed(KvCacheRemoveData {
+                    block_hashes: block_hashes[block_start..block_end]
+                        .iter()
+                        .map(|&h| ExternalSequenceBlockHash::from(h))
+                        .collect(),
+                }),
+            };
+            self.inner.publish(event).map_err(to_pyerr)?;
+            block_start = block_end;
+        }
+        Ok(())
+    }
 }
 
 #[pyclass]
@@ -360,6 +502,31 @@ impl RadixTree {
         Ok(())
     }
 
+    /// Apply a batch of events, serialized as a JSON array, in a single call.
+    /// Returns the number of events applied.
+    fn apply_events(
+        &mut self,
+        _py: Python,
+        worker_id: i64,
+        kv_cache_events_bytes: &[u8],
+    ) -> PyResult<usize> {
+        let kv_cache_events: Vec<llm_rs::kv_router::protocols::KvCacheEvent> =
+            serde_json::from_slice(kv_cache_events_bytes).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Failed to deserialize KvCacheEvent batch: {}",
+                    e
+                ))
+            })?;
+
+        let num_events = kv_cache_events.len();
+        for kv_cache_event in kv_cache_events {
+            let router_event =
+                llm_rs::kv_router::indexer::RouterEvent::new(worker_id, kv_cache_event);
+            self.inner.apply_event(router_event);
+        }
+        Ok(num_events)
+    }
+
     fn remove_worker(&mut self, _py: Python, worker_id: i64) -> PyResult<()> {
         self.inner.remove_worker(worker_id);
         Ok(())
@@ -534,6 +701,10 @@ pub(crate) struct EndpointKvMetrics {
     pub gpu_cache_usage_perc: f32,
     #[pyo3(get, set)]
     pub gpu_prefix_cache_hit_rate: f32,
+    #[pyo3(get, set)]
+    pub gpu_prefix_cache_queries: u64,
+    #[pyo3(get, set)]
+    pub gpu_prefix_cache_hits: u64,
 }
 
 #[pyclass]
@@ -592,6 +763,8 @@ impl KvMetricsAggregator {
                     num_requests_waiting: fwd_pass_metrics.worker_stats.num_requests_waiting,
                     gpu_cache_usage_perc: fwd_pass_metrics.kv_stats.gpu_cache_usage_perc,
                     gpu_prefix_cache_hit_rate: fwd_pass_metrics.kv_stats.gpu_prefix_cache_hit_rate,
+                    gpu_prefix_cache_queries: fwd_pass_metrics.kv_stats.gpu_prefix_cache_queries,
+                    gpu_prefix_cache_hits: fwd_pass_metrics.kv_stats.gpu_prefix_cache_hits,
                 }
             })
             .collect();
@@ -779,18 +952,22 @@ impl WorkerStats {
 #[pymethods]
 impl KvStats {
     #[new]
-    #[pyo3(signature = (kv_active_blocks, kv_total_blocks, gpu_cache_usage_perc, gpu_prefix_cache_hit_rate))]
+    #[pyo3(signature = (kv_active_blocks, kv_total_blocks, gpu_cache_usage_perc, gpu_prefix_cache_hit_rate, gpu_prefix_cache_queries=0, gpu_prefix_cache_hits=0))]
     fn new(
         kv_active_blocks: u64,
         kv_total_blocks: u64,
         gpu_cache_usage_perc: f32,
         gpu_prefix_cache_hit_rate: f32,
+        gpu_prefix_cache_queries: u64,
+        gpu_prefix_cache_hits: u64,
     ) -> Self {
         Self(RsKvStats {
             kv_active_blocks,
             kv_total_blocks,
             gpu_cache_usage_perc,
             gpu_prefix_cache_hit_rate,
+            gpu_prefix_cache_queries,
+            gpu_prefix_cache_hits,
         })
     }
 }
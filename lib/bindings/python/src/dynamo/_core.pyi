@@ -246,6 +246,32 @@ class Client:
 
     ...
 
+    def instance_ids(self) -> List[int]:
+        """
+        Ids of the instances currently known for the endpoint
+        """
+        ...
+
+    async def wait_for_instances(self) -> List[int]:
+        """
+        Wait until at least one instance is available and return their ids
+        """
+        ...
+
+    def is_static(self) -> bool:
+        """
+        Whether the endpoint is known at startup rather than discovered via
+        etcd, in which case its instances cannot be watched
+        """
+        ...
+
+    async def wait_for_instance_change(self, known_ids: List[int]) -> List[int]:
+        """
+        Wait until the set of instance ids differs from `known_ids` and return
+        the new, sorted set. Driven by the etcd watch rather than polling.
+        """
+        ...
+
     async def random(self, request: JsonLike) -> AsyncIterator[JsonLike]:
         """
         Pick a random instance of the endpoint and issue the request
@@ -363,9 +389,14 @@ class KvStats:
         kv_total_blocks: int,
         gpu_cache_usage_perc: float,
         gpu_prefix_cache_hit_rate: float,
+        gpu_prefix_cache_queries: int = 0,
+        gpu_prefix_cache_hits: int = 0,
     ) -> None:
         """
         Create a `KvStats` object.
+
+        `gpu_prefix_cache_queries` and `gpu_prefix_cache_hits` are cumulative
+        since the worker started.
         """
         ...
 
@@ -547,6 +578,23 @@ class RadixTree:
         """
         ...
 
+    def apply_events(self, worker_id: int, kv_cache_events_bytes: bytes) -> int:
+        """
+        Apply a batch of KV cache events to update the RadixTree state in a single call.
+
+        Args:
+            worker_id: ID of the worker that generated the events
+            kv_cache_events_bytes: KV cache events serialized as a JSON array, e.g. as
+                                   returned by `ZmqKvEventListener.next_event_batch`
+
+        Returns:
+            Number of events applied
+
+        Raises:
+            ValueError: If the batch cannot be deserialized
+        """
+        ...
+
     def remove_worker(self, worker_id: int) -> None:
         """
         Remove all blocks associated with a specific worker.
@@ -765,6 +813,33 @@ class KvEventPublisher:
         """
         ...
 
+    def publish_stored_batch(
+        self,
+        event_ids: List[int],
+        token_ids: bytes,
+        num_block_tokens: List[int],
+        block_hashes: List[int],
+        num_blocks: List[int],
+        lora_ids: List[int],
+        parent_hashes: List[Optional[int]],
+    ) -> None:
+        """
+        Publish a run of KV stored events. Event `i` has `num_blocks[i]` blocks,
+        the per block lists of all events are concatenated, and `token_ids`
+        packs the tokens of all blocks as native endian 32 bit integers,
+        e.g. `array("I", ...).tobytes()`.
+        """
+        ...
+
+    def publish_removed_batch(
+        self, event_ids: List[int], block_hashes: List[int], num_blocks: List[int]
+    ) -> None:
+        """
+        Publish a run of KV removed events. Event `i` removes the next
+        `num_blocks[i]` hashes of `block_hashes`.
+        """
+        ...
+
 class ZmqKvEventPublisherConfig:
     def __init__(
         self,
@@ -1161,6 +1236,20 @@ class ZmqKvEventListener:
         """
         ...
 
+    async def next_event_batch(self) -> Optional[bytes]:
+        """
+        Wait until at least one KV cache event is available, then drain all
+        available events into a single batch.
+
+        Returns:
+            The events serialized as one JSON array, to be passed to
+            `RadixTree.apply_events`, or None once the listener has shut down
+
+        Raises:
+            ValueError: If events cannot be serialized to JSON
+        """
+        ...
+
 class EntrypointArgs:
     """
     Settings to connect an input to a worker and run them.
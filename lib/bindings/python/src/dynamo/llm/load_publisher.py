@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Rate limited publishing of worker load, shared by the backend workers.
+
+Engines report their load on every scheduler iteration, hundreds of times per
+second under load. `CoalescingMetricsPublisher` publishes a report right away
+if the last one is at least `min_interval` old, and otherwise keeps the latest
+report and publishes it at the end of the interval, so bursts collapse into
+one update that is never older than `min_interval`. Reports that differ from
+the last published one by less than the change thresholds are not published
+at all, except every `heartbeat_interval`.
+
+Suppressed reports skip building the `ForwardPassMetrics` bindings, which is
+most of the per-iteration cost on the worker.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from dynamo._core import (
+    ForwardPassMetrics,
+    KvStats,
+    WorkerMetricsPublisher,
+    WorkerStats,
+)
+
+MIN_INTERVAL_MS_ENV = "DYN_METRICS_MIN_INTERVAL_MS"
+HEARTBEAT_MS_ENV = "DYN_METRICS_HEARTBEAT_MS"
+USAGE_DELTA_ENV = "DYN_METRICS_USAGE_DELTA"
+
+DEFAULT_MIN_INTERVAL = 0.02
+DEFAULT_HEARTBEAT_INTERVAL = 1.0
+DEFAULT_USAGE_DELTA = 0.01
+
+
+@dataclass
+class PrefixCacheCounter:
+    """Cumulative prefix cache lookups and hits of a worker, in the engine's unit."""
+
+    queries: int = 0
+    hits: int = 0
+
+    def add(self, queries: int, hits: int) -> None:
+        self.queries += queries
+        self.hits += hits
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.queries if self.queries else 0.0
+
+
+@dataclass
+class WorkerLoad:
+    """One load report of an engine."""
+
+    request_active_slots: int
+    request_total_slots: int
+    num_requests_waiting: int
+    kv_active_blocks: int
+    kv_total_blocks: int
+    gpu_cache_usage_perc: float
+    prefix_cache: Optional[PrefixCacheCounter] = None
+    # only for engines that report a rate but no counts, otherwise the
+    # cumulative rate of `prefix_cache`
+    gpu_prefix_cache_hit_rate: Optional[float] = None
+    data_parallel_rank: Optional[int] = None
+    spec_decode_stats: Any = None
+
+    def to_metrics(self) -> ForwardPassMetrics:
+        prefix_cache = self.prefix_cache or PrefixCacheCounter()
+        hit_rate = self.gpu_prefix_cache_hit_rate
+        if hit_rate is None:
+            hit_rate = prefix_cache.hit_rate
+        return ForwardPassMetrics(
+            worker_stats=WorkerStats(
+                request_active_slots=self.request_active_slots,
+                request_total_slots=self.request_total_slots,
+                num_requests_waiting=self.num_requests_waiting,
+                data_parallel_rank=self.data_parallel_rank,
+            ),
+            kv_stats=KvStats(
+                kv_active_blocks=self.kv_active_blocks,
+                kv_total_blocks=self.kv_total_blocks,
+                gpu_cache_usage_perc=self.gpu_cache_usage_perc,
+                gpu_prefix_cache_hit_rate=hit_rate,
+                gpu_prefix_cache_queries=prefix_cache.queries,
+                gpu_prefix_cache_hits=prefix_cache.hits,
+            ),
+            spec_decode_stats=self.spec_decode_stats,
+        )
+
+
+@dataclass
+class LoadPublisherStats:
+    received: int = 0
+    published: int = 0
+    # reports within the change thresholds of the last published one
+    suppressed: int = 0
+    # reports replaced by a later one before the end of their interval
+    coalesced: int = 0
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(float(os.environ[name]), 0.0) / 1000
+    except (KeyError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(float(os.environ[name]), 0.0)
+    except (KeyError, ValueError):
+        return default
+
+
+class CoalescingMetricsPublisher:
+    """
+    Wraps a `WorkerMetricsPublisher` with rate limiting, coalescing and change
+    threshold suppression; see the module docstring.
+
+    Defaults come from the DYN_METRICS_MIN_INTERVAL_MS, DYN_METRICS_HEARTBEAT_MS
+    and DYN_METRICS_USAGE_DELTA environment variables. A `min_interval` of 0
+    publishes every report that passes the change thresholds.
+
+    Request counts are published on any change, the router balances on them;
+    KV cache usage only when it moved by more than `usage_delta` (a fraction of
+    the cache) since the last publish.
+    """
+
+    def __init__(
+        self,
+        inner: Optional[WorkerMetricsPublisher] = None,
+        min_interval: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None,
+        usage_delta: Optional[float] = None,
+    ):
+        self.inner = inner if inner is not None else WorkerMetricsPublisher()
+        self.min_interval = (
+            min_interval
+            if min_interval is not None
+            else _env_seconds(MIN_INTERVAL_MS_ENV, DEFAULT_MIN_INTERVAL)
+        )
+        self.heartbeat_interval = (
+            heartbeat_interval
+            if heartbeat_interval is not None
+            else _env_seconds(HEARTBEAT_MS_ENV, DEFAULT_HEARTBEAT_INTERVAL)
+        )
+        self.usage_delta = (
+            usage_delta
+            if usage_delta is not None
+            else _env_float(USAGE_DELTA_ENV, DEFAULT_USAGE_DELTA)
+        )
+        self.stats = LoadPublisherStats()
+
+        self.latest: Optional[WorkerLoad] = None
+        self.last_sent: Optional[WorkerLoad] = None
+        self.last_sent_time = 0.0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def create_endpoint(self, component):
+        return self.inner.create_endpoint(component)
+
+    def update(self, load: WorkerLoad, force: bool = False) -> bool:
+        """
+        Report the current load. Returns whether it was published right away;
+        a report that was not may still be published at the end of the interval.
+        """
+        self.stats.received += 1
+        if self.latest is not None and self.flush_handle is not None:
+            # a trailing publish is already scheduled and will pick up this load
+            self.stats.coalesced += 1
+        self.latest = load
+        if force:
+            self._publish()
+            return True
+        if self.flush_handle is not None:
+            return False
+
+        elapsed = time.monotonic() - self.last_sent_time
+        if elapsed < self.heartbeat_interval and not self._changed(load):
+            self.stats.suppressed += 1
+            return False
+        if elapsed >= self.min_interval:
+            self._publish()
+            return True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish()
+            return True
+        self.flush_handle = loop.call_later(self.min_interval - elapsed, self._flush)
+        return False
+
+    def flush(self) -> None:
+        """Publish a report held for the end of the interval now."""
+        if self.flush_handle is not None:
+            self._publish()
+
+    def close(self) -> None:
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+    def _changed(self, load: WorkerLoad) -> bool:
+        last = self.last_sent
+        if last is None:
+            return True
+        if (
+            load.request_active_slots != last.request_active_slots
+            or load.num_requests_waiting != last.num_requests_waiting
+            or load.request_total_slots != last.request_total_slots
+            or load.kv_total_blocks != last.kv_total_blocks
+            or load.data_parallel_rank != last.data_parallel_rank
+        ):
+            return True
+        block_delta = self.usage_delta * load.kv_total_blocks
+        return (
+            abs(load.kv_active_blocks - last.kv_active_blocks) > block_delta
+            or abs(load.gpu_cache_usage_perc - last.gpu_cache_usage_perc)
+            > self.usage_delta
+        )
+
+    def _flush(self):
+        self.flush_handle = None
+        if self.latest is not None and self._changed(self.latest):
+            self._publish()
+        else:
+            self.stats.suppressed += 1
+
+    def _publish(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        load = self.latest
+        assert load is not None
+        self.inner.publish(load.to_metrics())
+        self.last_sent = load
+        self.last_sent_time = time.monotonic()
+        self.stats.published += 1
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Token streaming helpers shared by the backend handlers.
+
+`TokenDeltas` turns the cumulative token lists some engines report into the
+token deltas of the response stream, and passes engine deltas through as they
+are. `coalesce_token_chunks` merges consecutive token chunks of a stream
+within a latency budget, so that a fast decode emits one chunk per few tokens
+instead of one per token: every chunk costs a conversion to Rust, a channel
+send and a network message, which dominate the per-token CPU at high
+concurrency.
+
+Chunks are not reused across yields: the Rust side converts a chunk after the
+generator may already have produced the next one.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Sequence
+
+# default latency budget of `coalesce_token_chunks`, 0 disables coalescing
+COALESCE_MS_ENV = "DYN_TOKEN_STREAM_COALESCE_MS"
+DEFAULT_MAX_COALESCED_TOKENS = 64
+# chunks the coalescer reads ahead of a slow consumer before it stops reading
+MAX_READY_CHUNKS = 16
+
+_END = object()
+
+
+class TokenDeltas:
+    """
+    Tracks the tokens already streamed for each output index of a request.
+
+    With `cumulative=False` the engine already reports deltas (e.g. vLLM's
+    `RequestOutputKind.DELTA`), which are returned without copying or counting.
+    Otherwise only the new tail of the cumulative list is copied.
+    """
+
+    __slots__ = ("cumulative", "_num_seen", "_num_seen_by_index")
+
+    def __init__(self, cumulative: bool = True):
+        self.cumulative = cumulative
+        self._num_seen = 0
+        self._num_seen_by_index: Optional[Dict[int, int]] = None
+
+    def delta(self, token_ids: Sequence[int], index: int = 0) -> Sequence[int]:
+        """New tokens of output `index`, given what the engine reported for it."""
+        if not self.cumulative:
+            return token_ids
+        num_seen = self._swap(index, len(token_ids))
+        if num_seen == 0:
+            # the engine may extend its list in place, so even the first chunk is a copy
+            return list(token_ids)
+        return token_ids[num_seen:]
+
+    def mark_seen(self, token_ids: Sequence[int], index: int = 0) -> None:
+        """Record `token_ids` as streamed by the caller itself."""
+        if self.cumulative:
+            self._swap(index, len(token_ids))
+
+    def num_seen(self, index: int = 0) -> int:
+        if self._num_seen_by_index is None:
+            return self._num_seen if index == 0 else 0
+        return self._num_seen_by_index.get(index, 0)
+
+    def _swap(self, index: int, num_tokens: int) -> int:
+        # single output requests, the common case, skip the dict
+        if index == 0 and self._num_seen_by_index is None:
+            num_seen, self._num_seen = self._num_seen, num_tokens
+            return num_seen
+        if self._num_seen_by_index is None:
+            self._num_seen_by_index = {0: self._num_seen}
+        num_seen = self._num_seen_by_index.get(index, 0)
+        self._num_seen_by_index[index] = num_tokens
+        return num_seen
+
+
+def default_latency_budget() -> float:
+    """Latency budget in seconds from the DYN_TOKEN_STREAM_COALESCE_MS environment variable."""
+    try:
+        return max(float(os.environ.get(COALESCE_MS_ENV, "0")), 0.0) / 1000
+    except ValueError:
+        return 0.0
+
+
+def coalesce_token_chunks(
+    chunks: AsyncIterator[dict],
+    latency_budget: Optional[float] = None,
+    max_tokens: int = DEFAULT_MAX_COALESCED_TOKENS,
+) -> AsyncIterator[dict]:
+    """
+    Merge consecutive chunks of `chunks` that only carry `token_ids` (and the
+    same `index`), holding tokens back for at most `latency_budget` seconds
+    after the first held token, or until `max_tokens` are held.
+
+    The first chunk is never held back, so the time to first token is
+    unchanged, and a chunk carrying anything else (a finish reason, engine
+    specific fields) is emitted right away, with the held tokens prepended.
+    Returns `chunks` itself if the budget is 0.
+    """
+    if latency_budget is None:
+        latency_budget = default_latency_budget()
+    if latency_budget <= 0:
+        return chunks
+    return _coalesce(chunks, latency_budget, max_tokens)
+
+
+def _is_token_only(chunk) -> bool:
+    if not isinstance(chunk, dict) or "token_ids" not in chunk:
+        return False
+    return len(chunk) == 1 or (len(chunk) == 2 and "index" in chunk)
+
+
+class _Coalescer:
+    """
+    Reads a chunk stream ahead of its consumer and merges token chunks as they
+    arrive, so the consumer only wakes up once per emitted chunk.
+
+    Reading pauses while `max_ready` chunks wait for the consumer, so a slow
+    consumer still slows down the engine stream. A timer flush may add one
+    more chunk of the tokens held meanwhile.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[dict],
+        latency_budget: float,
+        max_tokens: int,
+        max_ready: int = MAX_READY_CHUNKS,
+    ):
+        self.chunks = chunks
+        self.latency_budget = latency_budget
+        self.max_tokens = max_tokens
+        self.max_ready = max_ready
+        self.loop = asyncio.get_running_loop()
+
+        # chunks ready for the consumer, then _END or the exception of the stream
+        self.ready: Deque = deque()
+        self.ready_event = asyncio.Event()
+        # set by the consumer when `ready` has room again
+        self.space_event = asyncio.Event()
+        self.held: List[dict] = []
+        self.num_held = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    async def pump(self):
+        first = True
+        try:
+            async for chunk in self.chunks:
+                if first or not _is_token_only(chunk):
+                    first = False
+                    self._flush(chunk)
+                else:
+                    self._hold(chunk)
+                while len(self.ready) >= self.max_ready:
+                    self.space_event.clear()
+                    await self.space_event.wait()
+        except BaseException as e:
+            self._flush()
+            self._emit(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            self._flush()
+            self._emit(_END)
+
+    def _hold(self, chunk: dict):
+        if self.held and self.held[0].get("index") != chunk.get("index"):
+            self._flush()
+        if not self.held:
+            self.timer = self.loop.call_later(self.latency_budget, self._flush)
+        self.held.append(chunk)
+        self.num_held += len(chunk["token_ids"])
+        if self.num_held >= self.max_tokens:
+            self._flush()
+
+    def _flush(self, last: Optional[dict] = None):
+        """Emit the held tokens, merged into `last` if it continues the same output."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        held, self.held, self.num_held = self.held, [], 0
+        if (
+            held
+            and last is not None
+            and "token_ids" in last
+            and held[0].get("index") == last.get("index")
+        ):
+            self._emit(_merge(held, last))
+            return
+        if held:
+            self._emit(_merge(held))
+        if last is not None:
+            self._emit(last)
+
+    def _emit(self, item):
+        self.ready.append(item)
+        self.ready_event.set()
+
+
+def _merge(held: List[dict], last: Optional[dict] = None) -> dict:
+    """One chunk with the tokens of `held` followed by `last`, which keeps its other fields."""
+    if len(held) == 1 and last is None:
+        return held[0]
+    token_ids: List[int] = []
+    for chunk in held:
+        token_ids.extend(chunk["token_ids"])
+    if last is None:
+        merged = dict(held[-1])
+    else:
+        token_ids.extend(last["token_ids"])
+        merged = dict(last)
+    merged["token_ids"] = token_ids
+    return merged
+
+
+async def _coalesce(
+    chunks: AsyncIterator[dict], latency_budget: float, max_tokens: int
+) -> AsyncIterator[dict]:
+    coalescer = _Coalescer(chunks, latency_budget, max_tokens)
+    pump_task = asyncio.create_task(coalescer.pump())
+    ready = coalescer.ready
+    try:
+        while True:
+            if not ready:
+                coalescer.ready_event.clear()
+                await coalescer.ready_event.wait()
+                continue
+            item = ready.popleft()
+            if len(ready) < coalescer.max_ready:
+                coalescer.space_event.set()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        if not pump_task.done():
+            pump_task.cancel()
+            await asyncio.gather(pump_task, return_exceptions=True)
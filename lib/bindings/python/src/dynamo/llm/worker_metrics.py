@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Prometheus metrics of the Python side of a backend worker.
+
+Collectors of the worker (prefill queue, disaggregation decisions, KV event
+batching, ...) are registered on the default `prometheus_client` registry,
+next to the engine's own metrics, and served together on one port per worker
+process, DYN_WORKER_METRICS_PORT. Without it, they are registered but not
+served.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from prometheus_client import REGISTRY, start_http_server
+
+logger = logging.getLogger(__name__)
+
+PORT_ENV = "DYN_WORKER_METRICS_PORT"
+
+_lock = threading.Lock()
+_server_port: Optional[int] = None
+
+
+def metrics_port() -> int:
+    """Port from the DYN_WORKER_METRICS_PORT environment variable, 0 if unset."""
+    try:
+        return max(int(os.environ[PORT_ENV]), 0)
+    except (KeyError, ValueError):
+        return 0
+
+
+def register_collector(collector, port: Optional[int] = None) -> Optional[int]:
+    """
+    Register `collector` on the worker registry, and serve the registry if it
+    is not served yet. Returns the port the registry is served on, if any.
+
+    Args:
+        collector: A `prometheus_client` collector.
+        port: Overrides DYN_WORKER_METRICS_PORT, 0 to not serve.
+    """
+    global _server_port
+    REGISTRY.register(collector)
+    with _lock:
+        if _server_port is None:
+            port = metrics_port() if port is None else port
+            if port:
+                start_http_server(port, registry=REGISTRY)
+                _server_port = port
+                logger.info(f"Serving worker metrics on port {port}")
+    return _server_port
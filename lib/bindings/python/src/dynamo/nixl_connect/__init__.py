@@ -16,16 +16,40 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
 import logging
 import socket
+import struct
+import time
 import uuid
+import weakref
 import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from enum import IntEnum
-from functools import cached_property
-from typing import Any, List, Optional
-
-from pydantic import BaseModel, ConfigDict, field_validator
+from functools import cached_property, lru_cache
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    List,
+    Optional,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PlainSerializer,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 try:
     import torch
@@ -59,6 +83,20 @@ except ImportError:
     except ImportError as e:
         raise ImportError("Numpy or CuPy must be installed to use this module.") from e
 
+# Compact binary encoding of `RdmaMetadata`, see `RdmaMetadata.to_bytes`. All integers are little-endian.
+#   header:     magic, version, operation kind, descriptor count, agent name length, notification key length,
+#               NIXL metadata length
+#   descriptor: device kind, reserved, device id (0xFFFF when unspecified), pointer, size; repeated
+#   payload:    UTF-8 agent name, UTF-8 notification key, zlib compressed NIXL metadata
+RDMA_METADATA_MAGIC = b"DNRM"
+RDMA_METADATA_VERSION = 1
+_RDMA_METADATA_HEADER = struct.Struct("<4sBBHHHI")
+_RDMA_METADATA_DESCRIPTOR = "BxHQQ"
+_NO_DEVICE_ID = 0xFFFF
+
+# Separates the notification keys of the passive operations completed by a batched transfer, see `RdmaMetadata.merge`.
+NOTIFICATION_KEY_SEPARATOR = "\n"
+
 
 class AbstractOperation(ABC):
     """
@@ -298,7 +336,10 @@ class ActiveOperation(AbstractOperation):
             raise ValueError("Argument `notification_key` must not be an empty string.")
 
         self._remote = remote
+        # Set by derived classes which leased `remote` from the connector's remote cache.
+        self._remote_leased = False
         self._status = OperationStatus.UNINITIALIZED
+        self._started_at: float = 0.0
 
         super().__init__(
             remote.connector,
@@ -373,6 +414,9 @@ class ActiveOperation(AbstractOperation):
         """
         error: Optional[Exception] = None
 
+        # Stop the notification pump from polling the transfer handle before it is released.
+        self._connector._notification_pump.unregister_transfer(self)
+
         if self._xfer_hndl is not None:
             try:
                 logger.debug(
@@ -387,6 +431,10 @@ class ActiveOperation(AbstractOperation):
             finally:
                 self._xfer_hndl = None
 
+        if getattr(self, "_remote_leased", False):
+            self._remote_leased = False
+            self._connector._remote_cache.release(self._remote)
+
         try:
             super()._release()
         except Exception as e:
@@ -411,28 +459,41 @@ class ActiveOperation(AbstractOperation):
         )
 
         # NIXL will cancel the transfer if it is in progress when the handle is released.
+        self._connector._notification_pump.unregister_transfer(self)
         self._connector._nixl.release_xfer_handle(self._xfer_hndl)
         self._status = OperationStatus.CANCELLED
         self._xfer_hndl = None
 
     async def _wait_for_completion_(self) -> None:
-        # Loop until the operation is no longer in progress (or "initialized"),
-        # yielding control to the event loop to allow other operations to run.
-        iteration_count = 0
-        while True:
-            if iteration_count & 10 == 0:
+        # Querying the status begins the transfer when it has not been started yet.
+        match self.status:
+            case OperationStatus.INITIALIZED | OperationStatus.IN_PROGRESS:
                 logger.debug(
-                    f"dynamo.nixl_connect.{self.__class__.__name__}: Waiting for operation {{ kind={self._operation_kind}, remote='{self._remote.name}', duration={iteration_count / 10}s }}."
+                    f"dynamo.nixl_connect.{self.__class__.__name__}: Waiting for operation {{ kind={self._operation_kind}, remote='{self._remote.name}' }}."
                 )
-            match self.status:
-                # "in progress" or "initialized" means the operation is ongoing.
-                case OperationStatus.INITIALIZED:
-                    await asyncio.sleep(0.1)
-                case OperationStatus.IN_PROGRESS:
-                    await asyncio.sleep(0.1)
-                # Any other state indicates completion or error.
-                case _:
-                    return
+                # The connector's notification pump polls the transfer state and wakes the caller on completion.
+                await self._connector._notification_pump.wait_transfer(self)
+
+    def _update_transfer_state_(self) -> OperationStatus:
+        """
+        Private method which queries NIXL for the state of a started transfer, used by `NotificationPump`.
+        """
+        match self._status:
+            case OperationStatus.INITIALIZED | OperationStatus.IN_PROGRESS:
+                pass
+            case _:
+                return self._status
+        if self._xfer_hndl is None:
+            return self._status
+
+        state = self._connector._nixl.check_xfer_state(self._xfer_hndl)
+        if state == "ERR":
+            self._status = OperationStatus.ERRORED
+        elif state == "DONE":
+            self._status = OperationStatus.COMPLETE
+        else:
+            self._status = OperationStatus.IN_PROGRESS
+        return self._status
 
     @abstractmethod
     def cancel(self) -> None:
@@ -472,23 +533,19 @@ class ActiveOperation(AbstractOperation):
             logger.debug(
                 f"dynamo.nixl_connect.{self.__class__.__name__}: NIXL reported transfer state: {state}"
             )
+            self._started_at = time.perf_counter()
             if state == "ERR":
                 self._status = OperationStatus.ERRORED
             elif state == "DONE":
                 self._status = OperationStatus.COMPLETE
             else:
                 self._status = OperationStatus.INITIALIZED
+                self._connector._notification_pump.register_transfer(self)
         else:
-            state = self._connector._nixl.check_xfer_state(self._xfer_hndl)
+            self._update_transfer_state_()
             logger.debug(
-                f"dynamo.nixl_connect.{self.__class__.__name__}: NIXL reported transfer state: {state}"
+                f"dynamo.nixl_connect.{self.__class__.__name__}: NIXL reported transfer state: {self._status}"
             )
-            if state == "ERR":
-                self._status = OperationStatus.ERRORED
-            elif state == "DONE":
-                self._status = OperationStatus.COMPLETE
-            else:
-                self._status = OperationStatus.IN_PROGRESS
 
         if self._status != old_status:
             logger.debug(
@@ -532,6 +589,10 @@ class Connector:
         self._nixl = nixl_api.nixl_agent(self._worker_id)
         self._hostname = socket.gethostname()
         self._agent_metadata: Optional[bytes] = None
+        self._agent_metadata_encoded: Optional[bytes] = None
+        self._notification_pump = NotificationPump(self)
+        self._remote_cache = RemoteCache(self)
+        self._descriptor_pool = DescriptorPool(self)
 
         logger.debug(
             f"dynamo.nixl_connect.{self.__class__.__name__}: Created {self.__repr__()}."
@@ -549,6 +610,13 @@ class Connector:
     def __str__(self) -> str:
         return self._worker_id
 
+    @property
+    def descriptor_pool(self) -> DescriptorPool:
+        """
+        Get the pool of pre-registered memory used to lease descriptors, see `lease_descriptor`.
+        """
+        return self._descriptor_pool
+
     @cached_property
     def is_cuda_available(self) -> bool:
         # Note: `cuda.is_available` initializes CUDA
@@ -565,7 +633,10 @@ class Connector:
         """
         Get the metadata of the worker.
         """
-        return self._nixl.get_agent_metadata()
+        # The metadata only changes when memory is registered or deregistered, see `_invalidate_metadata`.
+        if self._agent_metadata is None:
+            self._agent_metadata = self._nixl.get_agent_metadata()
+        return self._agent_metadata
 
     @property
     def name(self) -> str | None:
@@ -574,9 +645,23 @@ class Connector:
         """
         return self._worker_id
 
+    @property
+    def notification_pump(self) -> NotificationPump:
+        """
+        Get the notification pump which completes the operations of this connector.
+        """
+        return self._notification_pump
+
+    @property
+    def remote_cache(self) -> RemoteCache:
+        """
+        Get the cache of remote agents used by the active operations of this connector.
+        """
+        return self._remote_cache
+
     async def begin_read(
         self,
-        remote_metadata: RdmaMetadata,
+        remote_metadata: RdmaMetadata | list[RdmaMetadata],
         local_descriptors: Descriptor | list[Descriptor],
     ) -> ReadOperation:
         """
@@ -584,10 +669,12 @@ class Connector:
 
         Parameters
         ----------
-        remote_metadata : RdmaMetadata
-            RDMA metadata from a remote worker that has created a readable operation.
+        remote_metadata : RdmaMetadata | list[RdmaMetadata]
+            RDMA metadata from a remote worker that has created a readable operation. When a list is provided, the
+            readable operations of one remote worker are read with a single NIXL transfer, see `RdmaMetadata.merge`.
         local_descriptors : Descriptor | list[Descriptor]
-            Local descriptor(s) to receive data from the remote worker described by `remote_metadata`.
+            Local descriptor(s) to receive data from the remote worker described by `remote_metadata`, in the order of
+            the remote descriptors.
 
         Returns
         -------
@@ -601,6 +688,8 @@ class Connector:
         TypeError
             When `local_descriptors` is not of type `dynamo.nixl_connect.Descriptor` or `list[dynamo.nixl_connect.Descriptor]`.
         """
+        if isinstance(remote_metadata, list):
+            remote_metadata = RdmaMetadata.merge(remote_metadata)
         if remote_metadata is None or not isinstance(remote_metadata, RdmaMetadata):
             raise TypeError("Argument `remote_metadata` must be `RdmaMetadata`.")
         if not (
@@ -629,7 +718,7 @@ class Connector:
     async def begin_write(
         self,
         local_descriptors: Descriptor | list[Descriptor],
-        remote_metadata: RdmaMetadata,
+        remote_metadata: RdmaMetadata | list[RdmaMetadata],
     ) -> WriteOperation:
         """
         Creates a write operation for transferring data to a remote worker.
@@ -637,10 +726,14 @@ class Connector:
         Parameters
         ----------
         local_descriptors : Descriptor | list[Descriptor]
-            Local descriptors of one or more data objects to be transferred to the remote worker.
-        remote_metadata : RdmaMetadata
-            Serialized request from a remote worker that has created a readable operation.
-        """
+            Local descriptors of one or more data objects to be transferred to the remote worker, in the order of the
+            remote descriptors.
+        remote_metadata : RdmaMetadata | list[RdmaMetadata]
+            Serialized request from a remote worker that has created a writable operation. When a list is provided, the
+            writable operations of one remote worker are written with a single NIXL transfer, see `RdmaMetadata.merge`.
+        """
+        if isinstance(remote_metadata, list):
+            remote_metadata = RdmaMetadata.merge(remote_metadata)
         if remote_metadata is None or not isinstance(remote_metadata, RdmaMetadata):
             raise TypeError("Argument `remote_metadata` must be `RdmaMetadata`.")
         if not (
@@ -657,8 +750,8 @@ class Connector:
             raise RuntimeError(
                 "Cannot create a `WriteOperation` to write to a remote `ReadableOperation`."
             )
-        if not isinstance(remote_metadata.nixl_metadata, str):
-            raise TypeError("Argument `remote_metadata.nixl_metadata` must be `str`.")
+        if not isinstance(remote_metadata.nixl_metadata, bytes):
+            raise TypeError("Argument `remote_metadata.nixl_metadata` must be `bytes`.")
 
         if not self._is_initialized:
             raise RuntimeError(
@@ -708,6 +801,32 @@ class Connector:
         op = WritableOperation(self, local_descriptors)
         return op
 
+    def lease_descriptor(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+    ) -> DescriptorLease:
+        """
+        Leases a descriptor of pre-registered memory from the connector's descriptor pool.
+
+        Parameters
+        ----------
+        shape : int | tuple[int, ...] | torch.Size
+            Shape of the tensor to transfer.
+        dtype : torch.dtype
+            Data type of the tensor to transfer.
+        device : str | torch.device, optional
+            Device of the tensor to transfer, by default "cpu".
+
+        Returns
+        -------
+        DescriptorLease
+            Lease of the memory; write into `lease.tensor`, transfer `lease.descriptor`, and return the lease once the
+            operation has completed.
+        """
+        return self._descriptor_pool.lease(shape, dtype, device)
+
     async def initialize(self) -> None:
         # Only initialize the connector once.
         if self._is_initialized:
@@ -719,6 +838,33 @@ class Connector:
             f"dynamo.nixl_connect.{self.__class__.__name__}: Initialized {{ name: '{self._worker_id}' }} completed."
         )
 
+    # Private Methods
+
+    def _encoded_metadata(self) -> bytes:
+        """
+        Private method which gets the compressed metadata of the worker shared via `RdmaMetadata`.
+        """
+        if self._agent_metadata_encoded is None:
+            metadata = self.metadata
+            compressed = zlib.compress(metadata, level=6)
+            logger.debug(
+                f"dynamo.nixl_connect.{self.__class__.__name__}: Compressed NIXL metadata from {len(metadata)} bytes to {len(compressed)} bytes."
+            )
+            if len(compressed) > len(metadata):
+                logger.warning(
+                    f"dynamo.nixl_connect.{self.__class__.__name__}: Compressed NIXL metadata is larger than original ({len(compressed)} > {len(metadata)})."
+                )
+            self._agent_metadata_encoded = compressed
+
+        return self._agent_metadata_encoded
+
+    def _invalidate_metadata(self) -> None:
+        """
+        Private method which discards the cached metadata of the worker after memory has been registered or deregistered.
+        """
+        self._agent_metadata = None
+        self._agent_metadata_encoded = None
+
 
 class Descriptor:
     """
@@ -867,6 +1013,7 @@ class Descriptor:
         if self._nixl_hndl is not None and self._connector is not None:
             # Unregister the memory with NIXL.
             self._connector._nixl.deregister_memory(self._nixl_hndl)
+            self._connector._invalidate_metadata()
             self._nixl_hndl = None
 
         if self._data_ref is not None:
@@ -966,12 +1113,287 @@ class Descriptor:
                 (self._data_ptr, self._data_size, self._data_device.id, mem_type)
             ]
             self._nixl_hndl = connector._nixl.register_memory(reg_list, mem_type)
+        connector._invalidate_metadata()
 
         logger.debug(
             f"dynamo.nixl_connect.{self.__class__.__name__}: Registered {self.__repr__()} with NIXL."
         )
 
 
+class DescriptorLease:
+    """
+    Descriptor of pooled, pre-registered memory leased from a `DescriptorPool`.
+
+    Write the data to transfer into `tensor`, transfer it using `descriptor`, and return the lease once the operation
+    using it has completed; the memory may be handed to another lease as soon as it has been returned.
+    """
+
+    def __init__(
+        self,
+        pool: DescriptorPool,
+        buffer: _PoolBuffer,
+        tensor: torch.Tensor,
+    ) -> None:
+        self._pool = pool
+        self._buffer: Optional[_PoolBuffer] = buffer
+        self._tensor = tensor
+        self._descriptor = Descriptor(tensor)
+        # The memory is registered with NIXL by the pool for the lifetime of the buffer.
+        self._descriptor._connector = pool._connector
+
+    def __del__(self) -> None:
+        self.release()
+
+    def __enter__(self) -> DescriptorLease:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={tuple(self._tensor.shape)}, dtype={self._tensor.dtype}, descriptor={self._descriptor})"
+
+    @property
+    def descriptor(self) -> Descriptor:
+        """
+        Gets the descriptor of the leased memory, for use with readable, writable, read, and write operations.
+        """
+        return self._descriptor
+
+    @property
+    def tensor(self) -> torch.Tensor:
+        """
+        Gets the leased memory as a tensor of the requested shape and dtype.
+        """
+        return self._tensor
+
+    def release(self) -> None:
+        """
+        Returns the leased memory to the pool.
+        """
+        buffer = getattr(self, "_buffer", None)
+        if buffer is None:
+            return
+        self._buffer = None
+        self._pool._return(buffer)
+
+
+class DescriptorPool:
+    """
+    Connector-owned pool of host and CUDA memory buffers, registered with NIXL once and reused by leases.
+
+    Registering memory with NIXL, and deregistering it, is expensive and changes the metadata remote workers must load.
+    The pool rounds each lease up to a power of two size class of at least `min_buffer_size` bytes, hands out an idle
+    buffer of that class when there is one and otherwise allocates and registers a new one. Returned buffers stay
+    registered unless the idle buffers would exceed `max_idle_bytes`.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        min_buffer_size: int = 4096,
+        max_idle_bytes: int = 1 << 30,
+        cpu_only: bool = False,
+    ) -> None:
+        """
+        Creates a new descriptor pool.
+
+        Parameters
+        ----------
+        connector : Connector
+            Connector the pooled memory is registered with.
+        min_buffer_size : int, optional
+            Size, in bytes, of the smallest size class, by default 4KiB.
+        max_idle_bytes : int, optional
+            Maximum number of bytes kept registered by idle buffers, by default 1GiB.
+        cpu_only : bool, optional
+            When `True`, leases of CUDA memory are served from host memory, which allows code using the pool to be
+            tested without a GPU; by default `False`.
+        """
+        if not isinstance(connector, Connector):
+            raise TypeError(
+                "Argument `connector` must be `dynamo.nixl_connect.Connector`."
+            )
+        if min_buffer_size <= 0:
+            raise ValueError("Argument `min_buffer_size` must be positive.")
+        if max_idle_bytes < 0:
+            raise ValueError("Argument `max_idle_bytes` must not be negative.")
+
+        self._connector = connector
+        self._min_buffer_size = min_buffer_size
+        self._max_idle_bytes = max_idle_bytes
+        self._cpu_only = cpu_only
+        # Idle buffers by device and size class.
+        self._idle: dict[tuple[str, int], list[_PoolBuffer]] = {}
+        self._idle_bytes = 0
+        self._stats = DescriptorPoolStats()
+
+    @property
+    def cpu_only(self) -> bool:
+        """
+        Gets `True` when leases of CUDA memory are served from host memory.
+        """
+        return self._cpu_only
+
+    @property
+    def stats(self) -> DescriptorPoolStats:
+        """
+        Gets the lease counters and memory high-watermarks of the pool.
+        """
+        return self._stats
+
+    def clear(self) -> None:
+        """
+        Frees, and deregisters, every idle buffer.
+        """
+        for buffers in self._idle.values():
+            for buffer in buffers:
+                self._free(buffer)
+        self._idle.clear()
+        self._idle_bytes = 0
+
+    def lease(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+    ) -> DescriptorLease:
+        """
+        Leases pre-registered memory for a tensor of `shape` and `dtype` on `device`.
+
+        Parameters
+        ----------
+        shape : int | tuple[int, ...] | torch.Size
+            Shape of the tensor.
+        dtype : torch.dtype
+            Data type of the tensor.
+        device : str | torch.device, optional
+            Device of the tensor, by default "cpu".
+
+        Returns
+        -------
+        DescriptorLease
+            Lease which must be returned, using `release()` or a `with` block, once the transfer has completed.
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+        if not isinstance(dtype, torch.dtype):
+            raise TypeError("Argument `dtype` must be `torch.dtype`.")
+
+        device = self._resolve_device(device)
+        element_size = torch.empty((), dtype=dtype).element_size()
+        nbytes = element_size
+        for dim in shape:
+            if dim < 0:
+                raise ValueError(
+                    "Argument `shape` must not contain negative dimensions."
+                )
+            nbytes *= dim
+        size_class = max(self._min_buffer_size, 1 << max(nbytes - 1, 0).bit_length())
+
+        idle = self._idle.get((str(device), size_class))
+        if idle:
+            buffer = idle.pop()
+            self._idle_bytes -= buffer.size
+            self._stats.hits += 1
+        else:
+            buffer = self._allocate(device, size_class)
+
+        self._stats.leases += 1
+        self._stats.leased += 1
+        self._stats.leased_bytes += buffer.size
+        self._stats.leased_high_watermark = max(
+            self._stats.leased_high_watermark, self._stats.leased
+        )
+        self._stats.leased_bytes_high_watermark = max(
+            self._stats.leased_bytes_high_watermark, self._stats.leased_bytes
+        )
+
+        # Only buffers freed by `_free()` drop their tensor, and those are never pooled.
+        assert buffer.tensor is not None
+        tensor = buffer.tensor[:nbytes].view(dtype).view(shape)
+        return DescriptorLease(self, buffer, tensor)
+
+    def reserve(
+        self,
+        shape: int | tuple[int, ...] | torch.Size,
+        dtype: torch.dtype,
+        device: str | torch.device = "cpu",
+        count: int = 1,
+    ) -> None:
+        """
+        Allocates and registers `count` idle buffers for leases of `shape` and `dtype` on `device` ahead of time, for
+        example during startup, so that the first requests do not pay for the registration.
+        """
+        if count < 0:
+            raise ValueError("Argument `count` must not be negative.")
+        leases = [self.lease(shape, dtype, device) for _ in range(count)]
+        for lease in leases:
+            lease.release()
+
+    def _allocate(self, device: torch.device, size: int) -> _PoolBuffer:
+        tensor = torch.empty(size, dtype=torch.uint8, device=device)
+        descriptor = Descriptor(tensor)
+        descriptor.register_memory(self._connector)
+
+        self._stats.allocations += 1
+        self._stats.registered_bytes += size
+        self._stats.registered_bytes_high_watermark = max(
+            self._stats.registered_bytes_high_watermark, self._stats.registered_bytes
+        )
+        logger.debug(
+            f"dynamo.nixl_connect.{self.__class__.__name__}: Registered {size} byte buffer on {device} {{ registered: {self._stats.registered_bytes} bytes }}."
+        )
+        return _PoolBuffer(tensor, descriptor, str(device), size)
+
+    def _free(self, buffer: _PoolBuffer) -> None:
+        self._stats.registered_bytes -= buffer.size
+        # Deleting the descriptor deregisters the memory from NIXL.
+        buffer.descriptor = None
+        buffer.tensor = None
+
+    def _resolve_device(self, device: str | torch.device) -> torch.device:
+        device = torch.device(device)
+        if device.type == "cuda":
+            if self._cpu_only:
+                return torch.device("cpu")
+            if device.index is None:
+                return torch.device("cuda", torch.cuda.current_device())
+        elif device.type != "cpu":
+            raise ValueError(
+                f"Argument `device` must be a CPU or CUDA device; got {device}."
+            )
+        return device
+
+    def _return(self, buffer: _PoolBuffer) -> None:
+        self._stats.leased -= 1
+        self._stats.leased_bytes -= buffer.size
+        if self._idle_bytes + buffer.size > self._max_idle_bytes:
+            self._free(buffer)
+            return
+        self._idle.setdefault((buffer.device, buffer.size), []).append(buffer)
+        self._idle_bytes += buffer.size
+
+
+@dataclass
+class DescriptorPoolStats:
+    """
+    Lease counters and memory high-watermarks of a `DescriptorPool`.
+    """
+
+    leases: int = 0
+    # Leases served by an idle buffer, without registering memory.
+    hits: int = 0
+    allocations: int = 0
+    # Leases not yet returned, and the size of their buffers.
+    leased: int = 0
+    leased_bytes: int = 0
+    leased_high_watermark: int = 0
+    leased_bytes_high_watermark: int = 0
+    registered_bytes: int = 0
+    registered_bytes_high_watermark: int = 0
+
+
 class Device:
     """
     Represents a device in the system.
@@ -1063,6 +1485,307 @@ class DeviceKind(IntEnum):
             return "<invalid>"
 
 
+class NotificationPump:
+    """
+    Completes the operations of a `Connector`.
+
+    A single background task drains NIXL notifications and queries the state of started transfers, then resolves the
+    future of each waiting operation, keyed by its notification key. After any progress the pump polls on every turn of
+    the event loop, and backs off exponentially from `min_interval` to `max_interval` while nothing completes, so that a
+    waiter wakes within microseconds of completion when the connector is busy without spinning when it is idle.
+
+    The background task only runs while an operation is awaited; querying the status of an operation polls the pump
+    directly.
+    """
+
+    _MAX_UNCLAIMED = 1024
+
+    def __init__(
+        self,
+        connector: Connector,
+        min_interval: float = 0.00005,
+        max_interval: float = 0.001,
+        spin_polls: int = 64,
+    ) -> None:
+        """
+        Creates a new notification pump.
+
+        Parameters
+        ----------
+        connector : Connector
+            Connector the pump polls NIXL for.
+        min_interval : float, optional
+            Interval, in seconds, between polls once the pump stops spinning, by default 50µs.
+        max_interval : float, optional
+            Largest interval, in seconds, between polls while no operation completes, by default 1ms.
+        spin_polls : int, optional
+            Number of polls made on consecutive turns of the event loop after progress, by default 64.
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(
+                "Arguments `min_interval` and `max_interval` must satisfy `0 < min_interval <= max_interval`."
+            )
+        if spin_polls < 0:
+            raise ValueError("Argument `spin_polls` must not be negative.")
+
+        self._connector = connector
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._spin_polls = spin_polls
+        self._notifications: dict[str, _PumpWaiter] = {}
+        self._transfers: dict[
+            int, tuple[weakref.ref[ActiveOperation], _PumpWaiter]
+        ] = {}
+        # Notifications which arrived before, or after, their operation was registered with the pump.
+        self._unclaimed: OrderedDict[str, None] = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = NotificationPumpStats()
+
+    @property
+    def stats(self) -> NotificationPumpStats:
+        """
+        Gets the polling and completion latency statistics of the pump.
+        """
+        return self._stats
+
+    def is_notified(self, notification_key: str) -> bool:
+        """
+        Gets if the notification of a registered passive operation has been received.
+        """
+        waiter = self._notifications.get(notification_key)
+        return waiter is not None and waiter.done
+
+    def poll(self) -> bool:
+        """
+        Drains pending NIXL notifications and queries the state of started transfers once, resolving the waiters of
+        completed operations.
+
+        Returns
+        -------
+        bool
+            `True` when any notification was received or any transfer completed; otherwise `False`.
+        """
+        self._stats.polls += 1
+        progress = False
+
+        notifications = self._connector._nixl.get_new_notifs()
+        if not isinstance(notifications, dict):
+            raise TypeError(
+                f"Expected `dict[str, list[bytes]]` from NIXL notification query; got {type(notifications)}."
+            )
+        for values in notifications.values():
+            if not isinstance(values, list):
+                raise TypeError(
+                    f"Expected `dict[str, list[bytes]]` from NIXL notification query; got {type(notifications)}."
+                )
+            for value in values:
+                if not isinstance(value, bytes):
+                    continue
+                progress = True
+                self._stats.notifications += 1
+                # A batched transfer notifies every passive operation it completes with a single notification.
+                for notification_key in value.decode("utf-8").split(
+                    NOTIFICATION_KEY_SEPARATOR
+                ):
+                    waiter = self._notifications.get(notification_key)
+                    if waiter is None or waiter.done:
+                        self._unclaim(notification_key)
+                    else:
+                        self._complete(waiter, True)
+
+        for key, (op_ref, waiter) in list(self._transfers.items()):
+            op = op_ref()
+            if op is None:
+                del self._transfers[key]
+                continue
+            match op._update_transfer_state_():
+                case OperationStatus.INITIALIZED | OperationStatus.IN_PROGRESS:
+                    continue
+                case OperationStatus.ERRORED:
+                    self._stats.errors += 1
+            del self._transfers[key]
+            progress = True
+            self._complete(waiter, True)
+
+        return progress
+
+    def register_notification(self, notification_key: str) -> None:
+        """
+        Registers the notification key of a passive operation, the pump keeps its notification once received.
+        """
+        waiter = _PumpWaiter()
+        if notification_key in self._unclaimed:
+            del self._unclaimed[notification_key]
+            self._complete(waiter, True)
+        self._notifications[notification_key] = waiter
+
+    def register_transfer(self, operation: ActiveOperation) -> None:
+        """
+        Registers a started transfer, the pump queries its state until it completes or errors.
+        """
+        started_at = operation._started_at or time.perf_counter()
+        self._transfers[id(operation)] = (
+            weakref.ref(operation),
+            _PumpWaiter(started_at),
+        )
+
+    def unregister_notification(self, notification_key: str) -> None:
+        """
+        Unregisters a passive operation, waking any task waiting for it.
+        """
+        waiter = self._notifications.pop(notification_key, None)
+        if waiter is not None:
+            self._resolve(waiter, False)
+
+    def unregister_transfer(self, operation: ActiveOperation) -> None:
+        """
+        Unregisters an active operation, waking any task waiting for it.
+        """
+        entry = self._transfers.pop(id(operation), None)
+        if entry is not None:
+            self._resolve(entry[1], False)
+
+    async def wait_notification(self, notification_key: str) -> bool:
+        """
+        Waits for the notification of a registered passive operation.
+
+        Returns
+        -------
+        bool
+            `True` when the notification was received; `False` when the operation was unregistered first.
+        """
+        waiter = self._notifications.get(notification_key)
+        if waiter is None:
+            return False
+        return await self._wait(waiter)
+
+    async def wait_transfer(self, operation: ActiveOperation) -> bool:
+        """
+        Waits for a registered transfer to complete or error.
+
+        Returns
+        -------
+        bool
+            `True` when the transfer completed or errored; `False` when the operation was unregistered first.
+        """
+        entry = self._transfers.get(id(operation))
+        if entry is None:
+            return operation._status not in (
+                OperationStatus.INITIALIZED,
+                OperationStatus.IN_PROGRESS,
+            )
+        return await self._wait(entry[1])
+
+    def _complete(self, waiter: _PumpWaiter, result: bool) -> None:
+        self._stats.record(time.perf_counter() - waiter.started_at)
+        self._resolve(waiter, result)
+
+    def _has_waiters(self) -> bool:
+        return any(
+            w.future is not None and not w.future.done()
+            for w in self._notifications.values()
+        ) or any(
+            w.future is not None and not w.future.done()
+            for _, w in self._transfers.values()
+        )
+
+    def _resolve(self, waiter: _PumpWaiter, result: bool) -> None:
+        waiter.done = True
+        if waiter.future is not None and not waiter.future.done():
+            waiter.future.set_result(result)
+
+    async def _run(self) -> None:
+        interval = self._min_interval
+        idle_polls = 0
+        try:
+            while self._has_waiters():
+                if self.poll():
+                    interval = self._min_interval
+                    idle_polls = 0
+                else:
+                    idle_polls += 1
+
+                if idle_polls < self._spin_polls:
+                    # Yield to the event loop without arming a timer, which has a resolution of about a millisecond.
+                    await asyncio.sleep(0)
+                else:
+                    await asyncio.sleep(interval)
+                    interval = min(interval * 2, self._max_interval)
+        except Exception as e:
+            logger.error(
+                f"dynamo.nixl_connect.{self.__class__.__name__}: Failed to poll NIXL: {e}."
+            )
+            waiters = [w for w in self._notifications.values()]
+            waiters.extend(w for _, w in self._transfers.values())
+            for waiter in waiters:
+                if waiter.future is not None and not waiter.future.done():
+                    waiter.future.set_exception(e)
+        finally:
+            self._task = None
+
+    def _unclaim(self, notification_key: str) -> None:
+        self._stats.unclaimed += 1
+        self._unclaimed[notification_key] = None
+        while len(self._unclaimed) > NotificationPump._MAX_UNCLAIMED:
+            self._unclaimed.popitem(last=False)
+
+    async def _wait(self, waiter: _PumpWaiter) -> bool:
+        if waiter.done:
+            return True
+        if waiter.future is None or waiter.future.done():
+            waiter.future = asyncio.get_running_loop().create_future()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return await asyncio.shield(waiter.future)
+
+
+@dataclass
+class NotificationPumpStats:
+    """
+    Polling and completion latency statistics of a `NotificationPump`.
+
+    The latency of an operation is measured from the start of its transfer, or the registration of its notification key,
+    until the pump observes its completion.
+    """
+
+    polls: int = 0
+    notifications: int = 0
+    # Notifications which no registered operation was waiting for.
+    unclaimed: int = 0
+    completions: int = 0
+    errors: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    recent_latencies: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    @property
+    def latency_mean(self) -> float:
+        """
+        Gets the mean completion latency, in seconds.
+        """
+        return self.latency_sum / self.completions if self.completions else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Gets a percentile, from 0 to 100, of the completion latency of recent operations, in seconds.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("Argument `percentile` must be between 0 and 100.")
+        if len(self.recent_latencies) == 0:
+            return 0.0
+        latencies = sorted(self.recent_latencies)
+        return latencies[round(percentile / 100 * (len(latencies) - 1))]
+
+    def record(self, latency: float) -> None:
+        """
+        Records the completion of an operation.
+        """
+        self.completions += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.recent_latencies.append(latency)
+
+
 class OperationKind(IntEnum):
     """
     Kind of an operation.
@@ -1150,6 +1873,8 @@ class PassiveOperation(AbstractOperation):
 
         self._serialized_request: Optional[RdmaMetadata] = None
         self._status = OperationStatus.INITIALIZED
+        # Register the notification key before sharing the metadata, so that the remote's notification cannot be missed.
+        self._connector._notification_pump.register_notification(self._notification_key)
 
     def __del__(self) -> None:
         super().__del__()
@@ -1171,19 +1896,23 @@ class PassiveOperation(AbstractOperation):
             f")"
         )
 
+    def _release(self) -> None:
+        """
+        Private method to release resources.
+        """
+        connector = getattr(self, "_connector", None)
+        if connector is not None and getattr(self, "_notification_key", None):
+            connector._notification_pump.unregister_notification(self._notification_key)
+        super()._release()
+
     async def _wait_for_completion_(self) -> None:
-        # Loop until the operation is no longer in progress (or "initialized"),
-        # yielding control to the event loop to allow other operations to run.
-        while True:
-            match self.status:
-                # "in progress" or "initialized" means the operation is ongoing.
-                case OperationStatus.INITIALIZED:
-                    await asyncio.sleep(0.1)
-                case OperationStatus.IN_PROGRESS:
-                    await asyncio.sleep(0.1)
-                # Any other state indicates completion or error.
-                case _:
-                    return
+        match self.status:
+            case OperationStatus.INITIALIZED | OperationStatus.IN_PROGRESS:
+                # The connector's notification pump wakes the caller once the remote's notification arrives.
+                if await self._connector._notification_pump.wait_notification(
+                    self._notification_key
+                ):
+                    self._status = OperationStatus.COMPLETE
 
     def metadata(self) -> RdmaMetadata:
         """
@@ -1197,21 +1926,11 @@ class PassiveOperation(AbstractOperation):
             else:
                 descriptors = [self._local_desc_list.metadata()]
 
-            original_len = len(self._connector.metadata)
-            nixl_metadata = self._connector.metadata
-            nixl_metadata = zlib.compress(nixl_metadata, level=6)
-            compressed_len = len(nixl_metadata)
-            logger.debug(
-                f"dynamo.nixl_connect.{self.__class__.__name__}: Compressed NIXL metadata from {original_len} bytes to {compressed_len} bytes."
-            )
-            if compressed_len > original_len:
-                logger.warning(
-                    f"dynamo.nixl_connect.{self.__class__.__name__}: Compressed NIXL metadata is larger than original ({compressed_len} > {original_len})."
-                )
-
             self._serialized_request = RdmaMetadata(
+                # An empty agent name marks it as unknown to the receiving side.
+                agent_name=self._connector.name or "",
                 descriptors=descriptors,
-                nixl_metadata=nixl_metadata.hex(),
+                nixl_metadata=self._connector._encoded_metadata(),
                 notification_key=self._notification_key,
                 operation_kind=int(self._operation_kind),
             )
@@ -1230,36 +1949,17 @@ class PassiveOperation(AbstractOperation):
 
         old_status = self._status
 
-        # Query NIXL for any notifications.
-        notifications = self._connector._nixl.update_notifs()
+        # Drain pending NIXL notifications; notifications of other operations are kept by the pump for them.
+        pump = self._connector._notification_pump
+        if not pump.is_notified(self._notification_key):
+            pump.poll()
 
-        if isinstance(notifications, dict):
-            remote_state = OperationStatus.IN_PROGRESS
+        if pump.is_notified(self._notification_key):
+            self._status = OperationStatus.COMPLETE
             logger.debug(
-                f"dynamo.nixl_connect.{self.__class__.__name__}: NIXL reported notifications: {len(notifications)}."
+                f"dynamo.nixl_connect.{self.__class__.__name__}: {{ remote: '{self._connector.name}' status: '{old_status}' => '{self._status}' }}."
             )
 
-            for key, values in notifications.items():
-                if not isinstance(values, list):
-                    raise TypeError(
-                        f"Expected `dict[str, list[bytes]]` from NIXL notification query; got {type(notifications)}."
-                    )
-                for value in values:
-                    if not isinstance(value, bytes):
-                        continue
-                    notification_key = value.decode("utf-8")
-
-                    # Once we've found the notification key, we know the operation is complete.
-                    if notification_key == self._notification_key:
-                        remote_state = OperationStatus.COMPLETE
-                        break
-
-            if remote_state == OperationStatus.COMPLETE:
-                self._status = remote_state
-                logger.debug(
-                    f"dynamo.nixl_connect.{self.__class__.__name__}: {{ remote: '{self._connector.name}' status: '{old_status}' => '{self._status}' }}."
-                )
-
         return self._status
 
     @abstractmethod
@@ -1307,7 +2007,6 @@ class ReadOperation(ActiveOperation):
         if remote_metadata.operation_kind != OperationKind.READ.value:
             raise ValueError("Argument `remote_metadata` must be of kind `READ`.")
 
-        remote = Remote(connector, remote_metadata.nixl_metadata)
         remote_descriptors = remote_metadata.to_descriptors()
 
         if not (
@@ -1321,13 +2020,21 @@ class ReadOperation(ActiveOperation):
                 "Argument `local_descriptors` must be `dynamo.nixl_connect.Descriptor`, `list[dynamo.nixl_connect.Descriptor]`."
             )
 
-        super().__init__(
-            remote,
-            OperationKind.READ,
-            local_descriptors,
-            remote_descriptors,
-            remote_metadata.notification_key,
+        remote = connector._remote_cache.acquire(
+            remote_metadata.nixl_metadata, remote_metadata.agent_name
         )
+        try:
+            super().__init__(
+                remote,
+                OperationKind.READ,
+                local_descriptors,
+                remote_descriptors,
+                remote_metadata.notification_key,
+            )
+        except Exception:
+            connector._remote_cache.release(remote)
+            raise
+        self._remote_leased = True
         logger.debug(
             f"dynamo.nixl_connect.{self.__class__.__name__}: Created {self.__repr__()}"
         )
@@ -1424,11 +2131,84 @@ class RdmaMetadata(BaseModel):
         frozen=True,
         arbitrary_types_allowed=True,
     )
+    # Name of the NIXL agent of the passive side, empty when sent by an older worker.
+    agent_name: str = ""
     descriptors: List[SerializedDescriptor] = []
-    nixl_metadata: str = ""
+    # Compressed NIXL metadata of the passive side, hex-encoded in the JSON form.
+    nixl_metadata: bytes = b""
     notification_key: str = ""
     operation_kind: int = 0
 
+    @staticmethod
+    def from_base64(data: str) -> RdmaMetadata:
+        """
+        Decodes metadata encoded by `to_base64()`.
+        """
+        if not isinstance(data, str):
+            raise TypeError("Argument `data` must be `str`.")
+        return RdmaMetadata.from_bytes(base64.b64decode(data, validate=True))
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> RdmaMetadata:
+        """
+        Decodes metadata encoded by `to_bytes()`.
+
+        Raises
+        ------
+        ValueError
+            When `data` is not valid encoded metadata, or is encoded with an unsupported version.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                "Argument `data` must be `bytes`, `bytearray`, or `memoryview`."
+            )
+        return _decode_rdma_metadata(data)
+
+    def to_base64(self) -> str:
+        """
+        Encodes the metadata with `to_bytes()` as a base64 string, for embedding in JSON; see `CompactRdmaMetadata`.
+        """
+        return base64.b64encode(self.to_bytes()).decode("ascii")
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the metadata in a compact binary form: a versioned header, fixed size descriptors, and the compressed
+        NIXL metadata as raw bytes rather than hex. Decode with `from_bytes()`, or `RdmaMetadata.model_validate()`.
+        """
+        agent_name = self.agent_name.encode("utf-8")
+        notification_key = self.notification_key.encode("utf-8")
+        nixl_metadata = self.nixl_metadata
+        if len(self.descriptors) > 0xFFFF:
+            raise ValueError("Cannot encode more than 65535 descriptors.")
+        if len(agent_name) > 0xFFFF or len(notification_key) > 0xFFFF:
+            raise ValueError(
+                "Cannot encode an agent name or notification key longer than 65535 bytes."
+            )
+
+        values: list[int] = []
+        for descriptor in self.descriptors:
+            values.extend(_encode_device(descriptor.device))
+            values.append(descriptor.ptr)
+            values.append(descriptor.size)
+
+        return b"".join(
+            (
+                _RDMA_METADATA_HEADER.pack(
+                    RDMA_METADATA_MAGIC,
+                    RDMA_METADATA_VERSION,
+                    self.operation_kind,
+                    len(self.descriptors),
+                    len(agent_name),
+                    len(notification_key),
+                    len(nixl_metadata),
+                ),
+                _descriptors_struct(len(self.descriptors)).pack(*values),
+                agent_name,
+                notification_key,
+                nixl_metadata,
+            )
+        )
+
     def to_descriptors(self) -> Descriptor | list[Descriptor]:
         """
         Deserializes the request descriptor into a `dynamo.nixl_connect.Descriptor` or list of `dynamo.nixl_connect.Descriptor` objects.
@@ -1441,6 +2221,86 @@ class RdmaMetadata(BaseModel):
             return self.descriptors[0].to_descriptor()
         return [item.to_descriptor() for item in self.descriptors]
 
+    @staticmethod
+    def merge(items: list[RdmaMetadata]) -> RdmaMetadata:
+        """
+        Merges the metadata of several passive operations of one remote worker, so that a single active operation
+        transfers the data of all of them with one NIXL transfer and completes them with one notification.
+
+        Parameters
+        ----------
+        items : list[RdmaMetadata]
+            Metadata of operations of the same kind, created by the same remote worker without registering or
+            deregistering memory in between (i.e. with identical `nixl_metadata`), such as operations using
+            descriptors leased from its descriptor pool.
+
+        Returns
+        -------
+        RdmaMetadata
+            Metadata with the descriptors of every item, in order, and their notification keys.
+        """
+        if not (
+            isinstance(items, list)
+            and len(items) > 0
+            and all(isinstance(item, RdmaMetadata) for item in items)
+        ):
+            raise TypeError(
+                "Argument `items` must be a non-empty `list[RdmaMetadata]`."
+            )
+        if len(items) == 1:
+            return items[0]
+
+        first = items[0]
+        for item in items[1:]:
+            if item.operation_kind != first.operation_kind:
+                raise ValueError(
+                    "Argument `items` must only contain metadata of the same operation kind."
+                )
+            if (
+                item.agent_name != first.agent_name
+                or item.nixl_metadata != first.nixl_metadata
+            ):
+                raise ValueError(
+                    "Argument `items` must only contain metadata of the same remote worker with identical NIXL metadata."
+                )
+        for item in items:
+            if NOTIFICATION_KEY_SEPARATOR in item.notification_key:
+                raise ValueError(
+                    "Notification keys of merged metadata must not contain `NOTIFICATION_KEY_SEPARATOR`."
+                )
+
+        return RdmaMetadata(
+            agent_name=first.agent_name,
+            descriptors=[d for item in items for d in item.descriptors],
+            nixl_metadata=first.nixl_metadata,
+            notification_key=NOTIFICATION_KEY_SEPARATOR.join(
+                item.notification_key for item in items
+            ),
+            operation_kind=first.operation_kind,
+        )
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def validate_compact(cls, data: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        # Accept the compact forms produced by `to_bytes()` and `to_base64()`, alongside the field mapping.
+        # The decoder checks every value itself, so the decoded instance skips Pydantic validation.
+        if isinstance(data, str):
+            data = base64.b64decode(data, validate=True)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return _decode_rdma_metadata(data)
+        return handler(data)
+
+    @field_validator("nixl_metadata", mode="before")
+    @classmethod
+    def validate_nixl_metadata(cls, v: Any) -> Any:
+        if isinstance(v, str):
+            return bytes.fromhex(v)
+        return v
+
+    @field_serializer("nixl_metadata")
+    def serialize_nixl_metadata(self, v: bytes) -> str:
+        return v.hex()
+
     @field_validator("operation_kind")
     @classmethod
     def validate_operation_kind(cls, v: int) -> int:
@@ -1451,6 +2311,16 @@ class RdmaMetadata(BaseModel):
         return v
 
 
+CompactRdmaMetadata = Annotated[
+    RdmaMetadata,
+    PlainSerializer(lambda metadata: metadata.to_base64(), return_type=str),
+]
+"""
+`RdmaMetadata` which Pydantic serializes in its compact base64 form, see `RdmaMetadata.to_base64()`; use it as the type
+of request fields carrying metadata. Fields of this type accept both the compact form and the field mapping.
+"""
+
+
 class Remote:
     """
     Identifies a remote NIXL enabled worker relative to a local NIXL enabled worker.
@@ -1470,18 +2340,18 @@ class Remote:
 
         self._connector = connector
 
-        # When `nixl_metadata` is a string, it is assumed to have come from a remote worker
-        # via a `RdmaMetadata` object and therefore can assumed be a hex-encoded, compressed
-        # representation of the NIXL metadata.
+        # `nixl_metadata` comes from a remote worker via a `RdmaMetadata` object and therefore is the compressed
+        # representation of the NIXL metadata, hex-encoded when it is a string.
         if isinstance(nixl_metadata, str):
             # Decode the hex-encoded string into bytes.
             nixl_metadata = bytes.fromhex(nixl_metadata)
-            # Decompress the NIXL metadata.
-            nixl_metadata = zlib.decompress(nixl_metadata)
+        # Decompress the NIXL metadata.
+        nixl_metadata = zlib.decompress(nixl_metadata)
 
         self._name = connector._nixl.add_remote_agent(nixl_metadata)
         if isinstance(self._name, bytes):
             self._name = self._name.decode("utf-8")
+        self._is_loaded = True
 
         logger.debug(
             f"dynamo.nixl_connect.{self.__class__.__name__}: Created {self.__repr__()}."
@@ -1508,10 +2378,21 @@ class Remote:
     def __str__(self) -> str:
         return self._name
 
+    def _detach(self) -> None:
+        """
+        Private method which stops the remote from unloading its agent, used when newer metadata of the same agent
+        has been loaded. Not intended for public use.
+        """
+        self._is_loaded = False
+
     def _release(self) -> None:
         """
         Private method for releasing NIXL resources. Not intended for public use.
         """
+        if not getattr(self, "_is_loaded", False):
+            return
+        self._is_loaded = False
+
         # We have to unregister the remote agent from NIXL because we cannot know if the remote worker has updated its descriptors or not, and
         # NIXL will return an error if we attempt to register a remote agent with the same name but different descriptors (aka conn_info).
         self._connector._nixl.remove_remote_agent(self._name)
@@ -1534,6 +2415,191 @@ class Remote:
         return self._name
 
 
+class RemoteCache:
+    """
+    Connector-level cache of the remote NIXL agents used by active operations.
+
+    Loading the metadata of a remote agent requires decoding and decompressing it, then a NIXL handshake. Remotes are
+    keyed by agent name and a digest of their metadata, and leased to operations with a reference count: a remote is
+    only loaded again when its metadata changes, which happens when the remote worker registers or deregisters memory.
+    Remotes that no operation has leased for `idle_timeout` seconds, or beyond the `max_idle` most recently used, are
+    evicted and unloaded from NIXL.
+    """
+
+    def __init__(
+        self,
+        connector: Connector,
+        idle_timeout: float = 60.0,
+        max_idle: int = 64,
+    ) -> None:
+        """
+        Creates a new remote cache.
+
+        Parameters
+        ----------
+        connector : Connector
+            Connector the remote agents are loaded into.
+        idle_timeout : float, optional
+            Seconds after which a remote without leases is evicted, by default 60.
+        max_idle : int, optional
+            Maximum number of remotes without leases kept loaded, by default 64.
+        """
+        if idle_timeout < 0:
+            raise ValueError("Argument `idle_timeout` must not be negative.")
+        if max_idle < 0:
+            raise ValueError("Argument `max_idle` must not be negative.")
+
+        self._connector = connector
+        self._idle_timeout = idle_timeout
+        self._max_idle = max_idle
+        # Loaded remotes, by the agent name their metadata was sent with and the digest of the metadata.
+        self._entries: dict[tuple[str, bytes], _RemoteCacheEntry] = {}
+        # Key of the loaded remote of each agent, by the agent name reported by NIXL.
+        self._by_name: dict[str, tuple[str, bytes]] = {}
+        # Keys of remotes without leases, least recently used first.
+        self._idle: OrderedDict[tuple[str, bytes], float] = OrderedDict()
+        self._stats = RemoteCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> RemoteCacheStats:
+        """
+        Gets the hit, miss and eviction counters of the cache.
+        """
+        return self._stats
+
+    def acquire(self, nixl_metadata: bytes | str, agent_name: str = "") -> Remote:
+        """
+        Leases the remote described by `nixl_metadata`, loading it into NIXL when it is not cached.
+
+        Parameters
+        ----------
+        nixl_metadata : bytes | str
+            Compressed NIXL metadata of the remote agent, hex-encoded when `str`; see `RdmaMetadata`.
+        agent_name : str, optional
+            Name of the remote agent when known ahead of loading the metadata, which allows stale metadata of the same
+            agent to be unloaded first.
+
+        Returns
+        -------
+        Remote
+            Remote which must be returned with `release()` once the operation using it has been released.
+        """
+        if not isinstance(nixl_metadata, (bytes, str)):
+            raise TypeError("Argument `nixl_metadata` must be `bytes` or `str`.")
+        if len(nixl_metadata) == 0:
+            raise ValueError("Argument `nixl_metadata` cannot be empty.")
+
+        if isinstance(nixl_metadata, str):
+            nixl_metadata = bytes.fromhex(nixl_metadata)
+        digest = hashlib.blake2b(nixl_metadata, digest_size=16).digest()
+        key = (agent_name, digest)
+
+        now = time.monotonic()
+        self._evict(now)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+            # Unload the stale metadata of the agent before loading its new metadata, when nothing uses it anymore.
+            if agent_name:
+                self._retire(agent_name, unload=True)
+
+            remote = Remote(self._connector, nixl_metadata)
+            # The agent now has the new metadata in NIXL, a stale remote must not unload it.
+            self._retire(remote.name, unload=False)
+
+            entry = _RemoteCacheEntry(remote)
+            self._entries[key] = entry
+            self._by_name[remote.name] = key
+
+        entry.leases += 1
+        self._idle.pop(key, None)
+        return entry.remote
+
+    def clear(self) -> None:
+        """
+        Evicts every remote without leases.
+        """
+        for key in list(self._idle):
+            self._unload(key)
+
+    def release(self, remote: Remote) -> None:
+        """
+        Returns a remote leased with `acquire()`.
+        """
+        key = self._by_name.get(remote.name)
+        entry = None if key is None else self._entries.get(key)
+        if key is None or entry is None or entry.remote is not remote:
+            # The remote was replaced by newer metadata of its agent while leased.
+            remote._detach()
+            return
+        if entry.leases <= 0:
+            raise RuntimeError(
+                f"Remote '{remote.name}' released more times than it was acquired."
+            )
+
+        entry.leases -= 1
+        if entry.leases == 0:
+            self._idle[key] = time.monotonic()
+            self._evict(self._idle[key])
+
+    def _evict(self, now: float) -> None:
+        while self._idle:
+            key, idle_since = next(iter(self._idle.items()))
+            if (
+                len(self._idle) <= self._max_idle
+                and now - idle_since < self._idle_timeout
+            ):
+                break
+            self._unload(key)
+
+    def _retire(self, agent_name: str, unload: bool) -> None:
+        key = self._by_name.get(agent_name)
+        if key is None:
+            return
+        entry = self._entries[key]
+        if unload and entry.leases > 0:
+            # Still in use by an operation, the new metadata replaces it in NIXL instead.
+            return
+
+        self._stats.reloads += 1
+        if unload:
+            self._unload(key)
+            return
+
+        del self._entries[key]
+        del self._by_name[agent_name]
+        self._idle.pop(key, None)
+        # The agent now refers to the new metadata, so the stale remote must not unload it.
+        entry.remote._detach()
+
+    def _unload(self, key: tuple[str, bytes]) -> None:
+        entry = self._entries.pop(key)
+        self._idle.pop(key, None)
+        if self._by_name.get(entry.remote.name) == key:
+            del self._by_name[entry.remote.name]
+        self._stats.evictions += 1
+        entry.remote._release()
+
+
+@dataclass
+class RemoteCacheStats:
+    """
+    Counters of a `RemoteCache`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    # Remotes replaced by newer metadata of the same agent.
+    reloads: int = 0
+    evictions: int = 0
+
+
 class SerializedDescriptor(BaseModel):
     """
     Pydantic serialization type for memory descriptors.
@@ -1584,6 +2650,218 @@ class SerializedDescriptor(BaseModel):
         return v
 
 
+class TransferPipeline:
+    """
+    Keeps up to `max_in_flight` active operations in flight, and yields the result of each as it completes.
+
+    Moving many tensors one operation at a time leaves the network idle while each completion is awaited; the pipeline
+    overlaps the transfers while bounding the memory and NIXL resources in use.
+
+    Example
+    -------
+    ```python
+    pipeline = TransferPipeline(max_in_flight=8)
+    reads = (connector.begin_read(metadata, descriptor) for metadata, descriptor in requests)
+    async for result in pipeline.run(reads):
+        logger.info(f"{result.size} bytes in {result.latency * 1e3:.3f}ms, {result.throughput_gbps:.2f} GB/s")
+    ```
+    """
+
+    def __init__(self, max_in_flight: int = 4) -> None:
+        """
+        Creates a new transfer pipeline.
+
+        Parameters
+        ----------
+        max_in_flight : int, optional
+            Maximum number of operations in flight at once, by default 4.
+        """
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise ValueError("Argument `max_in_flight` must be a positive `int`.")
+
+        self._max_in_flight = max_in_flight
+        self._stats = TransferPipelineStats()
+
+    @property
+    def max_in_flight(self) -> int:
+        """
+        Gets the maximum number of operations in flight at once.
+        """
+        return self._max_in_flight
+
+    @property
+    def stats(self) -> TransferPipelineStats:
+        """
+        Gets the throughput and latency statistics of every run of the pipeline.
+        """
+        return self._stats
+
+    async def run(
+        self,
+        operations: (
+            Iterable[Awaitable[ActiveOperation]]
+            | AsyncIterable[Awaitable[ActiveOperation]]
+        ),
+    ) -> AsyncIterator[TransferResult]:
+        """
+        Starts the operations, keeping up to `max_in_flight` of them in flight, and yields their results in order of
+        completion.
+
+        Parameters
+        ----------
+        operations : Iterable[Awaitable[ActiveOperation]] | AsyncIterable[Awaitable[ActiveOperation]]
+            Awaitables creating the operations, such as the coroutines returned by `Connector.begin_read` and
+            `Connector.begin_write`; consumed lazily, as operations complete.
+
+        Returns
+        -------
+        AsyncIterator[TransferResult]
+            Results of the operations, including those which errored; the first exception raised creating or awaiting
+            an operation cancels the operations in flight and is raised to the caller.
+        """
+        if isinstance(operations, AsyncIterable):
+            async_iterator = operations.__aiter__()
+            iterator = None
+        elif isinstance(operations, Iterable):
+            async_iterator = None
+            iterator = iter(operations)
+        else:
+            raise TypeError(
+                "Argument `operations` must be `Iterable[Awaitable[ActiveOperation]]` or `AsyncIterable[Awaitable[ActiveOperation]]`."
+            )
+
+        in_flight: set[asyncio.Task[TransferResult]] = set()
+        done: set[asyncio.Task[TransferResult]] = set()
+        exhausted = False
+        started_at = time.perf_counter()
+        transfers, size = self._stats.transfers, self._stats.size
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._max_in_flight:
+                    try:
+                        if async_iterator is not None:
+                            awaitable = await async_iterator.__anext__()
+                        else:
+                            assert iterator is not None
+                            awaitable = next(iterator)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    in_flight.add(asyncio.create_task(self._transfer(awaitable)))
+
+                if len(in_flight) == 0:
+                    break
+
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                while done:
+                    result = done.pop().result()
+                    self._stats.record(result)
+                    logger.debug(
+                        f"dynamo.nixl_connect.{self.__class__.__name__}: {result.operation.operation_kind} of {result.size} bytes {result.status} in {result.latency * 1e3:.3f}ms ({result.throughput_gbps:.2f} GB/s)."
+                    )
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Retrieve the exceptions of operations completed alongside the one which raised.
+            for task in done:
+                if not task.cancelled():
+                    task.exception()
+
+            elapsed = time.perf_counter() - started_at
+            self._stats.elapsed += elapsed
+            transfers = self._stats.transfers - transfers
+            size = self._stats.size - size
+            if transfers > 0:
+                logger.info(
+                    f"dynamo.nixl_connect.{self.__class__.__name__}: Completed {transfers} transfers of {size} bytes in {elapsed * 1e3:.3f}ms "
+                    f"({size / elapsed / 1e9 if elapsed > 0 else 0.0:.2f} GB/s, max in flight: {self._max_in_flight})."
+                )
+
+    async def _transfer(self, awaitable: Awaitable[ActiveOperation]) -> TransferResult:
+        operation = await awaitable
+        if not isinstance(operation, ActiveOperation):
+            raise TypeError(
+                f"Expected `dynamo.nixl_connect.ActiveOperation` from pipeline awaitable; got {type(operation)}."
+            )
+
+        started_at = time.perf_counter()
+        await operation.wait_for_completion()
+        latency = time.perf_counter() - started_at
+
+        descriptors = operation._local_desc_list
+        if isinstance(descriptors, list):
+            size = sum(d.size for d in descriptors)
+        else:
+            size = descriptors.size
+        return TransferResult(operation, operation.status, size, latency)
+
+
+@dataclass
+class TransferPipelineStats:
+    """
+    Throughput and latency statistics of a `TransferPipeline`.
+    """
+
+    transfers: int = 0
+    errors: int = 0
+    # Bytes transferred by completed operations.
+    size: int = 0
+    # Seconds spent running the pipeline.
+    elapsed: float = 0.0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        """
+        Gets the mean latency of an operation, in seconds.
+        """
+        return self.latency_sum / self.transfers if self.transfers else 0.0
+
+    @property
+    def throughput_gbps(self) -> float:
+        """
+        Gets the throughput of the pipeline while running, in gigabytes per second.
+        """
+        return self.size / self.elapsed / 1e9 if self.elapsed > 0 else 0.0
+
+    def record(self, result: TransferResult) -> None:
+        """
+        Records the result of an operation.
+        """
+        self.transfers += 1
+        if result.status == OperationStatus.COMPLETE:
+            self.size += result.size
+        else:
+            self.errors += 1
+        self.latency_sum += result.latency
+        self.latency_max = max(self.latency_max, result.latency)
+
+
+@dataclass
+class TransferResult:
+    """
+    Result of an operation transferred by a `TransferPipeline`.
+    """
+
+    operation: ActiveOperation
+    status: OperationStatus
+    # Bytes transferred by the operation.
+    size: int
+    # Seconds from the start of the transfer until its completion.
+    latency: float
+
+    @property
+    def throughput_gbps(self) -> float:
+        """
+        Gets the throughput of the operation, in gigabytes per second.
+        """
+        return self.size / self.latency / 1e9 if self.latency > 0 else 0.0
+
+
 class WritableOperation(PassiveOperation):
     """
     Operation which can be awaited until written to by a `WriteOperation` from a remote worker.
@@ -1673,7 +2951,7 @@ class WriteOperation(ActiveOperation):
         ValueError
             When `remote_metadata` is not of kind `WRITE`.
         ValueError
-            When `remote_metadata.nixl_metadata` is not a non-empty `str`.
+            When `remote_metadata.nixl_metadata` is not a non-empty `bytes`.
         TypeError
             When `local_descriptors` is not a `dynamo.nixl_connect.Descriptor` or `list[dynamo.nixl_connect.Descriptor]`.
         """
@@ -1688,16 +2966,23 @@ class WriteOperation(ActiveOperation):
         if remote_metadata.operation_kind != OperationKind.WRITE.value:
             raise ValueError("Argument `remote_metadata` must be of kind `WRITE`.")
 
-        remote = Remote(connector, remote_metadata.nixl_metadata)
         remote_descriptors = remote_metadata.to_descriptors()
 
-        super().__init__(
-            remote,
-            OperationKind.WRITE,
-            local_descriptors,
-            remote_descriptors,
-            remote_metadata.notification_key,
+        remote = connector._remote_cache.acquire(
+            remote_metadata.nixl_metadata, remote_metadata.agent_name
         )
+        try:
+            super().__init__(
+                remote,
+                OperationKind.WRITE,
+                local_descriptors,
+                remote_descriptors,
+                remote_metadata.notification_key,
+            )
+        except Exception:
+            connector._remote_cache.release(remote)
+            raise
+        self._remote_leased = True
         logger.debug(
             f"dynamo.nixl_connect.{self.__class__.__name__}: Created {self.__repr__()}"
         )
@@ -1730,3 +3015,158 @@ class WriteOperation(ActiveOperation):
         Blocks the caller asynchronously until the operation has completed.
         """
         await super()._wait_for_completion_()
+
+
+def _decode_rdma_metadata(data: bytes | bytearray | memoryview) -> RdmaMetadata:
+    """
+    Private function which decodes metadata encoded by `RdmaMetadata.to_bytes()`.
+
+    Every value is checked against the field validators of `RdmaMetadata` and `SerializedDescriptor` here, so the
+    models are constructed without running Pydantic validation again, see `_construct_model()`.
+    """
+    data = memoryview(data)
+    if len(data) < _RDMA_METADATA_HEADER.size:
+        raise ValueError("Encoded RDMA metadata is truncated.")
+    (
+        magic,
+        version,
+        operation_kind,
+        descriptor_count,
+        agent_name_len,
+        notification_key_len,
+        nixl_metadata_len,
+    ) = _RDMA_METADATA_HEADER.unpack_from(data)
+    if magic != RDMA_METADATA_MAGIC:
+        raise ValueError("Data is not encoded RDMA metadata.")
+    if version != RDMA_METADATA_VERSION:
+        raise ValueError(
+            f"Unsupported RDMA metadata encoding version {version}, expected {RDMA_METADATA_VERSION}."
+        )
+    if operation_kind < 1 or operation_kind > 3:
+        raise ValueError(
+            f"Encoded RDMA metadata has an invalid operation kind {operation_kind}."
+        )
+
+    descriptors_struct = _descriptors_struct(descriptor_count)
+    offset = _RDMA_METADATA_HEADER.size + descriptors_struct.size
+    if len(data) != offset + agent_name_len + notification_key_len + nixl_metadata_len:
+        raise ValueError("Encoded RDMA metadata has an invalid length.")
+
+    values = descriptors_struct.unpack_from(data, _RDMA_METADATA_HEADER.size)
+    descriptors = [
+        _decode_descriptor(values[i], values[i + 1], values[i + 2], values[i + 3])
+        for i in range(0, len(values), 4)
+    ]
+
+    try:
+        agent_name = str(data[offset : offset + agent_name_len], "utf-8")
+        offset += agent_name_len
+        notification_key = str(data[offset : offset + notification_key_len], "utf-8")
+        offset += notification_key_len
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Encoded RDMA metadata has an invalid string: {e}.") from e
+
+    return _construct_model(
+        RdmaMetadata,
+        {
+            "agent_name": agent_name,
+            "descriptors": descriptors,
+            "nixl_metadata": data[offset:].tobytes(),
+            "notification_key": notification_key,
+            "operation_kind": operation_kind,
+        },
+    )
+
+
+def _construct_model(cls: type[BaseModel], values: dict[str, Any]) -> Any:
+    """
+    Private function which creates a model from already validated values of every one of its fields.
+
+    Same as `cls.model_construct(**values)` for the models of this module, which have no private attributes, without
+    its per-field default and alias lookups, which cost more than validating the small models decoded here.
+    """
+    model = cls.__new__(cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def _decode_descriptor(
+    kind: int, device_id: int, ptr: int, size: int
+) -> SerializedDescriptor:
+    """
+    Private function which creates a `SerializedDescriptor` from the values of an encoded descriptor.
+    """
+    if ptr == 0:
+        raise ValueError("Encoded descriptor has a zero `ptr`.")
+    # `size` is unsigned in the encoding, and the device is checked by `_decode_device()`.
+    return _construct_model(
+        SerializedDescriptor,
+        {"device": _decode_device(kind, device_id), "ptr": ptr, "size": size},
+    )
+
+
+@lru_cache(maxsize=64)
+def _decode_device(kind: int, device_id: int) -> str:
+    if kind == DeviceKind.HOST:
+        return "cpu"
+    if kind == DeviceKind.CUDA:
+        return "cuda" if device_id == _NO_DEVICE_ID else f"cuda:{device_id}"
+    raise ValueError(f"Encoded descriptor has an invalid device kind {kind}.")
+
+
+@lru_cache(maxsize=256)
+def _descriptors_struct(count: int) -> struct.Struct:
+    return struct.Struct("<" + _RDMA_METADATA_DESCRIPTOR * count)
+
+
+@lru_cache(maxsize=64)
+def _encode_device(device: str) -> tuple[int, int]:
+    kind, _, device_id = device.partition(":")
+    return (
+        DeviceKind.HOST if kind == "cpu" else DeviceKind.CUDA,
+        int(device_id) if device_id else _NO_DEVICE_ID,
+    )
+
+
+class _PoolBuffer:
+    """
+    Private class holding a registered buffer of a `DescriptorPool`.
+    """
+
+    __slots__ = ("descriptor", "device", "size", "tensor")
+
+    def __init__(
+        self, tensor: torch.Tensor, descriptor: Descriptor, device: str, size: int
+    ) -> None:
+        self.descriptor: Optional[Descriptor] = descriptor
+        self.device = device
+        self.size = size
+        self.tensor: Optional[torch.Tensor] = tensor
+
+
+class _PumpWaiter:
+    """
+    Private class tracking an operation registered with a `NotificationPump`.
+    """
+
+    __slots__ = ("done", "future", "started_at")
+
+    def __init__(self, started_at: Optional[float] = None) -> None:
+        self.done = False
+        self.future: Optional[asyncio.Future[bool]] = None
+        self.started_at = time.perf_counter() if started_at is None else started_at
+
+
+class _RemoteCacheEntry:
+    """
+    Private class tracking a remote loaded by a `RemoteCache`.
+    """
+
+    __slots__ = ("leases", "remote")
+
+    def __init__(self, remote: Remote) -> None:
+        self.leases = 0
+        self.remote = remote
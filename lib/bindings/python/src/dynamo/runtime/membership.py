@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Watch-based instance membership for endpoint clients.
+
+Instead of polling `Client.instance_ids()`, an `InstanceWatcher` awaits
+`Client.wait_for_instance_change()`, which is driven by the etcd watch the
+client already holds, and notifies listeners whenever instances join or leave.
+Watchers are shared per client, see `watch_instances`.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# listener(added, removed) with the sets of instance ids that joined / left
+MembershipListener = Callable[[FrozenSet[int], FrozenSet[int]], Any]
+
+# retry delays after the watch fails, e.g. while etcd is unreachable
+WATCH_RETRY_INITIAL_DELAY = 0.5
+WATCH_RETRY_MAX_DELAY = 10.0
+
+_WATCHERS: Dict[int, "InstanceWatcher"] = {}
+
+
+class InstanceWatcher:
+    """
+    Cache of the instance ids of one endpoint, kept up to date by a background
+    task instead of polling.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._instance_ids: FrozenSet[int] = frozenset(client.instance_ids())
+        self._listeners: List[MembershipListener] = []
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._refcount = 0
+
+    @property
+    def instance_ids(self) -> List[int]:
+        return sorted(self._instance_ids)
+
+    def __len__(self) -> int:
+        return len(self._instance_ids)
+
+    def __contains__(self, instance_id: int) -> bool:
+        return instance_id in self._instance_ids
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_listener(self, listener: MembershipListener) -> Callable[[], None]:
+        """
+        Register `listener(added, removed)`, called on every membership change.
+        Coroutine functions are awaited. Returns a callable that unregisters it.
+        """
+        self._listeners.append(listener)
+
+        def remove():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    async def wait_for_change(self, timeout: Optional[float] = None) -> List[int]:
+        """
+        Wait for the next membership change and return the new instance ids.
+        Raises asyncio.TimeoutError if nothing changes within `timeout` seconds.
+        """
+        await asyncio.wait_for(self._changed.wait(), timeout)
+        return self.instance_ids
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._watch())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _watchable(self) -> bool:
+        if not hasattr(self.client, "wait_for_instance_change"):
+            return False
+        is_static = getattr(self.client, "is_static", None)
+        return not (is_static is not None and is_static())
+
+    async def _watch(self):
+        if not self._watchable():
+            # the instances of a static endpoint never change
+            logger.info(
+                "Instances of the endpoint cannot be watched, keeping "
+                f"{self.instance_ids}"
+            )
+            return
+        delay = WATCH_RETRY_INITIAL_DELAY
+        while True:
+            try:
+                new_ids = await self.client.wait_for_instance_change(self.instance_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Instance watch failed, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, WATCH_RETRY_MAX_DELAY)
+                continue
+            delay = WATCH_RETRY_INITIAL_DELAY
+            await self._update(frozenset(new_ids))
+
+    async def _update(self, new_ids: FrozenSet[int]):
+        added = new_ids - self._instance_ids
+        removed = self._instance_ids - new_ids
+        if not added and not removed:
+            return
+        self._instance_ids = new_ids
+
+        # wake everyone waiting on this change and arm a fresh event for the next one
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+        for listener in list(self._listeners):
+            try:
+                result = listener(added, removed)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Instance membership listener failed: {e}")
+
+
+def watch_instances(client) -> InstanceWatcher:
+    """
+    Return the shared, running watcher of `client`, creating it on first use.
+    Must be called from within a running event loop. Pair with `release`.
+    """
+    watcher = _WATCHERS.get(id(client))
+    if watcher is None:
+        watcher = InstanceWatcher(client)
+        _WATCHERS[id(client)] = watcher
+    watcher._refcount += 1
+    watcher.start()
+    return watcher
+
+
+def release(watcher: InstanceWatcher):
+    """Drop a reference obtained from `watch_instances`; the last one stops the watch."""
+    watcher._refcount -= 1
+    if watcher._refcount <= 0:
+        watcher.stop()
+        if _WATCHERS.get(id(watcher.client)) is watcher:
+            del _WATCHERS[id(watcher.client)]
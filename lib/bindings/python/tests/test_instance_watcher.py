@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from dynamo.runtime.membership import release, watch_instances
+
+pytestmark = pytest.mark.pre_merge
+
+
+class FakeClient:
+    """Stands in for dynamo._core.Client, membership is changed via set_instances."""
+
+    def __init__(self, instance_ids):
+        self._instance_ids = sorted(instance_ids)
+        self._changed = asyncio.Event()
+
+    def instance_ids(self):
+        return list(self._instance_ids)
+
+    def set_instances(self, instance_ids):
+        self._instance_ids = sorted(instance_ids)
+        self._changed.set()
+
+    async def wait_for_instance_change(self, known_ids):
+        while sorted(known_ids) == self._instance_ids:
+            self._changed.clear()
+            await self._changed.wait()
+        return list(self._instance_ids)
+
+
+async def test_watcher_notifies_add_and_remove():
+    client = FakeClient([1, 2])
+    watcher = watch_instances(client)
+    events = []
+    watcher.add_listener(lambda added, removed: events.append((added, removed)))
+    assert watcher.instance_ids == [1, 2]
+
+    client.set_instances([1, 2, 3])
+    assert await watcher.wait_for_change(timeout=1) == [1, 2, 3]
+    client.set_instances([2, 3])
+    assert await watcher.wait_for_change(timeout=1) == [2, 3]
+
+    assert events == [({3}, set()), (set(), {1})]
+    release(watcher)
+    assert not watcher.running
+
+
+async def test_watcher_is_shared_per_client():
+    client = FakeClient([])
+    first = watch_instances(client)
+    second = watch_instances(client)
+    assert first is second
+
+    release(first)
+    assert second.running
+    release(second)
+    assert not second.running
+    assert watch_instances(client) is not first
+
+
+async def test_async_listener_and_removal():
+    client = FakeClient([])
+    watcher = watch_instances(client)
+    seen = []
+
+    async def listener(added, removed):
+        seen.append(sorted(added))
+
+    remove = watcher.add_listener(listener)
+    client.set_instances([7])
+    await watcher.wait_for_change(timeout=1)
+    remove()
+    client.set_instances([7, 8])
+    await watcher.wait_for_change(timeout=1)
+
+    assert seen == [[7]]
+    assert len(watcher) == 2 and 8 in watcher
+    release(watcher)
+
+
+async def test_wait_for_change_timeout():
+    watcher = watch_instances(FakeClient([1]))
+    with pytest.raises(asyncio.TimeoutError):
+        await watcher.wait_for_change(timeout=0.05)
+    release(watcher)
+
+
+class StaticClient(FakeClient):
+    def is_static(self):
+        return True
+
+    async def wait_for_instance_change(self, known_ids):
+        raise RuntimeError("Instances of a static endpoint cannot be watched")
+
+
+class InstanceListClient:
+    """A client that can only list its instances."""
+
+    def instance_ids(self):
+        return [4]
+
+
+@pytest.mark.parametrize("client_class", [StaticClient, InstanceListClient])
+async def test_unwatchable_client_stops_watching(client_class, caplog):
+    client = client_class([4]) if client_class is StaticClient else client_class()
+    with caplog.at_level("INFO", logger="dynamo.runtime.membership"):
+        watcher = watch_instances(client)
+        await asyncio.sleep(0.05)
+
+    assert not watcher.running
+    assert watcher.instance_ids == [4]
+    assert len(caplog.records) == 1
+    assert "cannot be watched" in caplog.records[0].getMessage()
+    release(watcher)
@@ -111,6 +111,45 @@ async def test_radix_tree_binding(distributed_runtime):
     )
 
 
+async def test_radix_tree_apply_events_batch(distributed_runtime):
+    """Test applying a batch of events to the RadixTree in a single call"""
+    import json
+
+    radix_tree = RadixTree()
+
+    events = [
+        {
+            "event_id": 1,
+            "data": {
+                "stored": {
+                    "parent_hash": None,
+                    "blocks": [{"block_hash": 0, "tokens_hash": 0}],
+                }
+            },
+        },
+        {
+            "event_id": 2,
+            "data": {
+                "stored": {
+                    "parent_hash": 0,
+                    "blocks": [{"block_hash": 1, "tokens_hash": 1}],
+                }
+            },
+        },
+        {"event_id": 3, "data": {"removed": {"block_hashes": [1]}}},
+    ]
+
+    worker_id = 0
+    num_applied = radix_tree.apply_events(worker_id, json.dumps(events).encode("utf-8"))
+    assert num_applied == 3
+
+    overlap_scores = radix_tree.find_matches([0, 1])
+    assert overlap_scores.scores == {worker_id: 1}
+
+    with pytest.raises(ValueError):
+        radix_tree.apply_events(worker_id, b"not a batch")
+
+
 # TODO Figure out how to test with different kv_block_size
 # Right now I get an error in EventPublisher init when I run this test
 # back to back. It occurs when calling dynamo_llm_init and I think is related to the
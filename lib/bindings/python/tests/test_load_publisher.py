@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from dynamo.llm.load_publisher import (
+    CoalescingMetricsPublisher,
+    PrefixCacheCounter,
+    WorkerLoad,
+)
+
+pytestmark = pytest.mark.pre_merge
+
+
+class RecordingPublisher:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, metrics):
+        self.published.append(metrics)
+
+
+def load(waiting=0, active_blocks=0, prefix_cache=None):
+    return WorkerLoad(
+        request_active_slots=1,
+        request_total_slots=8,
+        num_requests_waiting=waiting,
+        kv_active_blocks=active_blocks,
+        kv_total_blocks=1000,
+        gpu_cache_usage_perc=active_blocks / 1000,
+        prefix_cache=prefix_cache,
+    )
+
+
+def make_publisher(**kwargs):
+    inner = RecordingPublisher()
+    kwargs.setdefault("min_interval", 0.02)
+    kwargs.setdefault("heartbeat_interval", 10)
+    kwargs.setdefault("usage_delta", 0.01)
+    return inner, CoalescingMetricsPublisher(inner, **kwargs)
+
+
+def test_prefix_cache_counter():
+    counter = PrefixCacheCounter()
+    assert counter.hit_rate == 0.0
+    counter.add(queries=100, hits=25)
+    counter.add(queries=100, hits=75)
+    assert (counter.queries, counter.hits, counter.hit_rate) == (200, 100, 0.5)
+
+
+def test_suppresses_changes_below_threshold():
+    inner, publisher = make_publisher(min_interval=0)
+    assert publisher.update(load(active_blocks=100))
+    # 10 blocks is within 1% of the cache
+    assert not publisher.update(load(active_blocks=110))
+    assert publisher.update(load(active_blocks=111))
+    assert publisher.update(load(waiting=1, active_blocks=111))
+    assert len(inner.published) == 3
+    assert publisher.stats.suppressed == 1
+
+
+def test_heartbeat_republishes_unchanged_load():
+    inner, publisher = make_publisher(min_interval=0, heartbeat_interval=0)
+    publisher.update(load())
+    publisher.update(load())
+    assert len(inner.published) == 2
+
+
+async def test_coalesces_bursts_into_latest():
+    inner, publisher = make_publisher()
+    assert publisher.update(load(waiting=0))
+    for waiting in range(1, 10):
+        assert not publisher.update(load(waiting=waiting))
+    assert len(inner.published) == 1
+
+    await asyncio.sleep(0.05)
+    assert len(inner.published) == 2
+    assert publisher.last_sent.num_requests_waiting == 9
+    assert publisher.stats.coalesced == 8
+
+
+async def test_trailing_publish_skips_reverted_load():
+    inner, publisher = make_publisher()
+    publisher.update(load(waiting=0))
+    publisher.update(load(waiting=1))
+    publisher.update(load(waiting=0))
+    await asyncio.sleep(0.05)
+    assert len(inner.published) == 1
+
+
+async def test_force_and_flush_publish_now():
+    inner, publisher = make_publisher()
+    publisher.update(load(waiting=0))
+    assert publisher.update(load(waiting=0), force=True)
+    publisher.update(load(waiting=1))
+    publisher.flush()
+    assert len(inner.published) == 3
+    assert publisher.flush_handle is None
+    assert publisher.last_sent.num_requests_waiting == 1
+
+
+def test_publishes_cumulative_prefix_cache_counts():
+    counter = PrefixCacheCounter()
+    inner, publisher = make_publisher(min_interval=0)
+    counter.add(queries=64, hits=16)
+    publisher.update(load(prefix_cache=counter))
+    # counts alone do not trigger a publish, they ride along the next one
+    counter.add(queries=64, hits=64)
+    assert not publisher.update(load(prefix_cache=counter))
+    assert publisher.update(load(waiting=1, prefix_cache=counter))
+    assert len(inner.published) == 2
+    assert publisher.last_sent.prefix_cache.hit_rate == 80 / 128
@@ -0,0 +1,420 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import zlib
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+pytest.importorskip("torch")
+pytest.importorskip("nixl")
+
+import torch  # noqa: E402
+
+from dynamo.nixl_connect import (  # noqa: E402
+    NOTIFICATION_KEY_SEPARATOR,
+    ActiveOperation,
+    CompactRdmaMetadata,
+    Connector,
+    Descriptor,
+    DescriptorPool,
+    NotificationPump,
+    NotificationPumpStats,
+    OperationKind,
+    OperationStatus,
+    RdmaMetadata,
+    RemoteCache,
+    SerializedDescriptor,
+    TransferPipeline,
+)
+
+pytestmark = pytest.mark.pre_merge
+
+
+class FakeAgent:
+    """Stands in for `nixl_agent`, delivering queued notifications once."""
+
+    def __init__(self):
+        self.pending = []
+        self.loaded = []
+        self.unloaded = []
+        self.metadata_queries = 0
+        self.registered = 0
+        self.deregistered = 0
+
+    def get_agent_metadata(self):
+        self.metadata_queries += 1
+        return b"local:1"
+
+    def add_remote_agent(self, metadata):
+        self.loaded.append(metadata)
+        return metadata.split(b":")[0]
+
+    def remove_remote_agent(self, name):
+        self.unloaded.append(name)
+
+    def register_memory(self, *args):
+        self.registered += 1
+        return self.registered
+
+    def deregister_memory(self, handle):
+        self.deregistered += 1
+
+    def notify(self, notification_key):
+        self.pending.append(notification_key.encode("utf-8"))
+
+    def get_new_notifs(self):
+        notifications, self.pending = {"remote": self.pending}, []
+        return notifications
+
+
+class FakeTransfer:
+    def __init__(self):
+        self._started_at = 0.0
+        self._status = OperationStatus.INITIALIZED
+
+    def _update_transfer_state_(self):
+        return self._status
+
+
+def make_pump():
+    agent = FakeAgent()
+    return agent, NotificationPump(SimpleNamespace(_nixl=agent))
+
+
+async def test_wait_notification_wakes_on_notification():
+    agent, pump = make_pump()
+    pump.register_notification("key")
+    waiter = asyncio.create_task(pump.wait_notification("key"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    agent.notify("other")
+    agent.notify("key")
+    assert await asyncio.wait_for(waiter, timeout=1)
+    assert pump.is_notified("key")
+    assert pump.stats.completions == 1
+    assert pump.stats.unclaimed == 1
+
+
+async def test_keeps_notification_received_before_registration():
+    agent, pump = make_pump()
+    agent.notify("early")
+    assert pump.poll()
+    pump.register_notification("early")
+    assert pump.is_notified("early")
+    assert await pump.wait_notification("early")
+
+
+async def test_wait_transfer_wakes_on_completion():
+    _, pump = make_pump()
+    transfer = FakeTransfer()
+    pump.register_transfer(transfer)
+    waiter = asyncio.create_task(pump.wait_transfer(transfer))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not waiter.done()
+
+    transfer._status = OperationStatus.COMPLETE
+    assert await asyncio.wait_for(waiter, timeout=1)
+    assert pump.stats.completions == 1
+    # the pump stops once no operation is awaited
+    await asyncio.sleep(0.01)
+    assert pump._task is None
+
+
+async def test_unregister_wakes_waiter():
+    _, pump = make_pump()
+    pump.register_notification("key")
+    waiter = asyncio.create_task(pump.wait_notification("key"))
+    await asyncio.sleep(0)
+    pump.unregister_notification("key")
+    assert not await asyncio.wait_for(waiter, timeout=1)
+    assert pump.stats.completions == 0
+
+
+def test_latency_percentiles():
+    stats = NotificationPumpStats()
+    for latency in (0.004, 0.001, 0.003, 0.002):
+        stats.record(latency)
+    assert stats.completions == 4
+    assert stats.latency_max == 0.004
+    assert stats.latency_mean == pytest.approx(0.0025)
+    assert stats.latency_percentile(0) == 0.001
+    assert stats.latency_percentile(100) == 0.004
+
+
+def make_cache(**kwargs):
+    connector = Connector()
+    connector._nixl = FakeAgent()
+    return connector._nixl, RemoteCache(connector, **kwargs)
+
+
+def compressed(metadata):
+    return zlib.compress(metadata)
+
+
+def test_remote_cache_loads_unchanged_metadata_once():
+    agent, cache = make_cache()
+    first = cache.acquire(compressed(b"remote:1"), "remote")
+    second = cache.acquire(compressed(b"remote:1"), "remote")
+    assert first is second and first.name == "remote"
+    assert agent.loaded == [b"remote:1"]
+
+    cache.release(first)
+    cache.release(second)
+    assert agent.unloaded == []
+    assert cache.acquire(compressed(b"remote:1"), "remote") is first
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_remote_cache_reloads_changed_metadata():
+    agent, cache = make_cache()
+    cache.release(cache.acquire(compressed(b"remote:1"), "remote"))
+    cache.acquire(compressed(b"remote:2"), "remote")
+    # the stale metadata is unloaded before the new metadata is loaded
+    assert agent.unloaded == ["remote"]
+    assert agent.loaded == [b"remote:1", b"remote:2"]
+    assert cache.stats.reloads == 1
+    assert len(cache) == 1
+
+
+def test_remote_cache_keeps_leased_stale_remote_loaded():
+    agent, cache = make_cache()
+    stale = cache.acquire(compressed(b"remote:1"))
+    fresh = cache.acquire(compressed(b"remote:2"))
+    cache.release(stale)
+    cache.release(fresh)
+    # the agent refers to the new metadata, so the stale remote never unloads it
+    assert agent.unloaded == []
+    cache.clear()
+    assert agent.unloaded == ["remote"]
+    assert len(cache) == 0
+
+
+def test_remote_cache_evicts_idle_remotes():
+    agent, cache = make_cache(max_idle=1)
+    cache.release(cache.acquire(compressed(b"a:1"), "a"))
+    cache.release(cache.acquire(compressed(b"b:1"), "b"))
+    assert agent.unloaded == ["a"]
+    assert cache.stats.evictions == 1
+
+    agent, cache = make_cache(idle_timeout=0)
+    cache.release(cache.acquire(compressed(b"a:1"), "a"))
+    assert agent.unloaded == ["a"]
+
+
+def test_connector_caches_encoded_metadata():
+    connector = Connector()
+    connector._nixl = agent = FakeAgent()
+    encoded = connector._encoded_metadata()
+    assert connector._encoded_metadata() is encoded
+    assert agent.metadata_queries == 1
+
+    connector._invalidate_metadata()
+    assert connector._encoded_metadata() == encoded
+    assert agent.metadata_queries == 2
+
+
+def make_pool(**kwargs):
+    connector = Connector()
+    connector._nixl = FakeAgent()
+    return connector._nixl, DescriptorPool(connector, cpu_only=True, **kwargs)
+
+
+def test_descriptor_pool_reuses_registered_buffers():
+    agent, pool = make_pool()
+    with pool.lease((2, 3), torch.float32, "cuda") as lease:
+        assert lease.tensor.shape == (2, 3)
+        assert lease.descriptor.size == 24
+        assert str(lease.descriptor.device) == "cpu"
+    # same size class, no new registration
+    with pool.lease(6, torch.float32) as lease:
+        lease.descriptor.register_memory(pool._connector)
+    assert agent.registered == 1
+    assert (pool.stats.leases, pool.stats.hits, pool.stats.allocations) == (2, 1, 1)
+
+
+def test_descriptor_pool_tracks_high_watermarks():
+    _, pool = make_pool(min_buffer_size=1024)
+    leases = [pool.lease(1024, torch.uint8) for _ in range(3)]
+    assert pool.stats.leased_bytes == 3072
+    for lease in leases:
+        lease.release()
+    leases[0].release()
+    assert pool.stats.leased == 0
+    assert pool.stats.leased_high_watermark == 3
+    assert pool.stats.leased_bytes_high_watermark == 3072
+    assert pool.stats.registered_bytes == 3072
+
+
+def test_descriptor_pool_frees_idle_buffers_beyond_limit():
+    agent, pool = make_pool(max_idle_bytes=4096)
+    pool.reserve(4096, torch.uint8, count=2)
+    assert agent.registered == 2
+    assert pool.stats.registered_bytes == 4096
+    pool.clear()
+    assert pool.stats.registered_bytes == 0
+
+
+def rdma_metadata(key, ptr, nixl_metadata="00"):
+    return RdmaMetadata(
+        agent_name="remote",
+        descriptors=[SerializedDescriptor(device="cpu", ptr=ptr, size=64)],
+        nixl_metadata=nixl_metadata,
+        notification_key=key,
+        operation_kind=int(OperationKind.READ),
+    )
+
+
+def test_merge_rdma_metadata():
+    merged = RdmaMetadata.merge([rdma_metadata("a", 4096), rdma_metadata("b", 8192)])
+    assert [d.ptr for d in merged.descriptors] == [4096, 8192]
+    assert merged.notification_key.split(NOTIFICATION_KEY_SEPARATOR) == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        RdmaMetadata.merge([rdma_metadata("a", 4096), rdma_metadata("b", 8192, "01")])
+
+
+async def test_batched_notification_completes_every_operation():
+    agent, pump = make_pump()
+    for key in ("a", "b"):
+        pump.register_notification(key)
+    agent.notify(NOTIFICATION_KEY_SEPARATOR.join(["a", "b"]))
+    assert pump.poll()
+    assert pump.is_notified("a") and pump.is_notified("b")
+    assert pump.stats.notifications == 1
+    assert pump.stats.completions == 2
+
+
+class FakeOperation(ActiveOperation):
+    def __init__(self, size, delay, status=OperationStatus.COMPLETE):
+        self._operation_kind = OperationKind.READ
+        self._local_desc_list = Descriptor((4096, size, "cpu"))
+        self._delay = delay
+        self._final_status = status
+        self._status = OperationStatus.INITIALIZED
+
+    def _release(self):
+        pass
+
+    def cancel(self):
+        pass
+
+    @property
+    def status(self):
+        return self._status
+
+    async def wait_for_completion(self):
+        await asyncio.sleep(self._delay)
+        self._status = self._final_status
+
+
+async def test_pipeline_bounds_operations_in_flight(monkeypatch):
+    in_flight = 0
+    max_seen = 0
+
+    async def begin(size, delay):
+        nonlocal in_flight, max_seen
+        in_flight += 1
+        max_seen = max(max_seen, in_flight)
+        operation = FakeOperation(size, delay)
+        original = operation.wait_for_completion
+
+        async def wait():
+            nonlocal in_flight
+            await original()
+            in_flight -= 1
+
+        monkeypatch.setattr(operation, "wait_for_completion", wait)
+        return operation
+
+    pipeline = TransferPipeline(max_in_flight=2)
+    delays = [0.05, 0.01, 0.01, 0.01]
+    results = [r async for r in pipeline.run(begin(1000, d) for d in delays)]
+    assert max_seen == 2
+    # the slow first transfer completes after the ones started behind it
+    assert results[-1].latency >= 0.05
+    assert pipeline.stats.transfers == 4
+    assert pipeline.stats.size == 4000
+    assert pipeline.stats.throughput_gbps > 0
+
+
+async def test_pipeline_counts_errored_operations():
+    async def begin(status):
+        return FakeOperation(1000, 0, status)
+
+    pipeline = TransferPipeline()
+    results = [
+        r
+        async for r in pipeline.run(
+            [begin(OperationStatus.COMPLETE), begin(OperationStatus.ERRORED)]
+        )
+    ]
+    assert sorted(r.status for r in results) == [
+        OperationStatus.COMPLETE,
+        OperationStatus.ERRORED,
+    ]
+    assert (pipeline.stats.errors, pipeline.stats.size) == (1, 1000)
+
+
+def compact_metadata():
+    return RdmaMetadata(
+        agent_name="remote",
+        descriptors=[
+            SerializedDescriptor(device="cuda:1", ptr=0x7F0000000000, size=4718592),
+            SerializedDescriptor(device="cpu", ptr=4096, size=64),
+        ],
+        nixl_metadata=zlib.compress(b"agent metadata" * 64),
+        notification_key="4b1f0c1e-6c4f-4d5e-9a1b-2f3e4d5c6b7a",
+        operation_kind=int(OperationKind.WRITE),
+    )
+
+
+def zero_ptr_metadata():
+    metadata = compact_metadata()
+    descriptor = SerializedDescriptor.model_construct(device="cpu", ptr=0, size=64)
+    return metadata.model_copy(update={"descriptors": [descriptor]})
+
+
+def test_rdma_metadata_round_trips_compact_encoding():
+    metadata = compact_metadata()
+    encoded = metadata.to_bytes()
+    assert RdmaMetadata.from_bytes(encoded) == metadata
+    assert RdmaMetadata.from_base64(metadata.to_base64()) == metadata
+    # the validated path accepts both compact forms
+    assert RdmaMetadata.model_validate(encoded) == metadata
+    assert RdmaMetadata.model_validate(metadata.to_base64()) == metadata
+    assert len(encoded) < len(metadata.model_dump_json()) / 2
+    # the JSON form still carries hex NIXL metadata
+    assert RdmaMetadata.model_validate_json(metadata.model_dump_json()) == metadata
+    assert metadata.model_dump()["nixl_metadata"] == metadata.nixl_metadata.hex()
+
+
+def test_rdma_metadata_rejects_invalid_encoding():
+    encoded = bytearray(compact_metadata().to_bytes())
+    with pytest.raises(ValueError):
+        RdmaMetadata.from_bytes(encoded[:-1])
+    with pytest.raises(ValueError, match="zero"):
+        RdmaMetadata.from_bytes(zero_ptr_metadata().to_bytes())
+    encoded[5] = 0
+    with pytest.raises(ValueError, match="operation kind"):
+        RdmaMetadata.from_bytes(encoded)
+    encoded[4] = 2
+    with pytest.raises(ValueError, match="version"):
+        RdmaMetadata.from_bytes(encoded)
+
+
+def test_compact_rdma_metadata_field():
+    class Request(BaseModel):
+        serialized_request: CompactRdmaMetadata
+
+    metadata = compact_metadata()
+    body = Request(serialized_request=metadata).model_dump_json()
+    assert metadata.to_base64() in body
+    assert Request.model_validate_json(body).serialized_request == metadata
+    # requests from workers sending the field mapping are still accepted
+    legacy = {"serialized_request": metadata.model_dump()}
+    assert Request.model_validate(legacy).serialized_request == metadata
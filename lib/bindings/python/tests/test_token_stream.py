@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from dynamo.llm.token_stream import MAX_READY_CHUNKS, TokenDeltas, coalesce_token_chunks
+
+pytestmark = pytest.mark.pre_merge
+
+
+async def token_stream(num_tokens, delay, finish=True):
+    for i in range(num_tokens):
+        await asyncio.sleep(delay)
+        yield {"token_ids": [i]}
+    if finish:
+        yield {"token_ids": [], "finish_reason": "stop"}
+
+
+def test_token_deltas_cumulative_and_by_index():
+    deltas = TokenDeltas()
+    cumulative = [1, 2]
+    first = deltas.delta(cumulative)
+    assert first == [1, 2] and first is not cumulative
+    cumulative.extend([3, 4])
+    assert deltas.delta(cumulative) == [3, 4]
+    assert deltas.delta([7], index=1) == [7]
+    assert deltas.delta([1, 2, 3, 4, 5]) == [5]
+    assert deltas.num_seen() == 5 and deltas.num_seen(1) == 1
+
+    deltas.mark_seen([7, 8, 9], index=1)
+    assert deltas.delta([7, 8, 9, 10], index=1) == [10]
+
+    engine_delta = [3]
+    assert TokenDeltas(cumulative=False).delta(engine_delta) is engine_delta
+
+
+async def test_coalesce_disabled_returns_stream():
+    stream = token_stream(3, 0)
+    assert coalesce_token_chunks(stream, latency_budget=0) is stream
+
+
+async def test_coalesce_merges_tokens_within_budget():
+    chunks = [
+        chunk
+        async for chunk in coalesce_token_chunks(
+            token_stream(20, 0.001), latency_budget=0.05
+        )
+    ]
+    # the first token is not held back, the rest is flushed with the finish reason
+    assert chunks[0] == {"token_ids": [0]}
+    assert chunks[-1]["finish_reason"] == "stop"
+    assert len(chunks) < 21
+    assert [t for chunk in chunks for t in chunk["token_ids"]] == list(range(20))
+
+
+async def test_coalesce_caps_held_tokens():
+    chunks = [
+        chunk
+        async for chunk in coalesce_token_chunks(
+            token_stream(9, 0, finish=False), latency_budget=10, max_tokens=4
+        )
+    ]
+    assert [chunk["token_ids"] for chunk in chunks] == [
+        [0],
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+    ]
+
+
+async def test_coalesce_keeps_indices_apart():
+    async def batch_stream():
+        for chunk in (
+            {"token_ids": [0], "index": 0},
+            {"token_ids": [1], "index": 0},
+            {"token_ids": [2], "index": 0},
+            {"token_ids": [10], "index": 1},
+            {"token_ids": [], "index": 1, "finish_reason": "stop"},
+        ):
+            yield chunk
+
+    chunks = [
+        chunk
+        async for chunk in coalesce_token_chunks(batch_stream(), latency_budget=10)
+    ]
+    assert chunks == [
+        {"token_ids": [0], "index": 0},
+        {"token_ids": [1, 2], "index": 0},
+        {"token_ids": [10], "index": 1, "finish_reason": "stop"},
+    ]
+
+
+async def test_coalesce_flushes_then_raises():
+    async def failing_stream():
+        yield {"token_ids": [0]}
+        yield {"token_ids": [1]}
+        raise GeneratorExit("engine shut down")
+
+    chunks = []
+    with pytest.raises(GeneratorExit):
+        async for chunk in coalesce_token_chunks(failing_stream(), latency_budget=10):
+            chunks.append(chunk)
+    assert chunks == [{"token_ids": [0]}, {"token_ids": [1]}]
+
+
+async def test_coalesce_does_not_merge_into_chunk_without_tokens():
+    async def stream():
+        yield {"token_ids": [0]}
+        yield {"token_ids": [1]}
+        yield {"finish_reason": "stop"}
+
+    chunks = [
+        chunk async for chunk in coalesce_token_chunks(stream(), latency_budget=10)
+    ]
+    assert chunks == [{"token_ids": [0]}, {"token_ids": [1]}, {"finish_reason": "stop"}]
+
+
+async def test_coalesce_stops_reading_ahead_of_slow_consumer():
+    num_read = 0
+
+    async def endless_stream():
+        nonlocal num_read
+        while True:
+            num_read += 1
+            yield {"token_ids": [num_read], "finish_reason": None}
+            await asyncio.sleep(0)
+
+    chunks = coalesce_token_chunks(endless_stream(), latency_budget=10)
+    assert (await chunks.__anext__())["token_ids"] == [1]
+    await asyncio.sleep(0.05)
+    assert num_read <= MAX_READY_CHUNKS + 2
+    assert (await chunks.__anext__())["token_ids"] == [2]
+    await chunks.aclose()
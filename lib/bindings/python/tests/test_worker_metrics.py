@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import REGISTRY  # noqa: E402
+from prometheus_client.core import CounterMetricFamily  # noqa: E402
+
+from dynamo.llm import worker_metrics  # noqa: E402
+
+pytestmark = pytest.mark.pre_merge
+
+
+class OneCounter:
+    def collect(self):
+        yield CounterMetricFamily("dynamo_test_worker_metric", "test", value=3)
+
+
+def test_metrics_port_from_env(monkeypatch):
+    monkeypatch.delenv(worker_metrics.PORT_ENV, raising=False)
+    assert worker_metrics.metrics_port() == 0
+    monkeypatch.setenv(worker_metrics.PORT_ENV, "9091")
+    assert worker_metrics.metrics_port() == 9091
+    monkeypatch.setenv(worker_metrics.PORT_ENV, "not a port")
+    assert worker_metrics.metrics_port() == 0
+
+
+def test_register_collector_without_port():
+    collector = OneCounter()
+    try:
+        assert worker_metrics.register_collector(collector, port=0) is None
+        assert REGISTRY.get_sample_value("dynamo_test_worker_metric_total") == 3
+    finally:
+        REGISTRY.unregister(collector)
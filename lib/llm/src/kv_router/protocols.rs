@@ -52,6 +52,13 @@ pub struct KvStats {
     pub gpu_cache_usage_perc: f32,
     // percentage represented as a float from 0 to 1
     pub gpu_prefix_cache_hit_rate: f32,
+    // cumulative prefix cache lookups and hits since the worker started, in the
+    // engine's unit (tokens or blocks); the hit rate over any window is the ratio
+    // of the differences between two reports
+    #[serde(default)]
+    pub gpu_prefix_cache_queries: u64,
+    #[serde(default)]
+    pub gpu_prefix_cache_hits: u64,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize, Default, PartialEq)]
@@ -1009,6 +1009,7 @@ mod test_worker_metrics_publisher {
                     kv_total_blocks: 1000,
                     gpu_cache_usage_perc: 0.5,
                     gpu_prefix_cache_hit_rate: 0.8,
+                    ..Default::default()
                 },
                 worker_stats: WorkerStats {
                     num_requests_waiting: (i * 10) as u64, // Changing load metric
@@ -1050,6 +1051,7 @@ mod test_worker_metrics_publisher {
                     kv_total_blocks: 1000 + (i * 100) as u64,      // Change other metrics
                     gpu_cache_usage_perc: 0.3 + (i as f32 * 0.05), // Change other metrics
                     gpu_prefix_cache_hit_rate: 0.7 + (i as f32 * 0.01), // Change other metrics
+                    ..Default::default()
                 },
                 worker_stats: WorkerStats {
                     num_requests_waiting: 90, // Keep same as last published
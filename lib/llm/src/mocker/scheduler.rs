@@ -595,6 +595,8 @@ impl Scheduler {
             kv_total_blocks: total_capacity,
             gpu_cache_usage_perc,
             gpu_prefix_cache_hit_rate,
+            gpu_prefix_cache_queries: 0,
+            gpu_prefix_cache_hits: 0,
         };
 
         let spec_decode_stats = None;
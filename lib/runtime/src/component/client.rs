@@ -125,6 +125,28 @@ impl Client {
         Ok(instances)
     }
 
+    /// Wait until the set of instance ids differs from `known` and return the new, sorted set.
+    /// Returns immediately if the current set already differs. Order of `known` does not matter.
+    pub async fn wait_for_instance_ids_change(&self, known: &[i64]) -> Result<Vec<i64>> {
+        let InstanceSource::Dynamic(mut rx) = self.instance_source.as_ref().clone() else {
+            anyhow::bail!("Instances of a static endpoint cannot be watched");
+        };
+        let mut known = known.to_vec();
+        known.sort_unstable();
+        loop {
+            let mut instance_ids: Vec<i64> = rx
+                .borrow_and_update()
+                .iter()
+                .map(|instance| instance.id())
+                .collect();
+            instance_ids.sort_unstable();
+            if instance_ids != known {
+                return Ok(instance_ids);
+            }
+            rx.changed().await?;
+        }
+    }
+
     /// Is this component know at startup and not discovered via etcd?
     pub fn is_static(&self) -> bool {
         matches!(self.instance_source.as_ref(), InstanceSource::Static)
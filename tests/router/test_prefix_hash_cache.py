@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests of the prefix hash cache of the standalone router example."""
+
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+core = pytest.importorskip("dynamo._core")
+pytest.importorskip("prometheus_client")
+
+pytestmark = [pytest.mark.pre_merge, pytest.mark.unit]
+
+MODULE_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "examples/deployments/router_standalone/prefix_hash_cache.py"
+)
+BLOCK_SIZE = 4
+
+
+def load_prefix_hash_cache():
+    spec = importlib.util.spec_from_file_location("prefix_hash_cache", MODULE_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+prefix_hash_cache = load_prefix_hash_cache()
+PrefixHashCache = prefix_hash_cache.PrefixHashCache
+ENTRY_OVERHEAD_BYTES = prefix_hash_cache.ENTRY_OVERHEAD_BYTES
+
+
+def uncached(tokens):
+    return core.compute_block_hash_for_seq_py(tokens, BLOCK_SIZE)
+
+
+def test_hits_reuse_leading_blocks():
+    cache = PrefixHashCache(BLOCK_SIZE)
+    system = list(range(3 * BLOCK_SIZE))
+    first = system + [100] * BLOCK_SIZE + [7]
+
+    assert cache.compute_block_hashes(first) == uncached(first)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 4, 4)
+
+    second = system + [200] * (2 * BLOCK_SIZE)
+    assert cache.compute_block_hashes(second) == uncached(second)
+    assert (cache.hits, cache.misses, len(cache)) == (3, 6, 6)
+
+
+def test_matches_uncached_hashes_under_eviction():
+    # room for a dozen blocks, far fewer than the prompts below touch
+    entry_bytes = 4 * BLOCK_SIZE + ENTRY_OVERHEAD_BYTES
+    cache = PrefixHashCache(BLOCK_SIZE, max_bytes=12 * entry_bytes)
+    rng = random.Random(0)
+    prefixes = [
+        [rng.randrange(1000) for _ in range(rng.randrange(8 * BLOCK_SIZE))]
+        for _ in range(4)
+    ]
+
+    for _ in range(500):
+        tokens = rng.choice(prefixes) + [
+            rng.randrange(4) for _ in range(rng.randrange(4 * BLOCK_SIZE))
+        ]
+        assert cache.compute_block_hashes(tokens) == uncached(tokens)
+        assert cache.num_bytes <= cache.max_bytes
+
+    assert cache.evictions > 0
+    assert cache.hits > 0
+
+
+def test_shared_prefix_outlives_tails():
+    entry_bytes = 4 * BLOCK_SIZE + ENTRY_OVERHEAD_BYTES
+    cache = PrefixHashCache(BLOCK_SIZE, max_bytes=3 * entry_bytes)
+    prefix = [1] * BLOCK_SIZE
+
+    cache.compute_block_hashes(prefix + [2] * BLOCK_SIZE)
+    cache.compute_block_hashes(prefix + [3] * BLOCK_SIZE)
+    # the oldest tail is evicted first, the prefix was refreshed by the second lookup
+    cache.compute_block_hashes(prefix + [4] * BLOCK_SIZE)
+    assert cache.evictions == 1
+
+    hits = cache.hits
+    tokens = prefix + [3] * BLOCK_SIZE
+    assert cache.compute_block_hashes(tokens) == uncached(tokens)
+    assert cache.hits == hits + 2
+
+
+def test_rejects_non_positive_block_size():
+    with pytest.raises(ValueError):
+        PrefixHashCache(0)
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests of the translation of TRT-LLM KV events into publisher batches."""
+
+from array import array
+
+import pytest
+
+publisher_module = pytest.importorskip("dynamo.trtllm.publisher")
+
+pytestmark = [pytest.mark.pre_merge, pytest.mark.unit, pytest.mark.trtllm_marker]
+
+KV_BLOCK_SIZE = 4
+
+
+class RecordingKvEventPublisher:
+    """Records the batches published, in call order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def publish_stored_batch(
+        self,
+        event_ids,
+        token_ids,
+        num_block_tokens,
+        block_hashes,
+        num_blocks,
+        lora_ids,
+        parent_hashes,
+    ):
+        tokens = array("I")
+        tokens.frombytes(token_ids)
+        self.calls.append(
+            (
+                "stored",
+                list(event_ids),
+                list(block_hashes),
+                list(num_blocks),
+                tokens.tolist(),
+                list(num_block_tokens),
+                list(parent_hashes),
+            )
+        )
+
+    def publish_removed_batch(self, event_ids, block_hashes, num_blocks):
+        self.calls.append(
+            ("removed", list(event_ids), list(block_hashes), list(num_blocks))
+        )
+
+
+def stored_event(event_id, blocks, parent_hash=None):
+    return {
+        "event_id": event_id,
+        "data": {
+            "type": "stored",
+            "parent_hash": parent_hash,
+            "blocks": [
+                {
+                    "block_hash": block_hash,
+                    "tokens": [{"token_id": token_id} for token_id in tokens],
+                }
+                for block_hash, tokens in blocks
+            ],
+        },
+    }
+
+
+def removed_event(event_id, block_hashes):
+    return {
+        "event_id": event_id,
+        "data": {"type": "removed", "block_hashes": list(block_hashes)},
+    }
+
+
+@pytest.fixture
+def publisher(monkeypatch):
+    monkeypatch.delenv(publisher_module.KV_EVENT_BATCH_MS_ENV, raising=False)
+    publisher = publisher_module.Publisher(
+        component=None,
+        engine=None,
+        kv_listener=None,
+        worker_id=1,
+        kv_block_size=KV_BLOCK_SIZE,
+    )
+    publisher.kv_event_publisher = RecordingKvEventPublisher()
+    return publisher
+
+
+async def test_oversize_block_drops_only_its_event(publisher):
+    publisher._add_kv_cache_event(stored_event(1, [(10, [1, 2, 3, 4])]))
+    publisher._add_kv_cache_event(
+        stored_event(2, [(20, [5, 6, 7, 8]), (21, [9, 10, 11, 12, 13])], 10)
+    )
+    publisher._add_kv_cache_event(stored_event(3, [(30, [14, 15, 16, 17])], 10))
+    publisher._flush_kv_cache_events()
+
+    # the blocks of event 2 translated before the oversize one are dropped too
+    assert publisher.kv_event_publisher.calls == [
+        (
+            "stored",
+            [1, 3],
+            [10, 30],
+            [1, 1],
+            [1, 2, 3, 4, 14, 15, 16, 17],
+            [KV_BLOCK_SIZE, KV_BLOCK_SIZE],
+            [None, 10],
+        )
+    ]
+    assert publisher.kv_event_stats.stored_blocks == 2
+
+
+async def test_partial_blocks_are_not_stored_nor_removed(publisher):
+    publisher._add_kv_cache_event(
+        stored_event(1, [(10, [1, 2, 3, 4]), (11, [5, 6]), (12, [7, 8, 9, 10])])
+    )
+    publisher._add_kv_cache_event(removed_event(2, [10, 11]))
+    publisher._add_kv_cache_event(removed_event(3, [11]))
+    publisher._flush_kv_cache_events()
+
+    # the event stops at the partial block, which is only skipped once
+    assert publisher.kv_event_publisher.calls == [
+        ("stored", [1], [10], [1], [1, 2, 3, 4], [KV_BLOCK_SIZE], [None]),
+        ("removed", [2, 3], [10, 11], [1, 1]),
+    ]
+    assert not publisher.partial_block_hashes
+
+
+async def test_stored_and_removed_events_keep_engine_order(publisher):
+    publisher._add_kv_cache_event(stored_event(1, [(10, [1, 2, 3, 4])]))
+    publisher._add_kv_cache_event(stored_event(2, [(20, [5, 6, 7, 8])], 10))
+    publisher._add_kv_cache_event(removed_event(3, [20]))
+    publisher._add_kv_cache_event(stored_event(4, [(20, [5, 6, 7, 8])], 10))
+    publisher._add_kv_cache_event(removed_event(5, [10, 20]))
+    publisher._flush_kv_cache_events()
+
+    calls = publisher.kv_event_publisher.calls
+    assert [(call[0], call[1]) for call in calls] == [
+        ("stored", [1, 2]),
+        ("removed", [3]),
+        ("stored", [4]),
+        ("removed", [5]),
+    ]
+    assert calls[-1][2] == [10, 20]
+    stats = publisher.kv_event_stats
+    assert (stats.received, stats.published, stats.batches) == (5, 5, 4)
+    assert stats.backlog == 0
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests of the local vs remote prefill policies of vLLM decode workers."""
+
+import pytest
+
+disagg_policy = pytest.importorskip("dynamo.vllm.disagg_policy")
+CostPolicy = disagg_policy.CostPolicy
+DisaggCostModel = disagg_policy.DisaggCostModel
+LocalPrefixEstimator = disagg_policy.LocalPrefixEstimator
+StaticPrefillRemoteRule = disagg_policy.StaticPrefillRemoteRule
+ThresholdPolicy = disagg_policy.ThresholdPolicy
+
+pytestmark = [pytest.mark.pre_merge, pytest.mark.unit, pytest.mark.vllm]
+
+BLOCK_SIZE = 4
+
+
+def prompt(*blocks):
+    return [token for block in blocks for token in [block] * BLOCK_SIZE]
+
+
+def make_policy(policy_class, max_local_prefill_length=0, capacity=64, **cost):
+    return policy_class(
+        LocalPrefixEstimator(BLOCK_SIZE, capacity),
+        DisaggCostModel(**cost),
+        StaticPrefillRemoteRule(max_local_prefill_length),
+    )
+
+
+def test_estimator_matches_leading_blocks_only():
+    estimator = LocalPrefixEstimator(BLOCK_SIZE, capacity=64)
+    assert estimator.observe(prompt(1, 2, 3) + [9]) == 0
+    assert estimator.observe(prompt(1, 2, 4)) == 2 * BLOCK_SIZE
+    # the same block after another prefix is not cached
+    assert estimator.observe(prompt(5, 2)) == 0
+    assert estimator.observe(prompt(1, 2, 3, 4)) == 3 * BLOCK_SIZE
+
+
+def test_estimator_evicts_least_recent_blocks():
+    estimator = LocalPrefixEstimator(BLOCK_SIZE, capacity=2)
+    estimator.observe(prompt(1, 2))
+    estimator.observe(prompt(3))
+    assert estimator.observe(prompt(1, 2)) == BLOCK_SIZE
+    with pytest.raises(ValueError):
+        LocalPrefixEstimator(0, capacity=2)
+
+
+def test_no_prefill_workers_prefills_locally():
+    policy = make_policy(ThresholdPolicy)
+    decision = policy.decide(prompt(1, 2), num_prefill_workers=0)
+    assert (decision.remote, decision.reason) == (False, "no_prefill_workers")
+
+
+def test_threshold_policy_counts_uncached_tokens():
+    policy = make_policy(ThresholdPolicy, max_local_prefill_length=2 * BLOCK_SIZE)
+    first = policy.decide(prompt(1, 2, 3), num_prefill_workers=1)
+    assert (first.remote, first.reason, first.prefix_hit_length) == (True, "length", 0)
+
+    # two of the three blocks are cached now
+    second = policy.decide(prompt(1, 2, 4), num_prefill_workers=1)
+    assert (second.remote, second.prefix_hit_length) == (False, 2 * BLOCK_SIZE)
+
+    stats = policy.stats
+    assert stats.decisions == {("remote", "length"): 1, ("local", "length"): 1}
+    assert stats.prompt_tokens == 6 * BLOCK_SIZE
+    assert stats.prefix_hit_tokens == 2 * BLOCK_SIZE
+
+
+def test_cost_policy_compares_local_and_remote_time():
+    # 1 ms per token locally, remote prefills cost a fixed 5 ms
+    cost = dict(
+        local_prefill_tokens_per_s=1000.0,
+        kv_bytes_per_token=0,
+        remote_overhead_s=0.005,
+    )
+    policy = make_policy(CostPolicy, **cost)
+
+    short = policy.decide(prompt(1), num_prefill_workers=1)
+    assert (short.remote, short.reason) == (False, "cost")
+    long = policy.decide(prompt(2, 3), num_prefill_workers=1)
+    assert (long.remote, long.reason) == (True, "cost")
+    assert long.saved_seconds == pytest.approx(0.003)
+
+    queued = policy.decide(prompt(4, 5), num_prefill_workers=1, queue_wait=0.01)
+    assert (queued.remote, queued.reason) == (False, "queue")
+
+    # the length rule applies before the cost estimate
+    ruled = make_policy(CostPolicy, max_local_prefill_length=100, **cost)
+    decision = ruled.decide(prompt(6, 7), num_prefill_workers=1)
+    assert (decision.remote, decision.reason) == (False, "length")
+
+
+def test_policy_requires_choose():
+    with pytest.raises(TypeError):
+        disagg_policy.DisaggregationPolicy(
+            LocalPrefixEstimator(BLOCK_SIZE, 8), DisaggCostModel()
+        )
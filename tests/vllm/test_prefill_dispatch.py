@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests of the queue-based dispatch of remote prefills of vLLM decode workers."""
+
+import asyncio
+
+import pytest
+
+prefill_dispatch = pytest.importorskip("dynamo.vllm.prefill_dispatch")
+PrefillDispatchConfig = prefill_dispatch.PrefillDispatchConfig
+PrefillDispatcher = prefill_dispatch.PrefillDispatcher
+
+pytestmark = [pytest.mark.pre_merge, pytest.mark.unit, pytest.mark.vllm]
+
+BLOCK_SIZE = 4
+
+
+class FakeWatcher:
+    """Stands in for the InstanceWatcher of the prefill workers."""
+
+    def __init__(self, instance_ids):
+        self.instance_ids = sorted(instance_ids)
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def set_instances(self, instance_ids):
+        old, new = set(self.instance_ids), set(instance_ids)
+        self.instance_ids = sorted(new)
+        for listener in list(self.listeners):
+            listener(frozenset(new - old), frozenset(old - new))
+
+
+class FakeClient:
+    """Answers every direct request with one response naming the worker."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def direct(self, request, worker_id):
+        self.requests.append((request, worker_id))
+
+        async def stream():
+            yield {"worker_id": worker_id}
+
+        return stream()
+
+
+def prompt(prefix, length=4 * BLOCK_SIZE):
+    return [prefix] * length
+
+
+async def acquire(dispatcher, token_ids):
+    # a broken dispatch loop fails the test instead of hanging it
+    return await asyncio.wait_for(dispatcher.acquire(token_ids), 1)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def make_dispatcher():
+    dispatchers = []
+
+    def make(instance_ids, **config):
+        dispatcher = PrefillDispatcher(
+            FakeClient(),
+            FakeWatcher(instance_ids),
+            BLOCK_SIZE,
+            PrefillDispatchConfig(**config),
+        )
+        dispatchers.append(dispatcher)
+        return dispatcher
+
+    yield make
+    for dispatcher in dispatchers:
+        dispatcher.close()
+
+
+async def test_admission_control_queues_until_release(make_dispatcher):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=1)
+    assert await acquire(dispatcher, prompt(1)) == 1
+
+    second = asyncio.create_task(dispatcher.acquire(prompt(2)))
+    await settle()
+    assert not second.done()
+    assert dispatcher.inflight == {1: 1}
+
+    dispatcher.release(1)
+    assert await asyncio.wait_for(second, 1) == 1
+    assert dispatcher.stats.dispatched == 2
+
+
+async def test_micro_batch_groups_shared_prefixes(make_dispatcher):
+    dispatcher = make_dispatcher([1, 2], max_inflight_per_worker=0, batch_window=0.05)
+    granted = []
+
+    async def request(name, prefix):
+        granted.append((name, await acquire(dispatcher, prompt(prefix))))
+
+    await asyncio.gather(request("a", 1), request("b", 2), request("c", 1))
+
+    # c shares the prefix of a, so it is granted right after it, on its worker
+    assert granted == [("a", 1), ("c", 1), ("b", 2)]
+    assert dispatcher.stats.batches == 1
+    assert dispatcher.stats.affinity_hits == 1
+
+
+async def test_affinity_yields_to_less_loaded_worker(make_dispatcher):
+    dispatcher = make_dispatcher([1, 2], max_inflight_per_worker=0, affinity_slack=1)
+    assert await acquire(dispatcher, prompt(1)) == 1
+    assert await acquire(dispatcher, prompt(1)) == 1
+    # worker 1 now has two more prefills in flight than worker 2
+    assert await acquire(dispatcher, prompt(1)) == 2
+    assert dispatcher.stats.affinity_hits == 1
+
+    # short prompts have no prefix and go to the least loaded worker
+    assert await acquire(dispatcher, [1, 2]) == 2
+
+
+async def test_cancel_after_grant_releases_slot(make_dispatcher, monkeypatch):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=1)
+    task = asyncio.create_task(dispatcher.acquire(prompt(1)))
+    grant = dispatcher._grant
+
+    def grant_then_cancel(pending, worker_id, affinity):
+        grant(pending, worker_id, affinity)
+        task.cancel()
+
+    monkeypatch.setattr(dispatcher, "_grant", grant_then_cancel)
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, 1)
+    assert dispatcher.inflight == {1: 0}
+
+
+async def test_cancelled_request_is_not_granted(make_dispatcher):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=1)
+    assert await acquire(dispatcher, prompt(1)) == 1
+
+    queued = asyncio.create_task(dispatcher.acquire(prompt(1)))
+    await settle()
+    queued.cancel()
+    dispatcher.release(1)
+    await settle()
+
+    assert dispatcher.inflight == {1: 0}
+    assert dispatcher.stats.dispatched == 1
+    assert dispatcher.stats.affinity_hits == 0
+
+
+async def test_worker_removal_falls_back_to_local(make_dispatcher):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=1)
+    assert await acquire(dispatcher, prompt(1)) == 1
+    queued = asyncio.create_task(dispatcher.acquire(prompt(2)))
+    await settle()
+
+    dispatcher.watcher.set_instances([2])
+    assert await asyncio.wait_for(queued, 1) == 2
+    assert dispatcher.affinity == {dispatcher._prefix_key(prompt(2)): 2}
+
+    dispatcher.watcher.set_instances([])
+    assert await acquire(dispatcher, prompt(3)) is None
+    assert dispatcher.stats.local_fallbacks == 1
+    # a slot of a removed worker is not handed back
+    dispatcher.release(1)
+    assert dispatcher.inflight == {}
+
+
+async def test_expected_queue_wait(make_dispatcher):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=2)
+    dispatcher.stats.prefill_seconds = 0.2
+    assert dispatcher.expected_queue_wait() == 0.0
+
+    await acquire(dispatcher, prompt(1))
+    assert dispatcher.expected_queue_wait() == 0.0
+    await acquire(dispatcher, prompt(2))
+    # both slots taken: a new request waits for one of them to free up
+    assert dispatcher.expected_queue_wait() == pytest.approx(0.1)
+
+    assert make_dispatcher([], max_inflight_per_worker=2).expected_queue_wait() == 0
+    assert make_dispatcher([1], max_inflight_per_worker=0).expected_queue_wait() == 0
+
+
+async def test_prefill_sends_request_and_releases(make_dispatcher):
+    dispatcher = make_dispatcher([1], max_inflight_per_worker=1)
+    response = await dispatcher.prefill(prompt(1), {"request_id": "r"})
+
+    assert response == {"worker_id": 1}
+    assert dispatcher.client.requests == [({"request_id": "r"}, 1)]
+    assert dispatcher.inflight == {1: 0}
+    assert dispatcher.stats.prefill_seconds > 0